@@ -0,0 +1,13 @@
+"""
+Throughput benchmarks for the production workloads.
+
+Each benchmark times one subsystem the way the game drives it (v2 plays,
+the play and drive resolvers, season weeks, a historical season, league
+save/load and WebSocket frames) and reports operations per second. Runs
+are written as JSON so a release can be compared against a stored
+baseline.
+
+Usage:
+    python -m benchmarks [--quick] [--only v2_pass ...] [--output results.json]
+    python -m benchmarks --baseline benchmarks/results/baseline.json --fail-on-regression
+"""
@@ -0,0 +1,65 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+import argparse
+import os
+import sys
+
+from . import game, league, v2_plays, websocket  # noqa: F401  (register benchmarks)
+from .harness import (
+    BENCHMARKS,
+    DEFAULT_TOLERANCE,
+    PROJECT_ROOT,
+    compare_results,
+    format_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, "benchmarks", "results", "latest.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-subsystem throughput benchmarks")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--quick", action="store_true", help="small workloads (smoke test)")
+    parser.add_argument("--repeats", type=int, help="runs per benchmark (median is kept)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write JSON results")
+    parser.add_argument("--baseline", help="saved results to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="allowed fractional drop in throughput before flagging a regression",
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true",
+        help="exit non-zero when a benchmark regresses past the tolerance",
+    )
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<24} {bench.description}")
+        return
+
+    results = []
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        results.append(run_benchmark(BENCHMARKS[name], quick=args.quick, repeats=args.repeats))
+
+    comparisons = None
+    if args.baseline:
+        comparisons = compare_results(results, load_results(args.baseline))
+
+    print(format_results(results, comparisons, args.tolerance))
+    save_results(args.output, results, quick=args.quick)
+    print(f"\nResults written to {args.output}")
+
+    regressions = [c for c in comparisons or [] if c.is_regression(args.tolerance)]
+    if regressions and args.fail_on_regression:
+        names = ", ".join(c.name for c in regressions)
+        sys.exit(f"Throughput regressed past {args.tolerance:.0%}: {names}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Seeded leagues shared by the benchmarks (built once per process, never timed)."""
+
+import copy
+import random
+from functools import lru_cache
+
+from huddle.core.league.league import League
+from huddle.core.rng import SeedSequence
+from huddle.generators.league import generate_league_with_schedule
+from huddle.simulation.season import SeasonSimulator
+
+SEED = 2024
+
+
+@lru_cache(maxsize=None)
+def _base_league() -> League:
+    # The league generator draws from the module-level generator
+    state = random.getstate()
+    random.seed(SEED)
+    try:
+        return generate_league_with_schedule(season=2024)
+    finally:
+        random.setstate(state)
+
+
+def fresh_league() -> League:
+    """A 32-team league at week 0 with rosters, schedule, draft class and free agents."""
+    return copy.deepcopy(_base_league())
+
+
+@lru_cache(maxsize=None)
+def _played_league() -> League:
+    league = fresh_league()
+    simulator = SeasonSimulator(league, seed_sequence=SeedSequence(SEED))
+    for week in (1, 2):
+        simulator.simulate_week(week)
+    return league
+
+
+def played_league() -> League:
+    """The benchmark league two weeks into the season (game logs, stats, standings)."""
+    return copy.deepcopy(_played_league())
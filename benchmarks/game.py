@@ -0,0 +1,69 @@
+"""Game-level throughput: the play and drive resolvers and season weeks."""
+
+import random
+
+from huddle.core.rng import SeedSequence
+from huddle.simulation.engine import SimulationEngine, SimulationMode
+from huddle.simulation.season import SeasonSimulator
+
+from .fixtures import SEED, fresh_league
+from .harness import BenchContext, benchmark
+
+
+@benchmark("statistical_resolver", unit="plays")
+def statistical_resolver(ctx: BenchContext) -> None:
+    """StatisticalPlayResolver.resolve_play over full play-by-play games."""
+    league = fresh_league()
+    # FAST mode resolves whole drives, so play the games snap by snap
+    engine = SimulationEngine(
+        mode=SimulationMode.PLAY_BY_PLAY, keep_play_history=False, rng=random.Random(SEED)
+    )
+    resolver = engine._play_resolver
+    resolve_play = resolver.resolve_play
+
+    # Time only the resolver; play calling and game-state updates are not its cost
+    def timed_resolve(*args, **kwargs):
+        with ctx.timed("resolve_play"):
+            result = resolve_play(*args, **kwargs)
+        ctx.ops += 1
+        return result
+
+    resolver.resolve_play = timed_resolve
+    for game in league.get_games_for_week(1)[:ctx.scale(4, 1)]:
+        game_state = engine.create_game(
+            league.get_team(game.home_team_abbr), league.get_team(game.away_team_abbr)
+        )
+        engine.simulate_game(game_state)
+
+
+@benchmark("drive_resolver", unit="drives")
+def drive_resolver(ctx: BenchContext) -> None:
+    """StatisticalDriveResolver.resolve_drive over full FAST-mode games."""
+    league = fresh_league()
+    engine = SimulationEngine(mode=SimulationMode.FAST, rng=random.Random(SEED))
+    resolver = engine._drive_resolver
+    resolve_drive = resolver.resolve_drive
+
+    # Time only the resolver; applying drives to the game state is not its cost
+    def timed_resolve(*args, **kwargs):
+        with ctx.timed("resolve_drive"):
+            result = resolve_drive(*args, **kwargs)
+        ctx.ops += 1
+        return result
+
+    resolver.resolve_drive = timed_resolve
+    for game in league.get_games_for_week(1)[:ctx.scale(16, 2)]:
+        game_state = engine.create_game(
+            league.get_team(game.home_team_abbr), league.get_team(game.away_team_abbr)
+        )
+        engine.simulate_game(game_state)
+
+
+@benchmark("season_week", unit="weeks")
+def season_week(ctx: BenchContext) -> None:
+    """SeasonSimulator.simulate_week in FAST mode, from week 1."""
+    simulator = SeasonSimulator(fresh_league(), seed_sequence=SeedSequence(SEED))
+    for week in range(1, ctx.scale(3, 1) + 1):
+        with ctx.timed("simulate_week"):
+            simulator.simulate_week(week)
+        ctx.ops += 1
@@ -0,0 +1,231 @@
+"""Timing, registry and result storage for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Rates may drop this much against the baseline before a run is flagged
+DEFAULT_TOLERANCE = 0.15
+
+
+class BenchContext:
+    """
+    Handed to a benchmark function for one run.
+
+    Only code inside ``timed()`` blocks counts towards the result, so
+    setup (league generation, play construction for serialization
+    benchmarks) stays out of the rate. ``ops`` is the number of units
+    (plays, weeks, frames) the timed code processed.
+    """
+
+    def __init__(self, quick: bool = False) -> None:
+        self.quick = quick
+        self.ops = 0
+        self.phases: Dict[str, float] = {}
+
+    def scale(self, full: int, quick: int) -> int:
+        """Workload size for the current mode."""
+        return quick if self.quick else full
+
+    @contextmanager
+    def timed(self, phase: str = "total") -> Iterator[None]:
+        """Add the wall-clock time of the block to ``phase``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Add time measured by the caller to ``phase``."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @property
+    def seconds(self) -> float:
+        return sum(self.phases.values())
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark function."""
+    name: str
+    unit: str
+    func: Callable[[BenchContext], None]
+    description: str = ""
+    repeats: int = 3
+
+
+@dataclass
+class BenchmarkResult:
+    """Median run of one benchmark."""
+    name: str
+    unit: str
+    ops: int
+    seconds: float
+    runs: List[float] = field(default_factory=list)  # Seconds of every run
+    phases: Dict[str, float] = field(default_factory=dict)  # Of the median run
+
+    @property
+    def rate(self) -> float:
+        """Units per second."""
+        return self.ops / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "rate": self.rate}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResult":
+        return cls(
+            name=data["name"],
+            unit=data["unit"],
+            ops=data["ops"],
+            seconds=data["seconds"],
+            runs=data.get("runs", []),
+            phases=data.get("phases", {}),
+        )
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, unit: str, repeats: int = 3
+) -> Callable[[Callable[[BenchContext], None]], Callable[[BenchContext], None]]:
+    """Register ``func(ctx)`` under ``name``; the docstring's first line describes it."""
+    def register(func: Callable[[BenchContext], None]) -> Callable[[BenchContext], None]:
+        description = next(iter((func.__doc__ or "").strip().splitlines()), "")
+        BENCHMARKS[name] = Benchmark(name, unit, func, description, repeats)
+        return func
+    return register
+
+
+def run_benchmark(
+    bench: Benchmark, quick: bool = False, repeats: Optional[int] = None
+) -> BenchmarkResult:
+    """Run ``bench`` ``repeats`` times and keep the median run."""
+    contexts = []
+    for _ in range(repeats or bench.repeats):
+        ctx = BenchContext(quick=quick)
+        bench.func(ctx)
+        if not ctx.ops or not ctx.phases:
+            raise RuntimeError(f"Benchmark {bench.name} timed no work")
+        contexts.append(ctx)
+
+    median = sorted(contexts, key=lambda c: c.seconds)[len(contexts) // 2]
+    return BenchmarkResult(
+        name=bench.name,
+        unit=bench.unit,
+        ops=median.ops,
+        seconds=median.seconds,
+        runs=[c.seconds for c in contexts],
+        phases=dict(median.phases),
+    )
+
+
+# =============================================================================
+# Result Storage
+# =============================================================================
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def save_results(path: str, results: List[BenchmarkResult], quick: bool = False) -> None:
+    """Write ``results`` with enough environment detail to judge a comparison."""
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "quick": quick,
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """Results of a saved run, by benchmark name."""
+    with open(path) as f:
+        document = json.load(f)
+    return {
+        name: BenchmarkResult.from_dict(data) for name, data in document["results"].items()
+    }
+
+
+@dataclass
+class Comparison:
+    """One benchmark against its baseline."""
+    name: str
+    baseline: float  # Rate
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change in throughput (+0.10 = 10% faster)."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    def is_regression(self, tolerance: float = DEFAULT_TOLERANCE) -> bool:
+        return self.change < -tolerance
+
+
+def compare_results(
+    current: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult]
+) -> List[Comparison]:
+    """Pair each result with its baseline; benchmarks new in this run are skipped."""
+    return [
+        Comparison(r.name, baseline[r.name].rate, r.rate)
+        for r in current
+        if r.name in baseline
+    ]
+
+
+def format_results(
+    results: List[BenchmarkResult],
+    comparisons: Optional[List[Comparison]] = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> str:
+    """Results table, with the baseline change column when comparing."""
+    by_name = {c.name: c for c in comparisons or []}
+    lines = [
+        f"{'Benchmark':<24} {'rate':>12} {'unit':<10} {'ops':>6} {'seconds':>9} {'vs base':>9}",
+        "-" * 75,
+    ]
+    for r in results:
+        comparison = by_name.get(r.name)
+        change = ""
+        if comparison:
+            change = f"{comparison.change:+.1%}"
+            if comparison.is_regression(tolerance):
+                change += " !"
+        lines.append(
+            f"{r.name:<24} {r.rate:>12.2f} {r.unit + '/s':<10} {r.ops:>6} "
+            f"{r.seconds:>9.3f} {change:>9}"
+        )
+        if len(r.phases) > 1:
+            for phase, seconds in sorted(r.phases.items(), key=lambda p: -p[1]):
+                share = seconds / r.seconds if r.seconds else 0.0
+                lines.append(f"    {phase:<20} {seconds:>9.3f}s {share:>6.1%}")
+    return "\n".join(lines)
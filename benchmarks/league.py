@@ -0,0 +1,29 @@
+"""League-level throughput: a historical season and league save/load."""
+
+from huddle.core.league.league import League
+from huddle.core.simulation.historical_sim import HistoricalSimulator, SimulationConfig
+
+from .fixtures import SEED, played_league
+from .harness import BenchContext, benchmark
+
+
+@benchmark("historical_season", unit="seasons", repeats=1)
+def historical_season(ctx: BenchContext) -> None:
+    """One seeded HistoricalSimulator season for 32 teams, broken down by phase."""
+    config = SimulationConfig(years_to_simulate=0, seed=SEED)
+    result = HistoricalSimulator.create_with_nfl_teams(config).run()
+    for timing in result.profile.phases:
+        ctx.record(timing.phase, timing.wall_seconds)
+    ctx.ops += 1
+
+
+@benchmark("league_roundtrip", unit="leagues")
+def league_roundtrip(ctx: BenchContext) -> None:
+    """League.to_dict and League.from_dict for a 32-team league two weeks in."""
+    league = played_league()
+    for _ in range(ctx.scale(5, 1)):
+        with ctx.timed("to_dict"):
+            data = league.to_dict()
+        with ctx.timed("from_dict"):
+            League.from_dict(data)
+        ctx.ops += 1
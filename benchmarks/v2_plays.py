@@ -0,0 +1,52 @@
+"""v2 play simulation throughput (the engine behind the play and coach views)."""
+
+import random
+
+from huddle.simulation.v2.ai.qb_brain import enable_trace
+from huddle.simulation.v2.testing.calibration import build_pass_play, build_run_play, plan_plays
+
+from .harness import BenchContext, benchmark
+
+
+def _run_plays(ctx: BenchContext, kind: str, plays: int, traced: bool) -> None:
+    """Build and run seeded plays, timing construction and the tick loop separately."""
+    enable_trace(traced)
+    try:
+        for spec in plan_plays(plays, kind, seed=0):
+            random.seed(spec.seed)
+            if traced:
+                enable_trace(True)  # Clears the buffers, as each API play does
+            with ctx.timed("build"):
+                if kind == "run":
+                    orchestrator = build_run_play(spec.concept)
+                else:
+                    orchestrator = build_pass_play(spec.concept, spec.coverage)
+            with ctx.timed("run"):
+                orchestrator.run()
+            ctx.ops += 1
+    finally:
+        enable_trace(False)
+
+
+@benchmark("v2_pass", unit="plays")
+def v2_pass(ctx: BenchContext) -> None:
+    """Pass plays across the calibration concepts and coverages, tracing off."""
+    _run_plays(ctx, "pass", ctx.scale(40, 5), traced=False)
+
+
+@benchmark("v2_pass_traced", unit="plays")
+def v2_pass_traced(ctx: BenchContext) -> None:
+    """Pass plays with the brain trace system on, as the API runs them."""
+    _run_plays(ctx, "pass", ctx.scale(40, 5), traced=True)
+
+
+@benchmark("v2_run", unit="plays")
+def v2_run(ctx: BenchContext) -> None:
+    """Run plays across the calibration run concepts, tracing off."""
+    _run_plays(ctx, "run", ctx.scale(30, 4), traced=False)
+
+
+@benchmark("v2_run_traced", unit="plays")
+def v2_run_traced(ctx: BenchContext) -> None:
+    """Run plays with the brain trace system on."""
+    _run_plays(ctx, "run", ctx.scale(30, 4), traced=True)
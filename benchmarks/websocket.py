@@ -0,0 +1,60 @@
+"""WebSocket frame serialization for the v2 play viewer."""
+
+import asyncio
+import json
+import random
+
+from huddle.api.routers.v2_sim import (
+    ball_to_dict,
+    create_pass_play_session,
+    event_to_dict,
+    player_to_dict,
+    session_manager,
+    session_state_to_dict,
+)
+
+from .fixtures import SEED
+from .harness import BenchContext, benchmark
+
+MATCHUPS = [("mesh", "cover_3"), ("four_verts", "cover_2"), ("smash", "cover_1")]
+
+
+def _encode(frame: dict) -> str:
+    # What Starlette's WebSocket.send_json does to each frame
+    return json.dumps(frame, separators=(",", ":"), ensure_ascii=False)
+
+
+@benchmark("ws_frames", unit="frames")
+def ws_frames(ctx: BenchContext) -> None:
+    """Build and encode a state_sync frame plus one tick frame per simulation tick."""
+    random.seed(SEED)
+    for concept, coverage in MATCHUPS[:ctx.scale(3, 1)]:
+        session = asyncio.run(create_pass_play_session(concept, coverage))
+        orchestrator = session.orchestrator
+        players = session.offense_players + session.defense_players
+        events = []
+        orchestrator.event_bus.subscribe_all(events.append)
+        try:
+            with ctx.timed("state_sync"):
+                _encode({"type": "state_sync", "payload": session_state_to_dict(session)})
+            ctx.ops += 1
+
+            orchestrator._do_pre_snap_reads()
+            orchestrator._do_snap()
+            while not orchestrator._should_stop():
+                orchestrator._update_tick(orchestrator.clock.tick())
+                with ctx.timed("tick"):
+                    payload = {
+                        "tick": orchestrator.clock.tick_count,
+                        "time": orchestrator.clock.current_time,
+                        "phase": orchestrator.phase.value,
+                        "players": [player_to_dict(p, orchestrator, session) for p in players],
+                        "ball": ball_to_dict(orchestrator.ball, orchestrator.clock.current_time),
+                        "play_outcome": session.play_outcome.value,
+                        "events": [event_to_dict(e) for e in events],
+                    }
+                    _encode({"type": "tick", "payload": payload})
+                events.clear()
+                ctx.ops += 1
+        finally:
+            session_manager.sessions.pop(session.session_id, None)
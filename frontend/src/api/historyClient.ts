@@ -295,10 +295,29 @@ export async function runSimulation(config: Partial<SimulationConfig>): Promise<
   return response.json();
 }
 
+export interface PhaseTiming {
+  season: number;
+  phase: string;
+  wall_seconds: number;
+  cpu_seconds: number;
+  counts: Record<string, number>;
+  allocated_bytes: number | null;
+  peak_bytes: number | null;
+  profile_path: string | null;
+}
+
+export interface SimulationProfile {
+  phases: PhaseTiming[];
+  totals: PhaseTiming[];
+  total_seconds: number;
+}
+
 export interface ProgressEvent {
-  type: 'progress' | 'complete' | 'error';
+  type: 'progress' | 'phase' | 'complete' | 'error';
   message?: string;
+  timing?: PhaseTiming;
   summary?: SimulationSummary;
+  profile?: SimulationProfile;
 }
 
 export async function runSimulationWithProgress(
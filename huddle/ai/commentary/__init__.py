@@ -47,9 +47,19 @@ from .generator import (
     CommentaryResult,
 )
 
+from .cache import (
+    CachedCommentaryGenerator,
+    CommentaryCache,
+    RequestCoalescer,
+    PlayByPlayBatcher,
+    commentary_cache_key,
+)
+
 from .prompts import (
     build_play_by_play_prompt,
     build_color_prompt,
+    build_batch_play_by_play_prompt,
+    parse_batch_play_by_play,
     serialize_play_for_prompt,
     serialize_narratives_for_prompt,
     PLAY_BY_PLAY_SYSTEM,
@@ -86,9 +96,17 @@ __all__ = [
     # Generator
     "GeminiCommentaryGenerator",
     "CommentaryResult",
+    # Cache
+    "CachedCommentaryGenerator",
+    "CommentaryCache",
+    "RequestCoalescer",
+    "PlayByPlayBatcher",
+    "commentary_cache_key",
     # Prompts
     "build_play_by_play_prompt",
     "build_color_prompt",
+    "build_batch_play_by_play_prompt",
+    "parse_batch_play_by_play",
     "serialize_play_for_prompt",
     "serialize_narratives_for_prompt",
     "PLAY_BY_PLAY_SYSTEM",
@@ -0,0 +1,420 @@
+"""
+Commentary Cache
+
+Caching, request coalescing and batching in front of a CommentaryGenerator.
+
+Auto-play produces long runs of near-identical plays (2nd & medium runs
+between the 40s, incomplete passes on 3rd & long...). Rather than paying
+for one Gemini request per play, contexts are normalized into a cache key
+built from situation buckets, play type, outcome and participants:
+
+- Identical keys are served from an LRU cache.
+- Concurrent requests for the same key share one in-flight generation.
+- Play-by-play requests that queue up while a request is in flight are
+  sent together as a single batched prompt.
+
+Usage:
+    generator = CachedCommentaryGenerator(GeminiCommentaryGenerator())
+    call = await generator.generate_play_by_play(context)
+    color = await generator.generate_color(context)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, Optional
+
+from .schema import CommentaryContext, CommentaryGenerator
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONTEXT NORMALIZATION
+# =============================================================================
+
+def bucket_distance(distance: int) -> str:
+    """Bucket yards-to-go into short / medium / long."""
+    if distance <= 3:
+        return "short"
+    if distance <= 6:
+        return "medium"
+    return "long"
+
+
+def bucket_field_zone(yards_to_goal: int) -> str:
+    """Bucket field position into broadcast-relevant zones."""
+    if yards_to_goal <= 5:
+        return "goal_line"
+    if yards_to_goal <= 20:
+        return "red_zone"
+    if yards_to_goal <= 40:
+        return "opp_territory"
+    if yards_to_goal <= 60:
+        return "midfield"
+    if yards_to_goal <= 90:
+        return "own_territory"
+    return "backed_up"
+
+
+def bucket_score(score_differential: int) -> str:
+    """Bucket the offense's score differential by possessions."""
+    if score_differential == 0:
+        return "tied"
+    side = "leading" if score_differential > 0 else "trailing"
+    margin = abs(score_differential)
+    if margin <= 8:
+        return f"{side}_one_score"
+    if margin <= 16:
+        return f"{side}_two_scores"
+    return f"{side}_big"
+
+
+def bucket_clock(quarter: int, time_remaining_seconds: int) -> str:
+    """Bucket game clock into phases that change commentary tone."""
+    if quarter > 4:
+        return "overtime"
+    late_half = quarter in (2, 4)
+    if late_half and time_remaining_seconds <= 120:
+        return f"q{quarter}_two_minute"
+    if late_half and time_remaining_seconds <= 300:
+        return f"q{quarter}_late"
+    return f"q{quarter}"
+
+
+def _player_key(player) -> Optional[str]:
+    return player.player_id if player is not None else None
+
+
+def commentary_cache_key(context: CommentaryContext, kind: str) -> tuple:
+    """
+    Build a normalized cache key for a commentary request.
+
+    Facts a call states outright (who, what, how many yards) are kept
+    exact; situational context is bucketed so similar plays share a key.
+    Color keys additionally include the score/clock phase and the
+    narrative hooks the call is expected to weave in.
+
+    Args:
+        context: Full commentary context.
+        kind: "play_by_play" or "color".
+
+    Returns:
+        Hashable key.
+    """
+    play = context.play
+    sit = play.situation
+
+    key = (
+        kind,
+        play.play_concept.play_type,
+        play.outcome,
+        round(play.yards_gained),
+        _player_key(play.passer),
+        _player_key(play.receiver),
+        _player_key(play.ball_carrier),
+        _player_key(play.tackler),
+        sit.down,
+        bucket_distance(sit.distance),
+        bucket_field_zone(sit.yards_to_goal),
+        play.resulted_in_first_down,
+        play.resulted_in_touchdown,
+        play.resulted_in_turnover,
+    )
+
+    if kind == "color":
+        hooks = context.hooks_to_use or [
+            hook.headline for hook in context.narratives.active_hooks
+        ]
+        key += (
+            bucket_score(sit.score_differential),
+            bucket_clock(sit.quarter, sit.time_remaining_seconds),
+            context.energy_level,
+            context.suggested_focus,
+            tuple(sorted(hooks)),
+        )
+
+    return key
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for monitoring."""
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    batched_plays: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CommentaryCache:
+    """
+    LRU cache of generated commentary with optional expiry.
+
+    Entries older than ttl_seconds are treated as misses so long-running
+    sessions eventually get fresh phrasing for common plays.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return cached text for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, text = entry
+        if self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: Hashable, text: str) -> None:
+        """Store text under key, evicting the least recently used entry."""
+        self._entries[key] = (self._clock(), text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =============================================================================
+# COALESCING AND BATCHING
+# =============================================================================
+
+class RequestCoalescer:
+    """
+    Share one in-flight generation between concurrent identical requests.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        return key in self._in_flight
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[str]]) -> str:
+        """Await the in-flight request for key, or start one with factory."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await factory()
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so lone requests don't log "never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+
+class PlayByPlayBatcher:
+    """
+    Merge play-by-play requests that queue up while one is in flight.
+
+    The first request is dispatched immediately; anything submitted while
+    it is outstanding is sent as a single batched prompt on the next
+    dispatch, up to max_batch plays. Normal-speed play therefore pays no
+    added latency, and fast auto-play degrades to one request per burst.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[list[CommentaryContext]], Awaitable[list[str]]],
+        max_batch: int = 8,
+    ):
+        self._dispatch = dispatch
+        self.max_batch = max_batch
+        self._pending: list[tuple[CommentaryContext, asyncio.Future]] = []
+        self._worker: Optional[asyncio.Task] = None
+        self.batches_sent = 0
+        self.plays_batched = 0
+
+    async def submit(self, context: CommentaryContext) -> str:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((context, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+
+            contexts = [context for context, _ in batch]
+            try:
+                texts = await self._dispatch(contexts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            if len(batch) > 1:
+                self.batches_sent += 1
+                self.plays_batched += len(batch)
+
+            for (_, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+
+
+# =============================================================================
+# CACHED GENERATOR
+# =============================================================================
+
+class CachedCommentaryGenerator(CommentaryGenerator):
+    """
+    CommentaryGenerator wrapper adding caching, coalescing and batching.
+
+    Batching is used when the wrapped generator provides
+    generate_play_by_play_batch() (GeminiCommentaryGenerator does).
+    """
+
+    def __init__(
+        self,
+        generator: CommentaryGenerator,
+        cache: Optional[CommentaryCache] = None,
+        max_batch: int = 8,
+        enable_batching: bool = True,
+    ):
+        """
+        Args:
+            generator: Underlying generator that makes API calls.
+            cache: Cache to use. Defaults to a 512-entry LRU without expiry.
+            max_batch: Maximum plays per batched prompt.
+            enable_batching: Merge play-by-play requests that queue up.
+        """
+        self._generator = generator
+        self.cache = cache if cache is not None else CommentaryCache()
+        self.stats = CacheStats()
+        self._coalescer = RequestCoalescer()
+        self._last_play_by_play: Optional[str] = None
+
+        self._batcher: Optional[PlayByPlayBatcher] = None
+        if enable_batching and hasattr(generator, "generate_play_by_play_batch"):
+            self._batcher = PlayByPlayBatcher(
+                generator.generate_play_by_play_batch, max_batch=max_batch
+            )
+
+    async def close(self):
+        """Close the wrapped generator if it owns resources."""
+        close = getattr(self._generator, "close", None)
+        if close is not None:
+            await close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _cached(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[str]],
+    ) -> str:
+        text = self.cache.get(key)
+        if text is not None:
+            self.stats.hits += 1
+            return text
+
+        if self._coalescer.is_in_flight(key):
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+
+        text = await self._coalescer.run(key, factory)
+        self.cache.put(key, text)
+        return text
+
+    async def generate_play_by_play(
+        self,
+        context: CommentaryContext,
+    ) -> str:
+        """Play-by-play call, served from cache when an equivalent play was called."""
+        key = commentary_cache_key(context, "play_by_play")
+
+        async def factory() -> str:
+            if self._batcher is not None:
+                return await self._batcher.submit(context)
+            return await self._generator.generate_play_by_play(context)
+
+        text = await self._cached(key, factory)
+        self._last_play_by_play = text
+        return text
+
+    async def generate_color(
+        self,
+        context: CommentaryContext,
+    ) -> str:
+        """Color commentary, built on the most recent play-by-play call."""
+        key = commentary_cache_key(context, "color")
+        play_by_play = self._last_play_by_play
+
+        async def factory() -> str:
+            if play_by_play is None:
+                return await self._generator.generate_color(context)
+            return await self._generator.generate_color(context, play_by_play=play_by_play)
+
+        return await self._cached(key, factory)
+
+    async def generate_both(
+        self,
+        context: CommentaryContext,
+    ) -> tuple[str, str]:
+        """Generate play-by-play then color for one play."""
+        play_by_play = await self.generate_play_by_play(context)
+        color = await self.generate_color(context)
+        return play_by_play, color
+
+    def get_stats(self) -> dict:
+        """Cache and batching counters for monitoring."""
+        if self._batcher is not None:
+            self.stats.batches = self._batcher.batches_sent
+            self.stats.batched_plays = self._batcher.plays_batched
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "coalesced": self.stats.coalesced,
+            "hit_rate": round(self.stats.hit_rate, 3),
+            "batches": self.stats.batches,
+            "batched_plays": self.stats.batched_plays,
+            "cached_entries": len(self.cache),
+        }
@@ -76,6 +76,7 @@ class GeminiClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         timeout: float = 30.0,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize the Gemini client.
@@ -86,6 +87,7 @@ class GeminiClient:
             max_retries: Maximum retry attempts for transient errors.
             retry_delay: Base delay between retries (exponential backoff).
             timeout: Request timeout in seconds.
+            base_url: API root override (e.g. a local stub server for tests).
         """
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
@@ -98,6 +100,7 @@ class GeminiClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
 
         self._client: Optional[httpx.AsyncClient] = None
         self._total_tokens_used = 0
@@ -127,7 +130,7 @@ class GeminiClient:
     def _build_url(self, model: Optional[str] = None) -> str:
         """Build the API URL for the model."""
         m = model or self.model
-        return f"{self.BASE_URL}/models/{m}:generateContent?key={self.api_key}"
+        return f"{self.base_url}/models/{m}:generateContent?key={self.api_key}"
 
     def _build_request_body(
         self,
@@ -9,7 +9,12 @@ from dataclasses import dataclass
 from typing import Optional
 
 from .client import GeminiClient, GenerationResult, GeminiClientError
-from .prompts import build_play_by_play_prompt, build_color_prompt
+from .prompts import (
+    build_play_by_play_prompt,
+    build_color_prompt,
+    build_batch_play_by_play_prompt,
+    parse_batch_play_by_play,
+)
 from .schema import CommentaryContext, CommentaryGenerator
 
 
@@ -43,11 +48,13 @@ class GeminiCommentaryGenerator(CommentaryGenerator):
     PLAY_BY_PLAY_MAX_TOKENS = 100  # Short, punchy calls
     COLOR_TEMP = 0.85            # Higher for creative variety
     COLOR_MAX_TOKENS = 200       # Longer for narrative
+    BATCH_MAX_TOKENS_PER_PLAY = 60  # Batched calls share one response
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
+        client: Optional[GeminiClient] = None,
     ):
         """
         Initialize the generator.
@@ -55,8 +62,9 @@ class GeminiCommentaryGenerator(CommentaryGenerator):
         Args:
             api_key: Gemini API key. Defaults to GEMINI_API_KEY env var.
             model: Model to use. Defaults to gemini-2.0-flash-exp.
+            client: Preconfigured client (overrides api_key/model).
         """
-        self._client = GeminiClient(api_key=api_key, model=model)
+        self._client = client or GeminiClient(api_key=api_key, model=model)
         self._last_play_by_play: Optional[str] = None
 
     async def close(self):
@@ -110,9 +118,59 @@ class GeminiCommentaryGenerator(CommentaryGenerator):
             # Fallback to basic description
             return self._fallback_play_by_play(context)
 
+    async def generate_play_by_play_batch(
+        self,
+        contexts: list[CommentaryContext],
+    ) -> list[str]:
+        """
+        Generate play-by-play for several plays in one request.
+
+        Plays the model fails to return (or a failed request) fall back
+        to individual generation so every play still gets a call.
+
+        Args:
+            contexts: Commentary contexts, in play order.
+
+        Returns:
+            Play-by-play calls, aligned with contexts.
+        """
+        if len(contexts) == 1:
+            return [await self.generate_play_by_play(contexts[0])]
+
+        system_prompt, user_prompt = build_batch_play_by_play_prompt(contexts)
+        calls: dict[int, str] = {}
+
+        try:
+            result = await self._client.generate(
+                system=system_prompt,
+                user=user_prompt,
+                temperature=self.PLAY_BY_PLAY_TEMP,
+                max_tokens=self.BATCH_MAX_TOKENS_PER_PLAY * len(contexts),
+            )
+            calls = parse_batch_play_by_play(result.text, len(contexts))
+
+            logger.debug(
+                f"Batched play-by-play generated: {len(contexts)} plays, "
+                f"{result.latency_ms:.0f}ms, {result.total_tokens} tokens"
+            )
+
+        except GeminiClientError as e:
+            logger.error(f"Failed to generate batched play-by-play: {e}")
+
+        texts = []
+        for index, context in enumerate(contexts):
+            text = calls.get(index)
+            if text is None:
+                text = await self.generate_play_by_play(context)
+            texts.append(text)
+
+        self._last_play_by_play = texts[-1]
+        return texts
+
     async def generate_color(
         self,
         context: CommentaryContext,
+        play_by_play: Optional[str] = None,
     ) -> str:
         """
         Generate color commentary.
@@ -122,12 +180,13 @@ class GeminiCommentaryGenerator(CommentaryGenerator):
 
         Args:
             context: Full commentary context.
+            play_by_play: Call to build on. Defaults to the last one generated.
 
         Returns:
             Color commentary (2-4 sentences).
         """
         # Use cached play-by-play or generate one
-        play_by_play = self._last_play_by_play
+        play_by_play = play_by_play or self._last_play_by_play
         if not play_by_play:
             play_by_play = await self.generate_play_by_play(context)
 
@@ -5,6 +5,7 @@ Prompt templates and serialization functions for play-by-play and color commenta
 Uses Gemini Flash API for generation.
 """
 
+import re
 from typing import Optional
 
 from .schema import (
@@ -323,3 +324,62 @@ def build_color_prompt(
     user_lines.append("Generate color commentary (2-4 sentences):")
 
     return COLOR_COMMENTARY_SYSTEM, "\n".join(user_lines)
+
+
+def build_batch_play_by_play_prompt(
+    contexts: list[CommentaryContext],
+) -> tuple[str, str]:
+    """
+    Build a single prompt asking for play-by-play calls for several plays.
+
+    Used when auto-play outpaces the API: plays that queue up while a
+    request is in flight are sent together and the response is split
+    back out with parse_batch_play_by_play().
+
+    Returns:
+        tuple[str, str]: (system_prompt, user_prompt)
+    """
+    count = len(contexts)
+    user_lines = [
+        f"Call each of the following {count} plays separately.",
+        f"Respond with exactly {count} lines, one per play, each starting with "
+        "the play number in brackets, e.g. \"[1] Mahomes fires to Kelce...\".",
+    ]
+
+    for index, context in enumerate(contexts, start=1):
+        play = context.play
+        user_lines.append("")
+        user_lines.append(f"=== Play [{index}] ===")
+        user_lines.append(serialize_situation_for_prompt(play))
+        user_lines.append(serialize_play_for_prompt(play))
+
+    user_lines.append("")
+    user_lines.append(f"Generate {count} play-by-play calls:")
+
+    return PLAY_BY_PLAY_SYSTEM, "\n".join(user_lines)
+
+
+_BATCH_LINE = re.compile(r"^\s*\[(\d+)\]\s*(.+?)\s*$")
+
+
+def parse_batch_play_by_play(text: str, count: int) -> dict[int, str]:
+    """
+    Split a batched play-by-play response into per-play calls.
+
+    Args:
+        text: Raw model response.
+        count: Number of plays that were requested.
+
+    Returns:
+        Mapping of zero-based play index to call. Plays the model skipped
+        or numbered out of range are omitted so the caller can retry them.
+    """
+    calls: dict[int, str] = {}
+    for line in text.splitlines():
+        match = _BATCH_LINE.match(line)
+        if not match:
+            continue
+        index = int(match.group(1)) - 1
+        if 0 <= index < count and index not in calls:
+            calls[index] = match.group(2)
+    return calls
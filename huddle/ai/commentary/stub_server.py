@@ -0,0 +1,172 @@
+"""
+Local Gemini Stub Server
+
+Minimal HTTP server speaking the generateContent wire format so the
+client, cache and batching layers can be exercised without an API key.
+
+Usage:
+    with StubGeminiServer() as server:
+        client = GeminiClient(api_key="stub", base_url=server.base_url)
+        result = await client.generate(system="...", user="...")
+        assert server.request_count == 1
+
+Run standalone for manual testing against the frontend:
+    python -m huddle.ai.commentary.stub_server --port 8765
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+
+_BATCH_HEADER = re.compile(r"^=== Play \[(\d+)\] ===$", re.MULTILINE)
+
+
+def default_responder(system: str, user: str) -> str:
+    """
+    Canned responses: one numbered line per play for batched prompts,
+    a single sentence otherwise.
+    """
+    numbers = _BATCH_HEADER.findall(user)
+    if numbers:
+        return "\n".join(f"[{n}] Stub call for play {n}." for n in numbers)
+    return "Stub commentary."
+
+
+@dataclass
+class StubRequest:
+    """A request received by the stub server."""
+    model: str
+    system: str
+    user: str
+    body: dict = field(default_factory=dict)
+
+
+class StubGeminiServer:
+    """
+    Threaded stub of the Gemini generateContent endpoint.
+
+    Args:
+        responder: Maps (system, user) prompts to response text.
+        latency: Seconds to sleep before responding (simulates API latency).
+        status_code: HTTP status to return (use 429/500 to test retries).
+        host: Interface to bind.
+        port: Port to bind (0 picks a free port).
+    """
+
+    def __init__(
+        self,
+        responder: Callable[[str, str], str] = default_responder,
+        latency: float = 0.0,
+        status_code: int = 200,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.responder = responder
+        self.latency = latency
+        self.status_code = status_code
+        self.requests: list[StubRequest] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.requests)
+
+    def start(self) -> "StubGeminiServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StubGeminiServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _record(self, request: StubRequest) -> None:
+        with self._lock:
+            self.requests.append(request)
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                # Path looks like /models/{model}:generateContent?key=...
+                model = self.path.split("/models/", 1)[-1].split(":", 1)[0]
+                system = body.get("system_instruction", {}).get("parts", [{}])[0].get("text", "")
+                user = body.get("contents", [{}])[0].get("parts", [{}])[0].get("text", "")
+                stub._record(StubRequest(model=model, system=system, user=user, body=body))
+
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                if stub.status_code != 200:
+                    payload = {"error": {"code": stub.status_code, "message": "stub error"}}
+                else:
+                    text = stub.responder(system, user)
+                    prompt_tokens = (len(system) + len(user)) // 4
+                    completion_tokens = len(text) // 4
+                    payload = {
+                        "candidates": [{"content": {"parts": [{"text": text}]}}],
+                        "usageMetadata": {
+                            "promptTokenCount": prompt_tokens,
+                            "candidatesTokenCount": completion_tokens,
+                            "totalTokenCount": prompt_tokens + completion_tokens,
+                        },
+                    }
+
+                data = json.dumps(payload).encode()
+                self.send_response(stub.status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Gemini API stub")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubGeminiServer(latency=args.latency, port=args.port)
+    print(f"Gemini stub listening on {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
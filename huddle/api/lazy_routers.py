@@ -0,0 +1,77 @@
+"""Lazy router mounting.
+
+Importing every router at startup pulls in the play simulators, Pillow and
+the historical simulation stack before the first request is served, and
+autoscaled containers pay that on every cold start. Routers registered
+here are imported and included the first time a request reaches their
+prefix instead.
+
+    app.state.lazy_routers = [LazyRouter("/api/v1/games", "huddle.api.routers.games", "/api/v1")]
+    app.add_middleware(LazyRouterMiddleware, target=app)
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+@dataclass(frozen=True)
+class LazyRouter:
+    """
+    A router module mounted on first use.
+
+    Attributes:
+        path: URL prefix whose first request triggers the import
+        module: Dotted path of the module defining ``router``
+        prefix: Prefix passed to ``include_router``
+    """
+    path: str
+    module: str
+    prefix: str = ""
+
+    def matches(self, path: str) -> bool:
+        return path == self.path or path.startswith(self.path + "/")
+
+
+def mount_lazy_routers(app: FastAPI, path: Optional[str] = None) -> int:
+    """
+    Include the pending routers of ``app`` that serve ``path``.
+
+    Args:
+        app: Application whose ``state.lazy_routers`` lists pending routers
+        path: Request path; None mounts everything still pending
+
+    Returns:
+        Number of routers mounted
+    """
+    pending = getattr(app.state, "lazy_routers", None)
+    if not pending:
+        return 0
+
+    due = [r for r in pending if path is None or r.matches(path)]
+    for lazy in due:
+        module = importlib.import_module(lazy.module)
+        app.include_router(module.router, prefix=lazy.prefix)
+        pending.remove(lazy)
+    if due:
+        app.openapi_schema = None  # Regenerate with the new routes
+    return len(due)
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that mounts lazy routers ahead of their first request."""
+
+    def __init__(self, app: ASGIApp, target: FastAPI) -> None:
+        self.app = app
+        self.target = target
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        pending = getattr(self.target.state, "lazy_routers", None)
+        if pending and scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            # The schema describes every route, so it needs them all
+            mount_lazy_routers(self.target, None if path == self.target.openapi_url else path)
+        await self.app(scope, receive, send)
@@ -1,6 +1,7 @@
 """FastAPI application for Huddle football simulator."""
 
 import asyncio
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -9,42 +10,46 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 
-from huddle.api.routers import (
-    games_router,
-    pocket_router,
-    routes_router,
-    team_routes_router,
-    play_sim_router,
-    integrated_sim_router,
-    sandbox_router,
-    sandbox_websocket_router,
-    teams_router,
-    websocket_router,
-    management_router,
-    management_websocket_router,
-    v2_sim_router,
-    agentmail_router,
-    agentmail_websocket_router,
-    portraits_router,
-    history_router,
-    free_agency_router,
-    position_plan_router,
-    coach_mode_router,
-)
-from huddle.api.routers.admin import router as admin_router
-from huddle.api.routers.arms_prototype import router as arms_prototype_router
+from huddle.api.lazy_routers import LazyRouter, LazyRouterMiddleware
+
+_ROUTERS = "huddle.api.routers"
+
+# Routers are imported on the first request to their path, not at startup
+LAZY_ROUTERS = [
+    LazyRouter("/api/v1/games", f"{_ROUTERS}.games", "/api/v1"),
+    LazyRouter("/api/v1/teams", f"{_ROUTERS}.teams", "/api/v1"),
+    LazyRouter("/api/v1/sandbox", f"{_ROUTERS}.sandbox", "/api/v1"),
+    LazyRouter("/api/v1/pocket", f"{_ROUTERS}.pocket", "/api/v1"),
+    LazyRouter("/api/v1/routes", f"{_ROUTERS}.routes", "/api/v1"),
+    LazyRouter("/api/v1/team-routes", f"{_ROUTERS}.team_routes", "/api/v1"),
+    LazyRouter("/api/v1/play-sim", f"{_ROUTERS}.play_sim", "/api/v1"),
+    LazyRouter("/api/v1/integrated-sim", f"{_ROUTERS}.integrated_sim", "/api/v1"),
+    LazyRouter("/api/v1/management", f"{_ROUTERS}.management", "/api/v1/management"),
+    LazyRouter("/api/v1/admin", f"{_ROUTERS}.admin", "/api/v1"),
+    LazyRouter("/api/v1/v2-sim", f"{_ROUTERS}.v2_sim", "/api/v1"),
+    LazyRouter("/api/v1/agentmail", f"{_ROUTERS}.agentmail", "/api/v1"),  # Agent communication
+    LazyRouter("/api/v1/portraits", f"{_ROUTERS}.portraits", "/api/v1"),  # Player portraits
+    LazyRouter("/api/v1/history", f"{_ROUTERS}.history", "/api/v1"),  # Historical sim explorer
+    LazyRouter("/api/v1/free-agency", f"{_ROUTERS}.free_agency", "/api/v1"),  # Free agency bidding
+    LazyRouter("/api/v1/position-plan", f"{_ROUTERS}.position_plan", "/api/v1"),  # HC09 planning
+    LazyRouter("/api/v1/arms-prototype", f"{_ROUTERS}.arms_prototype", "/api/v1"),
+    LazyRouter("/api/v1/coach", f"{_ROUTERS}.coach_mode", "/api/v1"),  # Coach mode game interface
+    LazyRouter("/ws/games", f"{_ROUTERS}.websocket"),
+    LazyRouter("/ws/sandbox", f"{_ROUTERS}.sandbox_websocket"),
+    LazyRouter("/ws/management", f"{_ROUTERS}.management_websocket"),
+    LazyRouter("/ws/agentmail", f"{_ROUTERS}.agentmail_websocket"),
+]
 
 
 async def _cleanup_expired_sessions_task():
     """Periodic cleanup of expired game sessions."""
     while True:
         await asyncio.sleep(300)  # Every 5 minutes
-        try:
-            from huddle.api.routers.coach_mode import _game_sessions
-            if hasattr(_game_sessions, 'cleanup_expired'):
-                _game_sessions.cleanup_expired()
-        except ImportError:
-            pass  # Module not loaded yet
+        coach_mode = sys.modules.get("huddle.api.routers.coach_mode")
+        if coach_mode is None:
+            continue  # Router not mounted yet, so no sessions to expire
+        if hasattr(coach_mode._game_sessions, 'cleanup_expired'):
+            coach_mode._game_sessions.cleanup_expired()
 
 
 @asynccontextmanager
@@ -99,29 +104,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Include routers
-    app.include_router(games_router, prefix="/api/v1")
-    app.include_router(teams_router, prefix="/api/v1")
-    app.include_router(sandbox_router, prefix="/api/v1")
-    app.include_router(pocket_router, prefix="/api/v1")
-    app.include_router(routes_router, prefix="/api/v1")
-    app.include_router(team_routes_router, prefix="/api/v1")
-    app.include_router(play_sim_router, prefix="/api/v1")
-    app.include_router(integrated_sim_router, prefix="/api/v1")
-    app.include_router(management_router, prefix="/api/v1/management")
-    app.include_router(admin_router, prefix="/api/v1")
-    app.include_router(v2_sim_router, prefix="/api/v1")
-    app.include_router(agentmail_router, prefix="/api/v1")  # Agent communication
-    app.include_router(portraits_router, prefix="/api/v1")  # Player portraits
-    app.include_router(history_router, prefix="/api/v1")  # Historical simulation explorer
-    app.include_router(free_agency_router, prefix="/api/v1")  # Free agency bidding
-    app.include_router(position_plan_router, prefix="/api/v1")  # HC09-style position planning
-    app.include_router(arms_prototype_router, prefix="/api/v1")  # Arms prototype visualization
-    app.include_router(coach_mode_router, prefix="/api/v1")  # Coach mode game interface
-    app.include_router(websocket_router)
-    app.include_router(sandbox_websocket_router)
-    app.include_router(management_websocket_router)
-    app.include_router(agentmail_websocket_router)
+    # Routers mount on first request; see huddle.api.lazy_routers
+    app.state.lazy_routers = list(LAZY_ROUTERS)
+    app.add_middleware(LazyRouterMiddleware, target=app)
 
     return app
 
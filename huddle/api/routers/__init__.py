@@ -1,25 +1,41 @@
-"""API routers for different resource types."""
+"""API routers for different resource types.
+
+Router modules import on first attribute access so that importing one
+router does not pull in all the others.
+"""
+
+import importlib
+
+_ROUTER_MODULES = {
+    "games_router": "games",
+    "pocket_router": "pocket",
+    "routes_router": "routes",
+    "team_routes_router": "team_routes",
+    "sandbox_router": "sandbox",
+    "sandbox_websocket_router": "sandbox_websocket",
+    "teams_router": "teams",
+    "websocket_router": "websocket",
+    "management_router": "management",
+    "management_websocket_router": "management_websocket",
+    "play_sim_router": "play_sim",
+    "integrated_sim_router": "integrated_sim",
+    "v2_sim_router": "v2_sim",
+    "agentmail_router": "agentmail",
+    "agentmail_websocket_router": "agentmail_websocket",
+    "portraits_router": "portraits",
+    "history_router": "history",
+    "free_agency_router": "free_agency",
+    "position_plan_router": "position_plan",
+    "coach_mode_router": "coach_mode",
+}
+
+
+def __getattr__(name: str):
+    if name in _ROUTER_MODULES:
+        module = importlib.import_module(f"{__name__}.{_ROUTER_MODULES[name]}")
+        return module.router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from huddle.api.routers.games import router as games_router
-from huddle.api.routers.pocket import router as pocket_router
-from huddle.api.routers.routes import router as routes_router
-from huddle.api.routers.team_routes import router as team_routes_router
-from huddle.api.routers.sandbox import router as sandbox_router
-from huddle.api.routers.sandbox_websocket import router as sandbox_websocket_router
-from huddle.api.routers.teams import router as teams_router
-from huddle.api.routers.websocket import router as websocket_router
-from huddle.api.routers.management import router as management_router
-from huddle.api.routers.management_websocket import router as management_websocket_router
-from huddle.api.routers.play_sim import router as play_sim_router
-from huddle.api.routers.integrated_sim import router as integrated_sim_router
-from huddle.api.routers.v2_sim import router as v2_sim_router
-from huddle.api.routers.agentmail import router as agentmail_router
-from huddle.api.routers.agentmail_websocket import router as agentmail_websocket_router
-from huddle.api.routers.portraits import router as portraits_router
-from huddle.api.routers.history import router as history_router
-from huddle.api.routers.free_agency import router as free_agency_router
-from huddle.api.routers.position_plan import router as position_plan_router
-from huddle.api.routers.coach_mode import router as coach_mode_router
 
 __all__ = [
     "games_router",
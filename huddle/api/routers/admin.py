@@ -426,6 +426,9 @@ def _generate_league_sync(request: GenerateLeagueRequest) -> League:
             parity_mode=request.parity_mode,
         )
 
+    # Keep full GameLogs so /games/{id}/plays can serve play-by-play
+    league.retain_game_logs = True
+
     # Always auto-fill depth charts for normal generation
     for team in league.teams.values():
         team.roster.auto_fill_depth_chart()
@@ -434,8 +437,7 @@ def _generate_league_sync(request: GenerateLeagueRequest) -> League:
     if request.fantasy_draft:
         # Clear all team rosters
         for team in league.teams.values():
-            team.roster.players.clear()
-            team.roster.depth_chart.slots.clear()
+            team.roster.clear()
 
         # Generate large player pool (10 years of draft classes for variety)
         all_players = []
@@ -1753,8 +1755,7 @@ async def create_draft(request: CreateDraftRequest) -> DraftStateResponse:
 
         # Clear rosters for fantasy draft
         for team in _active_league.teams.values():
-            team.roster.players.clear()
-            team.roster.depth_chart.slots.clear()
+            team.roster.clear()
     else:
         # NFL draft - use draft class and standings-based order
         if not _active_league.draft_class:
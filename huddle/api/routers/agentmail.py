@@ -24,6 +24,8 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
+from huddle.api.services.agentmail_index import AgentMailIndex
+
 router = APIRouter(prefix="/agentmail", tags=["agentmail"])
 
 # Base path to agentmail folder
@@ -778,18 +780,7 @@ def _get_next_note_number(notes_dir: Path) -> str:
         notes_dir.mkdir(parents=True, exist_ok=True)
         return "001"
 
-    existing = list(notes_dir.glob("*.md"))
-    if not existing:
-        return "001"
-
-    numbers = []
-    for f in existing:
-        match = re.match(r"^(\d+)", f.name)
-        if match:
-            numbers.append(int(match.group(1)))
-
-    next_num = max(numbers) + 1 if numbers else 1
-    return f"{next_num:03d}"
+    return agentmail_index.next_number(notes_dir.parent.name, "notes")
 
 
 def _get_next_message_number(agent_dir: Path, direction: str) -> str:
@@ -799,18 +790,7 @@ def _get_next_message_number(agent_dir: Path, direction: str) -> str:
         folder.mkdir(parents=True, exist_ok=True)
         return "001"
 
-    existing = list(folder.glob("*.md"))
-    if not existing:
-        return "001"
-
-    numbers = []
-    for f in existing:
-        match = re.match(r"^(\d+)", f.name)
-        if match:
-            numbers.append(int(match.group(1)))
-
-    next_num = max(numbers) + 1 if numbers else 1
-    return f"{next_num:03d}"
+    return agentmail_index.next_number(agent_dir.name, direction)
 
 
 def _slugify(text: str) -> str:
@@ -820,6 +800,40 @@ def _slugify(text: str) -> str:
     return slug[:50]
 
 
+# In-memory index of parsed agentmail files (see services/agentmail_index.py)
+agentmail_index = AgentMailIndex(
+    AGENTMAIL_PATH,
+    parse_message=parse_message_file,
+    parse_status=parse_status_file,
+    parse_tuning_note=parse_tuning_note,
+    parse_agent_note=parse_agent_note,
+)
+
+
+def _write_markdown(filepath: Path, content: str) -> None:
+    """Write an agentmail markdown file and update the index."""
+    filepath.write_text(content)
+    agentmail_index.update_path(filepath)
+
+
+def _delete_markdown(filepath: Path) -> None:
+    """Delete an agentmail markdown file and update the index."""
+    filepath.unlink()
+    agentmail_index.update_path(filepath)
+
+
+def _dedupe_messages(messages: list[Message]) -> list[Message]:
+    """Drop copies of the same message delivered to several inboxes (CC, mentions)."""
+    seen = set()
+    unique_messages = []
+    for msg in messages:
+        key = (msg.from_agent, msg.to_agent, msg.subject, msg.date)
+        if key not in seen:
+            seen.add(key)
+            unique_messages.append(msg)
+    return unique_messages
+
+
 def _get_agent_info(agent_name: str) -> Optional[AgentInfo]:
     """Get info about an agent."""
     agent_dir = AGENTMAIL_PATH / agent_name
@@ -853,12 +867,10 @@ def _get_agent_info(agent_name: str) -> Optional[AgentInfo]:
             pass
 
     # Check status file for role
-    status_file = AGENTMAIL_PATH / "status" / f"{agent_name}_status.md"
-    has_status = status_file.exists()
+    status = agentmail_index.status(agent_name)
+    has_status = status is not None
     if has_status and not role:
-        status = parse_status_file(status_file)
-        if status:
-            role = status.role
+        role = status.role
 
     # Count messages - will be updated after all messages are parsed
     # (set to 0 here, actual count based on To/From fields computed in dashboard)
@@ -867,10 +879,9 @@ def _get_agent_info(agent_name: str) -> Optional[AgentInfo]:
 
     # Get last active (most recent file modification)
     last_active = None
-    all_files = list(agent_dir.rglob("*.md"))
-    if all_files:
-        most_recent = max(all_files, key=lambda f: f.stat().st_mtime)
-        last_active = datetime.fromtimestamp(most_recent.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
+    last_modified = agentmail_index.last_modified(agent_name)
+    if last_modified is not None:
+        last_active = datetime.fromtimestamp(last_modified).strftime("%Y-%m-%d %H:%M")
 
     return AgentInfo(
         name=agent_name,
@@ -914,57 +925,31 @@ async def get_dashboard_data(include_archived: bool = False):
             if info:
                 agents.append(info)
 
-            # Parse messages
-            to_dir = agent_dir / "to"
-            if to_dir.exists():
-                for msg_file in to_dir.glob("*.md"):
-                    msg = parse_message_file(msg_file, agent_dir.name, "to")
-                    if msg:
-                        messages.append(msg)
-                        # Also track as task if type is task
-                        if msg.type == "task":
-                            tasks.append(Task(
-                                id=msg.id,
-                                filename=msg.filename,
-                                from_agent=msg.from_agent,
-                                to_agent=msg.to_agent,
-                                title=msg.subject,
-                                description=msg.preview,
-                                date_created=msg.date,
-                                priority="medium",
-                                status="pending"
-                            ))
-
-            # Note: We intentionally skip `from/` folders here.
-            # The `from/` folder contains sender's archival copies which don't have
-            # updated status fields. The canonical message state lives in the
-            # recipient's `to/` folder only.
-
-    # Parse status files
-    status_path = AGENTMAIL_PATH / "status"
-    if status_path.exists():
-        for status_file in status_path.glob("*_status.md"):
-            status = parse_status_file(status_file)
-            if status:
-                agent_statuses.append(status)
-
-    # Parse tuning notes
-    tuning_path = AGENTMAIL_PATH / "tuning_notes"
-    if tuning_path.exists():
-        for note_file in tuning_path.glob("*.md"):
-            note = parse_tuning_note(note_file)
-            if note:
-                tuning_notes.append(note)
+    # Note: We intentionally skip `from/` folders here.
+    # The `from/` folder contains sender's archival copies which don't have
+    # updated status fields. The canonical message state lives in the
+    # recipient's `to/` folder only.
+    messages = agentmail_index.messages("to")
+    for msg in messages:
+        # Also track as task if type is task
+        if msg.type == "task":
+            tasks.append(Task(
+                id=msg.id,
+                filename=msg.filename,
+                from_agent=msg.from_agent,
+                to_agent=msg.to_agent,
+                title=msg.subject,
+                description=msg.preview,
+                date_created=msg.date,
+                priority="medium",
+                status="pending"
+            ))
+
+    agent_statuses = agentmail_index.statuses()
+    tuning_notes = agentmail_index.tuning_notes()
 
     # Deduplicate messages by content (same from+to+subject+date = duplicate)
-    seen = set()
-    unique_messages = []
-    for msg in messages:
-        key = (msg.from_agent, msg.to_agent, msg.subject, msg.date)
-        if key not in seen:
-            seen.add(key)
-            unique_messages.append(msg)
-    messages = unique_messages
+    messages = _dedupe_messages(messages)
 
     # Count archived messages before filtering
     archived_count = len([m for m in messages if m.archived])
@@ -1097,7 +1082,7 @@ async def create_agent(request: CreateAgentRequest):
 ## COORDINATION NOTES
 - Newly created agent - awaiting first tasks
 """
-    (status_dir / f"{request.name}_status.md").write_text(status_content)
+    _write_markdown(status_dir / f"{request.name}_status.md", status_content)
 
     return OperationResponse(
         success=True,
@@ -1125,11 +1110,12 @@ async def delete_agent(agent_name: str, confirm: bool = Query(False)):
 
     # Remove agent directory
     shutil.rmtree(agent_dir)
+    agentmail_index.remove_tree(agent_dir)
 
     # Remove status file if exists
     status_file = AGENTMAIL_PATH / "status" / f"{agent_name}_status.md"
     if status_file.exists():
-        status_file.unlink()
+        _delete_markdown(status_file)
 
     return OperationResponse(
         success=True,
@@ -1149,13 +1135,9 @@ async def get_agent(agent_name: str):
 @router.get("/agents/{agent_name}/status", response_model=AgentStatus)
 async def get_agent_status(agent_name: str):
     """Get an agent's full status (parsed)."""
-    status_file = AGENTMAIL_PATH / "status" / f"{agent_name}_status.md"
-    if not status_file.exists():
-        raise HTTPException(status_code=404, detail=f"No status file for agent '{agent_name}'")
-
-    status = parse_status_file(status_file)
+    status = agentmail_index.status(agent_name)
     if not status:
-        raise HTTPException(status_code=500, detail="Failed to parse status file")
+        raise HTTPException(status_code=404, detail=f"No status file for agent '{agent_name}'")
     return status
 
 
@@ -1227,25 +1209,13 @@ async def get_message(message_id: str, render: bool = Query(False)):
     if not msg_dir.exists():
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' {direction} folder not found")
 
-    # Look for file starting with the message number
-    msg_file = None
-    for f in msg_dir.glob(f"{msg_num}_*.md"):
-        msg_file = f
-        break
-
-    if not msg_file:
-        raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
-
-    # Parse the message
-    msg = parse_message_file(msg_file, agent_name, direction)
+    # Look up the parsed message by number
+    msg = agentmail_index.get_message(agent_name, direction, msg_num)
     if not msg:
-        raise HTTPException(status_code=500, detail="Failed to parse message file")
+        raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
 
     result = msg.model_dump()
 
-    # Add full content
-    result["content"] = msg_file.read_text()
-
     if render and result.get("content"):
         # Simple markdown to HTML (basic conversion)
         import html
@@ -1298,35 +1268,25 @@ async def get_agent_inbox(agent_name: str, include_content: bool = False, includ
     if not _ensure_agent_exists(agent_name):
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
-    to_dir = AGENTMAIL_PATH / agent_name / "to"
     messages = []
     seen_ids = set()
 
     # Direct inbox messages
-    if to_dir.exists():
-        for msg_file in sorted(to_dir.glob("*.md"), reverse=True):
-            msg = parse_message_file(msg_file, agent_name, "to")
-            if msg:
+    for msg in agentmail_index.folder_messages(agent_name, "to"):
+        if not include_content:
+            msg.content = None
+        messages.append(msg)
+        seen_ids.add(msg.id)
+
+    # Also include messages where this agent is CC'd
+    if include_cc:
+        for msg in agentmail_index.cc_messages(agent_name):
+            if msg.id not in seen_ids:
                 if not include_content:
                     msg.content = None
                 messages.append(msg)
                 seen_ids.add(msg.id)
 
-    # Also include messages where this agent is CC'd
-    if include_cc:
-        for agent_dir in AGENTMAIL_PATH.iterdir():
-            if not agent_dir.is_dir() or agent_dir.name in ["status", "notes", agent_name]:
-                continue
-            other_to_dir = agent_dir / "to"
-            if other_to_dir.exists():
-                for msg_file in other_to_dir.glob("*.md"):
-                    msg = parse_message_file(msg_file, agent_dir.name, "to")
-                    if msg and msg.id not in seen_ids and msg.cc and agent_name in msg.cc:
-                        if not include_content:
-                            msg.content = None
-                        messages.append(msg)
-                        seen_ids.add(msg.id)
-
     # Sort by date descending
     messages.sort(key=lambda m: m.date, reverse=True)
 
@@ -1347,16 +1307,10 @@ async def get_agent_outbox(agent_name: str, include_content: bool = False):
     if not _ensure_agent_exists(agent_name):
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
-    from_dir = AGENTMAIL_PATH / agent_name / "from"
-    messages = []
-
-    if from_dir.exists():
-        for msg_file in sorted(from_dir.glob("*.md"), reverse=True):
-            msg = parse_message_file(msg_file, agent_name, "from")
-            if msg:
-                if not include_content:
-                    msg.content = None
-                messages.append(msg)
+    messages = agentmail_index.folder_messages(agent_name, "from")
+    if not include_content:
+        for msg in messages:
+            msg.content = None
 
     return messages
 
@@ -1475,11 +1429,11 @@ async def send_message(request: SendMessageRequest):
 
     # Write to recipient inbox
     recipient_path = recipient_to / filename
-    recipient_path.write_text(full_content)
+    _write_markdown(recipient_path, full_content)
 
     # Write to sender outbox
     if sender_from:
-        (sender_from / filename).write_text(full_content)
+        _write_markdown(sender_from / filename, full_content)
 
     # Write to CC'd agents' inboxes
     if request.cc:
@@ -1487,7 +1441,7 @@ async def send_message(request: SendMessageRequest):
             if cc_agent != request.from_agent and _ensure_agent_exists(cc_agent):
                 cc_dir = AGENTMAIL_PATH / cc_agent / "to"
                 cc_dir.mkdir(parents=True, exist_ok=True)
-                (cc_dir / filename).write_text(full_content)
+                _write_markdown(cc_dir / filename, full_content)
 
     # Write to mentioned agents' inboxes (like CC but triggered by @ in body)
     if mentions:
@@ -1495,7 +1449,7 @@ async def send_message(request: SendMessageRequest):
             if _ensure_agent_exists(mentioned_agent):
                 mention_dir = AGENTMAIL_PATH / mentioned_agent / "to"
                 mention_dir.mkdir(parents=True, exist_ok=True)
-                (mention_dir / filename).write_text(full_content)
+                _write_markdown(mention_dir / filename, full_content)
 
     return SendMessageResponse(
         success=True,
@@ -1535,7 +1489,7 @@ async def update_message_status(request: UpdateMessageStatusRequest):
         raise HTTPException(status_code=404, detail=f"Agent directory not found")
 
     # Find file starting with the message number
-    matching_files = list(agent_dir.glob(f"{msg_num}_*.md"))
+    matching_files = agentmail_index.message_files(agent_name, direction, msg_num)
     if not matching_files:
         raise HTTPException(status_code=404, detail=f"Message not found")
 
@@ -1580,7 +1534,7 @@ async def update_message_status(request: UpdateMessageStatusRequest):
         update_note = f"\n\n---\n**Status Update ({today}):** {request.notes}"
         content += update_note
 
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -1614,7 +1568,7 @@ async def archive_message(request: ArchiveMessageRequest):
         raise HTTPException(status_code=404, detail=f"Agent directory not found")
 
     # Find file starting with the message number
-    matching_files = list(agent_dir.glob(f"{msg_num}_*.md"))
+    matching_files = agentmail_index.message_files(agent_name, direction, msg_num)
     if not matching_files:
         raise HTTPException(status_code=404, detail=f"Message not found")
 
@@ -1671,7 +1625,7 @@ async def archive_message(request: ArchiveMessageRequest):
         # Remove archived_at when unarchiving
         content = re.sub(r"\*\*Archived-At:\*\*\s*.+\n?", "", content)
 
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -1751,7 +1705,7 @@ async def update_message_routing(request: UpdateMessageRoutingRequest):
     if not agent_dir.exists():
         raise HTTPException(status_code=404, detail="Agent directory not found")
 
-    matching_files = list(agent_dir.glob(f"{msg_num}_*.md"))
+    matching_files = agentmail_index.message_files(agent_name, direction, msg_num)
     if not matching_files:
         raise HTTPException(status_code=404, detail="Message not found")
 
@@ -1796,7 +1750,7 @@ async def update_message_routing(request: UpdateMessageRoutingRequest):
                 flags=re.MULTILINE
             )
 
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -1829,7 +1783,7 @@ async def update_message_threading(request: UpdateMessageThreadingRequest):
     if not agent_dir.exists():
         raise HTTPException(status_code=404, detail="Agent directory not found")
 
-    matching_files = list(agent_dir.glob(f"{msg_num}_*.md"))
+    matching_files = agentmail_index.message_files(agent_name, direction, msg_num)
     if not matching_files:
         raise HTTPException(status_code=404, detail="Message not found")
 
@@ -1845,13 +1799,9 @@ async def update_message_threading(request: UpdateMessageThreadingRequest):
             target_agent = "_".join(target_parts[:-2])
             target_direction = target_parts[-2]
             target_num = target_parts[-1]
-            target_dir = AGENTMAIL_PATH / target_agent / target_direction
-            target_files = list(target_dir.glob(f"{target_num}_*.md"))
-            if target_files:
-                target_content = target_files[0].read_text()
-                thread_match = re.search(r"\*\*Thread(?:-ID)?:\*\*\s*(.+)", target_content)
-                if thread_match:
-                    thread_id = thread_match.group(1).strip()
+            target_msg = agentmail_index.get_message(target_agent, target_direction, target_num)
+            if target_msg and target_msg.thread_id:
+                thread_id = target_msg.thread_id
 
         # If still no thread_id, use the target message id as thread root
         if not thread_id:
@@ -1888,7 +1838,7 @@ async def update_message_threading(request: UpdateMessageThreadingRequest):
             content
         )
 
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -1926,11 +1876,11 @@ async def get_message_participants(message_id: str):
     if not agent_dir.exists():
         raise HTTPException(status_code=404, detail="Agent directory not found")
 
-    matching_files = list(agent_dir.glob(f"{msg_num}_*.md"))
+    matching_files = agentmail_index.message_files(agent_name, direction, msg_num)
     if not matching_files:
         raise HTTPException(status_code=404, detail="Message not found")
 
-    msg = parse_message_file(matching_files[0], agent_name, direction)
+    msg = agentmail_index.get_message(agent_name, direction, msg_num)
     if not msg:
         raise HTTPException(status_code=404, detail="Could not parse message")
 
@@ -1943,20 +1893,11 @@ async def get_message_participants(message_id: str):
     # If in a thread, get all thread participants
     thread_id = msg.thread_id
     if thread_id:
-        # Scan all agents for messages in this thread
-        for agent_dir in AGENTMAIL_PATH.iterdir():
-            if not agent_dir.is_dir() or agent_dir.name in ["status", "notes"]:
-                continue
-            for subdir in ["to", "from"]:
-                subdir_path = agent_dir / subdir
-                if subdir_path.exists():
-                    for msg_file in subdir_path.glob("*.md"):
-                        thread_msg = parse_message_file(msg_file, agent_dir.name, subdir)
-                        if thread_msg and thread_msg.thread_id == thread_id:
-                            participants.add(thread_msg.from_agent)
-                            participants.add(thread_msg.to_agent)
-                            if thread_msg.cc:
-                                participants.update(thread_msg.cc)
+        for thread_msg in agentmail_index.thread_messages(thread_id):
+            participants.add(thread_msg.from_agent)
+            participants.add(thread_msg.to_agent)
+            if thread_msg.cc:
+                participants.update(thread_msg.cc)
 
     return {
         "message_id": message_id,
@@ -1989,8 +1930,8 @@ async def update_agent_status(request: UpdateStatusRequest):
     role = request.role or "Agent role not specified"
 
     # Try to preserve existing role if not specified
-    if not request.role and status_file.exists():
-        existing = parse_status_file(status_file)
+    if not request.role:
+        existing = agentmail_index.status(request.agent_name)
         if existing and existing.role:
             role = existing.role
 
@@ -2047,7 +1988,7 @@ async def update_agent_status(request: UpdateStatusRequest):
     else:
         content += "- No active coordination\n"
 
-    status_file.write_text(content)
+    _write_markdown(status_file, content)
 
     return OperationResponse(
         success=True,
@@ -2063,16 +2004,10 @@ async def update_agent_status(request: UpdateStatusRequest):
 @router.get("/tuning-notes", response_model=list[TuningNote])
 async def get_tuning_notes(include_content: bool = False):
     """Get all tuning notes."""
-    tuning_dir = AGENTMAIL_PATH / "tuning_notes"
-    notes = []
-
-    if tuning_dir.exists():
-        for note_file in sorted(tuning_dir.glob("*.md")):
-            note = parse_tuning_note(note_file)
-            if note:
-                if not include_content:
-                    note.content = None
-                notes.append(note)
+    notes = agentmail_index.tuning_notes()
+    if not include_content:
+        for note in notes:
+            note.content = None
 
     return notes
 
@@ -2080,11 +2015,8 @@ async def get_tuning_notes(include_content: bool = False):
 @router.get("/tuning-notes/{note_id}")
 async def get_tuning_note(note_id: str):
     """Get a specific tuning note with full content."""
-    tuning_dir = AGENTMAIL_PATH / "tuning_notes"
-
-    for note_file in tuning_dir.glob(f"{note_id}_*.md"):
-        note = parse_tuning_note(note_file)
-        if note:
+    for note in agentmail_index.tuning_notes():
+        if note.filename.startswith(f"{note_id}_"):
             return note
 
     raise HTTPException(status_code=404, detail="Tuning note not found")
@@ -2100,16 +2032,10 @@ async def add_tuning_note(request: AddTuningNoteRequest):
     tuning_dir.mkdir(parents=True, exist_ok=True)
 
     # Get next number
-    existing = list(tuning_dir.glob("*.md"))
-    numbers = []
-    for f in existing:
-        match = re.match(r"^(\d+)", f.name)
-        if match:
-            numbers.append(int(match.group(1)))
-    next_num = max(numbers) + 1 if numbers else 1
+    next_num = agentmail_index.next_number("", "tuning_notes")
 
     slug = _slugify(request.topic)
-    filename = f"{next_num:03d}_{slug}.md"
+    filename = f"{next_num}_{slug}.md"
     today = datetime.now().strftime("%Y-%m-%d")
 
     content = f"""# {request.topic}
@@ -2123,7 +2049,7 @@ async def add_tuning_note(request: AddTuningNoteRequest):
 """
 
     filepath = tuning_dir / filename
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -2142,16 +2068,10 @@ async def get_agent_notes(agent_name: str, include_content: bool = False):
     if not _ensure_agent_exists(agent_name):
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
-    notes_dir = AGENTMAIL_PATH / agent_name / "notes"
-    notes = []
-
-    if notes_dir.exists():
-        for note_file in sorted(notes_dir.glob("*.md")):
-            note = parse_agent_note(note_file, agent_name)
-            if note:
-                if not include_content:
-                    note.content = None
-                notes.append(note)
+    notes = agentmail_index.agent_notes(agent_name)
+    if not include_content:
+        for note in notes:
+            note.content = None
 
     return notes
 
@@ -2162,19 +2082,16 @@ async def get_agent_note(agent_name: str, note_id: str):
     if not _ensure_agent_exists(agent_name):
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
-    notes_dir = AGENTMAIL_PATH / agent_name / "notes"
+    notes = agentmail_index.agent_notes(agent_name)
 
     # Try exact match first
-    note_file = notes_dir / f"{note_id}.md"
-    if note_file.exists():
-        note = parse_agent_note(note_file, agent_name)
-        if note:
+    for note in notes:
+        if note.id == note_id:
             return note
 
     # Try prefix match
-    for note_file in notes_dir.glob(f"{note_id}*.md"):
-        note = parse_agent_note(note_file, agent_name)
-        if note:
+    for note in notes:
+        if note.id.startswith(note_id):
             return note
 
     raise HTTPException(status_code=404, detail=f"Note '{note_id}' not found for agent '{agent_name}'")
@@ -2214,7 +2131,7 @@ async def add_agent_note(agent_name: str, request: CreateAgentNoteRequest):
 """
 
     filepath = notes_dir / filename
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -2234,12 +2151,12 @@ async def delete_agent_note(agent_name: str, note_id: str):
     # Try exact match first
     note_file = notes_dir / f"{note_id}.md"
     if note_file.exists():
-        note_file.unlink()
+        _delete_markdown(note_file)
         return OperationResponse(success=True, message=f"Note '{note_id}' deleted")
 
     # Try prefix match
     for note_file in notes_dir.glob(f"{note_id}*.md"):
-        note_file.unlink()
+        _delete_markdown(note_file)
         return OperationResponse(success=True, message=f"Note '{note_id}' deleted")
 
     raise HTTPException(status_code=404, detail=f"Note '{note_id}' not found for agent '{agent_name}'")
@@ -2294,15 +2211,13 @@ async def get_agent_briefing(agent_name: str):
             lines.append(f"    - {p.name}")
 
     # Notes
-    notes_dir = AGENTMAIL_PATH / agent_name / "notes"
-    notes = list(notes_dir.glob("*.md")) if notes_dir.exists() else []
-    if notes:
-        lines.append(f"\nNOTES: {len(notes)} files in notes/")
+    note_count = agentmail_index.file_count(agent_name, "notes")
+    if note_count:
+        lines.append(f"\nNOTES: {note_count} files in notes/")
 
     # Outbox
-    from_dir = AGENTMAIL_PATH / agent_name / "from"
-    sent = list(from_dir.glob("*.md")) if from_dir.exists() else []
-    lines.append(f"\nOUTBOX: {len(sent)} sent messages")
+    sent_count = agentmail_index.file_count(agent_name, "from")
+    lines.append(f"\nOUTBOX: {sent_count} sent messages")
 
     # Useful commands
     lines.append("\n" + "=" * 40)
@@ -2355,8 +2270,7 @@ async def get_agent_context(agent_name: str):
     own_info = _get_agent_info(agent_name)
 
     # Get own status
-    status_file = AGENTMAIL_PATH / "status" / f"{agent_name}_status.md"
-    own_status = parse_status_file(status_file) if status_file.exists() else None
+    own_status = agentmail_index.status(agent_name)
 
     # Get inbox
     inbox = await get_agent_inbox(agent_name, include_content=True)
@@ -2401,13 +2315,7 @@ async def get_agent_context(agent_name: str):
         })
 
     # Get all team statuses
-    team_statuses = []
-    status_dir = AGENTMAIL_PATH / "status"
-    if status_dir.exists():
-        for sf in status_dir.glob("*_status.md"):
-            status = parse_status_file(sf)
-            if status:
-                team_statuses.append(status)
+    team_statuses = agentmail_index.statuses()
 
     # Get per-agent notes
     agent_notes = await get_agent_notes(agent_name, include_content=False)
@@ -2480,7 +2388,7 @@ async def acknowledge_message(request: AcknowledgeMessageRequest):
     if not agent_dir.exists():
         raise HTTPException(status_code=404, detail="Agent directory not found")
 
-    matching_files = list(agent_dir.glob(f"{msg_num}_*.md"))
+    matching_files = agentmail_index.message_files(agent_name, direction, msg_num)
     if not matching_files:
         raise HTTPException(status_code=404, detail="Message not found")
 
@@ -2542,7 +2450,7 @@ async def acknowledge_message(request: AcknowledgeMessageRequest):
                 flags=re.MULTILINE
             )
 
-    filepath.write_text(content)
+    _write_markdown(filepath, content)
 
     return OperationResponse(
         success=True,
@@ -2614,18 +2522,15 @@ async def get_messages_since(agent_name: str, timestamp: str, include_content: b
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid timestamp format. Use ISO format.")
 
-    to_dir = AGENTMAIL_PATH / agent_name / "to"
     new_messages = []
 
-    if to_dir.exists():
-        for msg_file in to_dir.glob("*.md"):
-            file_mtime = datetime.fromtimestamp(msg_file.stat().st_mtime)
-            if file_mtime > since_time:
-                msg = parse_message_file(msg_file, agent_name, "to")
-                if msg:
-                    if not include_content:
-                        msg.content = None
-                    new_messages.append(msg)
+    for entry in agentmail_index.folder_entries(agent_name, "to"):
+        file_mtime = datetime.fromtimestamp(entry.mtime)
+        if file_mtime > since_time and entry.record is not None:
+            msg = entry.record.model_copy()
+            if not include_content:
+                msg.content = None
+            new_messages.append(msg)
 
     # Sort by date, newest first
     new_messages.sort(key=lambda m: m.date, reverse=True)
@@ -2654,10 +2559,12 @@ async def get_thread(thread_id: str):
     - participants: List of unique agents involved
     - reply_tree: Nested structure for UI rendering
     """
-    data = await get_dashboard_data()
-
-    # Get all messages with this thread_id
-    thread_messages = [m for m in data["messages"] if m.get("thread_id") == thread_id]
+    # Canonical (inbox) copies of non-archived messages, as on the dashboard
+    thread_messages = [
+        m.model_dump()
+        for m in _dedupe_messages(agentmail_index.thread_messages(thread_id, direction="to"))
+        if not m.archived
+    ]
 
     # Sort chronologically
     thread_messages.sort(key=lambda m: m.get("date", ""))
@@ -2880,61 +2787,15 @@ async def search_agentmail(request: SearchRequest):
             if request.agent and agent != request.agent:
                 continue
 
-            notes_dir = AGENTMAIL_PATH / agent / "notes"
-            if notes_dir.exists():
-                for note_file in notes_dir.glob("*.md"):
-                    note = parse_agent_note(note_file, agent)
-                    if not note:
-                        continue
-
-                    title = (note.title or "").lower()
-                    content = (note.content or "").lower()
-                    score = 0
-                    matches = []
-
-                    if query in title:
-                        score += 3
-                        matches.append(f"title: {note.title}")
-                    if query in content:
-                        score += 1
-                        idx = content.find(query)
-                        start = max(0, idx - 40)
-                        end = min(len(content), idx + len(query) + 40)
-                        matches.append(f"content: ...{note.content[start:end]}...")
-
-                    if score > 0:
-                        results.append({
-                            "type": "note",
-                            "id": f"{agent}/{note.id}",
-                            "title": note.title,
-                            "subtitle": f"{agent}'s note",
-                            "date": note.date,
-                            "matches": matches,
-                            "score": score,
-                            "metadata": {
-                                "agent": agent,
-                                "tags": note.tags,
-                                "domain": note.domain,
-                            }
-                        })
-
-    # Search tuning notes
-    if "tuning" in request.scope:
-        tuning_dir = AGENTMAIL_PATH / "tuning_notes"
-        if tuning_dir.exists():
-            for note_file in tuning_dir.glob("*.md"):
-                note = parse_tuning_note(note_file)
-                if not note:
-                    continue
-
-                topic = (note.topic or "").lower()
+            for note in agentmail_index.agent_notes(agent):
+                title = (note.title or "").lower()
                 content = (note.content or "").lower()
                 score = 0
                 matches = []
 
-                if query in topic:
+                if query in title:
                     score += 3
-                    matches.append(f"topic: {note.topic}")
+                    matches.append(f"title: {note.title}")
                 if query in content:
                     score += 1
                     idx = content.find(query)
@@ -2944,49 +2805,82 @@ async def search_agentmail(request: SearchRequest):
 
                 if score > 0:
                     results.append({
-                        "type": "tuning",
-                        "id": note.id,
-                        "title": note.topic,
-                        "subtitle": f"Added by {note.added_by}" if note.added_by else "Tuning note",
+                        "type": "note",
+                        "id": f"{agent}/{note.id}",
+                        "title": note.title,
+                        "subtitle": f"{agent}'s note",
                         "date": note.date,
                         "matches": matches,
                         "score": score,
                         "metadata": {
-                            "added_by": note.added_by,
+                            "agent": agent,
+                            "tags": note.tags,
+                            "domain": note.domain,
                         }
                     })
 
+    # Search tuning notes
+    if "tuning" in request.scope:
+        for note in agentmail_index.tuning_notes():
+            topic = (note.topic or "").lower()
+            content = (note.content or "").lower()
+            score = 0
+            matches = []
+
+            if query in topic:
+                score += 3
+                matches.append(f"topic: {note.topic}")
+            if query in content:
+                score += 1
+                idx = content.find(query)
+                start = max(0, idx - 40)
+                end = min(len(content), idx + len(query) + 40)
+                matches.append(f"content: ...{note.content[start:end]}...")
+
+            if score > 0:
+                results.append({
+                    "type": "tuning",
+                    "id": note.id,
+                    "title": note.topic,
+                    "subtitle": f"Added by {note.added_by}" if note.added_by else "Tuning note",
+                    "date": note.date,
+                    "matches": matches,
+                    "score": score,
+                    "metadata": {
+                        "added_by": note.added_by,
+                    }
+                })
+
     # Search status files
     if "status" in request.scope:
-        status_dir = AGENTMAIL_PATH / "status"
-        if status_dir.exists():
-            for status_file in status_dir.glob("*_status.md"):
-                if request.agent and request.agent not in status_file.name:
-                    continue
+        for entry in agentmail_index.status_entries():
+            status_file = Path(entry.path)
+            if request.agent and request.agent not in status_file.name:
+                continue
 
-                try:
-                    content = status_file.read_text().lower()
-                    agent_name = status_file.stem.replace("_status", "")
-
-                    if query in content:
-                        idx = content.find(query)
-                        start = max(0, idx - 40)
-                        end = min(len(content), idx + len(query) + 40)
-
-                        results.append({
-                            "type": "status",
-                            "id": agent_name,
-                            "title": f"{agent_name} Status",
-                            "subtitle": "Agent status file",
-                            "date": datetime.fromtimestamp(status_file.stat().st_mtime).strftime("%Y-%m-%d"),
-                            "matches": [f"content: ...{content[start:end]}..."],
-                            "score": 1,
-                            "metadata": {
-                                "agent": agent_name,
-                            }
-                        })
-                except Exception:
-                    continue
+            try:
+                content = status_file.read_text().lower()
+                agent_name = status_file.stem.replace("_status", "")
+
+                if query in content:
+                    idx = content.find(query)
+                    start = max(0, idx - 40)
+                    end = min(len(content), idx + len(query) + 40)
+
+                    results.append({
+                        "type": "status",
+                        "id": agent_name,
+                        "title": f"{agent_name} Status",
+                        "subtitle": "Agent status file",
+                        "date": datetime.fromtimestamp(entry.mtime).strftime("%Y-%m-%d"),
+                        "matches": [f"content: ...{content[start:end]}..."],
+                        "score": 1,
+                        "metadata": {
+                            "agent": agent_name,
+                        }
+                    })
+            except Exception:
+                continue
 
     # Sort by score descending, then by date
     results.sort(key=lambda r: (-r["score"], r.get("date", "") or ""), reverse=False)
@@ -3319,28 +3213,15 @@ def _check_for_reply(original_message_id: str, thread_id: Optional[str]) -> bool
     if not AGENTMAIL_PATH.exists():
         return False
 
-    # Search all agent inboxes for replies
-    for agent_dir in AGENTMAIL_PATH.iterdir():
-        if not agent_dir.is_dir() or agent_dir.name in ["status", "tuning_notes", "__pycache__"]:
-            continue
-
-        # Check to/from folders
-        for direction in ["to", "from"]:
-            msg_dir = agent_dir / direction
-            if not msg_dir.exists():
-                continue
-
-            for msg_file in msg_dir.glob("*.md"):
-                content = msg_file.read_text()
-
-                # Check if this message replies to the original
-                if f"**In-Reply-To:** {original_message_id}" in content:
-                    return True
+    # Any message that replies to the original
+    if agentmail_index.replies_to(original_message_id):
+        return True
 
-                # Check if this message is in the same thread (and is a different message)
-                if thread_id and f"**Thread:** {thread_id}" in content:
-                    # Make sure it's not the original message
-                    if f"_{original_message_id.split('_')[-1]}" not in msg_file.name:
-                        return True
+    # Any other message in the same thread
+    if thread_id:
+        original_num = original_message_id.split("_")[-1]
+        for msg in agentmail_index.thread_messages(thread_id):
+            if f"_{original_num}" not in msg.filename:
+                return True
 
     return False
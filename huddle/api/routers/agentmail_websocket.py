@@ -38,7 +38,9 @@ async def agentmail_websocket(websocket: WebSocket) -> None:
     await agentmail_session_manager.connect(websocket)
 
     # Start file watcher if not running (lazily starts on first client)
-    file_watcher = get_file_watcher(AGENTMAIL_PATH)
+    from huddle.api.routers.agentmail import agentmail_index
+
+    file_watcher = get_file_watcher(AGENTMAIL_PATH, agentmail_index)
     await file_watcher.start()
 
     try:
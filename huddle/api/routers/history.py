@@ -67,16 +67,20 @@ async def run_simulation_stream(
     """
     Run simulation with streaming progress updates (SSE).
 
-    Returns Server-Sent Events with progress messages.
-    Final event contains the simulation summary.
+    Returns Server-Sent Events with progress messages and a ``phase``
+    event with timings and counts as each season phase ends. The final
+    event contains the simulation summary and the phase profile.
     """
     import queue
     import threading
 
-    progress_queue: queue.Queue[str] = queue.Queue()
+    progress_queue: queue.Queue = queue.Queue()
 
     def progress_callback(message: str):
-        progress_queue.put(message)
+        progress_queue.put({"type": "progress", "message": message})
+
+    def phase_callback(timing):
+        progress_queue.put({"type": "phase", "timing": timing.to_dict()})
 
     config = SimulationConfig(
         num_teams=num_teams,
@@ -89,7 +93,9 @@ async def run_simulation_stream(
 
     def run_sim():
         try:
-            summary = history_service.run_simulation_with_progress(config, progress_callback)
+            summary = history_service.run_simulation_with_progress(
+                config, progress_callback, phase_callback
+            )
             result_holder["summary"] = summary
             result_holder["success"] = True
         except Exception as e:
@@ -109,12 +115,13 @@ async def run_simulation_stream(
                 if message == "__DONE__":
                     if result_holder.get("success"):
                         summary = result_holder["summary"]
-                        yield f"data: {json.dumps({'type': 'complete', 'summary': summary.model_dump(mode='json')})}\n\n"
+                        profile = history_service.get_simulation_profile(summary.sim_id)
+                        yield f"data: {json.dumps({'type': 'complete', 'summary': summary.model_dump(mode='json'), 'profile': profile})}\n\n"
                     else:
                         yield f"data: {json.dumps({'type': 'error', 'message': result_holder.get('error', 'Unknown error')})}\n\n"
                     break
                 else:
-                    yield f"data: {json.dumps({'type': 'progress', 'message': message})}\n\n"
+                    yield f"data: {json.dumps(message)}\n\n"
             except queue.Empty:
                 await asyncio.sleep(0.05)
 
@@ -143,6 +150,21 @@ async def get_simulation(sim_id: str):
     return result
 
 
+@router.get("/simulations/{sim_id}/profile")
+async def get_simulation_profile(sim_id: str):
+    """
+    Get per-season, per-phase timings of a simulation run.
+
+    Each phase reports wall and CPU seconds plus counts (players generated,
+    trades executed, games simulated, transactions), with totals per phase
+    sorted slowest first.
+    """
+    profile = history_service.get_simulation_profile(sim_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Simulation not found")
+    return profile
+
+
 @router.delete("/simulations/{sim_id}")
 async def delete_simulation(sim_id: str):
     """Delete a simulation from memory."""
@@ -310,7 +310,7 @@ async def cut_player(
         cap_savings = (player.salary or 0) - dead_this_year
 
     # Remove player from roster
-    del team.roster.players[pid]
+    team.roster.remove_player(pid)
 
     # Add player to free agents
     if hasattr(player, "team_id"):
@@ -53,8 +53,9 @@ from huddle.simulation.v2.ai.db_brain import db_brain
 from huddle.simulation.v2.ai.lb_brain import lb_brain
 from huddle.simulation.v2.ai.ol_brain import ol_brain
 from huddle.simulation.v2.ai.dl_brain import dl_brain
-from huddle.simulation.v2.resolution.blocking import get_play_blocking_quality
-import random
+from huddle.simulation.v2.resolution.blocking import (
+    blocking_quality_yards, get_play_blocking_quality
+)
 
 
 router = APIRouter(prefix="/v2-sim", tags=["v2-simulation"])
@@ -1572,37 +1573,9 @@ async def run_play_to_completion(session: V2SimSession) -> Dict[str, Any]:
     yards_gained = int(end_ball_y - start_ball_y)
 
     # Apply play-level blocking quality adjustment for runs
-    # This creates realistic run distribution (stuffs, explosives, etc.)
-    # NFL targets: 17% for 0 or loss, 11.6% for 10+, 2.5% for 20+, mean 4.5, median 3.0
     is_run_play = orch.config.is_run_play if orch.config else False
     if is_run_play:
-        quality = getattr(orch, '_play_blocking_quality', 'average')
-        if quality == "great":
-            # 15% of plays: OL dominates → explosive potential
-            # 20% of great plays (3% overall) are "breakaway" big plays
-            if random.random() < 0.20:
-                # Breakaway: RB breaks into secondary for 20+ yard gain
-                bonus = random.randint(18, 35)
-            else:
-                # Normal great block: solid 3-11 yard gain (fills 7-9 good bucket)
-                bonus = random.randint(3, 11)
-            yards_gained += bonus
-        elif quality == "poor":
-            # 20% of plays: DL wins → stuff potential
-            # Subtract 2-5 yards (creates losses and no-gains)
-            penalty = random.randint(2, 5)
-            yards_gained -= penalty
-        else:
-            # Average blocking (65%): variable outcome
-            # Creates distribution across short (1-3), medium (4-6), and some good (7-9)
-            # 10% chance of "congestion" (defense fills gaps quickly) → 0 or loss
-            if random.random() < 0.10:
-                # Congested play: gaps close fast, RB hits a wall
-                adjustment = random.randint(-3, 0)
-            else:
-                # Normal average: spread across short, medium, and occasional good
-                adjustment = random.randint(-2, 3)
-            yards_gained += adjustment
+        yards_gained += blocking_quality_yards(getattr(orch, '_play_blocking_quality', 'average'))
 
     # Determine outcome
     outcome = orch._result_outcome or "unknown"
@@ -2374,7 +2347,7 @@ async def v2_sim_websocket(websocket: WebSocket, session_id: str):
                     break
             if qb_id:
                 try:
-                    qb_state = get_qb_state(qb_id)
+                    qb_state = get_qb_state(orchestrator.brain_state, qb_id)
                     qb_state_data = {
                         "pressure_level": qb_state.pressure_level.value,
                         "current_read": qb_state.current_read,
@@ -2402,7 +2375,7 @@ async def v2_sim_websocket(websocket: WebSocket, session_id: str):
                     "play_outcome": session.play_outcome.value,
                     "ball_carrier_id": session.ball_carrier_id,
                     "qb_state": qb_state_data,
-                    "qb_trace": get_trace(),
+                    "qb_trace": get_trace(qb_id) if qb_id else [],
                     # Centralized player traces for SimAnalyzer
                     "player_traces": get_trace_system().to_dict_list(
                         get_trace_system().get_new_entries()
@@ -0,0 +1,424 @@
+"""In-process index of the AgentMail folder.
+
+The agentmail folder is the source of truth (agents and humans edit the
+markdown files directly), but parsing it on every request does not scale
+past a few hundred messages. AgentMailIndex keeps the parsed messages,
+notes, statuses and tuning notes in memory, with secondary indexes for the
+lookups the router makes (by folder, message number, thread, status, CC).
+
+The index is kept current three ways:
+- Router writes call update_path() for the files they touch.
+- AgentMailFileWatcher feeds filesystem events into update_path() (or
+  calls sync() when polling).
+- Without a live watcher, queries call ensure_fresh(), which re-stats the
+  tree at most every max_staleness seconds and reparses only changed files.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+
+# Folder keys for records that don't belong to an agent
+STATUS_KEY = ("", "status")
+TUNING_KEY = ("", "tuning_notes")
+
+_NUMBER_PREFIX = re.compile(r"^(\d+)")
+
+
+@dataclass
+class IndexEntry:
+    """A markdown file known to the index."""
+    path: str
+    kind: str                   # "message", "note", "status", "tuning", "other"
+    agent: str                  # Owning agent folder ("" for status/tuning)
+    subdir: str                 # "to", "from", "notes", "plans", "status", ...
+    number: Optional[str]       # Leading number from filename, if any
+    mtime: float
+    signature: tuple[int, int]  # (mtime_ns, size) used for change detection
+    record: Any = None          # Parsed pydantic model (None for "other")
+
+
+class AgentMailIndex:
+    """
+    Incrementally maintained index of agentmail markdown files.
+
+    Parsers are injected so the index stays independent of the router's
+    pydantic models.
+
+    Returned records are shallow copies; callers may mutate them (e.g.
+    strip content) without affecting the index.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        parse_message: Callable[[Path, str, str], Any],
+        parse_status: Callable[[Path], Any],
+        parse_tuning_note: Callable[[Path], Any],
+        parse_agent_note: Callable[[Path, str], Any],
+        max_staleness: float = 2.0,
+    ):
+        self.root = Path(root)
+        self.max_staleness = max_staleness
+        self._parse_message = parse_message
+        self._parse_status = parse_status
+        self._parse_tuning_note = parse_tuning_note
+        self._parse_agent_note = parse_agent_note
+
+        self._lock = threading.RLock()
+        self._last_sync: Optional[float] = None
+        self.live = False  # True while a watcher keeps the index current
+
+        self._entries: dict[str, IndexEntry] = {}
+        self._by_folder: dict[tuple[str, str], dict[str, IndexEntry]] = defaultdict(dict)
+        self._by_agent: dict[str, set[str]] = defaultdict(set)
+        self._by_number: dict[tuple[str, str, str], set[str]] = defaultdict(set)
+        self._by_thread: dict[str, set[str]] = defaultdict(set)
+        self._by_status: dict[str, set[str]] = defaultdict(set)
+        self._by_cc: dict[str, set[str]] = defaultdict(set)
+        self._by_reply_to: dict[str, set[str]] = defaultdict(set)
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def ensure_fresh(self) -> None:
+        """Resync if no watcher is running and the index may be stale."""
+        if self.live and self._last_sync is not None:
+            return
+        if self._last_sync is None or time.monotonic() - self._last_sync >= self.max_staleness:
+            self.sync()
+
+    def sync(self) -> set[str]:
+        """
+        Bring the index in line with the filesystem.
+
+        Only stats files; files are reparsed only when their mtime or size
+        changed.
+
+        Returns:
+            Paths that were added, modified or removed.
+        """
+        with self._lock:
+            seen: dict[str, tuple[int, int, float]] = {}
+            if self.root.exists():
+                self._stat_tree(self.root, 0, seen)
+
+            changed = set()
+            for path in list(self._entries):
+                if path not in seen:
+                    self._remove(path)
+                    changed.add(path)
+
+            for path, (mtime_ns, size, mtime) in seen.items():
+                entry = self._entries.get(path)
+                if entry is None and self._classify(path) is None:
+                    continue
+                if entry is None or entry.signature != (mtime_ns, size):
+                    self._load(path, (mtime_ns, size), mtime)
+                    changed.add(path)
+
+            self._last_sync = time.monotonic()
+            return changed
+
+    def update_path(self, path: Path | str) -> bool:
+        """
+        Reindex a single file after it was written or deleted.
+
+        Returns:
+            True if the file is (still) indexed.
+        """
+        path = str(path)
+        with self._lock:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self._remove(path)
+                return False
+
+            if self._classify(path) is None:
+                return False
+            self._load(path, (stat.st_mtime_ns, stat.st_size), stat.st_mtime)
+            return True
+
+    def remove_tree(self, directory: Path | str) -> None:
+        """Drop every entry under a directory (e.g. a deleted agent)."""
+        prefix = str(directory).rstrip(os.sep) + os.sep
+        with self._lock:
+            for path in [p for p in self._entries if p.startswith(prefix)]:
+                self._remove(path)
+
+    def _stat_tree(self, directory: Path | str, depth: int, seen: dict) -> None:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth == 0 and entry.name == "__pycache__":
+                            continue
+                        self._stat_tree(entry.path, depth + 1, seen)
+                    elif depth > 0 and entry.name.endswith(".md"):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        seen[entry.path] = (stat.st_mtime_ns, stat.st_size, stat.st_mtime)
+        except OSError:
+            pass
+
+    def _classify(self, path: str) -> Optional[tuple[str, str, str]]:
+        """Return (kind, agent, subdir) for an indexable path, else None."""
+        if not path.endswith(".md"):
+            return None
+        try:
+            parts = Path(path).relative_to(self.root).parts
+        except ValueError:
+            return None
+        if len(parts) < 2:
+            return None
+
+        top = parts[0]
+        if top == "__pycache__":
+            return None
+        if top == "status":
+            if len(parts) == 2 and parts[1].endswith("_status.md"):
+                return ("status", *STATUS_KEY)
+            return None
+        if top == "tuning_notes":
+            return ("tuning", *TUNING_KEY) if len(parts) == 2 else None
+
+        subdir = parts[1] if len(parts) > 2 else ""
+        if len(parts) == 3 and subdir in ("to", "from"):
+            return ("message", top, subdir)
+        if len(parts) == 3 and subdir == "notes":
+            return ("note", top, subdir)
+        return ("other", top, subdir)
+
+    def _load(self, path: str, signature: tuple[int, int], mtime: float) -> None:
+        classification = self._classify(path)
+        self._remove(path)
+        if classification is None:
+            return
+
+        kind, agent, subdir = classification
+        filepath = Path(path)
+        try:
+            if kind == "message":
+                record = self._parse_message(filepath, agent, subdir)
+            elif kind == "note":
+                record = self._parse_agent_note(filepath, agent)
+            elif kind == "status":
+                record = self._parse_status(filepath)
+            elif kind == "tuning":
+                record = self._parse_tuning_note(filepath)
+            else:
+                record = None
+        except (OSError, UnicodeDecodeError):
+            record = None
+
+        if record is None:
+            # Keep unparseable files as plain entries so they still count
+            # toward numbering and aren't reparsed on every sync
+            kind = "other"
+
+        match = _NUMBER_PREFIX.match(filepath.name)
+        entry = IndexEntry(
+            path=path,
+            kind=kind,
+            agent=agent,
+            subdir=subdir,
+            number=match.group(1) if match else None,
+            mtime=mtime,
+            signature=signature,
+            record=record,
+        )
+        self._add(entry)
+
+    def _add(self, entry: IndexEntry) -> None:
+        path = entry.path
+        self._entries[path] = entry
+        self._by_folder[(entry.agent, entry.subdir)][path] = entry
+        if entry.agent:
+            self._by_agent[entry.agent].add(path)
+        if entry.number is not None:
+            self._by_number[(entry.agent, entry.subdir, entry.number)].add(path)
+
+        if entry.kind == "message":
+            msg = entry.record
+            if msg.thread_id:
+                self._by_thread[msg.thread_id].add(path)
+            self._by_status[msg.status].add(path)
+            if msg.in_reply_to:
+                self._by_reply_to[msg.in_reply_to].add(path)
+            if entry.subdir == "to" and msg.cc:
+                for cc_agent in msg.cc:
+                    self._by_cc[cc_agent].add(path)
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+
+        self._by_folder[(entry.agent, entry.subdir)].pop(path, None)
+        if entry.agent:
+            self._by_agent[entry.agent].discard(path)
+        if entry.number is not None:
+            self._by_number[(entry.agent, entry.subdir, entry.number)].discard(path)
+
+        if entry.kind == "message":
+            msg = entry.record
+            if msg.thread_id:
+                self._by_thread[msg.thread_id].discard(path)
+            self._by_status[msg.status].discard(path)
+            if msg.in_reply_to:
+                self._by_reply_to[msg.in_reply_to].discard(path)
+            if entry.subdir == "to" and msg.cc:
+                for cc_agent in msg.cc:
+                    self._by_cc[cc_agent].discard(path)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _records(self, paths: Iterable[str]) -> list:
+        records = []
+        for path in paths:
+            entry = self._entries.get(path)
+            if entry is not None and entry.record is not None:
+                records.append(entry.record.model_copy())
+        return records
+
+    def _folder(self, agent: str, subdir: str) -> dict[str, IndexEntry]:
+        return self._by_folder.get((agent, subdir), {})
+
+    def messages(self, direction: str = "to") -> list:
+        """All messages in every agent's to/ (or from/) folder."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(
+                path
+                for (agent, subdir), folder in self._by_folder.items()
+                if agent and subdir == direction
+                for path in folder
+            )
+
+    def folder_messages(self, agent: str, direction: str) -> list:
+        """Messages in one agent's to/ or from/ folder, newest filename first."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(sorted(self._folder(agent, direction), reverse=True))
+
+    def folder_entries(self, agent: str, subdir: str) -> list[IndexEntry]:
+        """Raw entries (path, mtime, record) in one agent subfolder."""
+        self.ensure_fresh()
+        with self._lock:
+            return list(self._folder(agent, subdir).values())
+
+    def cc_messages(self, agent: str) -> list:
+        """Messages in other agents' inboxes that CC this agent."""
+        self.ensure_fresh()
+        with self._lock:
+            paths = [p for p in self._by_cc.get(agent, ()) if self._entries[p].agent != agent]
+            return self._records(paths)
+
+    def message_files(self, agent: str, direction: str, number: str) -> list[Path]:
+        """Files for a message id's (agent, direction, number)."""
+        self.ensure_fresh()
+        with self._lock:
+            return [Path(p) for p in sorted(self._by_number.get((agent, direction, number), ()))]
+
+    def get_message(self, agent: str, direction: str, number: str):
+        """Parsed message for (agent, direction, number), or None."""
+        files = self.message_files(agent, direction, number)
+        if not files:
+            return None
+        with self._lock:
+            entry = self._entries.get(str(files[0]))
+            return entry.record.model_copy() if entry and entry.record else None
+
+    def thread_messages(self, thread_id: str, direction: Optional[str] = None) -> list:
+        """Messages belonging to a thread, optionally only from to/ or from/."""
+        self.ensure_fresh()
+        with self._lock:
+            paths = sorted(self._by_thread.get(thread_id, ()))
+            if direction is not None:
+                paths = [p for p in paths if self._entries[p].subdir == direction]
+            return self._records(paths)
+
+    def replies_to(self, message_id: str) -> list:
+        """Messages whose In-Reply-To points at message_id."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(sorted(self._by_reply_to.get(message_id, ())))
+
+    def messages_with_status(self, status: str) -> list:
+        """Messages (to/ and from/) with the given Status field."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(sorted(self._by_status.get(status, ())))
+
+    def agent_notes(self, agent: str) -> list:
+        """An agent's notes, sorted by filename."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(sorted(self._folder(agent, "notes")))
+
+    def tuning_notes(self) -> list:
+        """Shared tuning notes, sorted by filename."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(sorted(self._folder(*TUNING_KEY)))
+
+    def statuses(self) -> list:
+        """All parsed agent status files."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._records(sorted(self._folder(*STATUS_KEY)))
+
+    def status(self, agent: str):
+        """Parsed status file for an agent, or None."""
+        self.ensure_fresh()
+        path = str(self.root / "status" / f"{agent}_status.md")
+        with self._lock:
+            entry = self._entries.get(path)
+            return entry.record.model_copy() if entry and entry.record else None
+
+    def status_entries(self) -> list[IndexEntry]:
+        """Raw entries for the status folder."""
+        self.ensure_fresh()
+        with self._lock:
+            return list(self._folder(*STATUS_KEY).values())
+
+    def last_modified(self, agent: str) -> Optional[float]:
+        """Most recent mtime of any markdown file in an agent's folder."""
+        self.ensure_fresh()
+        with self._lock:
+            paths = self._by_agent.get(agent)
+            if not paths:
+                return None
+            return max(self._entries[p].mtime for p in paths)
+
+    def file_count(self, agent: str, subdir: str) -> int:
+        """Number of markdown files in an agent subfolder."""
+        self.ensure_fresh()
+        with self._lock:
+            return len(self._folder(agent, subdir))
+
+    def next_number(self, agent: str, subdir: str) -> str:
+        """Next zero-padded file number for an agent subfolder (or tuning notes)."""
+        self.ensure_fresh()
+        with self._lock:
+            numbers = [
+                int(entry.number)
+                for entry in self._folder(agent, subdir).values()
+                if entry.number is not None
+            ]
+        return f"{max(numbers) + 1 if numbers else 1:03d}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,11 +4,19 @@ import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Set
+from typing import TYPE_CHECKING, Optional, Set
 from enum import Enum
 
 from fastapi import WebSocket
 
+try:
+    from watchfiles import awatch
+except ImportError:  # Optional: falls back to polling
+    awatch = None
+
+if TYPE_CHECKING:
+    from huddle.api.services.agentmail_index import AgentMailIndex
+
 
 class AgentMailWSMessageType(str, Enum):
     """WebSocket message types for AgentMail."""
@@ -157,14 +165,24 @@ class AgentMailFileWatcher:
     """
     Watches the agentmail folder for file changes and broadcasts updates.
 
-    Uses polling instead of watchdog for simplicity and cross-platform support.
+    Uses watchfiles (inotify/FSEvents) when installed and falls back to
+    polling otherwise. When given an AgentMailIndex, changed files are
+    reindexed as they arrive and the index is marked live so request
+    handlers skip their own staleness checks.
     """
 
-    def __init__(self, agentmail_path: Path, session_manager: AgentMailSessionManager):
+    def __init__(
+        self,
+        agentmail_path: Path,
+        session_manager: AgentMailSessionManager,
+        index: Optional["AgentMailIndex"] = None,
+    ):
         self.agentmail_path = agentmail_path
         self.session_manager = session_manager
+        self.index = index
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
         self._file_mtimes: dict[str, float] = {}
         self._poll_interval = 2.0  # Poll every 2 seconds
 
@@ -173,12 +191,27 @@ class AgentMailFileWatcher:
         if self._running:
             return
         self._running = True
-        self._file_mtimes = self._scan_files()
-        self._task = asyncio.create_task(self._watch_loop())
+        self._stop_event = asyncio.Event()
+        if self.index is not None:
+            self.index.sync()
+        else:
+            self._file_mtimes = self._scan_files()
+
+        if awatch is not None:
+            self._task = asyncio.create_task(self._event_loop())
+        else:
+            self._task = asyncio.create_task(self._watch_loop())
+
+        if self.index is not None:
+            self.index.live = True
 
     async def stop(self) -> None:
         """Stop watching for file changes."""
         self._running = False
+        if self.index is not None:
+            self.index.live = False
+        if self._stop_event:
+            self._stop_event.set()
         if self._task:
             self._task.cancel()
             try:
@@ -200,37 +233,62 @@ class AgentMailFileWatcher:
                 pass
         return mtimes
 
+    def _poll_changes(self) -> bool:
+        """Detect changes since the last poll. Returns True if anything changed."""
+        if self.index is not None:
+            return bool(self.index.sync())
+
+        new_mtimes = self._scan_files()
+        changed = new_mtimes != self._file_mtimes
+        self._file_mtimes = new_mtimes
+        return changed
+
+    async def _broadcast_sync(self) -> None:
+        """Broadcast a full state sync to connected clients."""
+        if not self.session_manager.connection_count:
+            return
+
+        # Import here to avoid circular imports
+        from huddle.api.routers.agentmail import get_dashboard_data
+
+        try:
+            dashboard_data = await get_dashboard_data()
+            await self.session_manager.broadcast_state_sync(dashboard_data)
+        except Exception as e:
+            print(f"Error broadcasting state sync: {e}")
+
+    async def _event_loop(self) -> None:
+        """Filesystem-event watch loop (watchfiles)."""
+        try:
+            async for changes in awatch(
+                self.agentmail_path,
+                stop_event=self._stop_event,
+                watch_filter=lambda change, path: path.endswith(".md"),
+            ):
+                if self.index is not None:
+                    for _, path in changes:
+                        self.index.update_path(path)
+                await self._broadcast_sync()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Fall back to polling (e.g. inotify watch limit reached)
+            print(f"File events unavailable, polling instead: {e}")
+            if self._running:
+                await self._watch_loop()
+
     async def _watch_loop(self) -> None:
         """Main watch loop - polls for file changes."""
         while self._running:
             try:
                 await asyncio.sleep(self._poll_interval)
 
-                if not self.session_manager.connection_count:
-                    continue  # No clients connected, skip scanning
-
-                new_mtimes = self._scan_files()
-
-                # Find changes
-                added = set(new_mtimes.keys()) - set(self._file_mtimes.keys())
-                removed = set(self._file_mtimes.keys()) - set(new_mtimes.keys())
-                modified = {
-                    f for f in new_mtimes
-                    if f in self._file_mtimes and new_mtimes[f] != self._file_mtimes[f]
-                }
-
-                # If any changes, broadcast state sync
-                if added or removed or modified:
-                    # Import here to avoid circular imports
-                    from huddle.api.routers.agentmail import get_dashboard_data
-
-                    try:
-                        dashboard_data = await get_dashboard_data()
-                        await self.session_manager.broadcast_state_sync(dashboard_data)
-                    except Exception as e:
-                        print(f"Error broadcasting state sync: {e}")
+                # Without an index, only scan when someone is listening
+                if self.index is None and not self.session_manager.connection_count:
+                    continue
 
-                self._file_mtimes = new_mtimes
+                if self._poll_changes():
+                    await self._broadcast_sync()
 
             except asyncio.CancelledError:
                 break
@@ -243,9 +301,12 @@ class AgentMailFileWatcher:
 _file_watcher: Optional[AgentMailFileWatcher] = None
 
 
-def get_file_watcher(agentmail_path: Path) -> AgentMailFileWatcher:
+def get_file_watcher(
+    agentmail_path: Path,
+    index: Optional["AgentMailIndex"] = None,
+) -> AgentMailFileWatcher:
     """Get or create the file watcher instance."""
     global _file_watcher
     if _file_watcher is None:
-        _file_watcher = AgentMailFileWatcher(agentmail_path, agentmail_session_manager)
+        _file_watcher = AgentMailFileWatcher(agentmail_path, agentmail_session_manager, index)
     return _file_watcher
@@ -112,8 +112,13 @@ def run_simulation(config: SimulationConfig) -> SimulationSummary:
 def run_simulation_with_progress(
     config: SimulationConfig,
     progress_callback: callable,
+    phase_callback: Optional[callable] = None,
 ) -> SimulationSummary:
-    """Run a historical simulation with progress updates."""
+    """
+    Run a historical simulation with progress updates.
+
+    ``phase_callback`` receives a PhaseTiming as each season phase ends.
+    """
     from typing import Callable
 
     sim_id = str(uuid.uuid4())[:8]
@@ -140,6 +145,7 @@ def run_simulation_with_progress(
         draft_rounds=config.draft_rounds,
         verbose=True,  # Enable verbose for progress messages
         progress_callback=progress_callback,
+        phase_callback=phase_callback,
     )
 
     # Run simulation
@@ -170,6 +176,21 @@ def get_simulation_result(sim_id: str) -> Optional[tuple[SimulationResult, Simul
     return _simulations[sim_id]
 
 
+def get_simulation_profile(sim_id: str) -> Optional[dict]:
+    """Per-season, per-phase timings of a simulation run, with phase totals."""
+    if sim_id not in _simulations:
+        return None
+    result, _ = _simulations[sim_id]
+    if result.profile is None:
+        return {"phases": [], "totals": [], "total_seconds": 0.0}
+    totals = sorted(result.profile.by_phase().values(), key=lambda p: -p.wall_seconds)
+    return {
+        **result.profile.to_dict(),
+        "totals": [t.to_dict() for t in totals],
+        "total_seconds": result.profile.total_seconds,
+    }
+
+
 def get_simulation(sim_id: str) -> Optional[FullSimulationData]:
     """Get full simulation data."""
     if sim_id not in _simulations:
@@ -143,12 +143,14 @@ class CapManager:
         contracts: dict[str, Contract],
         salary_cap: int = 255_000,
         team_status: "TeamStatusState" = None,
+        rng: Optional[random.Random] = None,
     ):
         self.team_id = team_id
         self.roster = roster
         self.contracts = contracts
         self.salary_cap = salary_cap
         self.team_status = team_status
+        self.rng = rng or random
 
         # Determine strategy based on team status
         self.strategy = self._determine_strategy()
@@ -335,7 +337,7 @@ class CapManager:
         Returns dict with years, value, guaranteed, signing_bonus or None.
         """
         # Can we afford them?
-        market = calculate_market_value(player)
+        market = calculate_market_value(player, rng=self.rng)
 
         if market.cap_hit_year1 > self.situation.cap_space:
             return None  # Can't afford
@@ -441,6 +443,8 @@ class CapManager:
             years=1,
             player_experience=player.experience_years,
             signed_date=current_date,
+            # Unseeded managers keep os-entropy ids
+            rng=self.rng if self.rng is not random else None,
         )
 
     def ensure_all_players_have_contracts(
@@ -15,9 +15,12 @@ Usage:
         project_performance,
         get_potential_tier,
         apply_offseason_development,
+        apply_offseason_development_bulk,
     )
 """
 
+import random
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 
@@ -347,10 +350,84 @@ def get_regression_factor(position: str, age: int) -> float:
         return (1 - decline_rate) ** years_past_peak
 
 
+# =============================================================================
+# Offseason Development
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _development_profile(position: str) -> tuple:
+    """
+    Per-position development table, built once per position.
+
+    Returns:
+        (prime_start, prime_end, growth_rate, decline_rate, attrs) where attrs
+        holds (name, growth_mult, decline_mult, overall_weight) for each
+        attribute relevant to the position, in overall-calculation order
+    """
+    from huddle.core.attributes import AttributeRegistry
+    from huddle.core.attributes.growth_profiles import (
+        ATTRIBUTE_GROWTH_CATEGORIES,
+        GrowthCategory,
+    )
+
+    # Category multipliers for growth and decline
+    CATEGORY_GROWTH_MULTIPLIERS = {
+        GrowthCategory.PHYSICAL: 0.5,   # Genetics-limited, hard to improve
+        GrowthCategory.MENTAL: 1.5,     # Highly trainable
+        GrowthCategory.TECHNIQUE: 1.0,  # Normal training
+        GrowthCategory.SPECIAL: 0.7,    # Moderate
+    }
+    CATEGORY_DECLINE_MULTIPLIERS = {
+        GrowthCategory.PHYSICAL: 1.5,   # Speed/athleticism goes first
+        GrowthCategory.MENTAL: 0.5,     # Experience compensates
+        GrowthCategory.TECHNIQUE: 1.0,  # Normal decline
+        GrowthCategory.SPECIAL: 0.7,    # Moderate
+    }
+
+    group = get_position_group(position)
+    prime_start, prime_end = PRIME_YEARS.get(group, (26, 28))
+
+    attrs = []
+    for attr_def in AttributeRegistry.get_for_position(position):
+        category = ATTRIBUTE_GROWTH_CATEGORIES.get(attr_def.name, GrowthCategory.TECHNIQUE)
+        attrs.append((
+            attr_def.name,
+            CATEGORY_GROWTH_MULTIPLIERS.get(category, 1.0),
+            CATEGORY_DECLINE_MULTIPLIERS.get(category, 1.0),
+            attr_def.position_weights.get(position, 0.0),
+        ))
+
+    return (
+        prime_start,
+        prime_end,
+        GROWTH_RATES.get(group, 10.0) / 100,
+        DECLINE_RATES.get(group, 6.0) / 100,
+        tuple(attrs),
+    )
+
+
+def _profile_overall(player, attrs: tuple) -> int:
+    """Player.overall computed from a development profile's weights."""
+    if not attrs:
+        return player.overall
+
+    values = player.attributes._values
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for attr_name, _, _, weight in attrs:
+        weighted_sum += values.get(attr_name, 50) * weight
+        total_weight += weight
+
+    if total_weight == 0:
+        return 50
+    return int(weighted_sum / total_weight)
+
+
 def apply_offseason_development(
     player,
     season: int,
     variance: float = 0.03,
+    rng: Optional[random.Random] = None,
 ) -> dict:
     """
     Apply one year of development to a player and return history snapshot.
@@ -372,116 +449,119 @@ def apply_offseason_development(
         player: Player object with age, position, attributes
         season: The season this development applies to
         variance: Random variance in development (default 3%)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Development history entry with before/after snapshots
     """
-    import random
-    from huddle.core.attributes import AttributeRegistry
-    from huddle.core.attributes.growth_profiles import (
-        ATTRIBUTE_GROWTH_CATEGORIES,
-        GrowthCategory,
-    )
+    return apply_offseason_development_bulk([player], season, variance, rng=rng)[0]
 
-    position = player.position.value
-    group = get_position_group(position)
-    peak_age = PEAK_AGES.get(group, 27)
-    prime_start, prime_end = PRIME_YEARS.get(group, (26, 28))
 
-    # Category multipliers for growth and decline
-    CATEGORY_GROWTH_MULTIPLIERS = {
-        GrowthCategory.PHYSICAL: 0.5,   # Genetics-limited, hard to improve
-        GrowthCategory.MENTAL: 1.5,     # Highly trainable
-        GrowthCategory.TECHNIQUE: 1.0,  # Normal training
-        GrowthCategory.SPECIAL: 0.7,    # Moderate
-    }
-    CATEGORY_DECLINE_MULTIPLIERS = {
-        GrowthCategory.PHYSICAL: 1.5,   # Speed/athleticism goes first
-        GrowthCategory.MENTAL: 0.5,     # Experience compensates
-        GrowthCategory.TECHNIQUE: 1.0,  # Normal decline
-        GrowthCategory.SPECIAL: 0.7,    # Moderate
-    }
+def apply_offseason_development_bulk(
+    players: List,
+    season: int,
+    variance: float = 0.03,
+    rng: Optional[random.Random] = None,
+) -> List[dict]:
+    """
+    Apply one year of development to many players at once.
 
-    # Record before state
-    age_before = player.age
-    overall_before = player.overall
-
-    # Get player's learning attribute (affects development speed)
-    # learning=50 is baseline (1.0x), learning=75 is 1.5x, learning=25 is 0.5x
-    learning = player.attributes.get("learning", 50)
-    learning_multiplier = learning / 50.0
-
-    # Increment age
-    player.age += 1
-    player.experience_years = getattr(player, 'experience_years', 0) + 1
-    age_after = player.age
-
-    # Determine development phase
-    if age_after < prime_start:
-        phase = "growth"
-        base_rate = GROWTH_RATES.get(group, 10.0) / 100
-        direction = 1  # Positive growth
-    elif age_after <= prime_end:
-        phase = "prime"
-        base_rate = 0.02  # Small random changes in prime
-        direction = random.choice([-1, 0, 0, 1])  # Mostly stable
-    else:
-        phase = "decline"
-        base_rate = DECLINE_RATES.get(group, 6.0) / 100
-        direction = -1  # Negative decline
-
-    # Get relevant attributes for this position
-    relevant_attrs = AttributeRegistry.get_for_position(position)
-
-    # Apply development to each relevant attribute
-    for attr_def in relevant_attrs:
-        attr_name = attr_def.name
-        current_value = player.attributes.get(attr_name, 50)
-
-        # Get growth category for this attribute
-        growth_category = ATTRIBUTE_GROWTH_CATEGORIES.get(attr_name, GrowthCategory.TECHNIQUE)
-
-        # Apply category-specific multiplier
-        if phase == "growth":
-            category_mult = CATEGORY_GROWTH_MULTIPLIERS.get(growth_category, 1.0)
-        elif phase == "decline":
-            category_mult = CATEGORY_DECLINE_MULTIPLIERS.get(growth_category, 1.0)
-        else:
-            category_mult = 1.0  # Prime phase - equal chance for all
+    Same curves and random draws as calling apply_offseason_development
+    for each player in order, but position tables (relevant attributes,
+    growth categories, rates, overall weights) are resolved once per
+    position and only attributes that actually move are written back.
+
+    Args:
+        players: Players to develop
+        season: The season this development applies to
+        variance: Random variance in development (default 3%)
+        rng: Random generator (defaults to the module-level one)
 
-        # Apply variance to the rate
-        # Learning attribute affects growth (high learning = faster development)
-        # but doesn't affect decline (can't learn your way out of aging)
-        if phase == "growth":
-            actual_rate = base_rate * category_mult * learning_multiplier * (1 + random.uniform(-variance, variance))
+    Returns:
+        Development history entries, one per player in order
+    """
+    rng = rng or random
+    uniform = rng.uniform
+    entries = []
+
+    for player in players:
+        prime_start, prime_end, growth_rate, decline_rate, attrs = _development_profile(
+            player.position.value
+        )
+        values = player.attributes._values
+
+        # Record before state
+        age_before = player.age
+        overall_before = _profile_overall(player, attrs)
+
+        # Get player's learning attribute (affects development speed)
+        # learning=50 is baseline (1.0x), learning=75 is 1.5x, learning=25 is 0.5x
+        learning_multiplier = values.get("learning", 50) / 50.0
+
+        # Increment age
+        player.age += 1
+        player.experience_years = getattr(player, 'experience_years', 0) + 1
+        age_after = player.age
+
+        # Determine development phase
+        if age_after < prime_start:
+            phase = "growth"
+            base_rate = growth_rate
+            direction = 1  # Positive growth
+        elif age_after <= prime_end:
+            phase = "prime"
+            base_rate = 0.02  # Small random changes in prime
+            direction = rng.choice([-1, 0, 0, 1])  # Mostly stable
         else:
-            actual_rate = base_rate * category_mult * (1 + random.uniform(-variance, variance))
-
-        # Calculate change
-        change = current_value * actual_rate * direction
-
-        # For growth, respect potential ceiling if set
-        if direction > 0:
-            potential = player.attributes.get_potential(attr_name)
-            if potential is not None:
-                max_change = potential - current_value
-                change = min(change, max_change)
-
-        # Apply change
-        new_value = current_value + change
-        new_value = max(1, min(99, int(new_value)))
-
-        player.attributes.set(attr_name, new_value)
-
-    # Record after state
-    overall_after = player.overall
-
-    return {
-        "season": season,
-        "age_before": age_before,
-        "age_after": age_after,
-        "overall_before": overall_before,
-        "overall_after": overall_after,
-        "phase": phase,
-        "change": overall_after - overall_before,
-    }
+            phase = "decline"
+            base_rate = decline_rate
+            direction = -1  # Negative decline
+
+        # Apply development to each relevant attribute
+        for attr_name, growth_mult, decline_mult, _ in attrs:
+            current_value = values.get(attr_name, 50)
+
+            # Apply category-specific multiplier
+            if phase == "growth":
+                category_mult = growth_mult
+            elif phase == "decline":
+                category_mult = decline_mult
+            else:
+                category_mult = 1.0  # Prime phase - equal chance for all
+
+            # Apply variance to the rate
+            # Learning attribute affects growth (high learning = faster development)
+            # but doesn't affect decline (can't learn your way out of aging)
+            if phase == "growth":
+                actual_rate = base_rate * category_mult * learning_multiplier * (1 + uniform(-variance, variance))
+            else:
+                actual_rate = base_rate * category_mult * (1 + uniform(-variance, variance))
+
+            # Calculate change
+            change = current_value * actual_rate * direction
+
+            # For growth, respect potential ceiling if set
+            if direction > 0:
+                potential = values.get(f"{attr_name}_potential")
+                if potential is not None:
+                    change = min(change, potential - current_value)
+
+            # Apply change (registered attributes all span 0-99)
+            new_value = max(1, min(99, int(current_value + change)))
+            if new_value != values.get(attr_name):
+                values[attr_name] = new_value
+
+        # Record after state
+        overall_after = _profile_overall(player, attrs)
+
+        entries.append({
+            "season": season,
+            "age_before": age_before,
+            "age_after": age_after,
+            "overall_before": overall_before,
+            "overall_after": overall_after,
+            "phase": phase,
+            "change": overall_after - overall_before,
+        })
+
+    return entries
@@ -273,12 +273,14 @@ class DraftAI:
         team_needs: TeamNeeds,
         config: DraftAIConfig = None,
         gm_archetype: GMArchetype = None,
+        rng: Optional[random.Random] = None,
     ):
         self.team_id = team_id
         self.identity = team_identity
         self.status = team_status
         self.needs = team_needs
         self.config = config or DraftAIConfig()
+        self.rng = rng or random
 
         # GM archetype for personality-based adjustments
         self.gm_archetype = gm_archetype or GMArchetype.BALANCED
@@ -814,7 +816,7 @@ class DraftAI:
             elif self.status.current_status in {TeamStatus.DYNASTY, TeamStatus.CONTENDING}:
                 return False  # Contenders need talent now
 
-            return random.random() < 0.5  # 50/50 for neutral teams
+            return self.rng.random() < 0.5  # 50/50 for neutral teams
 
         return False
 
@@ -906,7 +908,7 @@ class DraftAI:
 
         # Target is projected to go before our pick!
         # But add noise - maybe he falls
-        if random.random() < fall_probability:
+        if self.rng.random() < fall_probability:
             # We think he might fall, don't trade up
             return None
 
@@ -1232,6 +1234,7 @@ def generate_mock_draft(
     prospects: List["Player"],
     teams: Dict[str, "TeamState"],
     noise_factor: float = 0.15,
+    rng: Optional[random.Random] = None,
 ) -> MockDraft:
     """
     Generate a mock draft consensus with per-team noise.
@@ -1246,10 +1249,12 @@ def generate_mock_draft(
         prospects: List of Player objects in the draft class
         teams: Dict of team_id -> TeamState
         noise_factor: How much teams disagree on rankings (0.0-0.3)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         MockDraft with consensus and team-specific views
     """
+    rng = rng or random
     # Build consensus order (sorted by player grade/overall)
     sorted_prospects = sorted(prospects, key=lambda p: p.overall, reverse=True)
 
@@ -1273,7 +1278,7 @@ def generate_mock_draft(
             # Apply noise to consensus pick
             # Teams can see a player ±5 picks from consensus
             noise_range = int(len(consensus) * noise_factor)
-            noise = random.randint(-noise_range, noise_range)
+            noise = rng.randint(-noise_range, noise_range)
 
             # GM archetype affects how much noise
             # Analytics GMs are closer to consensus
@@ -136,12 +136,14 @@ class FreeAgencyAI:
         cap_space: int,
         team_needs: dict[str, float],
         gm_archetype: GMArchetype = None,
+        rng: Optional[random.Random] = None,
     ):
         self.team_id = team_id
         self.identity = team_identity
         self.status = team_status
         self.cap_space = cap_space
         self.needs = team_needs
+        self.rng = rng or random
 
         # GM archetype for personality-based adjustments
         self.gm_archetype = gm_archetype or GMArchetype.BALANCED
@@ -222,7 +224,7 @@ class FreeAgencyAI:
         need_score = self.needs.get(player.position.value, 0.3)
 
         # Get market value
-        market = calculate_market_value(player)
+        market = calculate_market_value(player, rng=self.rng)
         market_value = market.total_value
 
         # Value score - compare talent to cost
@@ -356,7 +358,7 @@ class FreeAgencyAI:
         if eval.max_offer < eval.market_value * 0.7:
             return None
 
-        market = calculate_market_value(player)
+        market = calculate_market_value(player, rng=self.rng)
 
         # Determine offer type
         if competing_offers and max(competing_offers) > eval.market_value:
@@ -509,6 +511,7 @@ def simulate_free_agency_market(
     free_agents: list["Player"],
     teams_with_ai: list[tuple[str, FreeAgencyAI]],
     num_days: int = 14,
+    rng: Optional[random.Random] = None,
 ) -> dict[str, str]:
     """
     Simulate free agency market with multiple teams bidding.
@@ -517,10 +520,12 @@ def simulate_free_agency_market(
         free_agents: Available free agents
         teams_with_ai: List of (team_id, FreeAgencyAI) tuples
         num_days: Days of free agency to simulate
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Dict mapping player_id -> team_id that signed them
     """
+    rng = rng or random
     signings: dict[str, str] = {}
     remaining_fas = list(free_agents)
 
@@ -560,7 +565,7 @@ def simulate_free_agency_market(
             winning_team, winning_offer = offers[0]
 
             # Player accepts (simplified - would use negotiation system)
-            if random.random() < 0.7:  # 70% acceptance rate
+            if rng.random() < 0.7:  # 70% acceptance rate
                 signings[player_id] = winning_team
                 remaining_fas = [p for p in remaining_fas if str(p.id) != player_id]
 
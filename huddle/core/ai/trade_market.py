@@ -321,7 +321,7 @@ class TradeMarket:
     # Supply: team_id -> list of available assets
     supply: Dict[str, List[TradeListing]] = field(default_factory=dict)
 
-    # Demand: team_id -> list of wanted assets
+    # Demand: team_id -> list of wanted assets (update via set_team_demand)
     demand: Dict[str, List[TradeTarget]] = field(default_factory=dict)
 
     # Bidding: asset_key -> all bids for that asset
@@ -333,6 +333,12 @@ class TradeMarket:
     # Cooldowns: team_id -> last round they traded
     team_cooldowns: Dict[str, int] = field(default_factory=dict)
 
+    # Demand index: (asset type, position or player) -> entries sorted by
+    # min overall, each (min_overall, rank in team's demand list, target)
+    _demand_index: Optional[Dict[Tuple[str, Optional[str]], list]] = field(
+        default=None, repr=False, compare=False
+    )
+
     def get_all_listings(self) -> List[TradeListing]:
         """Get all listings from all teams."""
         all_listings = []
@@ -340,6 +346,72 @@ class TradeMarket:
             all_listings.extend(team_listings)
         return all_listings
 
+    def set_team_supply(self, team_id: str, listings: List[TradeListing]):
+        """Replace a team's listings."""
+        if listings:
+            self.supply[team_id] = listings
+        else:
+            self.supply.pop(team_id, None)
+
+    def set_team_demand(self, team_id: str, targets: List[TradeTarget]):
+        """Replace a team's targets, keeping the demand index in sync."""
+        if targets:
+            self.demand[team_id] = targets
+        else:
+            self.demand.pop(team_id, None)
+
+        if self._demand_index is not None:
+            for key, entries in self._demand_index.items():
+                self._demand_index[key] = [e for e in entries if e[2].team_id != team_id]
+            self._index_targets(targets)
+
+    def find_interested_teams(self, listing: TradeListing) -> Dict[str, float]:
+        """
+        Teams with a target matching a listing.
+
+        Returns team_id -> priority of that team's first matching target,
+        as found by scanning its demand list with matches_listing.
+        """
+        if self._demand_index is None:
+            self._demand_index = {}
+            for targets in self.demand.values():
+                self._index_targets(targets)
+
+        if listing.asset_type == "player":
+            keys = [("player", listing.player_position), ("player_id", listing.player_id)]
+        elif listing.asset_type == "pick":
+            keys = [("pick_round", None)]
+        else:
+            return {}
+
+        overall = listing.player_overall or 0
+        best: Dict[str, Tuple[int, float]] = {}
+        for key in keys:
+            for min_overall, rank, target in self._demand_index.get(key, ()):
+                if min_overall > overall:
+                    break
+                if target.team_id in best and best[target.team_id][0] < rank:
+                    continue
+                if target.matches_listing(listing):
+                    best[target.team_id] = (rank, target.priority)
+
+        return {team_id: priority for team_id, (_, priority) in best.items()}
+
+    def _index_targets(self, targets: List[TradeTarget]):
+        """Add one team's targets to the demand index."""
+        for rank, target in enumerate(targets):
+            if target.target_type == "player_position":
+                key = ("player", target.position)
+            elif target.target_type == "specific_player":
+                key = ("player_id", target.player_id)
+            else:
+                key = (target.target_type, None)
+
+            min_overall = (target.min_overall or 0) if key[0] == "player" else 0
+            entries = self._demand_index.setdefault(key, [])
+            entries.append((min_overall, rank, target))
+            entries.sort(key=lambda e: e[0])
+
     def is_team_on_cooldown(self, team_id: str) -> bool:
         """Check if a team is on trade cooldown."""
         last_trade = self.team_cooldowns.get(team_id, -999)
@@ -442,12 +514,13 @@ def identify_available_assets(
     # === PLAYER LISTINGS ===
     for player in team.roster:
         player_id = str(player.id)
+        overall = player.overall  # Computed from attributes on every access
         contract = team.contracts.get(player_id)
         contract_years = contract.years_remaining if contract else 1
 
         # Calculate base trade value
         base_value = player_trade_value(
-            player.overall,
+            overall,
             player.age,
             contract_years,
             player.position.value,
@@ -464,7 +537,7 @@ def identify_available_assets(
             if pos_need:
                 if pos_need.acquisition_path == AcquisitionPath.KEEP_CURRENT:
                     # Team wants to keep - high commitment = high asking price
-                    if player.overall >= 85:
+                    if overall >= 85:
                         commitment = config.commitment_premium_keep_player
                     else:
                         commitment = 1.1
@@ -483,7 +556,7 @@ def identify_available_assets(
         status_mult = config.status_player_value_mults.get(status_name, 1.0)
 
         # Skip elite players unless rebuilding
-        if player.overall >= 90 and team.status.current_status != TeamStatus.REBUILDING:
+        if overall >= 90 and team.status.current_status != TeamStatus.REBUILDING:
             continue
 
         # Skip positions we desperately need
@@ -533,7 +606,7 @@ def identify_available_assets(
             commitment_multiplier=commitment * status_mult,
             player_id=player_id,
             player_name=player.full_name,
-            player_overall=player.overall,
+            player_overall=overall,
             player_age=player.age,
             player_position=player.position.value,
             contract_years=contract_years,
@@ -681,6 +754,7 @@ def generate_competitive_bid(
     competition_level: float,
     config: TradeMarketConfig,
     draft_prospects: Optional[List[DraftProspect]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Optional[Bid]:
     """
     Generate a competitive bid for a listing.
@@ -691,6 +765,7 @@ def generate_competitive_bid(
     - GM archetype (aggressive vs conservative bidding)
     - Scheme fit bonus
     """
+    rng = rng or random
     from huddle.core.ai.trade_ai import TradeAsset, player_trade_value
     from huddle.core.philosophy.evaluation import get_scheme_fit_bonus
 
@@ -740,7 +815,7 @@ def generate_competitive_bid(
         return None  # We're too far apart
 
     # Small chance to overbid
-    if random.random() < config.overbid_chance:
+    if rng.random() < config.overbid_chance:
         our_valuation = int(our_valuation * 1.1)
 
     # Build offer package from our picks
@@ -809,6 +884,7 @@ def generate_all_bids(
     market: TradeMarket,
     teams: Dict[str, TeamTradeState],
     draft_prospects: Optional[List[DraftProspect]] = None,
+    rng: Optional[random.Random] = None,
 ) -> None:
     """
     Phase 2: Generate all bids from interested teams.
@@ -816,6 +892,7 @@ def generate_all_bids(
     For each listing, find interested teams and generate their bids.
     Updates market.bid_pools in place.
     """
+    rng = rng or random
     all_listings = market.get_all_listings()
 
     for listing in all_listings:
@@ -825,9 +902,13 @@ def generate_all_bids(
 
         pool = BidPool(listing=listing)
 
-        # Find interested teams
+        # Find interested teams (demand index lookup)
+        interest = market.find_interested_teams(listing)
         interested_teams = []
         for team_id, team in teams.items():
+            if team_id not in interest:
+                continue
+
             # Can't bid on own assets
             if team_id == listing.listing_team_id:
                 continue
@@ -836,11 +917,7 @@ def generate_all_bids(
             if market.is_team_on_cooldown(team_id):
                 continue
 
-            # Check if any of their targets match this listing
-            for target in market.demand.get(team_id, []):
-                if target.matches_listing(listing):
-                    interested_teams.append((team, target.priority))
-                    break
+            interested_teams.append((team, interest[team_id]))
 
         if not interested_teams:
             continue
@@ -858,7 +935,7 @@ def generate_all_bids(
                     arch_name, participation_rate
                 )
 
-            if random.random() > participation_rate:
+            if rng.random() > participation_rate:
                 continue
 
             bid = generate_competitive_bid(
@@ -867,6 +944,7 @@ def generate_all_bids(
                 competition_level,
                 market.config,
                 draft_prospects,
+                rng=rng,
             )
 
             if bid:
@@ -1056,24 +1134,47 @@ def build_trade_market(
     # Build supply and demand for all teams
     for team_id, team in teams.items():
         # Supply: What are we willing to trade?
-        listings = identify_available_assets(team, config, draft_prospects)
-        if listings:
-            market.supply[team_id] = listings
+        market.set_team_supply(team_id, identify_available_assets(team, config, draft_prospects))
 
         # Demand: What do we want?
-        targets = identify_trade_targets(team, config)
-        if targets:
-            market.demand[team_id] = targets
+        market.set_team_demand(team_id, identify_trade_targets(team, config))
 
     return market
 
 
+def update_trade_market(
+    market: TradeMarket,
+    teams: Dict[str, TeamTradeState],
+    team_ids: List[str],
+    draft_prospects: Optional[List[DraftProspect]] = None,
+) -> None:
+    """
+    Re-run market discovery for teams whose rosters or picks changed.
+
+    Between rounds only the teams that traded have new supply or demand,
+    so the rest of the market is kept as is.
+    """
+    for team_id in team_ids:
+        team = teams.get(team_id)
+        if team is None:
+            continue
+        market.set_team_supply(
+            team_id, identify_available_assets(team, market.config, draft_prospects)
+        )
+        market.set_team_demand(team_id, identify_trade_targets(team, market.config))
+
+    # Keep listings in team order so bidding matches a full rebuild
+    market.supply = {t: market.supply[t] for t in teams if t in market.supply}
+    market.demand = {t: market.demand[t] for t in teams if t in market.demand}
+
+
 def simulate_trade_market(
     teams: Dict[str, TeamTradeState],
     season: int,
     config: Optional[TradeMarketConfig] = None,
     draft_prospects: Optional[List[DraftProspect]] = None,
     on_trade: Optional[callable] = None,
+    rng: Optional[random.Random] = None,
 ) -> List[ExecutedTrade]:
     """
     Main entry point: Run the full trade market simulation.
@@ -1083,27 +1184,32 @@ def simulate_trade_market(
     2. Bid generation (competitive)
     3. Auction resolution (best bid wins)
 
+    The market is discovered once; after each round only the teams that
+    traded are re-discovered (once on_trade has applied the trades).
+
     Returns all executed trades.
     """
+    rng = rng or random
     if config is None:
         config = TradeMarketConfig()
 
     all_trades = []
-    cooldowns: Dict[str, int] = {}
+
+    # Phase 1: Build market
+    market = build_trade_market(
+        teams=teams,
+        season=season,
+        round_number=1,
+        config=config,
+        draft_prospects=draft_prospects,
+    )
 
     for round_num in range(1, config.max_rounds + 1):
-        # Phase 1: Build market
-        market = build_trade_market(
-            teams=teams,
-            season=season,
-            round_number=round_num,
-            config=config,
-            draft_prospects=draft_prospects,
-            previous_cooldowns=cooldowns,
-        )
+        market.round_number = round_num
+        market.bid_pools = {}
 
         # Phase 2: Generate bids
-        generate_all_bids(market, teams, draft_prospects)
+        generate_all_bids(market, teams, draft_prospects, rng=rng)
 
         # Phase 3: Resolve auctions
         round_trades = resolve_auctions(market, teams)
@@ -1113,14 +1219,15 @@ def simulate_trade_market(
 
         all_trades.extend(round_trades)
 
-        # Update cooldowns for next round
-        cooldowns = market.team_cooldowns.copy()
-
         # Callback for each trade (used for logging, UI updates, etc.)
         if on_trade:
             for trade in round_trades:
                 on_trade(trade, round_num)
 
+        # Refresh supply and demand for the teams involved
+        traded = {t.seller_team_id for t in round_trades} | {t.buyer_team_id for t in round_trades}
+        update_trade_market(market, teams, [t for t in teams if t in traded], draft_prospects)
+
     return all_trades
 
 
@@ -1134,6 +1241,7 @@ def attempt_blockbuster_trade(
     season: int,
     config: TradeMarketConfig,
     draft_prospects: Optional[List[DraftProspect]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Optional[ExecutedTrade]:
     """
     Attempt to generate a blockbuster trade (franchise-altering).
@@ -1142,10 +1250,11 @@ def attempt_blockbuster_trade(
     1. REBUILDING team has elite (85+ OVR) player
     2. CONTENDING/WINDOW_CLOSING team has pick capital to pay
     """
+    rng = rng or random
     from huddle.core.ai.trade_ai import TradeAsset
 
     # Roll for blockbuster
-    if random.random() > config.blockbuster_chance_per_round:
+    if rng.random() > config.blockbuster_chance_per_round:
         return None
 
     # Find rebuilding teams with elite players
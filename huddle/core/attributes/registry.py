@@ -22,6 +22,10 @@ class AttributeRegistry:
     _attributes: dict[str, AttributeDefinition] = {}
     _initialized: bool = False
 
+    # Per-position lookups, cleared whenever an attribute is registered
+    _position_attrs: dict[str, list[AttributeDefinition]] = {}
+    _position_weights: dict[str, tuple[tuple[str, float], ...]] = {}
+
     @classmethod
     def initialize(cls) -> None:
         """Initialize registry with default attributes."""
@@ -35,6 +39,8 @@ class AttributeRegistry:
     def register(cls, attr_def: AttributeDefinition) -> None:
         """Register an attribute definition."""
         cls._attributes[attr_def.name] = attr_def
+        cls._position_attrs.clear()
+        cls._position_weights.clear()
 
     @classmethod
     def get(cls, name: str) -> AttributeDefinition:
@@ -64,11 +70,27 @@ class AttributeRegistry:
         Returns attributes that have a non-zero weight for the given position.
         """
         cls.initialize()
-        relevant = [
-            (a, a.position_weights.get(position, 0.0)) for a in cls._attributes.values()
-        ]
-        # Filter to only attributes with weight > 0, sorted by weight descending
-        return [a for a, w in sorted(relevant, key=lambda x: -x[1]) if w > 0]
+        if position not in cls._position_attrs:
+            relevant = [
+                (a, a.position_weights.get(position, 0.0)) for a in cls._attributes.values()
+            ]
+            # Filter to only attributes with weight > 0, sorted by weight descending
+            cls._position_attrs[position] = [
+                a for a, w in sorted(relevant, key=lambda x: -x[1]) if w > 0
+            ]
+        return list(cls._position_attrs[position])
+
+    @classmethod
+    def get_position_weights(cls, position: str) -> tuple[tuple[str, float], ...]:
+        """(name, weight) pairs for a position, in get_for_position order."""
+        weights = cls._position_weights.get(position)
+        if weights is None:
+            weights = tuple(
+                (a.name, a.position_weights.get(position, 0.0))
+                for a in cls.get_for_position(position)
+            )
+            cls._position_weights[position] = weights
+        return weights
 
     @classmethod
     def get_position_weight(cls, attr_name: str, position: str) -> float:
@@ -130,8 +152,8 @@ class PlayerAttributes:
         The overall is a weighted average of attributes that matter for
         the given position.
         """
-        relevant_attrs = AttributeRegistry.get_for_position(position)
-        if not relevant_attrs:
+        relevant_weights = AttributeRegistry.get_position_weights(position)
+        if not relevant_weights:
             # No position-specific weights, return average of all
             if self._values:
                 return int(sum(self._values.values()) / len(self._values))
@@ -139,11 +161,10 @@ class PlayerAttributes:
 
         total_weight = 0.0
         weighted_sum = 0.0
+        values = self._values
 
-        for attr_def in relevant_attrs:
-            weight = attr_def.position_weights.get(position, 0.0)
-            value = self.get(attr_def.name)
-            weighted_sum += value * weight
+        for attr_name, weight in relevant_weights:
+            weighted_sum += values.get(attr_name, 50) * weight
             total_weight += weight
 
         if total_weight == 0:
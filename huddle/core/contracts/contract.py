@@ -16,6 +16,8 @@ from enum import Enum, auto
 from typing import Optional
 import random
 
+from huddle.core.rng import random_uuid
+
 
 class ContractType(Enum):
     """Type of contract affecting structure and rules."""
@@ -426,14 +428,14 @@ def create_rookie_contract(
     team_id: str,
     pick_number: int,
     signed_date: date,
+    rng: Optional[random.Random] = None,
 ) -> Contract:
     """
     Create a rookie contract based on draft position.
 
-    Uses the rookie wage scale to determine value.
+    Uses the rookie wage scale to determine value. The contract id is drawn
+    from ``rng`` when given.
     """
-    import uuid
-
     values = get_rookie_contract_value(pick_number)
 
     total_years = values["years"]
@@ -484,7 +486,7 @@ def create_rookie_contract(
         ))
 
     contract = Contract(
-        contract_id=str(uuid.uuid4()),
+        contract_id=str(random_uuid(rng)),
         player_id=player_id,
         team_id=team_id,
         contract_type=ContractType.ROOKIE,
@@ -507,6 +509,7 @@ def create_veteran_contract(
     guaranteed: int,
     signing_bonus: int,
     signed_date: date,
+    rng: Optional[random.Random] = None,
 ) -> Contract:
     """
     Create a veteran free agent contract.
@@ -519,9 +522,8 @@ def create_veteran_contract(
         guaranteed: Total guaranteed money (thousands)
         signing_bonus: Signing bonus amount (thousands)
         signed_date: Date contract signed
+        rng: Optional generator for the contract id
     """
-    import uuid
-
     # Remaining value after signing bonus
     remaining_value = total_value - signing_bonus
 
@@ -555,7 +557,7 @@ def create_veteran_contract(
         ))
 
     return Contract(
-        contract_id=str(uuid.uuid4()),
+        contract_id=str(random_uuid(rng)),
         player_id=player_id,
         team_id=team_id,
         contract_type=ContractType.VETERAN,
@@ -574,14 +576,14 @@ def create_minimum_contract(
     years: int,
     player_experience: int,
     signed_date: date,
+    rng: Optional[random.Random] = None,
 ) -> Contract:
     """
     Create a league minimum contract.
 
-    Salary based on years of experience (NFL veteran minimum scale).
+    Salary based on years of experience (NFL veteran minimum scale). The
+    contract id is drawn from ``rng`` when given.
     """
-    import uuid
-
     # Veteran minimum by experience (2024 values, thousands)
     MINIMUM_SALARY = {
         0: 795,   # Rookie
@@ -610,7 +612,7 @@ def create_minimum_contract(
         ))
 
     return Contract(
-        contract_id=str(uuid.uuid4()),
+        contract_id=str(random_uuid(rng)),
         player_id=player_id,
         team_id=team_id,
         contract_type=ContractType.MINIMUM,
@@ -630,6 +632,7 @@ def create_franchise_tag(
     tag_value: int,
     signed_date: date,
     is_exclusive: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> Contract:
     """
     Create a franchise tag contract.
@@ -641,11 +644,10 @@ def create_franchise_tag(
         tag_value: Calculated tag value (thousands)
         signed_date: Date tag applied
         is_exclusive: Exclusive (can't negotiate) vs non-exclusive
+        rng: Optional generator for the contract id
     """
-    import uuid
-
     return Contract(
-        contract_id=str(uuid.uuid4()),
+        contract_id=str(random_uuid(rng)),
         player_id=player_id,
         team_id=team_id,
         contract_type=ContractType.FRANCHISE_TAG,
@@ -129,12 +129,14 @@ def generate_team_bid(
     team: "Team",
     listing: FreeAgentListing,
     player: "Player",
+    rng: Optional[random.Random] = None,
 ) -> Optional[TeamBid]:
     """
     Generate a team's bid for a free agent.
 
     Returns None if team won't bid.
     """
+    rng = rng or random
     # Calculate position need
     need = calculate_team_position_need(team, listing.position)
 
@@ -154,10 +156,10 @@ def generate_team_bid(
     # Generate bid based on tier
     if listing.tier == FreeAgentTier.ELITE:
         # Elite players get competitive bids near or above market
-        bid_pct = evaluation.max_offer_pct * random.uniform(0.90, 1.0)
+        bid_pct = evaluation.max_offer_pct * rng.uniform(0.90, 1.0)
     elif listing.tier == FreeAgentTier.STARTER:
         # Starters get market-rate bids
-        bid_pct = random.uniform(evaluation.opening_offer_pct, evaluation.max_offer_pct)
+        bid_pct = rng.uniform(evaluation.opening_offer_pct, evaluation.max_offer_pct)
     else:
         # Lower tiers get lower bids
         bid_pct = evaluation.opening_offer_pct
@@ -183,7 +185,8 @@ def generate_team_bid(
 def player_choose_team(
     listing: FreeAgentListing,
     bids: list[TeamBid],
-    team_records: dict[str, float] = None,  # abbr -> win_pct
+    team_records: dict[str, float] = None,  # abbr -> win_pct,
+    rng: Optional[random.Random] = None,
 ) -> tuple[Optional[TeamBid], str]:
     """
     Player chooses between competing bids.
@@ -195,6 +198,7 @@ def player_choose_team(
 
     Returns (chosen_bid, reason) or (None, reason) if unsigned.
     """
+    rng = rng or random
     if not bids:
         return (None, "No teams made offers")
 
@@ -231,7 +235,7 @@ def player_choose_team(
             total = (money_score * 0.40) + (contender_score * 0.25) + (interest_score * 0.35)
 
         # Add some randomness (player preferences/location)
-        total += random.uniform(-10, 10)
+        total += rng.uniform(-10, 10)
 
         scored_bids.append((bid, total, money_score, contender_score))
 
@@ -253,12 +257,14 @@ def player_choose_team(
 def run_free_agency_period(
     league: "League",
     user_team_abbr: str = None,
+    rng: Optional[random.Random] = None,
 ) -> FreeAgencyPeriod:
     """
     Run a complete free agency period.
 
     Returns the FreeAgencyPeriod with all signings.
     """
+    rng = rng or random
     period = FreeAgencyPeriod()
 
     # Create listings for all free agents
@@ -295,12 +301,12 @@ def run_free_agency_period(
             if abbr == user_team_abbr:
                 continue
 
-            bid = generate_team_bid(team, listing, player)
+            bid = generate_team_bid(team, listing, player, rng=rng)
             if bid:
                 bids.append(bid)
 
         # Player chooses
-        chosen, reason = player_choose_team(listing, bids, team_records)
+        chosen, reason = player_choose_team(listing, bids, team_records, rng=rng)
 
         if chosen:
             # Execute the signing
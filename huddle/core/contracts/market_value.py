@@ -9,7 +9,7 @@ Calculates fair market value for players based on:
 """
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 import random
 
 if TYPE_CHECKING:
@@ -122,6 +122,7 @@ def calculate_market_value(
     player: "Player",
     position_scarcity: float = 1.0,
     team_need: float = 0.5,
+    rng: Optional[random.Random] = None,
 ) -> MarketValue:
     """
     Calculate fair market value for a player.
@@ -141,10 +142,12 @@ def calculate_market_value(
         player: The player to evaluate
         position_scarcity: League-wide position scarcity (0.5-1.5)
         team_need: How much team needs this position (0.0-1.0)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         MarketValue with recommended contract terms
     """
+    rng = rng or random
     overall = player.overall
     pos_mult = POSITION_VALUE_MULTIPLIERS.get(player.position.value, 1.0)
 
@@ -251,23 +254,23 @@ def calculate_market_value(
 
     # Contract length based on age and value
     if player.age >= 32:
-        years = random.choice([1, 2])
+        years = rng.choice([1, 2])
     elif player.age >= 29:
-        years = random.choice([2, 3])
+        years = rng.choice([2, 3])
     elif overall >= 90:
-        years = random.choice([4, 5])  # Elite players get long-term deals
+        years = rng.choice([4, 5])  # Elite players get long-term deals
     elif overall >= 80:
-        years = random.choice([3, 4])
+        years = rng.choice([3, 4])
     else:
-        years = random.choice([2, 3])
+        years = rng.choice([2, 3])
 
     # Signing bonus: 20-40% of total value for starters, less for depth
     if overall >= 85:
-        bonus_pct = random.uniform(0.25, 0.40)
+        bonus_pct = rng.uniform(0.25, 0.40)
     elif overall >= 75:
-        bonus_pct = random.uniform(0.15, 0.25)
+        bonus_pct = rng.uniform(0.15, 0.25)
     else:
-        bonus_pct = random.uniform(0.05, 0.15)
+        bonus_pct = rng.uniform(0.05, 0.15)
 
     salary_total = base * years
     signing_bonus = int(salary_total * bonus_pct)
@@ -12,8 +12,11 @@ from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum, auto
 from typing import Optional
+import random
 import uuid
 
+from huddle.core.rng import random_uuid
+
 
 class PickProtection(Enum):
     """Type of protection on a conditional pick."""
@@ -334,17 +337,20 @@ def create_initial_picks_for_team(
     start_year: int,
     years_ahead: int = 3,
     rounds: int = 7,
+    rng: Optional[random.Random] = None,
 ) -> DraftPickInventory:
     """
     Create initial draft pick inventory for a team.
 
-    Generates picks for current year plus future years.
+    Generates picks for current year plus future years. Pick ids are drawn
+    from ``rng`` when given.
     """
     inventory = DraftPickInventory(team_id=team_id)
 
     for year in range(start_year, start_year + years_ahead + 1):
         for round_num in range(1, rounds + 1):
             pick = DraftPick(
+                pick_id=str(random_uuid(rng)),
                 year=year,
                 round=round_num,
                 original_team_id=team_id,
@@ -359,6 +365,7 @@ def create_league_draft_picks(
     team_ids: list[str],
     start_year: int,
     years_ahead: int = 3,
+    rng: Optional[random.Random] = None,
 ) -> dict[str, DraftPickInventory]:
     """
     Create draft pick inventories for all teams in a league.
@@ -368,7 +375,7 @@ def create_league_draft_picks(
     inventories = {}
     for team_id in team_ids:
         inventories[team_id] = create_initial_picks_for_team(
-            team_id, start_year, years_ahead
+            team_id, start_year, years_ahead, rng=rng
         )
     return inventories
 
@@ -15,6 +15,13 @@ from huddle.core.league.nfl_data import (
     get_team_by_name,
     get_team_by_city,
 )
+from huddle.core.league.archive import (
+    GameLogArchive,
+    SeasonGameLogs,
+    SeasonTable,
+    TeamSplit,
+    ArchivedPlayerGame,
+)
 from huddle.core.league.league import (
     League,
     TeamStanding,
@@ -40,4 +47,10 @@ __all__ = [
     "League",
     "TeamStanding",
     "ScheduledGame",
+    # Game Archive
+    "GameLogArchive",
+    "SeasonGameLogs",
+    "SeasonTable",
+    "TeamSplit",
+    "ArchivedPlayerGame",
 ]
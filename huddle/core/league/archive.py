@@ -0,0 +1,552 @@
+"""
+Columnar Game-Log Archive.
+
+A GameLog is a small object graph (team stats plus a PlayerGameStats
+with five nested stat dataclasses per player). Keeping one per game for
+every season a league has played adds up to hundreds of thousands of
+resident objects, and every query walks them linearly.
+
+GameLogArchive stores each season as two column tables instead:
+- games: one row per game (week, teams, score, team stats)
+- rows: one row per player per game (game, player, team, every stat)
+
+Each column is a stdlib ``array`` (int32, or float64 for half-sack
+style fields), so a season of player-game rows is a few hundred KB.
+Saved archives are a directory of raw column files that load
+memory-mapped; a mapped season is copied into memory only if more games
+are appended to it.
+
+GameLog and PlayerGameStats are rebuilt on demand as views over the
+columns. Play-by-play text is not archived.
+
+Usage:
+    archive = GameLogArchive()
+    archive.add_game(game_log, season=2024)
+
+    archive.leaders(2024, "passing", "yards", limit=5)
+    archive.player_games(player_id)
+    archive.team_splits("PHI", 2024)["home"].win_pct
+    archive.game_log(game_id)
+    archive.season_games(2024)  # game_id -> GameLog mapping
+
+    archive.save(Path("league.archive"))
+    archive = GameLogArchive.load(Path("league.archive"))
+"""
+
+import heapq
+import json
+import mmap
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from huddle.core.models.stats import (
+    DefensiveStats,
+    GameLog,
+    KickingStats,
+    PassingStats,
+    PlayerGameStats,
+    PlayerSeasonStats,
+    ReceivingStats,
+    RushingStats,
+    TeamGameStats,
+)
+
+
+def _typecode(field_type) -> str:
+    return "d" if field_type in (float, "float") else "i"
+
+
+# Player stat categories, as attributes of PlayerGameStats
+CATEGORIES = {
+    "passing": PassingStats,
+    "rushing": RushingStats,
+    "receiving": ReceivingStats,
+    "defense": DefensiveStats,
+    "kicking": KickingStats,
+}
+
+_TEAM_STATS = [f for f in fields(TeamGameStats) if f.name != "team_abbr"]
+
+# (column name, array typecode)
+GAME_COLUMNS = [
+    ("week", "i"), ("home", "i"), ("away", "i"),
+    ("home_score", "i"), ("away_score", "i"),
+    ("is_overtime", "b"), ("is_playoff", "b"),
+] + [
+    (f"{side}.{f.name}", _typecode(f.type)) for side in ("home", "away") for f in _TEAM_STATS
+]
+
+ROW_COLUMNS = [("game", "i"), ("player", "i"), ("team", "i")] + [
+    (f"{category}.{f.name}", _typecode(f.type))
+    for category, stats_cls in CATEGORIES.items()
+    for f in fields(stats_cls)
+]
+
+
+@dataclass
+class ArchivedPlayerGame:
+    """One player's line in one archived game."""
+
+    season: int
+    week: int
+    game_id: str
+    opponent_abbr: str
+    is_home: bool
+    stats: PlayerGameStats
+
+
+@dataclass
+class TeamSplit:
+    """Aggregate results for a team over a set of games."""
+
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: int = 0
+    points_against: int = 0
+    yards_for: int = 0
+    yards_against: int = 0
+
+    @property
+    def win_pct(self) -> float:
+        if self.games == 0:
+            return 0.0
+        return (self.wins + 0.5 * self.ties) / self.games
+
+    def add(self, points_for: int, points_against: int, yards_for: int, yards_against: int) -> None:
+        self.games += 1
+        if points_for > points_against:
+            self.wins += 1
+        elif points_for < points_against:
+            self.losses += 1
+        else:
+            self.ties += 1
+        self.points_for += points_for
+        self.points_against += points_against
+        self.yards_for += yards_for
+        self.yards_against += yards_against
+
+
+# =============================================================================
+# Season Table
+# =============================================================================
+
+class SeasonTable:
+    """One season of archived games, stored column-wise."""
+
+    def __init__(self, season: int) -> None:
+        self.season = season
+
+        # Dictionaries: rows store indexes into these
+        self.game_ids: list[str] = []
+        self.players: list[tuple[str, str, str]] = []  # (player_id, name, position)
+        self.teams: list[str] = []
+
+        self.games: dict[str, array | memoryview] = {n: array(c) for n, c in GAME_COLUMNS}
+        self.rows: dict[str, array | memoryview] = {n: array(c) for n, c in ROW_COLUMNS}
+
+        self._game_index: dict[str, int] = {}
+        self._player_index: dict[str, int] = {}
+        self._team_index: dict[str, int] = {}
+        self._maps: list[mmap.mmap] = []
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows["game"])
+
+    @property
+    def is_mapped(self) -> bool:
+        return bool(self._maps)
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def add_game(self, game_log: GameLog) -> None:
+        """Append a game and all of its player lines."""
+        game_id = str(game_log.game_id)
+        if game_id in self._game_index:
+            raise ValueError(f"Game {game_id} is already archived for {self.season}")
+        self._thaw()
+
+        game = len(self.game_ids)
+        self.game_ids.append(game_id)
+        self._game_index[game_id] = game
+
+        cols = self.games
+        cols["week"].append(game_log.week)
+        cols["home"].append(self._team(game_log.home_team_abbr))
+        cols["away"].append(self._team(game_log.away_team_abbr))
+        cols["home_score"].append(game_log.home_score)
+        cols["away_score"].append(game_log.away_score)
+        cols["is_overtime"].append(int(game_log.is_overtime))
+        cols["is_playoff"].append(int(game_log.is_playoff))
+        for side, team_stats in (("home", game_log.home_stats), ("away", game_log.away_stats)):
+            for f in _TEAM_STATS:
+                cols[f"{side}.{f.name}"].append(getattr(team_stats, f.name))
+
+        rows = self.rows
+        for player_id, line in game_log.player_stats.items():
+            rows["game"].append(game)
+            rows["player"].append(self._player(player_id, line))
+            rows["team"].append(self._team(line.team_abbr))
+            for category in CATEGORIES:
+                stats = getattr(line, category)
+                for f in fields(stats):
+                    rows[f"{category}.{f.name}"].append(getattr(stats, f.name))
+
+    def _team(self, abbr: str) -> int:
+        index = self._team_index.get(abbr)
+        if index is None:
+            index = self._team_index[abbr] = len(self.teams)
+            self.teams.append(abbr)
+        return index
+
+    def _player(self, player_id: str, line: PlayerGameStats) -> int:
+        index = self._player_index.get(player_id)
+        if index is None:
+            index = self._player_index[player_id] = len(self.players)
+            self.players.append((player_id, line.player_name, line.position))
+        return index
+
+    def _thaw(self) -> None:
+        """Copy memory-mapped columns into appendable arrays."""
+        if not self._maps:
+            return
+        for table, spec in ((self.games, GAME_COLUMNS), (self.rows, ROW_COLUMNS)):
+            for name, code in spec:
+                column = table[name]
+                if isinstance(column, memoryview):
+                    table[name] = array(code, column)
+                    column.release()
+        for m in self._maps:
+            m.close()
+        self._maps = []
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def game_index(self, game_id: str) -> Optional[int]:
+        return self._game_index.get(game_id)
+
+    def player_index(self, player_id: str) -> Optional[int]:
+        return self._player_index.get(player_id)
+
+    def team_index(self, abbr: str) -> Optional[int]:
+        return self._team_index.get(abbr)
+
+    def rows_for_player(self, player: int) -> list[int]:
+        return [i for i, p in enumerate(self.rows["player"]) if p == player]
+
+    def rows_for_game(self, game: int) -> list[int]:
+        return [i for i, g in enumerate(self.rows["game"]) if g == game]
+
+    def player_line(self, row: int) -> PlayerGameStats:
+        """Materialize one player-game row."""
+        player_id, name, position = self.players[self.rows["player"][row]]
+        line = PlayerGameStats(
+            player_id=UUID(player_id),
+            player_name=name,
+            team_abbr=self.teams[self.rows["team"][row]],
+            position=position,
+        )
+        for category, stats_cls in CATEGORIES.items():
+            setattr(line, category, stats_cls(**{
+                f.name: self.rows[f"{category}.{f.name}"][row] for f in fields(stats_cls)
+            }))
+        return line
+
+    def team_stats(self, game: int, side: str) -> TeamGameStats:
+        return TeamGameStats(
+            team_abbr=self.teams[self.games[side][game]],
+            **{f.name: self.games[f"{side}.{f.name}"][game] for f in _TEAM_STATS},
+        )
+
+    def game_log(self, game: int) -> GameLog:
+        """Materialize one game as a GameLog (without play-by-play)."""
+        cols = self.games
+        return GameLog(
+            game_id=UUID(self.game_ids[game]),
+            week=cols["week"][game],
+            home_team_abbr=self.teams[cols["home"][game]],
+            away_team_abbr=self.teams[cols["away"][game]],
+            home_score=cols["home_score"][game],
+            away_score=cols["away_score"][game],
+            is_overtime=bool(cols["is_overtime"][game]),
+            is_playoff=bool(cols["is_playoff"][game]),
+            home_stats=self.team_stats(game, "home"),
+            away_stats=self.team_stats(game, "away"),
+            player_stats={
+                self.players[self.rows["player"][row]][0]: self.player_line(row)
+                for row in self.rows_for_game(game)
+            },
+        )
+
+    def totals(self, column: str) -> dict[int, int | float]:
+        """Sum a player stat column per player index."""
+        result: dict[int, int | float] = {}
+        for player, value in zip(self.rows["player"], self.rows[column]):
+            if value:
+                result[player] = result.get(player, 0) + value
+        return result
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, directory: Path) -> None:
+        # The target may be the very files this season is mapped from
+        self._thaw()
+        directory.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "season": self.season,
+            "game_ids": self.game_ids,
+            "players": self.players,
+            "teams": self.teams,
+        }
+        with open(directory / "meta.json", "w") as f:
+            json.dump(meta, f)
+        for prefix, table in (("games", self.games), ("rows", self.rows)):
+            for name, column in table.items():
+                with open(directory / f"{prefix}.{name}.bin", "wb") as f:
+                    column.tofile(f)
+
+    @classmethod
+    def load(cls, directory: Path, mapped: bool = True) -> "SeasonTable":
+        with open(directory / "meta.json") as f:
+            meta = json.load(f)
+        table = cls(meta["season"])
+        table.game_ids = meta["game_ids"]
+        table.players = [tuple(p) for p in meta["players"]]
+        table.teams = meta["teams"]
+        table._game_index = {g: i for i, g in enumerate(table.game_ids)}
+        table._player_index = {p[0]: i for i, p in enumerate(table.players)}
+        table._team_index = {t: i for i, t in enumerate(table.teams)}
+
+        for prefix, columns, spec in (
+            ("games", table.games, GAME_COLUMNS),
+            ("rows", table.rows, ROW_COLUMNS),
+        ):
+            for name, code in spec:
+                path = directory / f"{prefix}.{name}.bin"
+                if not path.exists():
+                    continue  # Column added after this season was saved
+                columns[name] = table._read_column(path, code, mapped)
+        return table
+
+    def _read_column(self, path: Path, code: str, mapped: bool) -> array | memoryview:
+        size = path.stat().st_size
+        if not mapped or size == 0:
+            column = array(code)
+            column.frombytes(path.read_bytes())
+            return column
+        with open(path, "rb") as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(m)
+        return memoryview(m).cast(code)
+
+
+# =============================================================================
+# Archive
+# =============================================================================
+
+class SeasonGameLogs(Mapping[str, GameLog]):
+    """Read-only mapping of game_id -> GameLog over one archived season."""
+
+    def __init__(self, archive: "GameLogArchive", season: int) -> None:
+        self._archive = archive
+        self._season = season
+
+    def _table(self) -> Optional[SeasonTable]:
+        return self._archive.seasons.get(self._season)
+
+    def __getitem__(self, game_id: str) -> GameLog:
+        table = self._table()
+        game = table.game_index(str(game_id)) if table else None
+        if game is None:
+            raise KeyError(game_id)
+        return table.game_log(game)
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._table()
+        return iter(list(table.game_ids) if table else [])
+
+    def __len__(self) -> int:
+        table = self._table()
+        return len(table) if table else 0
+
+
+class GameLogArchive:
+    """Every archived game, organized by season."""
+
+    def __init__(self) -> None:
+        self.seasons: dict[int, SeasonTable] = {}
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.seasons.values())
+
+    def add_game(self, game_log: GameLog, season: int) -> None:
+        """Archive a completed game."""
+        table = self.seasons.get(season)
+        if table is None:
+            table = self.seasons[season] = SeasonTable(season)
+        table.add_game(game_log)
+
+    def season_games(self, season: int) -> SeasonGameLogs:
+        """A season's games as a game_id -> GameLog mapping, rebuilt per lookup."""
+        return SeasonGameLogs(self, season)
+
+    def _tables(self, season: Optional[int]) -> list[SeasonTable]:
+        if season is None:
+            return [self.seasons[s] for s in sorted(self.seasons)]
+        table = self.seasons.get(season)
+        return [table] if table else []
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def game_log(self, game_id: UUID | str) -> Optional[GameLog]:
+        """Rebuild a GameLog for an archived game."""
+        game_id = str(game_id)
+        for table in self.seasons.values():
+            game = table.game_index(game_id)
+            if game is not None:
+                return table.game_log(game)
+        return None
+
+    def team_game_logs(self, abbreviation: str, season: Optional[int] = None) -> list[GameLog]:
+        """Rebuild GameLogs for every archived game a team played."""
+        logs = []
+        for table in self._tables(season):
+            team = table.team_index(abbreviation)
+            if team is None:
+                continue
+            for game, (home, away) in enumerate(zip(table.games["home"], table.games["away"])):
+                if team in (home, away):
+                    logs.append(table.game_log(game))
+        return logs
+
+    def player_games(
+        self,
+        player_id: UUID | str,
+        season: Optional[int] = None,
+    ) -> list[ArchivedPlayerGame]:
+        """A player's game-by-game lines, oldest first."""
+        player_id = str(player_id)
+        games = []
+        for table in self._tables(season):
+            player = table.player_index(player_id)
+            if player is None:
+                continue
+            for row in table.rows_for_player(player):
+                game = table.rows["game"][row]
+                home = table.games["home"][game]
+                is_home = table.rows["team"][row] == home
+                opponent = table.games["away" if is_home else "home"][game]
+                games.append(ArchivedPlayerGame(
+                    season=table.season,
+                    week=table.games["week"][game],
+                    game_id=table.game_ids[game],
+                    opponent_abbr=table.teams[opponent],
+                    is_home=is_home,
+                    stats=table.player_line(row),
+                ))
+        return games
+
+    def season_stats(self, player_id: UUID | str, season: int) -> Optional[PlayerSeasonStats]:
+        """Rebuild a player's season totals from their archived games."""
+        table = self.seasons.get(season)
+        player = table.player_index(str(player_id)) if table else None
+        if player is None:
+            return None
+        return self._season_stats(table, player)
+
+    def _season_stats(self, table: SeasonTable, player: int) -> PlayerSeasonStats:
+        player_id, name, position = table.players[player]
+        rows = table.rows_for_player(player)
+        totals = PlayerSeasonStats(
+            player_id=UUID(player_id),
+            player_name=name,
+            team_abbr=table.teams[table.rows["team"][rows[-1]]],
+            position=position,
+            season=table.season,
+        )
+        for row in rows:
+            totals.add_game(table.player_line(row), table.game_ids[table.rows["game"][row]])
+        return totals
+
+    def leaders(
+        self,
+        season: int,
+        stat_category: str,
+        stat_name: str,
+        limit: int = 10,
+    ) -> list[tuple[PlayerSeasonStats, int | float]]:
+        """
+        Season leaders for a stat, same shape as League.get_season_leaders.
+
+        Only the top ``limit`` players are materialized.
+        """
+        table = self.seasons.get(season)
+        column = f"{stat_category}.{stat_name}"
+        if table is None or column not in table.rows:
+            return []
+        totals = table.totals(column)
+        top = heapq.nlargest(limit, (item for item in totals.items() if item[1] > 0),
+                             key=lambda item: item[1])
+        return [(self._season_stats(table, player), value) for player, value in top]
+
+    def team_splits(self, abbreviation: str, season: Optional[int] = None) -> dict[str, TeamSplit]:
+        """Home, away and total results for a team."""
+        splits = {"home": TeamSplit(), "away": TeamSplit(), "total": TeamSplit()}
+        for table in self._tables(season):
+            team = table.team_index(abbreviation)
+            if team is None:
+                continue
+            g = table.games
+            for game in range(len(table)):
+                if g["home"][game] == team:
+                    side, other = "home", "away"
+                elif g["away"][game] == team:
+                    side, other = "away", "home"
+                else:
+                    continue
+                result = (
+                    g[f"{side}_score"][game], g[f"{other}_score"][game],
+                    g[f"{side}.total_yards"][game], g[f"{other}.total_yards"][game],
+                )
+                splits[side].add(*result)
+                splits["total"].add(*result)
+        return splits
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, directory: Path) -> None:
+        """Write each season as a directory of raw column files."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for season, table in self.seasons.items():
+            table.save(directory / str(season))
+
+    @classmethod
+    def load(cls, directory: Path, mapped: bool = True) -> "GameLogArchive":
+        """Load an archive; columns are memory-mapped unless ``mapped`` is False."""
+        archive = cls()
+        if not directory.exists():
+            return archive
+        for season_dir in sorted(directory.iterdir()):
+            if (season_dir / "meta.json").exists():
+                table = SeasonTable.load(season_dir, mapped)
+                archive.seasons[table.season] = table
+        return archive
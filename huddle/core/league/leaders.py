@@ -0,0 +1,170 @@
+"""
+Season Leader Tables.
+
+League.get_season_leaders used to scan every player's season stats and
+sort them on each call. SeasonLeaders keeps a small top-K board per
+(category, stat) instead, updated as each game is added, so a leaders
+read only sorts K entries.
+
+Counting stats almost only go up, which is what makes a bounded board
+work: a player can only enter the top K by increasing. When a player on
+a board loses value (e.g. a negative rushing game), someone outside
+the board might now belong on it, so that board is rebuilt from the
+full season stats on its next read.
+
+Derived stats (properties such as ``completion_pct``) can move either
+way on every game and are not tracked; reads for them fall back to a
+full scan.
+"""
+
+from dataclasses import fields
+from typing import Iterable, Optional
+
+from huddle.core.models.stats import (
+    DefensiveStats,
+    KickingStats,
+    PassingStats,
+    PlayerGameStats,
+    PlayerSeasonStats,
+    ReceivingStats,
+    RushingStats,
+)
+
+# Stats tracked per category (dataclass fields, not derived properties)
+TRACKED_STATS: dict[str, tuple[str, ...]] = {
+    category: tuple(f.name for f in fields(stats_cls))
+    for category, stats_cls in (
+        ("passing", PassingStats),
+        ("rushing", RushingStats),
+        ("receiving", ReceivingStats),
+        ("defense", DefensiveStats),
+        ("kicking", KickingStats),
+    )
+}
+
+DEFAULT_BOARD_SIZE = 25
+
+
+def _rank(key: str, value: int | float, order: dict[str, int]) -> tuple:
+    """Sort key: highest value first, then earliest recorded."""
+    return (-value, order.get(key, len(order)))
+
+
+class LeaderBoard:
+    """
+    Top-K players for one stat.
+
+    Ties are broken by the order players first recorded a stat, which is
+    the order a stable sort over League.season_stats would produce.
+    """
+
+    def __init__(self, size: int = DEFAULT_BOARD_SIZE) -> None:
+        self.size = size
+        self.stale = False
+        self._values: dict[str, int | float] = {}
+        self._sorted: Optional[list[tuple[str, int | float]]] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, key: str, value: int | float, order: dict[str, int]) -> None:
+        """Record a player's new season total."""
+        current = self._values.get(key)
+        if current is not None:
+            if value < current:
+                self.stale = True
+            if value > 0:
+                self._values[key] = value
+            else:
+                del self._values[key]
+            self._sorted = None
+            return
+
+        if value <= 0:
+            return
+        if len(self._values) < self.size:
+            self._values[key] = value
+            self._sorted = None
+            return
+
+        last_key, last_value = self.top(order)[-1]
+        if _rank(key, value, order) < _rank(last_key, last_value, order):
+            del self._values[last_key]
+            self._values[key] = value
+            self._sorted = None
+
+    def top(
+        self,
+        order: dict[str, int],
+        limit: Optional[int] = None,
+    ) -> list[tuple[str, int | float]]:
+        if self._sorted is None:
+            self._sorted = sorted(self._values.items(), key=lambda kv: _rank(*kv, order))
+        return self._sorted if limit is None else self._sorted[:limit]
+
+    def rebuild(self, values: Iterable[tuple[str, int | float]], order: dict[str, int]) -> None:
+        """Replace the board with the top K of ``values``."""
+        ranked = sorted(
+            ((key, value) for key, value in values if value > 0),
+            key=lambda kv: _rank(*kv, order),
+        )[:self.size]
+        self._values = dict(ranked)
+        self._sorted = ranked
+        self.stale = False
+
+
+class SeasonLeaders:
+    """Leader boards for every tracked stat in one season."""
+
+    def __init__(self, size: int = DEFAULT_BOARD_SIZE) -> None:
+        self.size = size
+        self._boards: dict[tuple[str, str], LeaderBoard] = {
+            (category, stat): LeaderBoard(size)
+            for category, stats in TRACKED_STATS.items()
+            for stat in stats
+        }
+        # player key -> first-seen rank, for tie-breaking
+        self._order: dict[str, int] = {}
+
+    def record_game(self, key: str, season: PlayerSeasonStats, game: PlayerGameStats) -> None:
+        """Update the boards for stats this game changed (call after season.add_game)."""
+        if key not in self._order:
+            self._order[key] = len(self._order)
+        for category, stats in TRACKED_STATS.items():
+            game_category = getattr(game, category)
+            season_category = getattr(season, category)
+            for stat in stats:
+                if getattr(game_category, stat):
+                    self._boards[(category, stat)].update(
+                        key, getattr(season_category, stat), self._order
+                    )
+
+    def leaders(
+        self,
+        category: str,
+        stat: str,
+        limit: int,
+        season_stats: dict[str, PlayerSeasonStats],
+    ) -> Optional[list[tuple[PlayerSeasonStats, int | float]]]:
+        """
+        Top ``limit`` players, or None if the stat isn't tracked or
+        ``limit`` exceeds the board size (caller should scan).
+        """
+        board = self._boards.get((category, stat))
+        if board is None or limit > self.size:
+            return None
+        if board.stale:
+            board.rebuild(
+                ((key, getattr(getattr(s, category), stat)) for key, s in season_stats.items()),
+                self._order,
+            )
+        return [(season_stats[key], value) for key, value in board.top(self._order, limit)]
+
+    def rebuild(self, season_stats: dict[str, PlayerSeasonStats]) -> None:
+        """Rebuild every board from scratch (e.g. after loading a save)."""
+        self._order = {key: i for i, key in enumerate(season_stats)}
+        for (category, stat), board in self._boards.items():
+            board.rebuild(
+                ((key, getattr(getattr(s, category), stat)) for key, s in season_stats.items()),
+                self._order,
+            )
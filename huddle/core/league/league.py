@@ -11,12 +11,15 @@ This module provides the League class - the top-level container for a
 - Season progression
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
 import json
 from pathlib import Path
 
+from huddle.core.league.archive import GameLogArchive
+from huddle.core.league.leaders import SeasonLeaders
 from huddle.core.league.nfl_data import (
     Conference,
     Division,
@@ -249,12 +252,22 @@ class League:
     # blockbuster_trades: list of notable trades with details
     blockbuster_trades: list[dict] = field(default_factory=list)
 
-    # Game logs (keyed by game_id string)
-    game_logs: dict[str, GameLog] = field(default_factory=dict)
+    # Columnar archive of every game played, across seasons
+    archive: GameLogArchive = field(default_factory=GameLogArchive, repr=False)
+
+    # Also keep this season's GameLog objects (with play-by-play, which the
+    # archive drops). Off by default; game_logs is then an archive view.
+    retain_game_logs: bool = False
+
+    # Retained GameLogs (keyed by game_id string), current season only
+    _game_logs: dict[str, GameLog] = field(default_factory=dict, repr=False)
 
     # Season stats (keyed by player_id string)
     season_stats: dict[str, PlayerSeasonStats] = field(default_factory=dict)
 
+    # Top-K leader boards over season_stats, kept current by add_game_log
+    _leaders: SeasonLeaders = field(default_factory=SeasonLeaders, repr=False)
+
     # Transaction log (tracks all roster moves, trades, signings)
     transactions: Optional["TransactionLog"] = None
 
@@ -596,8 +609,10 @@ class League:
     # ==========================================================================
 
     def add_game_log(self, game_log: GameLog) -> None:
-        """Add a game log and update season stats."""
-        self.game_logs[str(game_log.game_id)] = game_log
+        """Add a game log, archive it, and update season stats."""
+        self.archive.add_game(game_log, self.current_season)
+        if self.retain_game_logs:
+            self._game_logs[str(game_log.game_id)] = game_log
 
         # Update season stats for each player
         for player_id_str, game_stats in game_log.player_stats.items():
@@ -609,20 +624,34 @@ class League:
                     position=game_stats.position,
                     season=self.current_season,
                 )
-            self.season_stats[player_id_str].add_game(game_stats, str(game_log.game_id))
+            season_stats = self.season_stats[player_id_str]
+            season_stats.add_game(game_stats, str(game_log.game_id))
+            self._leaders.record_game(player_id_str, season_stats, game_stats)
+
+    @property
+    def game_logs(self) -> Mapping[str, GameLog]:
+        """This season's games keyed by game_id string."""
+        if self.retain_game_logs:
+            return self._game_logs
+        return self.archive.season_games(self.current_season)
 
     def get_game_log(self, game_id: UUID) -> Optional[GameLog]:
-        """Get a game log by game ID."""
-        return self.game_logs.get(str(game_id))
+        """Get a game log by game ID (from any archived season)."""
+        game_log = self._game_logs.get(str(game_id))
+        if game_log is None:
+            game_log = self.archive.game_log(game_id)
+        return game_log
 
     def get_player_season_stats(self, player_id: UUID) -> Optional[PlayerSeasonStats]:
         """Get season stats for a player."""
         return self.season_stats.get(str(player_id))
 
     def get_team_game_logs(self, abbreviation: str) -> list[GameLog]:
-        """Get all game logs for a team."""
+        """Get all game logs for a team this season."""
+        if not self.retain_game_logs:
+            return self.archive.team_game_logs(abbreviation, self.current_season)
         return [
-            log for log in self.game_logs.values()
+            log for log in self._game_logs.values()
             if log.home_team_abbr == abbreviation or log.away_team_abbr == abbreviation
         ]
 
@@ -643,6 +672,11 @@ class League:
         Returns:
             List of (PlayerSeasonStats, stat_value) tuples
         """
+        leaders = self._leaders.leaders(stat_category, stat_name, limit, self.season_stats)
+        if leaders is not None:
+            return leaders
+
+        # Derived stats (and very long lists) aren't tracked: scan
         results = []
         for stats in self.season_stats.values():
             category = getattr(stats, stat_category, None)
@@ -654,6 +688,10 @@ class League:
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:limit]
 
+    def rebuild_leaders(self) -> None:
+        """Rebuild leader boards from season_stats (after loading or editing it)."""
+        self._leaders.rebuild(self.season_stats)
+
     # ==========================================================================
     # Season Progression
     # ==========================================================================
@@ -743,8 +781,9 @@ class League:
 
         # Clear schedule and season stats
         self.schedule = []
-        self.game_logs = {}
+        self._game_logs = {}
         self.season_stats = {}
+        self._leaders = SeasonLeaders()
 
         return expiring_contracts
 
@@ -784,7 +823,9 @@ class League:
             "draft_class": [p.to_dict() for p in self.draft_class],
             "draft_order": self.draft_order,
             "champions": {str(y): abbr for y, abbr in self.champions.items()},
-            "game_logs": {k: v.to_dict() for k, v in self.game_logs.items()},
+            "retain_game_logs": self.retain_game_logs,
+            # Unretained games are only written by the archive (see save)
+            "game_logs": {k: v.to_dict() for k, v in self._game_logs.items()},
             "season_stats": {k: v.to_dict() for k, v in self.season_stats.items()},
         }
 
@@ -816,6 +857,7 @@ class League:
             name=data.get("name", "NFL League"),
             current_season=data.get("current_season", 2024),
             current_week=data.get("current_week", 0),
+            retain_game_logs=data.get("retain_game_logs", False),
         )
 
         # Load teams
@@ -849,15 +891,19 @@ class League:
             int(y): abbr for y, abbr in data.get("champions", {}).items()
         }
 
-        # Load game logs
-        league.game_logs = {
-            k: GameLog.from_dict(v) for k, v in data.get("game_logs", {}).items()
-        }
+        # Load game logs. Saves without an archive directory only have these,
+        # so archive them too (load() replaces the archive if one was saved).
+        for game_data in data.get("game_logs", {}).values():
+            game_log = GameLog.from_dict(game_data)
+            league.archive.add_game(game_log, league.current_season)
+            if league.retain_game_logs:
+                league._game_logs[str(game_log.game_id)] = game_log
 
         # Load season stats
         league.season_stats = {
             k: PlayerSeasonStats.from_dict(v) for k, v in data.get("season_stats", {}).items()
         }
+        league.rebuild_leaders()
 
         # Load transaction log if present
         if "transactions" in data:
@@ -887,16 +933,22 @@ class League:
         return league
 
     def save(self, path: Path) -> None:
-        """Save the league to a JSON file."""
+        """Save the league to a JSON file (game archive alongside it)."""
         with open(path, "w") as f:
             json.dump(self.to_dict(), f, indent=2)
+        if len(self.archive):
+            self.archive.save(path.with_suffix(".archive"))
 
     @classmethod
     def load(cls, path: Path) -> "League":
-        """Load a league from a JSON file."""
+        """Load a league from a JSON file, memory-mapping its game archive."""
         with open(path, "r") as f:
             data = json.load(f)
-        return cls.from_dict(data)
+        league = cls.from_dict(data)
+        archive_dir = path.with_suffix(".archive")
+        if archive_dir.exists():
+            league.archive = GameLogArchive.load(archive_dir)
+        return league
 
     # ==========================================================================
     # League Info
@@ -390,12 +390,20 @@ class DriveResult:
     time_elapsed_seconds: int = 0
 
     # Drive outcome
-    result: str = ""  # "TD", "FG", "FG_MISS", "PUNT", "TURNOVER", "DOWNS", "END_HALF"
+    result: str = ""  # "TD", "FG", "FG_MISS", "PUNT", "TURNOVER", "DOWNS", "SAFETY", "END_HALF"
     points: int = 0
+    turnover_type: str = ""  # "INT" or "FUMBLE" when result is "TURNOVER"
+
+    # Where the other team takes over (0-100 from their own goal line) after
+    # a punt, missed field goal, turnover or turnover on downs
+    takeover_yard_line: Optional[int] = None
 
     # Key plays (optional, for narrative)
     big_plays: list[str] = field(default_factory=list)  # Descriptions of notable plays
 
+    # Box score credits: (player_id, stat column, amount). Not serialized.
+    credits: list[tuple[UUID, str, float]] = field(default_factory=list)
+
     @property
     def display(self) -> str:
         """Human-readable drive summary."""
@@ -420,6 +428,8 @@ class DriveResult:
             "time_elapsed_seconds": self.time_elapsed_seconds,
             "result": self.result,
             "points": self.points,
+            "turnover_type": self.turnover_type,
+            "takeover_yard_line": self.takeover_yard_line,
             "big_plays": self.big_plays,
         }
 
@@ -434,5 +444,7 @@ class DriveResult:
             time_elapsed_seconds=data.get("time_elapsed_seconds", 0),
             result=data.get("result", ""),
             points=data.get("points", 0),
+            turnover_type=data.get("turnover_type", ""),
+            takeover_yard_line=data.get("takeover_yard_line"),
             big_plays=data.get("big_plays", []),
         )
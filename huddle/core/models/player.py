@@ -1,5 +1,6 @@
 """Player model."""
 
+import random
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
@@ -373,12 +374,17 @@ class Player:
         """Set a specific attribute value."""
         self.attributes.set(attr_name, value)
 
-    def get_preferred_number(self, taken_numbers: set[int]) -> int:
+    def get_preferred_number(
+        self,
+        taken_numbers: set[int],
+        rng: Optional[random.Random] = None,
+    ) -> int:
         """
         Get the best available jersey number for this player.
 
         Args:
             taken_numbers: Set of jersey numbers already taken on the team
+            rng: Random generator for the fallback pick (module-level if None)
 
         Returns:
             Best available number from preferences, or a valid random number
@@ -389,11 +395,15 @@ class Player:
                 return num
 
         # Fall back to position-appropriate random number
-        return self._get_fallback_number(taken_numbers)
+        return self._get_fallback_number(taken_numbers, rng)
 
-    def _get_fallback_number(self, taken_numbers: set[int]) -> int:
+    def _get_fallback_number(
+        self,
+        taken_numbers: set[int],
+        rng: Optional[random.Random] = None,
+    ) -> int:
         """Get a random valid number for this position that isn't taken."""
-        import random
+        rng = rng or random
 
         # Position-appropriate ranges (NFL rules)
         ranges = {
@@ -431,7 +441,7 @@ class Player:
                     available.append(num)
 
         if available:
-            return random.choice(available)
+            return rng.choice(available)
 
         # Last resort: any available number 1-99
         for num in range(1, 100):
@@ -5,7 +5,7 @@ from typing import Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class PassingStats:
     """Passing statistics."""
 
@@ -70,7 +70,7 @@ class PassingStats:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class RushingStats:
     """Rushing statistics."""
 
@@ -110,7 +110,7 @@ class RushingStats:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReceivingStats:
     """Receiving statistics."""
 
@@ -158,7 +158,7 @@ class ReceivingStats:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class DefensiveStats:
     """Defensive statistics."""
 
@@ -211,7 +211,7 @@ class DefensiveStats:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class KickingStats:
     """Kicking statistics."""
 
@@ -258,7 +258,7 @@ class KickingStats:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerGameStats:
     """Complete statistics for a player in a single game."""
 
@@ -1,5 +1,6 @@
 """Team and roster models."""
 
+import random
 from dataclasses import dataclass, field
 from typing import Dict, Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
@@ -93,22 +94,35 @@ class Roster:
     depth_chart: DepthChart = field(default_factory=DepthChart)
     team_id: Optional[UUID] = None  # Set by Team to track which team owns this roster
 
-    def add_player(self, player: Player, assign_jersey: bool = True) -> None:
+    # Players grouped by position in roster order, kept in step with
+    # add_player/remove_player (rebuilt if `players` is edited directly)
+    _by_position: dict[Position, list[Player]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def add_player(
+        self,
+        player: Player,
+        assign_jersey: bool = True,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         """
         Add a player to the roster.
 
         Args:
             player: Player to add
             assign_jersey: If True, automatically assign a jersey number
+            rng: Random generator for fallback jersey numbers
         """
-        self.players[player.id] = player
+        self._store_player(player)
         # Set team_id on player so they know which team they belong to
         if self.team_id:
             player.team_id = self.team_id
 
         if assign_jersey and player.jersey_number == 0:
             taken = self.get_taken_jersey_numbers()
-            player.jersey_number = player.get_preferred_number(taken)
+            player.jersey_number = player.get_preferred_number(taken, rng)
 
     def add_player_with_jersey_resolution(self, player: Player) -> tuple[bool, Optional[Player]]:
         """
@@ -125,7 +139,7 @@ class Roster:
             - number_changed: True if incoming player had to change their number
             - displaced_player: Player who lost their number (if any)
         """
-        self.players[player.id] = player
+        self._store_player(player)
         # Set team_id on player so they know which team they belong to
         if self.team_id:
             player.team_id = self.team_id
@@ -173,13 +187,23 @@ class Roster:
         return None
 
     def remove_player(self, player_id: UUID) -> Optional[Player]:
-        """Remove a player from the roster."""
+        """Remove a player from the roster, closing their depth chart gap."""
+        self._position_index()
         player = self.players.pop(player_id, None)
         # Clear team_id when player is removed
         if player:
             player.team_id = None
+            self._unindex(player)
+            self._drop_from_depth_chart(player_id)
         return player
 
+    def clear(self) -> None:
+        """Remove every player and empty the depth chart."""
+        self.players.clear()
+        self.depth_chart.slots.clear()
+        self._by_position.clear()
+        self._indexed_count = 0
+
     def get_player(self, player_id: UUID) -> Optional[Player]:
         """Get a player by ID."""
         return self.players.get(player_id)
@@ -193,7 +217,7 @@ class Roster:
 
     def get_players_by_position(self, position: Position) -> list[Player]:
         """Get all players at a specific position."""
-        return [p for p in self.players.values() if p.position == position]
+        return list(self._position_index().get(position, ()))
 
     def get_offensive_starters(self) -> dict[str, Player]:
         """Get all offensive starters."""
@@ -235,26 +259,80 @@ class Roster:
         Places players at their position slots sorted by overall rating.
         Best player at each position becomes the starter (depth 1).
         """
-        # Group players by position
-        by_position: dict[str, list[Player]] = {}
-        for player in self.players.values():
-            pos = player.position.value
-            if pos not in by_position:
-                by_position[pos] = []
-            by_position[pos].append(player)
-
-        # Sort each position by overall (best first)
-        for pos in by_position:
-            by_position[pos].sort(key=lambda p: p.overall, reverse=True)
-
         # Clear existing depth chart
         self.depth_chart.slots.clear()
 
-        # Fill depth chart slots
-        for pos, players in by_position.items():
-            for depth, player in enumerate(players, start=1):
-                slot = f"{pos}{depth}"
-                self.depth_chart.set(slot, player.id)
+        for position, players in self._position_index().items():
+            self._fill_position_depth(position.value, players)
+
+    def update_position_depth(self, position: Position) -> None:
+        """
+        Re-rank one position's depth chart by overall.
+
+        Call after a player's attributes change instead of refilling the
+        whole depth chart.
+        """
+        players = self._position_index().get(position, [])
+        for depth in range(1, len(self.depth_chart.get_all_at_position(position.value)) + 1):
+            self.depth_chart.slots.pop(f"{position.value}{depth}", None)
+        self._fill_position_depth(position.value, players)
+
+    def _fill_position_depth(self, position: str, players: list[Player]) -> None:
+        """Set a position's slots from players sorted by overall (best first)."""
+        ranked = sorted(players, key=lambda p: p.overall, reverse=True)
+        for depth, player in enumerate(ranked, start=1):
+            self.depth_chart.set(f"{position}{depth}", player.id)
+
+    def _drop_from_depth_chart(self, player_id: UUID) -> None:
+        """Remove a player's slots, moving players below them up one spot."""
+        for slot, slot_player_id in list(self.depth_chart.slots.items()):
+            if slot_player_id != player_id:
+                continue
+            position = slot.rstrip("0123456789")
+            ranked = self.depth_chart.get_all_at_position(position)
+            for depth in range(1, len(ranked) + 1):
+                self.depth_chart.slots.pop(f"{position}{depth}", None)
+            self.depth_chart.slots.pop(slot, None)
+            for depth, pid in enumerate((p for p in ranked if p != player_id), start=1):
+                self.depth_chart.set(f"{position}{depth}", pid)
+
+    def _store_player(self, player: Player) -> None:
+        """
+        Add or replace a player in `players` and the position index.
+
+        New arrivals go to the bottom of their position's depth chart.
+        """
+        index = self._position_index()
+        previous = self.players.get(player.id)
+        self.players[player.id] = player
+        if previous is not None:
+            self._unindex(previous)
+        index.setdefault(player.position, []).append(player)
+        self._indexed_count += 1
+
+        if player.id not in self.depth_chart.slots.values():
+            position = player.position.value
+            depth = len(self.depth_chart.get_all_at_position(position)) + 1
+            self.depth_chart.set(f"{position}{depth}", player.id)
+
+    def _unindex(self, player: Player) -> None:
+        """Drop a player from the position index (by identity)."""
+        bucket = self._by_position.get(player.position, [])
+        for i, indexed in enumerate(bucket):
+            if indexed is player:
+                del bucket[i]
+                self._indexed_count -= 1
+                return
+        self._indexed_count = -1  # Out of step; rebuild on next lookup
+
+    def _position_index(self) -> dict[Position, list[Player]]:
+        """Players by position, rebuilt if `players` changed behind our back."""
+        if self._indexed_count != len(self.players):
+            self._by_position = {}
+            for player in self.players.values():
+                self._by_position.setdefault(player.position, []).append(player)
+            self._indexed_count = len(self.players)
+        return self._by_position
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
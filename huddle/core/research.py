@@ -0,0 +1,77 @@
+"""
+Research Model Loading.
+
+Calibration data exported by the research pipeline lives in
+``research/exports/active`` as JSON. Modules expose it as module-level
+mappings, but parsing every model at import slows down cold starts of
+anything that merely imports them, so the files are read on first access:
+
+    DRAFT_MODEL = ResearchModel("draft_model.json")
+    BY_ROUND = ResearchModel("draft_model.json", "by_round", default={...})
+"""
+
+import json
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+RESEARCH_DIR = Path(__file__).parent.parent.parent / "research" / "exports" / "active"
+
+
+@lru_cache(maxsize=None)
+def load_research_model(filename: str) -> dict:
+    """Parse a model JSON file from research exports ({} when missing)."""
+    path = RESEARCH_DIR / filename
+    if path.exists():
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+class ResearchModel(Mapping):
+    """
+    Read-only view of a research model, loaded on first access.
+
+    Attributes:
+        filename: Model file in the research exports
+        section: Top-level key to expose instead of the whole model
+        default: Used when the file or section is missing
+    """
+
+    def __init__(
+        self, filename: str, section: Optional[str] = None, default: Optional[dict] = None
+    ) -> None:
+        self.filename = filename
+        self.section = section
+        self.default = default if default is not None else {}
+        self._data: Optional[dict] = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            model = load_research_model(self.filename)
+            if self.section is None:
+                self._data = model or self.default
+            else:
+                self._data = model.get(self.section, self.default)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        section = f", {self.section!r}" if self.section else ""
+        return f"ResearchModel({self.filename!r}{section})"
@@ -7,10 +7,14 @@ from huddle.core.simulation.historical_sim import (
     TeamState,
     create_league_with_history,
 )
+from huddle.core.simulation.profiling import PhaseProfiler, PhaseTiming, SimulationProfile
 
 __all__ = [
     "HistoricalSimulator",
+    "PhaseProfiler",
+    "PhaseTiming",
     "SimulationConfig",
+    "SimulationProfile",
     "SimulationResult",
     "TeamState",
     "create_league_with_history",
@@ -15,12 +15,15 @@ from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Optional, Callable
 from uuid import UUID
+import inspect
 import random
 
 from huddle.core.calendar import LeagueCalendar, LeagueEvent, create_calendar_for_season
 from huddle.core.league.league import League, ScheduledGame, TeamStanding
 from huddle.core.league.nfl_data import NFL_TEAMS
 from huddle.core.models.team import Team
+from huddle.core.rng import SeedSequence, random_uuid
+from huddle.core.simulation.profiling import PhaseProfiler, PhaseTiming, SimulationProfile
 from huddle.simulation.season import SeasonSimulator
 from huddle.simulation.engine import SimulationMode
 from huddle.generators.league import generate_nfl_schedule
@@ -241,10 +244,20 @@ class SimulationConfig:
     games_per_season: int = 17
     playoff_teams: int = 14
 
+    # Reproducibility: when set, every season phase and game draws from
+    # its own stream derived from this seed (see huddle.core.rng)
+    seed: Optional[int] = None
+
     # Speed settings
     verbose: bool = False
     progress_callback: Optional[Callable[[str], None]] = None
 
+    # Profiling: wall/CPU time and counts are always recorded per phase;
+    # allocations and per-phase cProfile dumps are opt-in (both are slow)
+    phase_callback: Optional[Callable[[PhaseTiming], None]] = None
+    track_allocations: bool = False
+    profile_dir: Optional[str] = None
+
 
 @dataclass
 class SeasonSnapshot:
@@ -337,6 +350,9 @@ class SimulationResult:
     seasons_simulated: int = 0
     total_transactions: int = 0
 
+    # Per-season, per-phase timings of the run
+    profile: Optional[SimulationProfile] = None
+
     def to_league(self, name: str = "NFL League") -> League:
         """
         Convert simulation results to a League object with full history.
@@ -486,6 +502,7 @@ class SimulationResult:
             "blockbuster_trades": self.blockbuster_trades,  # Already list of dicts
             "seasons_simulated": self.seasons_simulated,
             "total_transactions": self.total_transactions,
+            "profile": self.profile.to_dict() if self.profile else None,
         }
 
     @classmethod
@@ -525,6 +542,7 @@ class SimulationResult:
             blockbuster_trades=data.get("blockbuster_trades", []),
             seasons_simulated=data.get("seasons_simulated", 0),
             total_transactions=data.get("total_transactions", 0),
+            profile=SimulationProfile.from_dict(data["profile"]) if data.get("profile") else None,
         )
 
 
@@ -550,6 +568,16 @@ class HistoricalSimulator:
         self.generate_players = player_generator
         self.team_data = team_data
 
+        # Random streams (module-level generator when unseeded)
+        self.seed_sequence: Optional[SeedSequence] = (
+            SeedSequence(config.seed) if config.seed is not None else None
+        )
+        self.rng = random
+        parameters = inspect.signature(player_generator).parameters.values()
+        self._generator_takes_rng = any(
+            p.name == "rng" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters
+        )
+
         # State
         self.teams: dict[str, TeamState] = {}
         self.transaction_log: TransactionLog = None
@@ -563,6 +591,14 @@ class HistoricalSimulator:
         self.current_season: int = 0
         self.current_calendar: LeagueCalendar = None
 
+        # Phase instrumentation
+        self.profiler = PhaseProfiler(
+            track_allocations=config.track_allocations,
+            profile_dir=config.profile_dir,
+            on_phase=config.phase_callback,
+        )
+        self._phase_transactions = 0
+
     @classmethod
     def create_with_nfl_teams(
         cls,
@@ -604,14 +640,19 @@ class HistoricalSimulator:
         self._log(f"Starting historical simulation from {start_season} to {self.config.target_season}")
 
         # Initialize league
+        self._enter_phase(start_season, "initialize")
         self._initialize_league(start_season)
 
         # Simulate each season
-        for season in range(start_season, self.config.target_season + 1):
-            self.current_season = season
-            self._log(f"\n=== Simulating {season} Season ===")
+        try:
+            for season in range(start_season, self.config.target_season + 1):
+                self.current_season = season
+                self._log(f"\n=== Simulating {season} Season ===")
 
-            self._simulate_season(season)
+                self._simulate_season(season)
+        finally:
+            self._end_phase()
+            self.profiler.close()
 
         # Finalize
         self._log(f"\nSimulation complete. {len(self.transaction_log.transactions)} total transactions.")
@@ -627,8 +668,61 @@ class HistoricalSimulator:
             blockbuster_trades=self.blockbuster_trades,
             seasons_simulated=self.config.years_to_simulate + 1,
             total_transactions=len(self.transaction_log.transactions),
+            profile=self.profiler.profile,
         )
 
+    # =========================================================================
+    # Random Streams
+    # =========================================================================
+
+    def _enter_phase(self, season: int, phase: str) -> None:
+        """Switch self.rng to the stream for one phase of a season and start timing it."""
+        self._end_phase()
+        if self.seed_sequence is not None:
+            self.rng = self.seed_sequence.child("season", season, phase).rng()
+        self._phase_transactions = self._transaction_count()
+        self.profiler.start(season, phase)
+
+    def _end_phase(self) -> None:
+        """Finish timing the current phase, charging it the transactions it logged."""
+        if self.profiler.active:
+            self.profiler.count("transactions", self._transaction_count() - self._phase_transactions)
+            self.profiler.stop()
+
+    def _transaction_count(self) -> int:
+        return len(self.transaction_log.transactions) if self.transaction_log else 0
+
+    def _games_seed(self, season: int) -> Optional[SeedSequence]:
+        """Parent of the per-game streams for a season's games."""
+        if self.seed_sequence is None:
+            return None
+        return self.seed_sequence.child("season", season, "games")
+
+    def _generate_player(self, **kwargs):
+        """Call the player generator, passing the phase stream if it takes one."""
+        if self._generator_takes_rng:
+            kwargs["rng"] = self.rng
+        self.profiler.count("players_generated")
+        return self.generate_players(**kwargs)
+
+    def _generate_position_group(self, position: Position, ages: list[int]) -> list:
+        """Players at one position, generated as a batch with the stock generator."""
+        from huddle.generators.player import generate_player, generate_players
+
+        if self.generate_players is generate_player:
+            self.profiler.count("players_generated", len(ages))
+            return generate_players(position, len(ages), ages=ages, rng=self.rng)
+        return [self._generate_player(position=position, age=age) for age in ages]
+
+    @property
+    def _id_rng(self) -> Optional[random.Random]:
+        """Stream for ids: the phase stream when seeded, os entropy (None) otherwise."""
+        return self.rng if self.seed_sequence is not None else None
+
+    def _new_id(self) -> UUID:
+        """Player, team and transaction id, reproducible for seeded runs."""
+        return random_uuid(self._id_rng)
+
     def _initialize_league(self, start_season: int):
         """Initialize league state for start of simulation."""
         self.transaction_log = TransactionLog(league_id="main")
@@ -642,6 +736,7 @@ class HistoricalSimulator:
                 [team_id],
                 start_season,
                 years_ahead=3,
+                rng=self._id_rng,
             )[team_id]
 
             # Initialize team status (random for first season)
@@ -651,7 +746,7 @@ class HistoricalSimulator:
             )
 
             # Assign random GM archetype for personality-based decisions
-            gm_archetype = random.choice(list(GMArchetype))
+            gm_archetype = self.rng.choice(list(GMArchetype))
 
             self.teams[team_id] = TeamState(
                 team_id=team_id,
@@ -694,19 +789,12 @@ class HistoricalSimulator:
                 # Convert string to Position enum
                 pos = Position(position_str)
 
-                for i in range(count):
-                    # Generate player with varied age
-                    # First player at position tends to be older/more experienced
-                    if i == 0:
-                        age = random.randint(26, 32)
-                    else:
-                        age = random.randint(22, 28)
-
-                    player = self.generate_players(
-                        position=pos,
-                        age=age,
-                    )
-                    roster.append(player)
+                # Varied ages: first player at position tends to be older/more experienced
+                ages = [
+                    self.rng.randint(26, 32) if i == 0 else self.rng.randint(22, 28)
+                    for i in range(count)
+                ]
+                roster.extend(self._generate_position_group(pos, ages))
 
             # Now assign contracts within cap budget
             contracts = self._assign_roster_contracts_within_cap(
@@ -785,7 +873,7 @@ class HistoricalSimulator:
                 base_salary = market_salary
 
             # Add variance
-            base_salary = int(base_salary * random.uniform(0.9, 1.1))
+            base_salary = int(base_salary * self.rng.uniform(0.9, 1.1))
             base_salary = max(min_salary, base_salary)
 
             # Determine contract type and years
@@ -813,6 +901,7 @@ class HistoricalSimulator:
                     team_id=team_id,
                     pick_number=pick_estimate,
                     signed_date=date(season - experience, 4, 28),
+                    rng=self._id_rng,
                 )
                 # Advance to current year
                 for _ in range(experience):
@@ -825,7 +914,8 @@ class HistoricalSimulator:
                     total_value=total_value_contract + signing_bonus,
                     guaranteed=guaranteed,
                     signing_bonus=signing_bonus,
-                    signed_date=date(season - random.randint(0, years - 1), 3, 15),
+                    signed_date=date(season - self.rng.randint(0, years - 1), 3, 15),
+                    rng=self._id_rng,
                 )
 
             contracts[str(player.id)] = contract
@@ -840,39 +930,49 @@ class HistoricalSimulator:
 
         # 0. Create position plans for all teams (HC09-style holistic planning)
         # This determines each team's acquisition strategy BEFORE FA/Draft
+        self._enter_phase(season, "position_plans")
         self._create_position_plans(season)
 
         # Advance to free agency
         self.current_calendar.advance_to_event(LeagueEvent.FREE_AGENCY_START)
 
         # 1. Free Agency (uses position plans for commitment-aware decisions)
+        self._enter_phase(season, "free_agency")
         self._simulate_free_agency(season)
 
         # 1.5. Trades (commitment premiums affect valuations)
+        self._enter_phase(season, "trades")
         self._simulate_trades(season)
 
         # 2. Draft (uses position plans for commitment-aware selection)
         self.current_calendar.advance_to_event(LeagueEvent.DRAFT_START)
+        self._enter_phase(season, "draft")
         self._simulate_draft(season)
 
         # 3. Roster cuts
         self.current_calendar.advance_to_event(LeagueEvent.ROSTER_CUT_53)
+        self._enter_phase(season, "roster_cuts")
         self._simulate_roster_cuts(season)
 
         # 4. Regular season
         self.current_calendar.advance_to_event(LeagueEvent.REGULAR_SEASON_START)
+        self._enter_phase(season, "regular_season")
         self._simulate_regular_season(season)
 
         # 5. Playoffs
+        self._enter_phase(season, "playoffs")
         self._simulate_playoffs(season)
 
         # 6. Apply player development (aging, growth/decline)
+        self._enter_phase(season, "development")
         self._apply_offseason_development(season)
 
         # 7. Update team statuses
+        self._enter_phase(season, "team_status")
         self._update_team_statuses(season)
 
         # 8. Handle expiring contracts
+        self._enter_phase(season, "contracts")
         self._handle_contract_expirations(season)
 
     def _create_position_plans(self, season: int):
@@ -906,7 +1006,7 @@ class HistoricalSimulator:
                 team.contracts[str(p.id)].is_expiring()
             ]
             for player in expiring:
-                if random.random() < 0.35:  # 35% expected to hit FA
+                if self.rng.random() < 0.35:  # 35% expected to hit FA
                     fa_options.append({
                         'player_id': str(player.id),
                         'position': player.position.value,
@@ -958,8 +1058,6 @@ class HistoricalSimulator:
 
         These are simplified projections used for planning, not actual players.
         """
-        from uuid import uuid4
-
         prospects = []
 
         # Position distribution for elite prospects
@@ -971,7 +1069,7 @@ class HistoricalSimulator:
         for i in range(10):
             pos = ELITE_POSITIONS[i % len(ELITE_POSITIONS)]
             prospects.append(DraftProspect(
-                player_id=uuid4(),
+                player_id=self._new_id(),
                 name=f"Top {pos} Prospect {i+1}",
                 position=pos,
                 grade=95 - i,  # 95, 94, 93...
@@ -984,7 +1082,7 @@ class HistoricalSimulator:
         for i in range(22):
             pos = (ELITE_POSITIONS + MID_POSITIONS)[i % len(ELITE_POSITIONS + MID_POSITIONS)]
             prospects.append(DraftProspect(
-                player_id=uuid4(),
+                player_id=self._new_id(),
                 name=f"Rd1 {pos} Prospect",
                 position=pos,
                 grade=85 - (i // 4),  # 85-80 range
@@ -998,7 +1096,7 @@ class HistoricalSimulator:
             for i in range(32):
                 pos = (ELITE_POSITIONS + MID_POSITIONS)[i % len(ELITE_POSITIONS + MID_POSITIONS)]
                 prospects.append(DraftProspect(
-                    player_id=uuid4(),
+                    player_id=self._new_id(),
                     name=f"Rd{rd} {pos} Prospect",
                     position=pos,
                     grade=78 - (rd * 3) - (i // 8),
@@ -1038,6 +1136,7 @@ class HistoricalSimulator:
             season=season,
             config=config,
             draft_prospects=draft_prospects,
+            rng=self.rng,
         )
 
         if blockbuster:
@@ -1063,6 +1162,7 @@ class HistoricalSimulator:
             config=config,
             draft_prospects=draft_prospects,
             on_trade=on_trade,
+            rng=self.rng,
         )
 
         # Summarize results
@@ -1126,6 +1226,7 @@ class HistoricalSimulator:
         """
         from huddle.core.ai.trade_ai import TradeAsset, TradeProposal
 
+        self.profiler.count("trades_executed")
         seller = self.teams[trade.seller_team_id]
         buyer = self.teams[trade.buyer_team_id]
 
@@ -1170,6 +1271,7 @@ class HistoricalSimulator:
 
         # Log transaction
         self.transaction_log.add(Transaction(
+            transaction_id=str(self._new_id()),
             transaction_type=TransactionType.TRADE,
             team_id=seller.team_id,
             other_team_id=buyer.team_id,
@@ -1248,6 +1350,7 @@ class HistoricalSimulator:
 
         # Log transaction (single log for the league)
         self.transaction_log.add(Transaction(
+            transaction_id=str(self._new_id()),
             transaction_type=TransactionType.TRADE,
             team_id=team_from.team_id,
             other_team_id=team_to.team_id,
@@ -1281,7 +1384,7 @@ class HistoricalSimulator:
             ]
             # Some players re-sign with current team, some hit market
             for player in expiring:
-                if random.random() < 0.35:  # 35% hit free agency
+                if self.rng.random() < 0.35:  # 35% hit free agency
                     free_agents.append((player, team.team_id))
 
         # Sort FAs by value (best players sign first - realistic)
@@ -1290,7 +1393,7 @@ class HistoricalSimulator:
         # Process each free agent with competitive bidding
         for player, old_team_id in free_agents:
             # Calculate base market value
-            market = calculate_market_value(player)
+            market = calculate_market_value(player, rng=self.rng)
 
             # Find interested teams using FreeAgencyAI for evaluation
             interested_teams = []
@@ -1334,6 +1437,7 @@ class HistoricalSimulator:
                         "DE", "DT", "OLB", "ILB", "CB", "FS", "SS"
                     ]},
                     gm_archetype=team.gm_archetype,
+                    rng=self.rng,
                 )
 
                 # Evaluate this free agent
@@ -1345,7 +1449,7 @@ class HistoricalSimulator:
                 effective_priority = evaluation.priority * (0.7 + plan_aggression * 0.6)
 
                 # Use AI priority score for interest determination
-                if effective_priority > 0.3 or random.random() < 0.2:
+                if effective_priority > 0.3 or self.rng.random() < 0.2:
                     interested_teams.append((team, effective_priority, position_need, fa_ai, plan_aggression))
 
             if not interested_teams:
@@ -1375,11 +1479,12 @@ class HistoricalSimulator:
                 guaranteed=guaranteed,
                 signing_bonus=signing_bonus,
                 signed_date=self.current_calendar.current_date,
+                rng=self._id_rng,
             )
 
             # Now find a team that can ACTUALLY afford this contract
             # Sort by interest and filter by actual cap space (including roster reserve)
-            interested_teams.sort(key=lambda x: x[1] * random.uniform(0.8, 1.2), reverse=True)
+            interested_teams.sort(key=lambda x: x[1] * self.rng.uniform(0.8, 1.2), reverse=True)
 
             winning_team = None
             winning_fa_ai = None
@@ -1411,6 +1516,7 @@ class HistoricalSimulator:
                 guaranteed=guaranteed,
                 signing_bonus=signing_bonus,
                 signed_date=self.current_calendar.current_date,
+                rng=self._id_rng,
             )
 
             # Update rosters
@@ -1444,6 +1550,7 @@ class HistoricalSimulator:
                 contract_guaranteed=guaranteed,
                 season=season,
                 transaction_date=self.current_calendar.current_date,
+                rng=self._id_rng,
             ))
 
     def _simulate_draft(self, season: int):
@@ -1488,12 +1595,8 @@ class HistoricalSimulator:
         draft_class = []
         for position_str, count in DRAFT_CLASS_COUNTS.items():
             pos = Position(position_str)
-            for _ in range(count):
-                player = self.generate_players(
-                    position=pos,
-                    age=random.randint(21, 23),
-                )
-                draft_class.append(player)
+            ages = [self.rng.randint(21, 23) for _ in range(count)]
+            draft_class.extend(self._generate_position_group(pos, ages))
 
         # Sort by overall (draft order proxy)
         draft_class.sort(key=lambda p: p.overall, reverse=True)
@@ -1518,6 +1621,7 @@ class HistoricalSimulator:
             prospects=draft_class,
             teams=self.teams,
             noise_factor=trade_config.draft_mock_noise,
+            rng=self.rng,
         )
         self._log(f"    Generated mock draft consensus for {len(draft_class)} prospects")
 
@@ -1567,6 +1671,7 @@ class HistoricalSimulator:
                 team_status=team.status,
                 team_needs=needs,
                 gm_archetype=team.gm_archetype,
+                rng=self.rng,
             )
 
             # Use position plan's draft board if available
@@ -1616,6 +1721,7 @@ class HistoricalSimulator:
                 team_id=team.team_id,
                 pick_number=pick_number,
                 signed_date=self.current_calendar.current_date,
+                rng=self._id_rng,
             )
 
             # Add to roster
@@ -1650,6 +1756,7 @@ class HistoricalSimulator:
                 pick_round=pick.round,
                 season=season,
                 transaction_date=self.current_calendar.current_date,
+                rng=self._id_rng,
             ))
 
             pick_number += 1
@@ -1693,6 +1800,7 @@ class HistoricalSimulator:
             team_status=current_team.status,
             team_needs=needs,
             gm_archetype=current_team.gm_archetype,
+            rng=self.rng,
         )
 
         if not available:
@@ -1709,7 +1817,7 @@ class HistoricalSimulator:
         # Skip detailed check if they definitely won't
         if best_available.raw_grade >= 90:
             # Elite talent - unlikely to trade down
-            if random.random() > 0.15:  # 15% chance to still consider
+            if self.rng.random() > 0.15:  # 15% chance to still consider
                 return False
 
         # Get upcoming picks that might want to trade up
@@ -1748,6 +1856,7 @@ class HistoricalSimulator:
                 team_status=later_team.status,
                 team_needs=later_needs,
                 gm_archetype=later_team.gm_archetype,
+                rng=self.rng,
             )
 
             # Does this team want to trade up?
@@ -1831,6 +1940,8 @@ class HistoricalSimulator:
 
         Swaps pick ownership and logs the transaction.
         """
+        self.profiler.count("trades_executed")
+
         # Swap pick ownership
         old_owner = pick_acquired.current_team_id
         pick_acquired.current_team_id = trading_up_team.team_id
@@ -1846,6 +1957,7 @@ class HistoricalSimulator:
             pick_details.append(f"#{p.pick_number or '?'} (Rd {p.round})")
 
         self.transaction_log.add(Transaction(
+            transaction_id=str(self._new_id()),
             transaction_type=TransactionType.DRAFT_TRADE,
             team_id=trading_down_team.team_id,
             team_name=trading_down_team.team_name,
@@ -1889,6 +2001,7 @@ class HistoricalSimulator:
                         season=season,
                         transaction_date=self.current_calendar.current_date,
                         dead_money=dead_money,
+                        rng=self._id_rng,
                     ))
 
     def _simulate_regular_season(self, season: int):
@@ -1916,7 +2029,10 @@ class HistoricalSimulator:
         self._log(f"    Generated {len(schedule)} games")
 
         # Create simulator and run all games
-        simulator = SeasonSimulator(league, mode=SimulationMode.FAST)
+        simulator = SeasonSimulator(
+            league, mode=SimulationMode.FAST, seed_sequence=self._games_seed(season),
+        )
+        simulator.on_game_complete(lambda result: self.profiler.count("games_simulated"))
 
         # Simulate week by week
         for week in range(1, 19):
@@ -1940,7 +2056,7 @@ class HistoricalSimulator:
         for team in self.teams.values():
             avg_overall = sum(p.overall for p in team.roster) / len(team.roster) if team.roster else 50
             expected_wins = (avg_overall - 50) / 50 * 8 + 8.5
-            actual_wins = int(expected_wins + random.gauss(0, 2.5))
+            actual_wins = int(expected_wins + self.rng.gauss(0, 2.5))
             actual_wins = max(0, min(17, actual_wins))
             team.wins = actual_wins
             team.losses = self.config.games_per_season - actual_wins
@@ -1964,6 +2080,7 @@ class HistoricalSimulator:
 
                 if nfl_data:
                     team = Team(
+                        id=self._new_id(),
                         name=nfl_data.name,
                         city=nfl_data.city,
                         abbreviation=nfl_data.abbreviation,
@@ -1973,6 +2090,7 @@ class HistoricalSimulator:
                 else:
                     # Use generic team info
                     team = Team(
+                        id=self._new_id(),
                         name=team_state.team_name,
                         city="City",
                         abbreviation=team_id,
@@ -1982,7 +2100,7 @@ class HistoricalSimulator:
 
                 # Add all players from TeamState roster
                 for player in team_state.roster:
-                    team.roster.add_player(player)
+                    team.roster.add_player(player, rng=self.rng)
 
                 # Auto-fill depth chart
                 team.roster.auto_fill_depth_chart()
@@ -2015,7 +2133,10 @@ class HistoricalSimulator:
         if league and len(league.teams) == 32:
             # Use real playoff simulation with proper bracket
             try:
-                simulator = SeasonSimulator(league, mode=SimulationMode.FAST)
+                simulator = SeasonSimulator(
+                    league, mode=SimulationMode.FAST, seed_sequence=self._games_seed(season),
+                )
+                simulator.on_game_complete(lambda result: self.profiler.count("games_simulated"))
                 playoff_results = simulator.simulate_playoffs()
 
                 # Extract playoff participants
@@ -2043,7 +2164,7 @@ class HistoricalSimulator:
         """Simplified playoff simulation (fallback for non-32-team leagues)."""
         standings = sorted(
             self.teams.values(),
-            key=lambda t: (t.wins, random.random()),
+            key=lambda t: (t.wins, self.rng.random()),
             reverse=True
         )
 
@@ -2062,7 +2183,7 @@ class HistoricalSimulator:
         # Champion from top teams (higher seeds more likely)
         if playoff_teams:
             weights = [4, 3, 2, 1][:len(playoff_teams)]
-            champion = random.choices(playoff_teams[:4], weights=weights[:len(playoff_teams)])[0]
+            champion = self.rng.choices(playoff_teams[:4], weights=weights[:len(playoff_teams)])[0]
             champion.won_championship = True
             self._log(f"    Champion: {champion.team_name}")
 
@@ -2121,7 +2242,7 @@ class HistoricalSimulator:
         Args:
             season: The season just completed
         """
-        from huddle.core.ai.development_curves import apply_offseason_development
+        from huddle.core.ai.development_curves import apply_offseason_development_bulk
 
         self._log(f"  Applying development for {season}...")
 
@@ -2129,27 +2250,27 @@ class HistoricalSimulator:
         players_improved = 0
         players_declined = 0
 
-        for team in self.teams.values():
-            for player in team.roster:
-                player_id = str(player.id)
+        # Develop the whole league in one pass
+        players = [player for team in self.teams.values() for player in team.roster]
+        entries = apply_offseason_development_bulk(players, season, rng=self.rng)
 
-                # Initialize development history if needed
-                if player_id not in self.development_histories:
-                    self.development_histories[player_id] = PlayerDevelopmentHistory(
-                        player_id=player_id,
-                        player_name=player.full_name,
-                        position=player.position.value,
-                    )
+        for player, entry in zip(players, entries):
+            player_id = str(player.id)
 
-                # Apply development and get history entry
-                entry = apply_offseason_development(player, season)
-                self.development_histories[player_id].add_entry(entry)
+            # Initialize development history if needed
+            if player_id not in self.development_histories:
+                self.development_histories[player_id] = PlayerDevelopmentHistory(
+                    player_id=player_id,
+                    player_name=player.full_name,
+                    position=player.position.value,
+                )
+            self.development_histories[player_id].add_entry(entry)
 
-                players_developed += 1
-                if entry["change"] > 0:
-                    players_improved += 1
-                elif entry["change"] < 0:
-                    players_declined += 1
+            players_developed += 1
+            if entry["change"] > 0:
+                players_improved += 1
+            elif entry["change"] < 0:
+                players_declined += 1
 
         self._log(f"    {players_developed} players developed: {players_improved} improved, {players_declined} declined")
 
@@ -2178,6 +2299,7 @@ class HistoricalSimulator:
                 contracts=team.contracts,
                 salary_cap=team.salary_cap,
                 team_status=team.status,
+                rng=self.rng,
             )
 
             # Handle expired contracts - decide to re-sign or release
@@ -2196,6 +2318,7 @@ class HistoricalSimulator:
                             guaranteed=offer["guaranteed"],
                             signing_bonus=offer["signing_bonus"],
                             signed_date=self.current_calendar.current_date,
+                            rng=self._id_rng,
                         )
                         team.contracts[player_id] = new_contract
                     else:
@@ -2230,6 +2353,7 @@ class HistoricalSimulator:
                         dead_money=dead_money,
                         season=season,
                         transaction_date=self.current_calendar.current_date,
+                        rng=self._id_rng,
                     ))
                     # Remove player
                     team.roster = [p for p in team.roster if p.id != player.id]
@@ -2262,13 +2386,13 @@ class HistoricalSimulator:
                     pos = Position(pos_str)
 
                     # Generate replacement player (varied quality)
-                    new_player = self.generate_players(
+                    new_player = self._generate_player(
                         position=pos,
-                        age=random.randint(25, 31),
+                        age=self.rng.randint(25, 31),
                     )
 
                     # Calculate market value and create appropriate contract
-                    market = calculate_market_value(new_player)
+                    market = calculate_market_value(new_player, rng=self.rng)
 
                     # Check actual remaining cap space
                     current_cap_used = sum(c.cap_hit() for c in team.contracts.values())
@@ -2283,6 +2407,7 @@ class HistoricalSimulator:
                         guaranteed=int(market.total_value * 0.3),
                         signing_bonus=market.signing_bonus,
                         signed_date=self.current_calendar.current_date,
+                        rng=self._id_rng,
                     )
 
                     min_contract = create_minimum_contract(
@@ -2291,6 +2416,7 @@ class HistoricalSimulator:
                         years=1,
                         player_experience=new_player.experience_years,
                         signed_date=self.current_calendar.current_date,
+                        rng=self._id_rng,
                     )
 
                     # Use market rate only if it fits under cap
@@ -2318,6 +2444,7 @@ class HistoricalSimulator:
                         contract_guaranteed=contract.total_guaranteed,
                         season=season,
                         transaction_date=self.current_calendar.current_date,
+                        rng=self._id_rng,
                     ))
 
                 # Recalculate cap again
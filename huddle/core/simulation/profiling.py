@@ -0,0 +1,209 @@
+"""
+Phase-level instrumentation for the historical simulation.
+
+HistoricalSimulator switches phases (free agency, trades, draft, games,
+development, ...) through ``_enter_phase``. The PhaseProfiler measures
+each one: wall time, CPU time of the simulating thread, and the counts
+the simulator reports (players generated, trades executed, games
+simulated, transactions logged). Optionally it also records allocations
+with tracemalloc and writes a cProfile dump per phase.
+
+Wall and CPU time are always collected (two clock reads per phase);
+allocation tracking slows the simulation noticeably and is opt-in.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+@dataclass
+class PhaseTiming:
+    """Measurements for one phase of one season."""
+    season: int
+    phase: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    counts: dict[str, int] = field(default_factory=dict)
+    allocated_bytes: Optional[int] = None  # Net growth over the phase
+    peak_bytes: Optional[int] = None  # Peak above the phase's starting point
+    profile_path: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "season": self.season,
+            "phase": self.phase,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "counts": dict(self.counts),
+            "allocated_bytes": self.allocated_bytes,
+            "peak_bytes": self.peak_bytes,
+            "profile_path": self.profile_path,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhaseTiming":
+        return cls(
+            season=data["season"],
+            phase=data["phase"],
+            wall_seconds=data.get("wall_seconds", 0.0),
+            cpu_seconds=data.get("cpu_seconds", 0.0),
+            counts=dict(data.get("counts", {})),
+            allocated_bytes=data.get("allocated_bytes"),
+            peak_bytes=data.get("peak_bytes"),
+            profile_path=data.get("profile_path"),
+        )
+
+
+@dataclass
+class SimulationProfile:
+    """Every phase timing of a simulation run, in the order they ran."""
+    phases: list[PhaseTiming] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(p.wall_seconds for p in self.phases)
+
+    def for_season(self, season: int) -> list[PhaseTiming]:
+        return [p for p in self.phases if p.season == season]
+
+    def by_phase(self) -> dict[str, PhaseTiming]:
+        """Phase totals summed across seasons (season is 0 in the totals)."""
+        totals: dict[str, PhaseTiming] = {}
+        for timing in self.phases:
+            total = totals.setdefault(timing.phase, PhaseTiming(season=0, phase=timing.phase))
+            total.wall_seconds += timing.wall_seconds
+            total.cpu_seconds += timing.cpu_seconds
+            for name, count in timing.counts.items():
+                total.counts[name] = total.counts.get(name, 0) + count
+            if timing.allocated_bytes is not None:
+                total.allocated_bytes = (total.allocated_bytes or 0) + timing.allocated_bytes
+            if timing.peak_bytes is not None:
+                total.peak_bytes = max(total.peak_bytes or 0, timing.peak_bytes)
+        return totals
+
+    def format_report(self) -> str:
+        """Per-phase totals, slowest first."""
+        total = self.total_seconds
+        lines = [
+            f"{'Phase':<16} {'wall':>9} {'cpu':>9} {'share':>6} {'alloc MB':>9}  counts",
+            "-" * 72,
+        ]
+        phases = sorted(self.by_phase().values(), key=lambda p: -p.wall_seconds)
+        for p in phases:
+            share = p.wall_seconds / total if total else 0.0
+            alloc = f"{p.allocated_bytes / 1e6:.1f}" if p.allocated_bytes is not None else "-"
+            counts = ", ".join(f"{k}={v}" for k, v in sorted(p.counts.items()))
+            lines.append(
+                f"{p.phase:<16} {p.wall_seconds:>8.2f}s {p.cpu_seconds:>8.2f}s "
+                f"{share:>6.1%} {alloc:>9}  {counts}"
+            )
+        lines.append(f"{'total':<16} {total:>8.2f}s")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {"phases": [p.to_dict() for p in self.phases]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimulationProfile":
+        return cls(phases=[PhaseTiming.from_dict(p) for p in data.get("phases", [])])
+
+
+class PhaseProfiler:
+    """
+    Measures the phase between ``start()`` and ``stop()``.
+
+    Args:
+        track_allocations: Record allocations with tracemalloc (slow)
+        profile_dir: Write a cProfile dump per phase into this directory
+        on_phase: Called with each PhaseTiming as its phase ends
+    """
+
+    def __init__(
+        self,
+        track_allocations: bool = False,
+        profile_dir: Optional[str] = None,
+        on_phase: Optional[Callable[[PhaseTiming], None]] = None,
+    ) -> None:
+        self.track_allocations = track_allocations
+        self.profile_dir = profile_dir
+        self.on_phase = on_phase
+        self.profile = SimulationProfile()
+
+        self._current: Optional[PhaseTiming] = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._memory_start = 0
+        self._started_tracemalloc = False
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    @property
+    def active(self) -> bool:
+        return self._current is not None
+
+    def start(self, season: int, phase: str) -> None:
+        """Begin measuring ``phase``, ending the current one first."""
+        self.stop()
+        self._current = PhaseTiming(season=season, phase=phase)
+
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+
+        if self.profile_dir:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+        self._wall_start = time.perf_counter()
+        # Thread CPU time: the API runs simulations on a worker thread
+        self._cpu_start = time.thread_time()
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to a counter of the current phase (ignored between phases)."""
+        if self._current is not None and n:
+            self._current.counts[name] = self._current.counts.get(name, 0) + n
+
+    def stop(self) -> Optional[PhaseTiming]:
+        """End the current phase and return its timing (None if none was running)."""
+        timing = self._current
+        if timing is None:
+            return None
+
+        timing.cpu_seconds = time.thread_time() - self._cpu_start
+        timing.wall_seconds = time.perf_counter() - self._wall_start
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            os.makedirs(self.profile_dir, exist_ok=True)
+            index = len(self.profile.phases)
+            timing.profile_path = os.path.join(
+                self.profile_dir, f"{timing.season}_{index:02d}_{timing.phase}.prof"
+            )
+            self._cprofile.dump_stats(timing.profile_path)
+            self._cprofile = None
+
+        if self.track_allocations and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            timing.allocated_bytes = current - self._memory_start
+            timing.peak_bytes = peak - self._memory_start
+
+        self._current = None
+        self.profile.phases.append(timing)
+        if self.on_phase:
+            self.on_phase(timing)
+        return timing
+
+    def close(self) -> None:
+        """End the last phase and release tracemalloc if this profiler started it."""
+        self.stop()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
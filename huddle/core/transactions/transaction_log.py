@@ -11,8 +11,11 @@ from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum, auto
 from typing import Optional, TYPE_CHECKING
+import random
 import uuid
 
+from huddle.core.rng import random_uuid
+
 if TYPE_CHECKING:
     from huddle.core.contracts.contract import Contract
     from huddle.core.draft.picks import DraftPick
@@ -152,7 +155,7 @@ class TradeAsset:
         return "Unknown asset"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     A single transaction in the league.
@@ -424,9 +427,11 @@ def create_draft_transaction(
     transaction_date: date,
     contract_id: str = None,
     contract_value: int = None,
+    rng: Optional[random.Random] = None,
 ) -> Transaction:
     """Create a draft selection transaction."""
     return Transaction(
+        transaction_id=str(random_uuid(rng)),
         transaction_type=TransactionType.DRAFT_SELECTION,
         transaction_date=transaction_date,
         season=season,
@@ -456,9 +461,11 @@ def create_signing_transaction(
     transaction_date: date,
     contract_id: str = None,
     cap_hit: int = 0,
+    rng: Optional[random.Random] = None,
 ) -> Transaction:
     """Create a free agent signing transaction."""
     return Transaction(
+        transaction_id=str(random_uuid(rng)),
         transaction_type=TransactionType.FA_SIGNING,
         transaction_date=transaction_date,
         season=season,
@@ -488,9 +495,11 @@ def create_cut_transaction(
     cap_savings: int = 0,
     is_june1: bool = False,
     dead_money_next_year: int = 0,
+    rng: Optional[random.Random] = None,
 ) -> Transaction:
     """Create a player release transaction."""
     return Transaction(
+        transaction_id=str(random_uuid(rng)),
         transaction_type=TransactionType.CUT_JUNE1 if is_june1 else TransactionType.CUT,
         transaction_date=transaction_date,
         season=season,
@@ -517,6 +526,7 @@ def create_trade_transaction(
     transaction_date: date,
     dead_money: int = 0,
     notes: str = "",
+    rng: Optional[random.Random] = None,
 ) -> Transaction:
     """Create a trade transaction."""
     # Get player info if player is being traded
@@ -532,6 +542,7 @@ def create_trade_transaction(
             break
 
     return Transaction(
+        transaction_id=str(random_uuid(rng)),
         transaction_type=TransactionType.TRADE,
         transaction_date=transaction_date,
         season=season,
@@ -562,9 +573,11 @@ def create_ir_transaction(
     injury_type: str,
     expected_weeks: int = None,
     is_return: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> Transaction:
     """Create an IR placement or return transaction."""
     return Transaction(
+        transaction_id=str(random_uuid(rng)),
         transaction_type=TransactionType.IR_RETURN if is_return else TransactionType.IR_PLACE,
         transaction_date=transaction_date,
         season=season,
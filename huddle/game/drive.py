@@ -49,7 +49,7 @@ class DriveEndReason(Enum):
     SAFETY = "safety"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayLog:
     """Record of a single play in a drive."""
     play_number: int
@@ -2,6 +2,7 @@
 
 from huddle.generators.player import (
     generate_player,
+    generate_players,
     generate_team,
     generate_team_with_identity,
     generate_rookie,
@@ -17,6 +18,7 @@ from huddle.generators.league import (
 __all__ = [
     # Player generation
     "generate_player",
+    "generate_players",
     "generate_team",
     "generate_team_with_identity",
     "generate_rookie",
@@ -4,33 +4,21 @@ Loads research models and provides calibrated generation functions.
 Research source: research/exports/active/
 """
 
-import json
 import math
 import random
-from pathlib import Path
 from typing import Optional
 
+from huddle.core.research import ResearchModel
+
 # =============================================================================
 # Load Research Models
 # =============================================================================
 
-_RESEARCH_DIR = Path(__file__).parent.parent.parent / "research" / "exports" / "active"
-
-
-def _load_model(filename: str) -> dict:
-    """Load a model JSON file from research exports."""
-    path = _RESEARCH_DIR / filename
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return {}
-
-
-# Load models at module import
-PHYSICAL_MODEL = _load_model("physical_profile_model.json")
-CONTRACT_MODEL = _load_model("contract_model.json")
-DRAFT_MODEL = _load_model("draft_model.json")
-POSITION_VALUE_MODEL = _load_model("position_value_model.json")
+# Parsed on first access
+PHYSICAL_MODEL = ResearchModel("physical_profile_model.json")
+CONTRACT_MODEL = ResearchModel("contract_model.json")
+DRAFT_MODEL = ResearchModel("draft_model.json")
+POSITION_VALUE_MODEL = ResearchModel("position_value_model.json")
 
 
 # =============================================================================
@@ -73,12 +61,13 @@ def get_physical_stats(position: str) -> dict:
     return pos_stats.get(mapped_pos, {})
 
 
-def generate_weight(position: str) -> int:
+def generate_weight(position: str, rng: Optional[random.Random] = None) -> int:
     """Generate calibrated weight for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     wt_stats = stats.get("wt", {"mean": 220, "std": 20})
 
-    weight = int(random.gauss(wt_stats["mean"], wt_stats["std"]))
+    weight = int(rng.gauss(wt_stats["mean"], wt_stats["std"]))
 
     # Clamp to reasonable range
     min_wt = wt_stats.get("min", 160)
@@ -86,12 +75,13 @@ def generate_weight(position: str) -> int:
     return max(min_wt, min(max_wt, weight))
 
 
-def generate_forty_time(position: str) -> float:
+def generate_forty_time(position: str, rng: Optional[random.Random] = None) -> float:
     """Generate calibrated 40-yard dash time for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     forty_stats = stats.get("forty", {"mean": 4.70, "std": 0.15})
 
-    forty = random.gauss(forty_stats["mean"], forty_stats["std"])
+    forty = rng.gauss(forty_stats["mean"], forty_stats["std"])
 
     # Clamp to reasonable range
     min_forty = forty_stats.get("min", 4.20)
@@ -99,12 +89,13 @@ def generate_forty_time(position: str) -> float:
     return round(max(min_forty, min(max_forty, forty)), 2)
 
 
-def generate_vertical(position: str) -> float:
+def generate_vertical(position: str, rng: Optional[random.Random] = None) -> float:
     """Generate calibrated vertical jump for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     vert_stats = stats.get("vertical", {"mean": 33, "std": 3.5})
 
-    vert = random.gauss(vert_stats["mean"], vert_stats["std"])
+    vert = rng.gauss(vert_stats["mean"], vert_stats["std"])
 
     # Clamp to reasonable range
     min_vert = vert_stats.get("min", 24)
@@ -112,12 +103,13 @@ def generate_vertical(position: str) -> float:
     return round(max(min_vert, min(max_vert, vert)), 1)
 
 
-def generate_broad_jump(position: str) -> int:
+def generate_broad_jump(position: str, rng: Optional[random.Random] = None) -> int:
     """Generate calibrated broad jump for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     broad_stats = stats.get("broad_jump", {"mean": 115, "std": 7})
 
-    broad = random.gauss(broad_stats["mean"], broad_stats["std"])
+    broad = rng.gauss(broad_stats["mean"], broad_stats["std"])
 
     # Clamp to reasonable range
     min_broad = broad_stats.get("min", 90)
@@ -125,23 +117,25 @@ def generate_broad_jump(position: str) -> int:
     return int(max(min_broad, min(max_broad, broad)))
 
 
-def generate_bench_reps(position: str) -> int:
+def generate_bench_reps(position: str, rng: Optional[random.Random] = None) -> int:
     """Generate calibrated bench press reps for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     bench_stats = stats.get("bench", {"mean": 20, "std": 5})
 
-    bench = random.gauss(bench_stats["mean"], bench_stats["std"])
+    bench = rng.gauss(bench_stats["mean"], bench_stats["std"])
 
     # Clamp to reasonable range (0-40 reps)
     return max(0, min(40, int(bench)))
 
 
-def generate_cone_drill(position: str) -> float:
+def generate_cone_drill(position: str, rng: Optional[random.Random] = None) -> float:
     """Generate calibrated 3-cone drill time for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     cone_stats = stats.get("cone", {"mean": 7.10, "std": 0.20})
 
-    cone = random.gauss(cone_stats["mean"], cone_stats["std"])
+    cone = rng.gauss(cone_stats["mean"], cone_stats["std"])
 
     # Clamp to reasonable range
     min_cone = cone_stats.get("min", 6.40)
@@ -149,12 +143,13 @@ def generate_cone_drill(position: str) -> float:
     return round(max(min_cone, min(max_cone, cone)), 2)
 
 
-def generate_shuttle(position: str) -> float:
+def generate_shuttle(position: str, rng: Optional[random.Random] = None) -> float:
     """Generate calibrated shuttle time for a position."""
+    rng = rng or random
     stats = get_physical_stats(position)
     shuttle_stats = stats.get("shuttle", {"mean": 4.30, "std": 0.15})
 
-    shuttle = random.gauss(shuttle_stats["mean"], shuttle_stats["std"])
+    shuttle = rng.gauss(shuttle_stats["mean"], shuttle_stats["std"])
 
     # Clamp to reasonable range
     min_shuttle = shuttle_stats.get("min", 3.90)
@@ -369,12 +364,13 @@ def get_round_success_rates(round_num: int) -> dict:
     })
 
 
-def generate_prospect_tier(pick_number: int) -> str:
+def generate_prospect_tier(pick_number: int, rng: Optional[random.Random] = None) -> str:
     """
     Generate prospect tier based on pick number.
 
     Returns: "elite", "star", "starter", "rotation", "bust"
     """
+    rng = rng or random
     if pick_number <= 10:
         weights = [0.30, 0.40, 0.20, 0.08, 0.02]
     elif pick_number <= 32:
@@ -387,7 +383,7 @@ def generate_prospect_tier(pick_number: int) -> str:
         weights = [0.01, 0.04, 0.15, 0.35, 0.45]
 
     tiers = ["elite", "star", "starter", "rotation", "bust"]
-    return random.choices(tiers, weights=weights, k=1)[0]
+    return rng.choices(tiers, weights=weights, k=1)[0]
 
 
 def tier_to_overall_range(tier: str) -> tuple[int, int]:
@@ -414,14 +410,15 @@ def tier_to_potential_range(tier: str) -> tuple[int, int]:
     return ranges.get(tier, (75, 85))
 
 
-def generate_prospect_ratings(pick_number: int) -> dict:
+def generate_prospect_ratings(pick_number: int, rng: Optional[random.Random] = None) -> dict:
     """
     Generate prospect current/potential ratings based on pick.
 
     Returns:
         Dict with tier, current_overall, potential
     """
-    tier = generate_prospect_tier(pick_number)
+    rng = rng or random
+    tier = generate_prospect_tier(pick_number, rng=rng)
 
     current_range = tier_to_overall_range(tier)
     potential_range = tier_to_potential_range(tier)
@@ -431,13 +428,13 @@ def generate_prospect_ratings(pick_number: int) -> dict:
 
     current = int(
         current_range[0] + (current_range[1] - current_range[0]) * (0.3 + 0.7 * pick_factor)
-        + random.gauss(0, 2)
+        + rng.gauss(0, 2)
     )
     current = max(current_range[0], min(current_range[1], current))
 
     potential = int(
         potential_range[0] + (potential_range[1] - potential_range[0]) * (0.3 + 0.7 * pick_factor)
-        + random.gauss(0, 2)
+        + rng.gauss(0, 2)
     )
     potential = max(potential_range[0], min(potential_range[1], potential))
 
@@ -1,11 +1,14 @@
 """Player and team generation."""
 
 import random
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence
 
-from huddle.core.attributes import PlayerAttributes
+from huddle.core.attributes import AttributeRegistry, PlayerAttributes
 from huddle.core.enums import Position
 from huddle.core.models.player import Player
+from huddle.core.rng import random_uuid
 from huddle.core.models.team import Team
 from huddle.core.models.team_identity import TeamIdentity, create_random_identity
 from huddle.core.models.tendencies import TeamTendencies, OffensiveScheme, DefensiveScheme
@@ -568,29 +571,77 @@ POSITION_PHYSICALS: dict[Position, tuple[tuple[int, int], tuple[int, int]]] = {
 }
 
 
-def _generate_jersey_preferences(position: Position) -> list[int]:
+def _generate_jersey_preferences(
+    position: Position,
+    rng: Optional[random.Random] = None,
+) -> list[int]:
     """Generate a list of preferred jersey numbers for a position."""
+    rng = rng or random
     iconic = ICONIC_NUMBERS.get(position, list(range(1, 100)))
 
     # Pick 3-5 preferred numbers from iconic list with some randomization
-    num_preferences = random.randint(3, 5)
+    num_preferences = rng.randint(3, 5)
     preferences = []
 
     # First preference is often from top iconic numbers
-    if random.random() < 0.7:  # 70% chance to prefer iconic number first
-        preferences.append(random.choice(iconic[:5]))
+    if rng.random() < 0.7:  # 70% chance to prefer iconic number first
+        preferences.append(rng.choice(iconic[:5]))
     else:
-        preferences.append(random.choice(iconic))
+        preferences.append(rng.choice(iconic))
 
     # Fill remaining preferences
     while len(preferences) < num_preferences:
-        num = random.choice(iconic)
+        num = rng.choice(iconic)
         if num not in preferences:
             preferences.append(num)
 
     return preferences
 
 
+@dataclass(frozen=True)
+class _PositionProfile:
+    """Per-position generation tables, resolved once instead of per player."""
+
+    template: tuple[tuple[str, int, int, int, int], ...]  # name, mean, std, low, high
+    height: tuple[int, int]
+    archetypes: tuple[tuple[str, tuple[tuple[str, float], ...]], ...]
+
+
+@lru_cache(maxsize=None)
+def _attribute_bounds() -> dict[str, tuple[int, int]]:
+    """Valid (min, max) range of every registered attribute."""
+    return {a.name: (a.min_value, a.max_value) for a in AttributeRegistry.get_all()}
+
+
+def _clamp_attribute(name: str, value: int) -> int:
+    """Clamp like PlayerAttributes.set, without the registry lookup."""
+    low, high = _attribute_bounds().get(name, (0, 99))
+    return max(low, min(high, value))
+
+
+@lru_cache(maxsize=None)
+def _position_profile(position: Position) -> _PositionProfile:
+    """Attribute template, physicals and archetype weights for a position."""
+    # Generated values are clamped to 40-99 and then to the attribute's own
+    # range; both ranges overlap, so one clamp to their intersection suffices.
+    bounds = _attribute_bounds()
+    template = tuple(
+        (name, mean, std, max(40, low), min(99, high))
+        for name, (mean, std) in POSITION_TEMPLATES.get(position, {}).items()
+        for low, high in [bounds.get(name, (0, 99))]
+    )
+    height, _ = POSITION_PHYSICALS.get(position, ((72, 3), (215, 20)))
+
+    archetypes = []
+    philosophy_enum = POSITION_TO_PHILOSOPHY_ENUM.get(position.value)
+    for philosophy in philosophy_enum or ():
+        weights = PHILOSOPHY_ATTRIBUTE_WEIGHTS.get(philosophy.value, {})
+        if weights:
+            archetypes.append((philosophy.value, tuple(weights.items())))
+
+    return _PositionProfile(template=template, height=height, archetypes=tuple(archetypes))
+
+
 def generate_player(
     position: Position,
     overall_target: Optional[int] = None,
@@ -602,6 +653,7 @@ def generate_player(
     experience_years: Optional[int] = None,
     years_on_team: Optional[int] = None,
     college: Optional[str] = None,
+    rng: Optional[random.Random] = None,
 ) -> Player:
     """
     Generate a random player at a position.
@@ -617,133 +669,230 @@ def generate_player(
         experience_years: NFL experience (derived from age if None)
         years_on_team: Tenure with current team (defaults to experience)
         college: College attended (random if None)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Generated Player
     """
-    # Generate name
-    fname = first_name or random.choice(FIRST_NAMES)
-    lname = last_name or random.choice(LAST_NAMES)
-
-    # Determine overall modifier
-    if overall_target is None:
-        overall_target = random.randint(65, 90)
-
-    # Apply team identity position boost
-    if team_identity:
-        position_boost = team_identity.get_position_boost(position.name)
-        overall_target = int(overall_target + position_boost)
-        overall_target = max(55, min(99, overall_target))
-
-    overall_mod = (overall_target - 75) / 25  # -0.4 to +0.6
-
-    # Get team identity attribute emphasis
-    attr_emphasis = {}
-    if team_identity:
-        attr_emphasis = team_identity.get_attribute_emphasis(position.name)
-
-    # Generate attributes
-    attrs = PlayerAttributes()
-    template = POSITION_TEMPLATES.get(position, {})
-
-    for attr_name, (mean, std) in template.items():
-        # Adjust mean by overall modifier
-        adjusted_mean = mean + (overall_mod * 15)
-
-        # Apply team identity emphasis
-        emphasis = attr_emphasis.get(attr_name, 1.0)
-        adjusted_mean = adjusted_mean * emphasis
-
-        value = int(random.gauss(adjusted_mean, std))
-        value = max(40, min(99, value))
-        attrs.set(attr_name, value)
-
-    # Generate POTENTIAL (the ceiling) - NFL HC09 "Big Three" meta attribute
-    # Potential is typically higher than current overall, with variance
-    base_potential = overall_target + random.randint(5, 15) + int(potential_modifier)
-    # Young players tend to have higher potential gap
-    potential_variance = random.gauss(0, 5)
-    potential = int(base_potential + potential_variance)
-    potential = max(overall_target, min(99, potential))  # At least current overall
-    attrs.set("potential", potential)
-
-    # Generate LEARNING (playbook mastery speed) - NFL HC09 "Big Three"
-    # Correlated with awareness but has its own variance
-    base_learning = attrs.get("awareness", 70) + random.randint(-10, 10)
-    learning = int(random.gauss(base_learning, 8))
-    learning = max(40, min(99, learning))
-    attrs.set("learning", learning)
-
-    # Generate DURABILITY attributes (for wear & tear system)
-    _generate_durability_attrs(attrs)
-
-    # Generate physicals using calibrated data
-    from huddle.generators.calibration import generate_weight
-
-    height_params, _ = POSITION_PHYSICALS.get(
-        position, ((72, 3), (215, 20))
+    return _PlayerBuilder(position, team_identity, rng).build(
+        overall_target=overall_target,
+        first_name=first_name,
+        last_name=last_name,
+        age=age,
+        potential_modifier=potential_modifier,
+        experience_years=experience_years,
+        years_on_team=years_on_team,
+        college=college,
     )
-    height = int(random.gauss(height_params[0], height_params[1]))
-    # Use calibrated weight from NFL combine data
-    weight = generate_weight(position.value)
 
-    # Age and experience
-    player_age = age if age is not None else random.randint(22, 32)
 
-    # Calculate experience if not provided
-    if experience_years is not None:
-        exp = experience_years
-    else:
-        # Experience based on age (entered league at 21-23)
-        max_exp = player_age - 21
-        exp = min(max_exp, random.randint(0, max(0, max_exp)))
-
-    # Team tenure (defaults to full experience for new team generation)
-    tenure = years_on_team if years_on_team is not None else exp
-
-    # Adjust potential based on age (older players have less upside)
-    if player_age > 28:
-        age_penalty = (player_age - 28) * 2
-        current_potential = attrs.get("potential", 75)
-        attrs.set("potential", max(overall_target, current_potential - age_penalty))
-
-    # Jersey preferences
-    jersey_prefs = _generate_jersey_preferences(position)
-
-    # College (weighted toward Power 5)
-    player_college = college
-    if player_college is None:
-        if random.random() < 0.75:  # 75% from Power 5 (first 50 in list)
-            player_college = random.choice(COLLEGES[:50])
+def generate_players(
+    position: Position,
+    count: int,
+    ages: Optional[Sequence[Optional[int]]] = None,
+    overall_targets: Optional[Sequence[Optional[int]]] = None,
+    potential_modifiers: Optional[Sequence[float]] = None,
+    experience_years: Optional[Sequence[Optional[int]]] = None,
+    years_on_team: Optional[Sequence[Optional[int]]] = None,
+    team_identity: Optional[TeamIdentity] = None,
+    rng: Optional[random.Random] = None,
+) -> list[Player]:
+    """
+    Generate several players at one position.
+
+    Position tables and team identity lookups are resolved once for the
+    whole batch. Draws are made in the same order as repeated
+    generate_player calls, so a seeded batch matches its sequential
+    equivalent player for player.
+
+    Args:
+        position: Position to generate
+        count: Number of players
+        ages: Per-player age (random 22-32 where None)
+        overall_targets: Per-player target overall (randomized where None)
+        potential_modifiers: Per-player modifier to potential
+        experience_years: Per-player NFL experience (derived from age where None)
+        years_on_team: Per-player tenure (defaults to experience where None)
+        team_identity: Optional team identity shared by the batch
+        rng: Random generator (defaults to the module-level one)
+
+    Returns:
+        List of generated players
+    """
+    builder = _PlayerBuilder(position, team_identity, rng)
+    return [
+        builder.build(
+            overall_target=overall_targets[i] if overall_targets else None,
+            age=ages[i] if ages else None,
+            potential_modifier=potential_modifiers[i] if potential_modifiers else 0.0,
+            experience_years=experience_years[i] if experience_years else None,
+            years_on_team=years_on_team[i] if years_on_team else None,
+        )
+        for i in range(count)
+    ]
+
+
+class _PlayerBuilder:
+    """Generates players at one position with one team identity."""
+
+    def __init__(
+        self,
+        position: Position,
+        team_identity: Optional[TeamIdentity] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        from huddle.generators.calibration import generate_weight
+
+        self.position = position
+        self.profile = _position_profile(position)
+        self.seeded_rng = rng
+        self.rng = rng or random
+        self.generate_weight = generate_weight
+
+        # Team identity position boost and attribute emphasis
+        self.position_boost = None
+        self.attr_emphasis = {}
+        if team_identity:
+            self.position_boost = team_identity.get_position_boost(position.name)
+            self.attr_emphasis = team_identity.get_attribute_emphasis(position.name)
+
+    def build(
+        self,
+        overall_target: Optional[int] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        age: Optional[int] = None,
+        potential_modifier: float = 0.0,
+        experience_years: Optional[int] = None,
+        years_on_team: Optional[int] = None,
+        college: Optional[str] = None,
+    ) -> Player:
+        """Generate one player (see generate_player)."""
+        rng = self.rng
+        position = self.position
+        player_id = random_uuid(self.seeded_rng)
+        # Generate name
+        fname = first_name or rng.choice(FIRST_NAMES)
+        lname = last_name or rng.choice(LAST_NAMES)
+
+        # Determine overall modifier
+        if overall_target is None:
+            overall_target = rng.randint(65, 90)
+
+        # Apply team identity position boost
+        if self.position_boost is not None:
+            overall_target = int(overall_target + self.position_boost)
+            overall_target = max(55, min(99, overall_target))
+
+        overall_mod = (overall_target - 75) / 25  # -0.4 to +0.6
+
+        # Generate attributes
+        attrs = PlayerAttributes()
+        values = attrs._values
+        attr_emphasis = self.attr_emphasis
+        gauss = rng.gauss
+
+        for attr_name, mean, std, low, high in self.profile.template:
+            # Adjust mean by overall modifier
+            adjusted_mean = mean + (overall_mod * 15)
+
+            # Apply team identity emphasis
+            emphasis = attr_emphasis.get(attr_name, 1.0)
+            adjusted_mean = adjusted_mean * emphasis
+
+            value = int(gauss(adjusted_mean, std))
+            values[attr_name] = max(low, min(high, value))
+
+        # Generate POTENTIAL (the ceiling) - NFL HC09 "Big Three" meta attribute
+        # Potential is typically higher than current overall, with variance
+        base_potential = overall_target + rng.randint(5, 15) + int(potential_modifier)
+        # Young players tend to have higher potential gap
+        potential_variance = gauss(0, 5)
+        potential = int(base_potential + potential_variance)
+        potential = max(overall_target, min(99, potential))  # At least current overall
+        values["potential"] = _clamp_attribute("potential", potential)
+
+        # Generate LEARNING (playbook mastery speed) - NFL HC09 "Big Three"
+        # Correlated with awareness but has its own variance
+        base_learning = values.get("awareness", 70) + rng.randint(-10, 10)
+        learning = int(gauss(base_learning, 8))
+        learning = max(40, min(99, learning))
+        values["learning"] = _clamp_attribute("learning", learning)
+
+        # Generate DURABILITY attributes (for wear & tear system)
+        _generate_durability_attrs(attrs, rng=rng)
+
+        # Generate physicals using calibrated data
+        height_mean, height_std = self.profile.height
+        height = int(gauss(height_mean, height_std))
+        # Use calibrated weight from NFL combine data
+        weight = self.generate_weight(position.value, rng=rng)
+
+        # Age and experience
+        player_age = age if age is not None else rng.randint(22, 32)
+
+        # Calculate experience if not provided
+        if experience_years is not None:
+            exp = experience_years
         else:
-            player_college = random.choice(COLLEGES)
+            # Experience based on age (entered league at 21-23)
+            max_exp = player_age - 21
+            exp = min(max_exp, rng.randint(0, max(0, max_exp)))
+
+        # Team tenure (defaults to full experience for new team generation)
+        tenure = years_on_team if years_on_team is not None else exp
+
+        # Adjust potential based on age (older players have less upside)
+        if player_age > 28:
+            age_penalty = (player_age - 28) * 2
+            current_potential = values.get("potential", 75)
+            values["potential"] = _clamp_attribute(
+                "potential", max(overall_target, current_potential - age_penalty)
+            )
 
-    player = Player(
-        first_name=fname,
-        last_name=lname,
-        position=position,
-        attributes=attrs,
-        age=player_age,
-        height_inches=height,
-        weight_lbs=weight,
-        jersey_number=0,  # Will be assigned when added to roster
-        preferred_jersey_numbers=jersey_prefs,
-        experience_years=exp,
-        years_on_team=tenure,
-        college=player_college,
-    )
+        # Jersey preferences
+        jersey_prefs = _generate_jersey_preferences(position, rng=rng)
 
-    # Assign HC09-style archetype based on attribute profile
-    player.player_archetype = _assign_archetype(player)
+        # College (weighted toward Power 5)
+        player_college = college
+        if player_college is None:
+            if rng.random() < 0.75:  # 75% from Power 5 (first 50 in list)
+                player_college = rng.choice(COLLEGES[:50])
+            else:
+                player_college = rng.choice(COLLEGES)
+
+        player = Player(
+            id=player_id,
+            first_name=fname,
+            last_name=lname,
+            position=position,
+            attributes=attrs,
+            age=player_age,
+            height_inches=height,
+            weight_lbs=weight,
+            jersey_number=0,  # Will be assigned when added to roster
+            preferred_jersey_numbers=jersey_prefs,
+            experience_years=exp,
+            years_on_team=tenure,
+            college=player_college,
+        )
 
-    return player
+        # Assign HC09-style archetype based on attribute profile
+        player.player_archetype = _best_archetype(values, self.profile)
+
+        return player
 
 
-def _generate_durability_attrs(attrs: PlayerAttributes) -> None:
+def _generate_durability_attrs(
+    attrs: PlayerAttributes,
+    rng: Optional[random.Random] = None,
+) -> None:
     """Generate durability attributes for wear & tear system."""
+    rng = rng or random
+    values = attrs._values
     # Base toughness (overall durability)
-    base_toughness = random.gauss(75, 12)
-    attrs.set("toughness", int(max(40, min(99, base_toughness))))
+    base_toughness = rng.gauss(75, 12)
+    values["toughness"] = _clamp_attribute("toughness", int(max(40, min(99, base_toughness))))
 
     # Individual body part durability
     # Each has independent variance but correlated with base toughness
@@ -758,12 +907,12 @@ def _generate_durability_attrs(attrs: PlayerAttributes) -> None:
 
     for part in body_parts:
         # Correlated with toughness but with individual variance
-        part_durability = base_toughness + random.gauss(0, 10)
-        attrs.set(part, int(max(40, min(99, part_durability))))
+        part_durability = base_toughness + rng.gauss(0, 10)
+        values[part] = _clamp_attribute(part, int(max(40, min(99, part_durability))))
 
     # Injury resistance (general, from original system)
-    injury_resistance = base_toughness + random.gauss(0, 8)
-    attrs.set("injury", int(max(40, min(99, injury_resistance))))
+    injury_resistance = base_toughness + rng.gauss(0, 8)
+    values["injury"] = _clamp_attribute("injury", int(max(40, min(99, injury_resistance))))
 
 
 def _assign_archetype(player: Player) -> Optional[str]:
@@ -782,29 +931,19 @@ def _assign_archetype(player: Player) -> Optional[str]:
     Returns:
         The archetype value (e.g., "power", "speed", "mobile") or None
     """
-    position = player.position.value
+    return _best_archetype(player.attributes._values, _position_profile(player.position))
 
-    # Get the philosophy enum for this position
-    philosophy_enum = POSITION_TO_PHILOSOPHY_ENUM.get(position)
-    if not philosophy_enum:
-        return None
 
+def _best_archetype(values: dict[str, int], profile: _PositionProfile) -> Optional[str]:
+    """Archetype with the highest weighted attribute score."""
     best_archetype = None
     best_fit_score = -1
 
-    # Test each philosophy value for this position
-    for philosophy in philosophy_enum:
-        archetype_value = philosophy.value
-        weights = PHILOSOPHY_ATTRIBUTE_WEIGHTS.get(archetype_value, {})
-
-        if not weights:
-            continue
-
+    for archetype_value, weights in profile.archetypes:
         # Calculate fit score: sum(attribute_value * weight)
         fit_score = 0.0
-        for attr_name, weight in weights.items():
-            attr_value = player.attributes.get(attr_name, 50)
-            fit_score += attr_value * weight
+        for attr_name, weight in weights:
+            fit_score += values.get(attr_name, 50) * weight
 
         if fit_score > best_fit_score:
             best_fit_score = fit_score
@@ -813,8 +952,9 @@ def _assign_archetype(player: Player) -> Optional[str]:
     return best_archetype
 
 
-def _get_jersey_number(position: Position) -> int:
+def _get_jersey_number(position: Position, rng: Optional[random.Random] = None) -> int:
     """Get a position-appropriate jersey number."""
+    rng = rng or random
     ranges = {
         Position.QB: (1, 19),
         Position.RB: (20, 49),
@@ -840,7 +980,7 @@ def _get_jersey_number(position: Position) -> int:
         Position.LS: (40, 49),
     }
     low, high = ranges.get(position, (1, 99))
-    return random.randint(low, high)
+    return rng.randint(low, high)
 
 
 def generate_rookie(
@@ -853,6 +993,7 @@ def generate_rookie(
     draft_pick: Optional[int] = None,
     draft_year: Optional[int] = None,
     team_identity: Optional[TeamIdentity] = None,
+    rng: Optional[random.Random] = None,
 ) -> Player:
     """
     Generate a rookie player (fresh out of college).
@@ -874,14 +1015,16 @@ def generate_rookie(
         draft_pick: Overall pick number
         draft_year: Year drafted
         team_identity: Team identity for scheme-specific tuning
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Generated rookie Player
     """
+    rng = rng or random
     # Rookie age distribution (most are 21-22, few 23)
     age_weights = [(21, 0.3), (22, 0.5), (23, 0.2)]
     ages, weights = zip(*age_weights)
-    rookie_age = random.choices(ages, weights=weights)[0]
+    rookie_age = rng.choices(ages, weights=weights)[0]
 
     # If no overall target, base on draft round
     if overall_target is None:
@@ -897,25 +1040,25 @@ def generate_rookie(
                 7: (52, 62),  # Seventh round: 52-62
             }
             low, high = round_overall_ranges.get(draft_round, (55, 70))
-            overall_target = random.randint(low, high)
+            overall_target = rng.randint(low, high)
         else:
-            overall_target = random.randint(60, 75)
+            overall_target = rng.randint(60, 75)
 
     # Rookies have higher potential variance (sleepers and busts)
     # Roll for potential modifier: can be negative (bust) or very positive (sleeper)
     bust_chance = 0.15  # 15% chance of being a bust (low potential)
     sleeper_chance = 0.10  # 10% chance of being a sleeper (very high potential)
 
-    roll = random.random()
+    roll = rng.random()
     if roll < bust_chance:
         # Bust: potential is only slightly above current
-        potential_mod = random.uniform(-5, 2)
+        potential_mod = rng.uniform(-5, 2)
     elif roll < bust_chance + sleeper_chance:
         # Sleeper: potential is much higher than current
-        potential_mod = random.uniform(10, 20)
+        potential_mod = rng.uniform(10, 20)
     else:
         # Normal: standard potential gap
-        potential_mod = random.uniform(0, 10)
+        potential_mod = rng.uniform(0, 10)
 
     # Generate the player
     player = generate_player(
@@ -929,6 +1072,7 @@ def generate_rookie(
         experience_years=0,
         years_on_team=0,
         college=college,
+        rng=rng,
     )
 
     # Set draft information
@@ -946,32 +1090,32 @@ def generate_rookie(
         if draft_round == 1:
             if draft_pick and draft_pick <= 5:
                 # Top 5 picks get mega deals
-                player.salary = random.randint(8000, 15000)
-                player.signing_bonus = random.randint(20000, 35000)
+                player.salary = rng.randint(8000, 15000)
+                player.signing_bonus = rng.randint(20000, 35000)
             elif draft_pick and draft_pick <= 15:
-                player.salary = random.randint(4000, 8000)
-                player.signing_bonus = random.randint(10000, 20000)
+                player.salary = rng.randint(4000, 8000)
+                player.signing_bonus = rng.randint(10000, 20000)
             else:
-                player.salary = random.randint(2500, 5000)
-                player.signing_bonus = random.randint(5000, 12000)
+                player.salary = rng.randint(2500, 5000)
+                player.signing_bonus = rng.randint(5000, 12000)
         elif draft_round == 2:
-            player.salary = random.randint(1500, 3000)
-            player.signing_bonus = random.randint(2000, 5000)
+            player.salary = rng.randint(1500, 3000)
+            player.signing_bonus = rng.randint(2000, 5000)
         elif draft_round == 3:
-            player.salary = random.randint(1000, 2000)
-            player.signing_bonus = random.randint(800, 2500)
+            player.salary = rng.randint(1000, 2000)
+            player.signing_bonus = rng.randint(800, 2500)
         elif draft_round == 4:
-            player.salary = random.randint(900, 1500)
-            player.signing_bonus = random.randint(400, 1200)
+            player.salary = rng.randint(900, 1500)
+            player.signing_bonus = rng.randint(400, 1200)
         elif draft_round == 5:
-            player.salary = random.randint(850, 1200)
-            player.signing_bonus = random.randint(200, 600)
+            player.salary = rng.randint(850, 1200)
+            player.signing_bonus = rng.randint(200, 600)
         elif draft_round == 6:
-            player.salary = random.randint(800, 1000)
-            player.signing_bonus = random.randint(100, 400)
+            player.salary = rng.randint(800, 1000)
+            player.signing_bonus = rng.randint(100, 400)
         else:
-            player.salary = random.randint(750, 950)  # 7th round / UDFA
-            player.signing_bonus = random.randint(50, 200)
+            player.salary = rng.randint(750, 950)  # 7th round / UDFA
+            player.signing_bonus = rng.randint(50, 200)
 
         player.signing_bonus_remaining = player.signing_bonus
 
@@ -982,6 +1126,7 @@ def generate_draft_class(
     year: int,
     num_players: int = 260,
     team_identity: Optional[TeamIdentity] = None,
+    rng: Optional[random.Random] = None,
 ) -> list[Player]:
     """
     Generate a full draft class of rookies.
@@ -1003,10 +1148,12 @@ def generate_draft_class(
         year: Draft year
         num_players: Number of players to generate
         team_identity: Optional team identity for filtering
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         List of draft-eligible players (not yet assigned to teams)
     """
+    rng = rng or random
     draft_class = []
 
     # Draft tiers with Gaussian parameters
@@ -1073,18 +1220,18 @@ def generate_draft_class(
             tier_name, _, curr_mean, curr_std, pot_mean, pot_std = selected_tier
 
             # Generate ratings with Gaussian distribution
-            current_overall = int(random.gauss(curr_mean, curr_std))
-            potential = int(random.gauss(pot_mean, pot_std))
+            current_overall = int(rng.gauss(curr_mean, curr_std))
+            potential = int(rng.gauss(pot_mean, pot_std))
 
             # Clamp values
             current_overall = max(38, min(88, current_overall))
             potential = max(current_overall, min(99, potential))
 
             # Add boom/bust variance (8% hidden gems, 7% busts)
-            roll = random.random()
+            roll = rng.random()
             if roll < 0.08:
                 # Hidden gem - much higher potential than tier suggests
-                potential = min(99, potential + random.randint(10, 18))
+                potential = min(99, potential + rng.randint(10, 18))
             elif roll < 0.15:
                 # Bust - potential barely above current
                 potential = max(current_overall, min(current_overall + 5, potential - 8))
@@ -1097,6 +1244,7 @@ def generate_draft_class(
                 draft_year=year,
                 tier_name=tier_name,
                 team_identity=team_identity,
+                rng=rng,
             )
             draft_class.append(rookie)
 
@@ -1116,6 +1264,7 @@ def _generate_draft_prospect(
     draft_year: int,
     tier_name: str = "day3_late",
     team_identity: Optional[TeamIdentity] = None,
+    rng: Optional[random.Random] = None,
 ) -> Player:
     """
     Generate a draft prospect with specific overall and potential targets.
@@ -1129,8 +1278,9 @@ def _generate_draft_prospect(
     - Draft tier (elite prospects have higher ceilings overall)
     - Bust/gem status (affects perceived vs actual potential)
     """
+    rng = rng or random
     # Rookie age distribution
-    age = random.choices([21, 22, 23], weights=[0.3, 0.5, 0.2])[0]
+    age = rng.choices([21, 22, 23], weights=[0.3, 0.5, 0.2])[0]
 
     # Calculate potential modifier to hit our target
     potential_mod = potential - current_overall
@@ -1144,6 +1294,7 @@ def _generate_draft_prospect(
         potential_modifier=potential_mod,
         experience_years=0,
         years_on_team=0,
+        rng=rng,
     )
 
     # Override potential to hit exact target (generate_player adds variance)
@@ -1168,7 +1319,7 @@ def _generate_draft_prospect(
 
     # Add variance to media perception
     # 15% chance of significant over/under rating (busts and gems)
-    perception_roll = random.random()
+    perception_roll = rng.random()
 
     # Track bust/gem status for potential generation
     is_bust = False
@@ -1178,22 +1329,22 @@ def _generate_draft_prospect(
         if perception_roll < 0.08:
             # BUST: Media overrates this player by 1-3 rounds
             # They look the part but won't pan out
-            media_round = max(1, base_round - random.randint(1, 3))
+            media_round = max(1, base_round - rng.randint(1, 3))
             is_bust = True
         elif perception_roll < 0.15:
             # GEM: Media underrates this player by 1-3 rounds
             # Doesn't have the "look" but is actually good
-            media_round = min(7, base_round + random.randint(1, 3))
+            media_round = min(7, base_round + rng.randint(1, 3))
             is_gem = True
         else:
             # Normal variance: +/- 1 round
-            media_round = max(1, min(7, base_round + random.randint(-1, 1)))
+            media_round = max(1, min(7, base_round + rng.randint(-1, 1)))
 
         player.projected_draft_round = media_round
     else:
         # UDFA - 20% chance media sees them as late-round pick
-        if random.random() < 0.20:
-            player.projected_draft_round = random.randint(6, 7)
+        if rng.random() < 0.20:
+            player.projected_draft_round = rng.randint(6, 7)
         else:
             player.projected_draft_round = None  # Undrafted projection
 
@@ -1216,6 +1367,7 @@ def _generate_draft_prospect(
         is_bust=is_bust,
         is_gem=is_gem,
         scouted_percentage=0,  # Prospects start unscouted
+        rng=rng,
     )
 
     # Store actual potentials in attributes (these are the true ceilings)
@@ -1247,10 +1399,10 @@ def _generate_draft_prospect(
     pos = player.position.value
 
     # Use calibrated NFL combine data with position-specific distributions
-    player.forty_yard_dash = generate_forty_time(pos)
-    player.bench_press_reps = generate_bench_reps(pos)
-    player.vertical_jump = generate_vertical(pos)
-    player.broad_jump = generate_broad_jump(pos)
+    player.forty_yard_dash = generate_forty_time(pos, rng=rng)
+    player.bench_press_reps = generate_bench_reps(pos, rng=rng)
+    player.vertical_jump = generate_vertical(pos, rng=rng)
+    player.broad_jump = generate_broad_jump(pos, rng=rng)
 
     return player
 
@@ -24,6 +24,7 @@ def generate_attribute_potential(
     current_value: int,
     tier: str = "day2",
     player_ceiling_modifier: float = 1.0,
+    rng: Optional[random.Random] = None,
 ) -> int:
     """
     Generate potential ceiling for a single attribute.
@@ -33,10 +34,12 @@ def generate_attribute_potential(
         current_value: Current attribute value
         tier: Draft tier (elite, day1, day2, day3_early, day3_late, udfa)
         player_ceiling_modifier: Individual player variance (0.85-1.15)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Potential ceiling (capped at 99)
     """
+    rng = rng or random
     # Check for attribute-specific overrides first (e.g., speed has lower growth)
     if attr_name in ATTRIBUTE_GROWTH_OVERRIDES:
         base_min, base_max = ATTRIBUTE_GROWTH_OVERRIDES[attr_name]
@@ -52,26 +55,26 @@ def generate_attribute_potential(
 
     # HIGH-RATED: More likely to be peaked
     if current_value >= 90:
-        peaked_roll = random.random()
+        peaked_roll = rng.random()
         if peaked_roll < 0.25:  # 25% already at ceiling
             return current_value
         elif peaked_roll < 0.50:  # 25% minimal growth
-            return min(99, current_value + random.randint(1, 2))
+            return min(99, current_value + rng.randint(1, 2))
         # else: 50% normal growth (continues below)
     elif current_value >= 85:
-        peaked_roll = random.random()
+        peaked_roll = rng.random()
         if peaked_roll < 0.10:  # 10% already at ceiling
             return current_value
         elif peaked_roll < 0.25:  # 15% minimal growth
-            return min(99, current_value + random.randint(1, 2))
+            return min(99, current_value + rng.randint(1, 2))
         # else: 75% normal growth
 
     # LOW-RATED: Chance to be "raw" with big upside
     elif current_value <= 75:
-        raw_roll = random.random()
+        raw_roll = rng.random()
         if raw_roll < 0.12:  # 12% are raw athletes with big upside
             # Raw prospect: 1.5-2x normal growth
-            raw_multiplier = random.uniform(1.5, 2.0)
+            raw_multiplier = rng.uniform(1.5, 2.0)
             growth = int(base_max * raw_multiplier)
             return min(99, current_value + growth)
 
@@ -90,7 +93,7 @@ def generate_attribute_potential(
     max_growth = max(min_growth + 1, max_growth)
 
     # Generate ceiling with slight bias toward middle (triangular distribution)
-    growth = int(random.triangular(min_growth, max_growth, (min_growth + max_growth) / 2))
+    growth = int(rng.triangular(min_growth, max_growth, (min_growth + max_growth) / 2))
 
     potential = current_value + growth
     return min(99, potential)
@@ -101,6 +104,7 @@ def generate_perceived_potential(
     scouted_percentage: int,
     is_bust: bool = False,
     is_gem: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> int:
     """
     Generate media/scout perceived potential that may differ from actual.
@@ -114,26 +118,28 @@ def generate_perceived_potential(
         scouted_percentage: How much scouting done (0-100)
         is_bust: If True, perceived is inflated
         is_gem: If True, perceived is deflated
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Perceived potential ceiling
     """
+    rng = rng or random
     # Base error decreases with scouting
     max_error = int(15 * (1 - scouted_percentage / 100))
 
     if is_bust:
         # Overrated: perceived higher than actual
-        inflation = random.randint(5, 15)
-        error = random.randint(0, max_error)
+        inflation = rng.randint(5, 15)
+        error = rng.randint(0, max_error)
         return min(99, actual_potential + inflation + error)
     elif is_gem:
         # Underrated: perceived lower than actual
-        deflation = random.randint(5, 15)
-        error = random.randint(-max_error, 0)
+        deflation = rng.randint(5, 15)
+        error = rng.randint(-max_error, 0)
         return max(40, actual_potential - deflation + error)
     else:
         # Normal variance
-        error = random.randint(-max_error, max_error)
+        error = rng.randint(-max_error, max_error)
         return max(40, min(99, actual_potential + error))
 
 
@@ -143,6 +149,7 @@ def generate_all_potentials(
     is_bust: bool = False,
     is_gem: bool = False,
     scouted_percentage: int = 0,
+    rng: Optional[random.Random] = None,
 ) -> tuple[dict[str, int], dict[str, int]]:
     """
     Generate all attribute potentials for a player.
@@ -153,13 +160,15 @@ def generate_all_potentials(
         is_bust: Media overrates this player
         is_gem: Media underrates this player
         scouted_percentage: Scouting progress
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         Tuple of (actual_potentials, perceived_potentials)
         Keys are formatted as "{attr_name}_potential"
     """
+    rng = rng or random
     # Individual player variance (some players are late bloomers, some peak early)
-    player_ceiling_mod = random.uniform(0.85, 1.15)
+    player_ceiling_mod = rng.uniform(0.85, 1.15)
 
     actual_potentials: dict[str, int] = {}
     perceived_potentials: dict[str, int] = {}
@@ -173,13 +182,13 @@ def generate_all_potentials(
 
         # Generate actual potential
         actual = generate_attribute_potential(
-            attr_name, current_value, tier, player_ceiling_mod
+            attr_name, current_value, tier, player_ceiling_mod, rng=rng
         )
         actual_potentials[f"{attr_name}_potential"] = actual
 
         # Generate perceived potential
         perceived = generate_perceived_potential(
-            actual, scouted_percentage, is_bust, is_gem
+            actual, scouted_percentage, is_bust, is_gem, rng=rng
         )
         perceived_potentials[f"{attr_name}_potential"] = perceived
 
@@ -293,6 +302,7 @@ class ProspectDurabilityReport:
 def generate_college_injury_history(
     actual_durability: dict[str, int],
     position: str,
+    rng: Optional[random.Random] = None,
 ) -> list[dict]:
     """
     Generate simulated college injury history based on durability.
@@ -302,10 +312,12 @@ def generate_college_injury_history(
     Args:
         actual_durability: True durability ratings by body part
         position: Player position (affects injury likelihood)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         List of injury history entries
     """
+    rng = rng or random
     history = []
 
     # Position injury modifiers (some positions get hurt more)
@@ -322,20 +334,20 @@ def generate_college_injury_history(
         base_chance = max(0.01, (100 - durability) / 150)
         injury_chance = base_chance * pos_modifier
 
-        if random.random() < injury_chance:
+        if rng.random() < injury_chance:
             # Determine severity
-            if random.random() < 0.15:  # 15% season-ending
-                games_missed = random.randint(8, 12)
+            if rng.random() < 0.15:  # 15% season-ending
+                games_missed = rng.randint(8, 12)
                 severity = "season-ending"
-                year = random.choice(["freshman", "sophomore", "junior"])
-            elif random.random() < 0.40:  # Multi-game
-                games_missed = random.randint(2, 6)
+                year = rng.choice(["freshman", "sophomore", "junior"])
+            elif rng.random() < 0.40:  # Multi-game
+                games_missed = rng.randint(2, 6)
                 severity = "moderate"
-                year = random.choice(["freshman", "sophomore", "junior", "senior"])
+                year = rng.choice(["freshman", "sophomore", "junior", "senior"])
             else:  # Minor
-                games_missed = random.randint(1, 2)
+                games_missed = rng.randint(1, 2)
                 severity = "minor"
-                year = random.choice(["sophomore", "junior", "senior"])
+                year = rng.choice(["sophomore", "junior", "senior"])
 
             history.append({
                 "injury_type": injury_type,
@@ -351,6 +363,7 @@ def generate_college_injury_history(
 def generate_prospect_durability_report(
     player: "Player",
     scout_accuracy: float = 0.7,
+    rng: Optional[random.Random] = None,
 ) -> ProspectDurabilityReport:
     """
     Generate scout estimates for prospect durability.
@@ -365,10 +378,12 @@ def generate_prospect_durability_report(
     Args:
         player: The prospect being scouted
         scout_accuracy: Scout's ability (0.5-1.0)
+        rng: Random generator (defaults to the module-level one)
 
     Returns:
         ProspectDurabilityReport with estimates and flags
     """
+    rng = rng or random
     # Get actual durability values
     actual_durability = {
         "head": player.attributes.get("head_durability", 75),
@@ -382,7 +397,7 @@ def generate_prospect_durability_report(
     # Generate college injury history (if not already present)
     if not player.injury_history:
         college_history = generate_college_injury_history(
-            actual_durability, player.position.value
+            actual_durability, player.position.value, rng=rng
         )
     else:
         college_history = player.injury_history
@@ -410,7 +425,7 @@ def generate_prospect_durability_report(
             has_history = False
 
         # Generate estimate with error
-        error = random.randint(-max_error, max_error)
+        error = rng.randint(-max_error, max_error)
         estimated = max(40, min(99, actual + error))
 
         # Determine confidence
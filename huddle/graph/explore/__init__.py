@@ -29,6 +29,10 @@ Usage:
     generator = ContextGenerator()
     generator.generate_matchup_context("PHI", "DAL")
     cards = get_game_context_queue().get_relevant(limit=5)
+
+    # Pin both rosters' context for the active game
+    generator.prepare_game("PHI", "DAL")
+    get_explore_cache().stats.hit_rate
 """
 
 from huddle.graph.explore.traversal import (
@@ -49,6 +53,15 @@ from huddle.graph.explore.tools import (
     get_tool_descriptions,
     execute_tool,
     TOOL_REGISTRY,
+    prime_game_context,
+    release_game_context,
+)
+
+from huddle.graph.explore.cache import (
+    ExploreCache,
+    ExploreCacheStats,
+    get_explore_cache,
+    set_explore_cache,
 )
 
 from huddle.graph.explore.context import (
@@ -77,6 +90,13 @@ __all__ = [
     "get_tool_descriptions",
     "execute_tool",
     "TOOL_REGISTRY",
+    "prime_game_context",
+    "release_game_context",
+    # Cache
+    "ExploreCache",
+    "ExploreCacheStats",
+    "get_explore_cache",
+    "set_explore_cache",
     # Context
     "ContextType",
     "ContextCard",
@@ -0,0 +1,285 @@
+"""
+Read-through cache for graph exploration.
+
+The commentary and context layers call the exploration tools for the
+same players and teams over and over during a game. Results are cached
+here, keyed by tool name and arguments:
+
+- TTL + LRU: entries expire after ``ttl_seconds`` and the least recently
+  used entry is evicted past ``max_entries``.
+- Write invalidation: every entry is tagged with the node keys it was
+  built from (ids, abbreviations, the identifiers it was asked for).
+  The sync layer reports the nodes it writes (see
+  ``huddle.graph.sync.base.add_write_listener``) and matching entries
+  are dropped.
+- Pinned neighborhood: results for the two teams in the active game can
+  be pinned so they never expire or get evicted while the game runs
+  (see ``tools.prime_game_context``). Writes still invalidate them.
+
+Usage:
+    @cached_tool
+    def get_player_context(identifier: str, ...) -> ToolResult: ...
+
+    get_explore_cache().stats.hit_rate
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from huddle.graph.sync.base import add_write_listener, remove_write_listener
+
+logger = logging.getLogger(__name__)
+
+# Returned by ExploreCache.get on a miss (None is a valid cached value)
+MISSING = object()
+
+
+@dataclass
+class ExploreCacheStats:
+    """Hit/miss counters for monitoring."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ExploreCache:
+    """
+    Thread-safe TTL + LRU cache with tag-based invalidation.
+
+    Invalidation can arrive from the graph write-behind thread, so every
+    operation takes the cache lock.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = True
+        self.stats = ExploreCacheStats()
+        self._clock = clock
+        self._lock = threading.RLock()
+        # key -> (stored_at, value, tags)
+        self._entries: OrderedDict[Hashable, tuple[float, Any, frozenset]] = OrderedDict()
+        # key -> (value, tags); never expire or get evicted
+        self._pinned: dict[Hashable, tuple[Any, frozenset]] = {}
+        # tag -> keys (cached or pinned) that depend on it
+        self._by_tag: dict[str, set[Hashable]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or MISSING."""
+        with self._lock:
+            pinned = self._pinned.get(key)
+            if pinned is not None:
+                self.stats.hits += 1
+                return pinned[0]
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return MISSING
+
+            stored_at, value, tags = entry
+            if self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds:
+                self._drop(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, tags: Iterable[Any] = ()) -> None:
+        """Store value under key, evicting the least recently used entry."""
+        tags = _tag_set(tags)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (self._clock(), value, tags)
+            self._index(key, tags)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.stats.evictions += 1
+
+    def pin(self, key: Hashable, value: Any, tags: Iterable[Any] = ()) -> None:
+        """Store value under key until release_pinned() or a matching write."""
+        tags = _tag_set(tags)
+        with self._lock:
+            self._drop(key)
+            self._pinned[key] = (value, tags)
+            self._index(key, tags)
+
+    def release_pinned(self) -> None:
+        """Drop all pinned entries (e.g. when the active game ends)."""
+        with self._lock:
+            for key in list(self._pinned):
+                self._drop(key)
+
+    def invalidate(self, tags: Optional[Iterable[Any]]) -> int:
+        """
+        Drop every entry tagged with any of ``tags`` (None = everything).
+
+        Registered as a sync-layer write listener. Returns the number of
+        entries dropped.
+        """
+        with self._lock:
+            if tags is None:
+                count = len(self._entries) + len(self._pinned)
+                self._entries.clear()
+                self._pinned.clear()
+                self._by_tag.clear()
+            else:
+                keys = set()
+                for tag in _tag_set(tags):
+                    keys |= self._by_tag.get(tag, set())
+                for key in keys:
+                    self._drop(key)
+                count = len(keys)
+            self.stats.invalidations += count
+            return count
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+    @property
+    def pinned_count(self) -> int:
+        return len(self._pinned)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    def _index(self, key: Hashable, tags: frozenset) -> None:
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        tags = entry[2] if entry is not None else None
+        pinned = self._pinned.pop(key, None)
+        if pinned is not None:
+            tags = pinned[1]
+        for tag in tags or ():
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+
+def _tag_set(tags: Iterable[Any]) -> frozenset:
+    return frozenset(str(t) for t in tags if t not in (None, ""))
+
+
+# =============================================================================
+# Global Cache
+# =============================================================================
+
+_explore_cache: Optional[ExploreCache] = None
+
+
+def get_explore_cache() -> ExploreCache:
+    """Get the shared exploration cache, subscribed to sync-layer writes."""
+    global _explore_cache
+    if _explore_cache is None:
+        _explore_cache = ExploreCache()
+        add_write_listener(_explore_cache.invalidate)
+    return _explore_cache
+
+
+def set_explore_cache(cache: Optional[ExploreCache]) -> None:
+    """Replace the shared cache (None resets to a fresh default on next use)."""
+    global _explore_cache
+    if _explore_cache is not None:
+        remove_write_listener(_explore_cache.invalidate)
+    _explore_cache = cache
+    if cache is not None:
+        add_write_listener(cache.invalidate)
+
+
+# =============================================================================
+# Tagging and Decorator
+# =============================================================================
+
+def node_tags(value: Any) -> set[str]:
+    """
+    Collect the node keys a result was built from.
+
+    Walks dicts, lists and GraphNode-like objects for ``id`` and ``abbr``
+    values (nodes are written under either).
+    """
+    tags: set[str] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for name in ("id", "abbr"):
+                if isinstance(item.get(name), (str, int)):
+                    tags.add(str(item[name]))
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list, tuple)))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif hasattr(item, "properties") and hasattr(item, "id"):
+            tags.add(str(item.id))
+            stack.append(item.properties)
+    return tags
+
+
+def cached_tool(func: Callable) -> Callable:
+    """
+    Cache successful results of an exploration tool.
+
+    The key is the tool name plus its bound arguments (defaults applied),
+    so ``get_player_context("X")`` and ``get_player_context("X", True)``
+    share an entry. The undecorated tool is available as ``.uncached``
+    and the key builder as ``.cache_key``.
+    """
+    signature = inspect.signature(func)
+
+    def cache_key(*args, **kwargs) -> tuple:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return (func.__name__, tuple(bound.arguments.items()))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_explore_cache()
+        if not cache.enabled:
+            return func(*args, **kwargs)
+
+        key = cache_key(*args, **kwargs)
+        result = cache.get(key)
+        if result is not MISSING:
+            return result
+
+        result = func(*args, **kwargs)
+        if result.success:
+            cache.put(key, result, tool_tags(result, key))
+        return result
+
+    wrapper.uncached = func
+    wrapper.cache_key = cache_key
+    return wrapper
+
+
+def tool_tags(result: Any, key: tuple) -> set[str]:
+    """Tags for a ToolResult: nodes in its data plus the string arguments."""
+    tags = node_tags(result.data)
+    tags.update(value for _, value in key[1] if isinstance(value, str))
+    return tags
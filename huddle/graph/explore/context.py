@@ -19,6 +19,8 @@ from huddle.graph.explore.tools import (
     get_player_context,
     get_team_context,
     get_matchup_context,
+    prime_game_context,
+    release_game_context,
 )
 
 logger = logging.getLogger(__name__)
@@ -305,6 +307,16 @@ class ContextGenerator:
 
         return cards
 
+    def prepare_game(self, home_abbr: str, away_abbr: str) -> list[ContextCard]:
+        """
+        Pin both teams' graph neighborhood, then generate matchup cards.
+
+        Call at kickoff so in-game lookups for either roster are served
+        from memory.
+        """
+        prime_game_context(home_abbr, away_abbr)
+        return self.generate_matchup_context(home_abbr, away_abbr)
+
     def generate_matchup_context(
         self,
         team_a: str,
@@ -440,6 +452,7 @@ def get_game_context_queue() -> ContextQueue:
 
 
 def reset_game_context() -> None:
-    """Reset the game context queue (e.g., at game start)."""
+    """Reset the game context queue and unpin the previous game's results."""
     global _game_context_queue
     _game_context_queue = ContextQueue()
+    release_game_context()
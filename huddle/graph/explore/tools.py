@@ -16,6 +16,7 @@ from dataclasses import dataclass, asdict
 from typing import Any, Optional
 
 from huddle.graph.connection import get_graph, is_graph_enabled
+from huddle.graph.explore.cache import cached_tool, get_explore_cache, tool_tags
 from huddle.graph.explore.traversal import GraphTraversal, GraphNode, explore
 from huddle.graph.sync.computed import (
     calculate_career_phase,
@@ -42,6 +43,7 @@ class ToolResult:
         return asdict(self)
 
 
+@cached_tool
 def get_player_context(
     identifier: str,
     include_stats: bool = True,
@@ -147,6 +149,7 @@ def get_player_context(
     )
 
 
+@cached_tool
 def get_team_context(
     identifier: str,
     include_roster: bool = True,
@@ -345,6 +348,7 @@ def get_game_context(
     )
 
 
+@cached_tool
 def get_matchup_context(
     entity_a: str,
     entity_b: str,
@@ -498,6 +502,7 @@ def search_players(
         return ToolResult(success=False, data=None, summary=f"Search failed: {e}")
 
 
+@cached_tool
 def find_connection(
     entity_a: str,
     entity_b: str,
@@ -559,6 +564,65 @@ def find_connection(
         )
 
 
+# ============================================================================
+# GAME NEIGHBORHOOD
+# ============================================================================
+
+def prime_game_context(home_abbr: str, away_abbr: str) -> int:
+    """
+    Precompute and pin tool results for the two teams in an active game.
+
+    Warms team and matchup context plus player context for both rosters
+    (under player id and name, the two ways callers look players up).
+    Pinned results don't expire while the game runs; a graph write that
+    touches one of them still invalidates it. Replaces any previously
+    pinned game.
+
+    Returns:
+        Number of pinned results
+    """
+    cache = get_explore_cache()
+    cache.release_pinned()
+    if not is_graph_enabled():
+        return 0
+
+    _pin(get_team_context, home_abbr)
+    _pin(get_team_context, away_abbr)
+    _pin(get_matchup_context, home_abbr, away_abbr)
+
+    rows = GraphTraversal().query(
+        """
+        MATCH (p:Player)-[:PLAYS_FOR]->(t:Team)
+        WHERE t.abbr IN $abbrs
+        RETURN p.id as id, p.name as name
+        """,
+        {"abbrs": [home_abbr, away_abbr]},
+    )
+    for row in rows:
+        _pin(get_player_context, row["id"], aliases=[row.get("name")])
+
+    logger.debug(f"Pinned {cache.pinned_count} results for {away_abbr} @ {home_abbr}")
+    return cache.pinned_count
+
+
+def release_game_context() -> None:
+    """Unpin the active game's results (they are recomputed on demand)."""
+    get_explore_cache().release_pinned()
+
+
+def _pin(tool, identifier: str, *args, aliases: list = ()) -> None:
+    key = tool.cache_key(identifier, *args)
+    result = tool.uncached(identifier, *args)
+    if not result.success:
+        return
+    cache = get_explore_cache()
+    tags = tool_tags(result, key)
+    cache.pin(key, result, tags)
+    for alias in aliases:
+        if alias:
+            cache.pin(tool.cache_key(alias, *args), result, tags | {alias})
+
+
 # ============================================================================
 # TOOL REGISTRY (for LLM integration)
 # ============================================================================
@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from huddle.graph.connection import GraphConnection, get_graph, is_graph_enabled
+from huddle.graph.explore.cache import MISSING, ExploreCache, get_explore_cache, node_tags
 from huddle.graph.schema import NodeLabels, RelTypes
 
 logger = logging.getLogger(__name__)
@@ -159,10 +160,19 @@ class GraphTraversal:
     High-level graph traversal operations.
 
     Provides semantic navigation methods for AI agents.
+
+    explore, find_path and find_similar are read through the shared
+    ExploreCache (pass ``cache`` to use another one). Cached GraphNodes
+    are shared between callers and should be treated as read-only.
     """
 
-    def __init__(self, graph: Optional[GraphConnection] = None):
+    def __init__(
+        self,
+        graph: Optional[GraphConnection] = None,
+        cache: Optional[ExploreCache] = None,
+    ):
         self._graph = graph or get_graph()
+        self._cache = cache or get_explore_cache()
 
     def explore(self, entity_type: str, identifier: str) -> Optional[GraphNode]:
         """
@@ -181,7 +191,18 @@ class GraphTraversal:
             explore("game", "game_123")
         """
         label = self._normalize_label(entity_type)
-
+        key = ("explore", self._graph, label, identifier)
+        node = self._cached(key)
+        if node is not MISSING:
+            return node
+
+        node = self._explore(label, identifier)
+        # Misses aren't cached: the entity may be synced later under a new key
+        if node is not None:
+            self._store(key, node, node_tags(node) | {identifier})
+        return node
+
+    def _explore(self, label: str, identifier: str) -> Optional[GraphNode]:
         # Try exact ID match first
         query = f"""
         MATCH (n:{label} {{id: $id}})
@@ -228,46 +249,65 @@ class GraphTraversal:
         Returns:
             GraphPath if found, None otherwise
         """
+        key = ("find_path", self._graph, start.id, end.id, max_depth)
+        path = self._cached(key)
+        if path is not MISSING:
+            return path
+
+        try:
+            path = self._find_path(start, end, max_depth)
+        except Exception as e:
+            logger.error(f"Failed to find path: {e}")
+            return None
+
+        tags = {start.id, end.id}
+        if path is not None:
+            tags |= node_tags(path.nodes)
+        self._store(key, path, tags)
+        return path
+
+    def _find_path(
+        self,
+        start: GraphNode,
+        end: GraphNode,
+        max_depth: int,
+    ) -> Optional[GraphPath]:
         query = """
         MATCH (a {id: $start_id}), (b {id: $end_id})
         MATCH path = shortestPath((a)-[*..%d]-(b))
         RETURN path, [r in relationships(path) | type(r)] as rel_types
         """ % max_depth
 
-        try:
-            results = self._graph.run_query(query, {
-                "start_id": start.id,
-                "end_id": end.id,
-            })
-
-            if not results:
-                return None
+        results = self._graph.run_query(query, {
+            "start_id": start.id,
+            "end_id": end.id,
+        })
 
-            path_data = results[0]["path"]
-            rel_types = results[0]["rel_types"]
+        if not results:
+            return None
 
-            # Extract intermediate nodes
-            nodes = []
-            for node in path_data.nodes[1:-1]:  # Exclude start and end
-                node_dict = dict(node)
-                labels = list(node.labels)
-                nodes.append(GraphNode(
-                    id=node_dict.get("id", ""),
-                    label=labels[0] if labels else "Unknown",
-                    properties=node_dict,
-                    _graph=self._graph,
-                ))
+        path_data = results[0]["path"]
+        rel_types = results[0]["rel_types"]
+
+        # Extract intermediate nodes
+        nodes = []
+        for node in path_data.nodes[1:-1]:  # Exclude start and end
+            node_dict = dict(node)
+            labels = list(node.labels)
+            nodes.append(GraphNode(
+                id=node_dict.get("id", ""),
+                label=labels[0] if labels else "Unknown",
+                properties=node_dict,
+                _graph=self._graph,
+            ))
 
-            return GraphPath(
-                start=start,
-                end=end,
-                nodes=nodes,
-                relationships=rel_types,
-                length=len(rel_types),
-            )
-        except Exception as e:
-            logger.error(f"Failed to find path: {e}")
-            return None
+        return GraphPath(
+            start=start,
+            end=end,
+            nodes=nodes,
+            relationships=rel_types,
+            length=len(rel_types),
+        )
 
     def find_similar(
         self,
@@ -286,6 +326,21 @@ class GraphTraversal:
         Returns:
             List of similar nodes
         """
+        key = ("find_similar", self._graph, node.id, by, limit)
+        similar = self._cached(key)
+        if similar is not MISSING:
+            return similar
+
+        try:
+            similar = self._find_similar(node, by, limit)
+        except Exception as e:
+            logger.error(f"Failed to find similar: {e}")
+            return []
+
+        self._store(key, similar, node_tags(similar) | {node.id})
+        return similar
+
+    def _find_similar(self, node: GraphNode, by: str, limit: int) -> list[GraphNode]:
         if by == "position" and node.label == "Player":
             # Find players at same position
             position = node.properties.get("position", "")
@@ -343,20 +398,16 @@ class GraphTraversal:
                 """
                 params = {"id": node.id, "limit": limit}
 
-        try:
-            results = self._graph.run_query(query, params)
-            return [
-                GraphNode(
-                    id=dict(r["n"]).get("id", ""),
-                    label=r["labels"][0] if r["labels"] else node.label,
-                    properties=dict(r["n"]),
-                    _graph=self._graph,
-                )
-                for r in results
-            ]
-        except Exception as e:
-            logger.error(f"Failed to find similar: {e}")
-            return []
+        results = self._graph.run_query(query, params)
+        return [
+            GraphNode(
+                id=dict(r["n"]).get("id", ""),
+                label=r["labels"][0] if r["labels"] else node.label,
+                properties=dict(r["n"]),
+                _graph=self._graph,
+            )
+            for r in results
+        ]
 
     def query(
         self,
@@ -377,6 +428,15 @@ class GraphTraversal:
         """
         return self._graph.run_query(cypher, parameters or {})
 
+    def _cached(self, key: tuple) -> Any:
+        if not self._cache.enabled:
+            return MISSING
+        return self._cache.get(key)
+
+    def _store(self, key: tuple, value: Any, tags: set[str]) -> None:
+        if self._cache.enabled:
+            self._cache.put(key, value, tags)
+
     def _normalize_label(self, entity_type: str) -> str:
         """Normalize entity type to graph label."""
         mapping = {
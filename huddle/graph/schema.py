@@ -80,6 +80,7 @@ class RelTypes:
 
     # Temporal
     SEASON_STATS = "SEASON_STATS"  # Player -> Season (with stats)
+    SEASON_RECORD = "SEASON_RECORD"  # Team -> Season (with standings)
 
 
 # ============================================================================
@@ -30,9 +30,14 @@ from huddle.graph.sync.base import (
     full_sync,
     sync_entity,
     sync_relationship,
+    add_write_listener,
+    remove_write_listener,
+    notify_written,
     SyncResult,
 )
 
+from huddle.graph.sync.batch import BatchWriter
+
 from huddle.graph.sync.players import (
     sync_player,
     sync_player_stats,
@@ -59,10 +64,16 @@ from huddle.graph.sync.games import (
 from huddle.graph.sync.handlers import (
     register_game_handlers,
     unregister_game_handlers,
+    get_write_queue,
     graph_sync_enabled,
     sync_after_game,
 )
 
+from huddle.graph.sync.writer import (
+    GraphWriteQueue,
+    WriteQueueStats,
+)
+
 from huddle.graph.sync.computed import (
     sync_all_computed_properties,
     sync_player_career_phase,
@@ -72,6 +83,8 @@ from huddle.graph.sync.computed import (
     CareerPhase,
     PerformanceTrend,
     Narrative,
+    ComputedPropertyTracker,
+    HeadToHeadTally,
 )
 
 from huddle.graph.sync.historical import (
@@ -85,7 +98,11 @@ __all__ = [
     "full_sync",
     "sync_entity",
     "sync_relationship",
+    "add_write_listener",
+    "remove_write_listener",
+    "notify_written",
     "SyncResult",
+    "BatchWriter",
     # Players
     "sync_player",
     "sync_player_stats",
@@ -106,8 +123,12 @@ __all__ = [
     # Handlers
     "register_game_handlers",
     "unregister_game_handlers",
+    "get_write_queue",
     "graph_sync_enabled",
     "sync_after_game",
+    # Write-behind queue
+    "GraphWriteQueue",
+    "WriteQueueStats",
     # Computed
     "sync_all_computed_properties",
     "sync_player_career_phase",
@@ -117,6 +138,8 @@ __all__ = [
     "CareerPhase",
     "PerformanceTrend",
     "Narrative",
+    "ComputedPropertyTracker",
+    "HeadToHeadTally",
     # Historical
     "HistoricalGraphSync",
     "PlayerTeamHistory",
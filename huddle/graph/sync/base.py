@@ -1,21 +1,54 @@
 """
 Base sync utilities for the graph module.
 
-Provides the core sync infrastructure: batching, error handling,
-and the main full_sync entry point.
+Provides the core sync infrastructure: single-entity upserts, error
+handling, and the main full_sync entry point (which writes through
+BatchWriter in batch.py).
 """
 
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 from uuid import UUID
 
 from huddle.graph.connection import get_graph, GraphConnection
 from huddle.graph.schema import init_schema, NodeLabels, RelTypes
 
+if TYPE_CHECKING:
+    from huddle.graph.sync.batch import BatchWriter
+
 logger = logging.getLogger(__name__)
 
+# Listeners told which nodes the sync layer wrote, so read caches can
+# drop stale entries. Called with a set of node keys (ids, abbreviations,
+# names), or None when the whole graph was cleared.
+WriteListener = Callable[[Optional[set[str]]], None]
+_write_listeners: list[WriteListener] = []
+
+
+def add_write_listener(listener: WriteListener) -> None:
+    """Register a callback for node writes made through the sync layer."""
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+
+def remove_write_listener(listener: WriteListener) -> None:
+    if listener in _write_listeners:
+        _write_listeners.remove(listener)
+
+
+def notify_written(keys: Optional[Iterable[Any]]) -> None:
+    """Tell write listeners which node keys were written (None = everything)."""
+    if not _write_listeners:
+        return
+    key_set = None if keys is None else {str(k) for k in keys if k is not None}
+    for listener in list(_write_listeners):
+        try:
+            listener(key_set)
+        except Exception as e:
+            logger.warning(f"Graph write listener failed: {e}")
+
 
 @dataclass
 class SyncResult:
@@ -76,6 +109,7 @@ def sync_entity(
         """
 
         result = graph.run_write(query, {"id": id_str, "properties": properties})
+        notify_written([id_str])
 
         duration = (datetime.now() - start).total_seconds() * 1000
         return SyncResult(
@@ -116,6 +150,7 @@ def sync_entity_by_key(
         """
 
         result = graph.run_write(query, {"key_value": key_value, "properties": properties})
+        notify_written([key_value])
 
         duration = (datetime.now() - start).total_seconds() * 1000
         return SyncResult(
@@ -174,6 +209,7 @@ def sync_relationship(
             params = {"from_id": from_id_str, "to_id": to_id_str}
 
         result = graph.run_write(query, params)
+        notify_written([from_id_str, to_id_str])
 
         duration = (datetime.now() - start).total_seconds() * 1000
         return SyncResult(
@@ -229,6 +265,7 @@ def sync_relationship_by_keys(
             params = {"from_value": from_value, "to_value": to_value}
 
         result = graph.run_write(query, params)
+        notify_written([from_value, to_value])
 
         duration = (datetime.now() - start).total_seconds() * 1000
         return SyncResult(
@@ -242,7 +279,11 @@ def sync_relationship_by_keys(
         return SyncResult(success=False, errors=[str(e)], duration_ms=duration)
 
 
-def full_sync(league: Any, graph: Optional[GraphConnection] = None) -> SyncResult:
+def full_sync(
+    league: Any,
+    graph: Optional[GraphConnection] = None,
+    chunk_size: Optional[int] = None,
+) -> SyncResult:
     """
     Perform a full sync of all entities from a League object.
 
@@ -252,13 +293,20 @@ def full_sync(league: Any, graph: Optional[GraphConnection] = None) -> SyncResul
     - All game logs
     - Relationships between entities
 
+    Upserts are queued on a BatchWriter and written as UNWIND statements,
+    so the number of round-trips grows with the number of chunks rather
+    than the number of entities.
+
     Args:
         league: The League object containing all game state
         graph: Optional graph connection (uses global if not provided)
+        chunk_size: Rows per UNWIND statement (defaults to config.sync_batch_size)
 
     Returns:
         Combined SyncResult for the entire operation
     """
+    from huddle.graph.sync.batch import BatchWriter
+
     graph = graph or get_graph()
     start = datetime.now()
 
@@ -271,35 +319,32 @@ def full_sync(league: Any, graph: Optional[GraphConnection] = None) -> SyncResul
     # Initialize schema first
     init_schema(graph)
 
-    total_result = SyncResult(success=True)
+    batch = BatchWriter(graph, chunk_size)
 
     # Sync organizational structure (divisions, conferences)
     logger.info("Syncing organizational structure...")
-    org_result = _sync_organization(graph)
-    total_result = total_result + org_result
+    _sync_organization(batch)
 
     # Sync teams
     logger.info(f"Syncing {len(league.teams)} teams...")
     for team in league.teams.values():
-        team_result = _sync_team(team, graph)
-        total_result = total_result + team_result
+        _sync_team(team, batch)
 
         # Sync players on this team's roster
         for player in team.roster.players.values():
-            player_result = _sync_player(player, team, graph)
-            total_result = total_result + player_result
+            _sync_player(player, team, batch)
 
     # Sync game logs
     logger.info(f"Syncing {len(league.game_logs)} game logs...")
     for game_id, game_log in league.game_logs.items():
-        game_result = _sync_game(game_log, graph)
-        total_result = total_result + game_result
+        _sync_game(game_log, batch)
 
     # Sync season stats relationships
     logger.info(f"Syncing {len(league.season_stats)} season stats...")
     for player_id, stats in league.season_stats.items():
-        stats_result = _sync_season_stats(player_id, stats, league.season, graph)
-        total_result = total_result + stats_result
+        _sync_season_stats(player_id, stats, league.season, batch)
+
+    total_result = batch.flush()
 
     duration = (datetime.now() - start).total_seconds() * 1000
     total_result.duration_ms = duration
@@ -307,21 +352,18 @@ def full_sync(league: Any, graph: Optional[GraphConnection] = None) -> SyncResul
     logger.info(
         f"Full sync complete: {total_result.nodes_created} nodes created, "
         f"{total_result.relationships_created} relationships created, "
-        f"{len(total_result.errors)} errors, {duration:.0f}ms"
+        f"{len(total_result.errors)} errors, {batch.statements} statements, {duration:.0f}ms"
     )
 
     return total_result
 
 
-def _sync_organization(graph: GraphConnection) -> SyncResult:
-    """Sync NFL organizational structure (conferences, divisions)."""
-    result = SyncResult(success=True)
-
+def _sync_organization(batch: "BatchWriter") -> None:
+    """Queue NFL organizational structure (conferences, divisions)."""
     # Create conferences
     conferences = ["AFC", "NFC"]
     for conf in conferences:
-        r = sync_entity(NodeLabels.CONFERENCE, conf, {"name": conf}, graph)
-        result = result + r
+        batch.merge_node(NodeLabels.CONFERENCE, conf, {"name": conf})
 
     # Create divisions with conference relationships
     divisions = {
@@ -330,21 +372,16 @@ def _sync_organization(graph: GraphConnection) -> SyncResult:
     }
 
     for div_name, conf_name in divisions.items():
-        r = sync_entity(NodeLabels.DIVISION, div_name, {"name": div_name}, graph)
-        result = result + r
-        r = sync_relationship(
+        batch.merge_node(NodeLabels.DIVISION, div_name, {"name": div_name})
+        batch.merge_relationship(
             NodeLabels.DIVISION, div_name,
             RelTypes.IN_CONFERENCE,
             NodeLabels.CONFERENCE, conf_name,
-            graph=graph
         )
-        result = result + r
 
-    return result
 
-
-def _sync_team(team: Any, graph: GraphConnection) -> SyncResult:
-    """Sync a single team to the graph.
+def _sync_team(team: Any, batch: "BatchWriter") -> None:
+    """Queue a single team.
 
     Teams are merged on abbreviation (not UUID) since they're stable entities.
     """
@@ -370,26 +407,23 @@ def _sync_team(team: Any, graph: GraphConnection) -> SyncResult:
         properties["cap_room"] = team.financials.cap_room
 
     # Merge on abbr for teams (stable identifier)
-    result = sync_entity_by_key(NodeLabels.TEAM, "abbr", abbr, properties, graph)
+    batch.merge_node(NodeLabels.TEAM, abbr, properties, key="abbr")
 
     # Sync division relationship - lookup from NFL_TEAMS data
     nfl_data = NFL_TEAMS.get(abbr)
     if nfl_data and nfl_data.division:
         # Division enum value is already "AFC East", "NFC West" etc.
         div_name = nfl_data.division.value
-        r = sync_relationship_by_keys(
-            NodeLabels.TEAM, "abbr", abbr,
+        batch.merge_relationship(
+            NodeLabels.TEAM, abbr,
             RelTypes.IN_DIVISION,
-            NodeLabels.DIVISION, "name", div_name,
-            graph=graph
+            NodeLabels.DIVISION, div_name,
+            from_key="abbr", to_key="name",
         )
-        result = result + r
 
-    return result
 
-
-def _sync_player(player: Any, team: Any, graph: GraphConnection) -> SyncResult:
-    """Sync a single player to the graph."""
+def _sync_player(player: Any, team: Any, batch: "BatchWriter") -> None:
+    """Queue a single player and their PLAYS_FOR relationship."""
     properties = {
         "name": player.full_name,
         "position": player.position.value if hasattr(player.position, "value") else str(player.position),
@@ -412,23 +446,19 @@ def _sync_player(player: Any, team: Any, graph: GraphConnection) -> SyncResult:
     if hasattr(player, "weight_lbs"):
         properties["weight_lbs"] = player.weight_lbs
 
-    result = sync_entity(NodeLabels.PLAYER, player.id, properties, graph)
+    batch.merge_node(NodeLabels.PLAYER, player.id, properties)
 
     # Sync PLAYS_FOR relationship
-    r = sync_relationship(
+    batch.merge_relationship(
         NodeLabels.PLAYER, player.id,
         RelTypes.PLAYS_FOR,
         NodeLabels.TEAM, team.id,
         {"since": player.years_on_team},
-        graph
     )
-    result = result + r
-
-    return result
 
 
-def _sync_game(game_log: Any, graph: GraphConnection) -> SyncResult:
-    """Sync a game log to the graph."""
+def _sync_game(game_log: Any, batch: "BatchWriter") -> None:
+    """Queue a game log and its player participation."""
     properties = {
         "week": game_log.week,
         "home_team_abbr": game_log.home_team_abbr,
@@ -439,7 +469,7 @@ def _sync_game(game_log: Any, graph: GraphConnection) -> SyncResult:
         "is_playoff": getattr(game_log, "is_playoff", False),
     }
 
-    result = sync_entity(NodeLabels.GAME, game_log.game_id, properties, graph)
+    batch.merge_node(NodeLabels.GAME, game_log.game_id, properties)
 
     # Sync team relationships
     # Note: Would need team IDs here, currently have abbreviations
@@ -456,27 +486,23 @@ def _sync_game(game_log: Any, graph: GraphConnection) -> SyncResult:
             "receiving_tds": getattr(stats.receiving, "touchdowns", 0),
         }
 
-        r = sync_relationship(
-            NodeLabels.PLAYER, player_id,
+        batch.merge_relationship(
+            NodeLabels.PLAYER, str(player_id),
             RelTypes.PLAYED_IN,
-            NodeLabels.GAME, game_log.game_id,
+            NodeLabels.GAME, str(game_log.game_id),
             stats_dict,
-            graph
         )
-        result = result + r
-
-    return result
 
 
 def _sync_season_stats(
     player_id: str,
     stats: Any,
     season_year: int,
-    graph: GraphConnection
-) -> SyncResult:
-    """Sync a player's season stats as a SEASON_STATS relationship."""
-    # Ensure season node exists
-    result = sync_entity(NodeLabels.SEASON, str(season_year), {"year": season_year}, graph)
+    batch: "BatchWriter",
+) -> None:
+    """Queue a player's season stats as a SEASON_STATS relationship."""
+    # Ensure season node exists (coalesced across players)
+    batch.merge_node(NodeLabels.SEASON, str(season_year), {"year": season_year})
 
     # Create SEASON_STATS relationship with aggregated stats
     stats_dict = {
@@ -489,12 +515,9 @@ def _sync_season_stats(
         "receiving_tds": getattr(stats.receiving, "touchdowns", 0) if hasattr(stats, "receiving") else 0,
     }
 
-    r = sync_relationship(
-        NodeLabels.PLAYER, player_id,
+    batch.merge_relationship(
+        NodeLabels.PLAYER, str(player_id),
         RelTypes.SEASON_STATS,
         NodeLabels.SEASON, str(season_year),
         stats_dict,
-        graph
     )
-
-    return result + r
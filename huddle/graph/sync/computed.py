@@ -9,17 +9,23 @@ Calculates derived properties for graph nodes:
 
 These properties add "intelligence" to the graph - the AI exploration
 layer can query these computed values rather than raw data.
+
+ComputedPropertyTracker keeps them up to date incrementally: it is fed
+each GameLog once, keeps a rolling window of recent games per player and
+running head-to-head tallies per team pair, and only recomputes players
+and matchups touched since the last sync.
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from uuid import UUID
 
 from huddle.graph.connection import GraphConnection, get_graph, is_graph_enabled
 from huddle.graph.schema import NodeLabels, RelTypes
-from huddle.graph.sync.base import SyncResult, sync_entity
+from huddle.graph.sync.base import SyncResult, notify_written, sync_entity
 
 logger = logging.getLogger(__name__)
 
@@ -503,6 +509,7 @@ def sync_narratives(
                     "narrative_id": narrative.id,
                     "participant_id": participant_id,
                 })
+                notify_written([narrative.id, participant_id])
                 result.relationships_created += 1
             except Exception as e:
                 result.errors.append(str(e))
@@ -510,6 +517,322 @@ def sync_narratives(
     return result
 
 
+# ============================================================================
+# INCREMENTAL TRACKING
+# ============================================================================
+
+@dataclass
+class HeadToHeadTally:
+    """Running head-to-head record, updated one game at a time.
+
+    Teams are stored in sorted abbreviation order so (A, B) and (B, A)
+    share a tally.
+    """
+    team_a_abbr: str
+    team_b_abbr: str
+    games_played: int = 0
+    team_a_wins: int = 0
+    team_b_wins: int = 0
+    ties: int = 0
+    point_differential: int = 0  # Team A's perspective
+    streak_team: Optional[str] = None  # "A", "B" or None after a tie
+    streak_length: int = 0
+
+    def record(self, team_a_score: int, team_b_score: int) -> None:
+        self.games_played += 1
+        self.point_differential += team_a_score - team_b_score
+
+        if team_a_score > team_b_score:
+            self.team_a_wins += 1
+            winner = "A"
+        elif team_b_score > team_a_score:
+            self.team_b_wins += 1
+            winner = "B"
+        else:
+            self.ties += 1
+            winner = None
+
+        if winner is not None and winner == self.streak_team:
+            self.streak_length += 1
+        else:
+            self.streak_team = winner
+            self.streak_length = 1 if winner else 0
+
+    @property
+    def streak(self) -> str:
+        if not self.streak_team:
+            return "none"
+        return f"{self.streak_team}{self.streak_length}"
+
+    def to_head_to_head(self) -> HeadToHead:
+        from huddle.graph.sync.teams import get_division_for_team
+
+        div_a = get_division_for_team(self.team_a_abbr)
+        is_division_rival = div_a is not None and div_a == get_division_for_team(self.team_b_abbr)
+
+        return HeadToHead(
+            team_a_id=self.team_a_abbr,
+            team_b_id=self.team_b_abbr,
+            team_a_abbr=self.team_a_abbr,
+            team_b_abbr=self.team_b_abbr,
+            games_played=self.games_played,
+            team_a_wins=self.team_a_wins,
+            team_b_wins=self.team_b_wins,
+            ties=self.ties,
+            point_differential=self.point_differential,
+            streak=self.streak,
+            is_rivalry=is_division_rival,
+            rivalry_intensity="division" if is_division_rival else "none",
+        )
+
+
+def _game_stat_line(stats: Any) -> dict:
+    """
+    Flatten PlayerGameStats into the dict calculate_performance_trend reads.
+
+    Only categories the player took part in are included, so a receiver's
+    trend isn't dragged toward zero by passing yards they never had a
+    chance to gain.
+    """
+    line = {}
+    if stats.passing.attempts:
+        line["passing_yards"] = stats.passing.yards
+    if stats.rushing.attempts:
+        line["rushing_yards"] = stats.rushing.yards
+    if stats.receiving.targets or stats.receiving.receptions:
+        line["receiving_yards"] = stats.receiving.yards
+    if stats.defense.tackles or stats.defense.sacks:
+        line["tackles"] = stats.defense.tackles
+        line["sacks"] = stats.defense.sacks
+    return line
+
+
+class ComputedPropertyTracker:
+    """
+    Incrementally maintained computed properties.
+
+    Usage:
+        tracker = ComputedPropertyTracker()
+        tracker.record_game(game_log)        # after each game
+        ...
+        tracker.sync(league)                 # after each week
+
+    Each sync only recomputes players who played (and team pairs that
+    met) since the previous sync, so its cost follows the week's games
+    rather than league history.
+    """
+
+    def __init__(self, window: int = 5):
+        self.window = window
+        self._recent: dict[str, deque] = {}  # player_id -> stat lines, most recent first
+        self._player_team: dict[str, str] = {}  # player_id -> team abbr in last game
+        self._head_to_head: dict[tuple[str, str], HeadToHeadTally] = {}
+        self._recorded_games: set[str] = set()
+        self.dirty_players: set[str] = set()
+        self.dirty_matchups: set[tuple[str, str]] = set()
+
+    def record_game(self, game_log: Any) -> bool:
+        """
+        Fold one completed game into the rolling windows and tallies.
+
+        Returns False if the game was already recorded.
+        """
+        game_id = str(game_log.game_id)
+        if game_id in self._recorded_games:
+            return False
+        self._recorded_games.add(game_id)
+
+        for player_id, stats in game_log.player_stats.items():
+            player_id = str(player_id)
+            recent = self._recent.get(player_id)
+            if recent is None:
+                recent = self._recent[player_id] = deque(maxlen=self.window)
+            recent.appendleft(_game_stat_line(stats))
+            self._player_team[player_id] = stats.team_abbr
+            self.dirty_players.add(player_id)
+
+        home, away = game_log.home_team_abbr, game_log.away_team_abbr
+        key = _matchup_key(home, away)
+        tally = self._head_to_head.get(key)
+        if tally is None:
+            tally = self._head_to_head[key] = HeadToHeadTally(*key)
+        if key[0] == home:
+            tally.record(game_log.home_score, game_log.away_score)
+        else:
+            tally.record(game_log.away_score, game_log.home_score)
+        self.dirty_matchups.add(key)
+
+        return True
+
+    def record_games(self, game_logs: Iterable[Any]) -> int:
+        """Record several games in order. Returns how many were new."""
+        return sum(1 for game_log in game_logs if self.record_game(game_log))
+
+    def mark_dirty(self, player_id: str | UUID, team_abbr: Optional[str] = None) -> None:
+        """Force a player to be recomputed at the next sync."""
+        player_id = str(player_id)
+        self.dirty_players.add(player_id)
+        if team_abbr:
+            self._player_team[player_id] = team_abbr
+
+    def performance_trend(self, player_id: str | UUID) -> PerformanceTrend:
+        """Performance trend over the player's rolling window."""
+        player_id = str(player_id)
+        return calculate_performance_trend(
+            player_id, list(self._recent.get(player_id, ())), self.window
+        )
+
+    def head_to_head(self, abbr_a: str, abbr_b: str) -> Optional[HeadToHead]:
+        """Head-to-head record from ``abbr_a``'s perspective."""
+        tally = self._head_to_head.get(_matchup_key(abbr_a, abbr_b))
+        if tally is None:
+            return None
+        h2h = tally.to_head_to_head()
+        if tally.team_a_abbr != abbr_a:
+            h2h = _flip_head_to_head(h2h)
+        return h2h
+
+    def sync(
+        self,
+        league: Any,
+        graph: Optional[GraphConnection] = None,
+        chunk_size: Optional[int] = None,
+    ) -> SyncResult:
+        """
+        Recompute and write properties for dirty players and matchups.
+
+        Writes go through a BatchWriter. The dirty sets are cleared once
+        the writes have been attempted.
+        """
+        from huddle.graph.sync.batch import BatchWriter
+
+        graph = graph or get_graph()
+
+        if not graph.is_enabled:
+            self.dirty_players.clear()
+            self.dirty_matchups.clear()
+            return SyncResult(success=True)
+
+        batch = BatchWriter(graph, chunk_size)
+
+        for player_id in self.dirty_players:
+            player = self._find_player(league, player_id)
+            if player is None:
+                continue
+            _queue_player_properties(batch, player, self.performance_trend(player_id))
+
+        for key in self.dirty_matchups:
+            _queue_head_to_head(batch, self._head_to_head[key].to_head_to_head())
+
+        logger.debug(
+            f"Computed properties: {len(self.dirty_players)} players, "
+            f"{len(self.dirty_matchups)} matchups dirty"
+        )
+        self.dirty_players.clear()
+        self.dirty_matchups.clear()
+
+        return batch.flush()
+
+    def _find_player(self, league: Any, player_id: str) -> Optional[Any]:
+        """Look the player up on their last known roster, then league-wide."""
+        try:
+            uuid = UUID(player_id)
+        except ValueError:
+            uuid = None
+        key = uuid or player_id
+
+        team = league.teams.get(self._player_team.get(player_id))
+        if team is not None:
+            player = team.roster.players.get(key)
+            if player is not None:
+                return player
+
+        for team in league.teams.values():
+            player = team.roster.players.get(key)
+            if player is not None:
+                return player
+        return None
+
+
+def _matchup_key(abbr_a: str, abbr_b: str) -> tuple[str, str]:
+    return (abbr_a, abbr_b) if abbr_a <= abbr_b else (abbr_b, abbr_a)
+
+
+def _flip_head_to_head(h2h: HeadToHead) -> HeadToHead:
+    streak = h2h.streak
+    if streak[:1] in ("A", "B"):
+        streak = ("B" if streak[0] == "A" else "A") + streak[1:]
+    return HeadToHead(
+        team_a_id=h2h.team_b_id,
+        team_b_id=h2h.team_a_id,
+        team_a_abbr=h2h.team_b_abbr,
+        team_b_abbr=h2h.team_a_abbr,
+        games_played=h2h.games_played,
+        team_a_wins=h2h.team_b_wins,
+        team_b_wins=h2h.team_a_wins,
+        ties=h2h.ties,
+        point_differential=-h2h.point_differential,
+        streak=streak,
+        is_rivalry=h2h.is_rivalry,
+        rivalry_intensity=h2h.rivalry_intensity,
+    )
+
+
+def _queue_player_properties(
+    batch: Any,
+    player: Any,
+    trend: Optional[PerformanceTrend],
+) -> None:
+    """Queue career phase, trend and narratives for one player."""
+    phase = calculate_career_phase(player)
+    properties = {
+        "career_phase": phase.phase,
+        "career_phase_confidence": phase.confidence,
+        "peak_age_estimate": phase.peak_age_estimate,
+        "years_from_peak": phase.years_from_peak,
+        "trajectory": phase.trajectory,
+    }
+    if trend is not None and trend.window:
+        properties.update({
+            "trend_direction": trend.direction,
+            "trend_magnitude": trend.magnitude,
+            "trend_window": trend.window,
+            "hot_streak": trend.hot_streak,
+            "cold_streak": trend.cold_streak,
+        })
+    batch.merge_node(NodeLabels.PLAYER, player.id, properties)
+
+    for narrative in detect_narratives(player=player):
+        batch.merge_node(NodeLabels.NARRATIVE, narrative.id, {
+            "type": narrative.type,
+            "title": narrative.title,
+            "description": narrative.description,
+            "is_active": narrative.is_active,
+            "intensity": narrative.intensity,
+        })
+        for participant_id in narrative.participants:
+            batch.merge_relationship(
+                NodeLabels.PLAYER, participant_id,
+                RelTypes.INVOLVED_IN,
+                NodeLabels.NARRATIVE, narrative.id,
+            )
+
+
+def _queue_head_to_head(batch: Any, h2h: HeadToHead) -> None:
+    batch.merge_node(NodeLabels.HEAD_TO_HEAD, f"{h2h.team_a_abbr}_{h2h.team_b_abbr}", {
+        "team_a_abbr": h2h.team_a_abbr,
+        "team_b_abbr": h2h.team_b_abbr,
+        "games_played": h2h.games_played,
+        "team_a_wins": h2h.team_a_wins,
+        "team_b_wins": h2h.team_b_wins,
+        "ties": h2h.ties,
+        "point_differential": h2h.point_differential,
+        "streak": h2h.streak,
+        "is_rivalry": h2h.is_rivalry,
+        "rivalry_intensity": h2h.rivalry_intensity,
+    })
+
+
 # ============================================================================
 # BATCH COMPUTED PROPERTY SYNC
 # ============================================================================
@@ -517,31 +840,29 @@ def sync_narratives(
 def sync_all_computed_properties(
     league: Any,
     graph: Optional[GraphConnection] = None,
+    tracker: Optional[ComputedPropertyTracker] = None,
 ) -> SyncResult:
     """
-    Calculate and sync all computed properties for a league.
+    Calculate and sync computed properties for a league.
 
-    This is expensive - run periodically or after significant changes.
+    With a tracker, only players and matchups touched since its last sync
+    are recomputed. Without one, everything is rebuilt from the league's
+    game logs - expensive, run at startup or after significant changes.
     """
     graph = graph or get_graph()
 
     if not is_graph_enabled():
         return SyncResult(success=True)
 
-    logger.info("Syncing all computed properties...")
-    result = SyncResult(success=True)
+    if tracker is None:
+        logger.info("Syncing all computed properties...")
+        tracker = ComputedPropertyTracker()
+        tracker.record_games(league.game_logs.values())
+        for abbr, team in league.teams.items():
+            for player in team.roster.players.values():
+                tracker.mark_dirty(player.id, abbr)
 
-    # Sync career phases for all players
-    for team in league.teams.values():
-        for player in team.roster.players.values():
-            r = sync_player_career_phase(player, graph)
-            result = result + r
-
-            # Detect and sync narratives
-            narratives = detect_narratives(player=player)
-            if narratives:
-                r = sync_narratives(narratives, graph)
-                result = result + r
+    result = tracker.sync(league, graph)
 
     logger.info(
         f"Computed properties synced: {result.nodes_created} nodes, "
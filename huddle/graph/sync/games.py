@@ -10,7 +10,7 @@ from uuid import UUID
 
 from huddle.graph.connection import GraphConnection, get_graph, is_graph_enabled
 from huddle.graph.schema import NodeLabels, RelTypes
-from huddle.graph.sync.base import SyncResult, sync_entity, sync_relationship
+from huddle.graph.sync.base import SyncResult, notify_written, sync_entity, sync_relationship
 
 logger = logging.getLogger(__name__)
 
@@ -282,6 +282,8 @@ def _sync_game_team_relationships(
     except Exception as e:
         result.errors.append(f"AWAY_TEAM: {e}")
 
+    notify_written([game_id, game_log.home_team_abbr, game_log.away_team_abbr])
+
     # WON/LOST relationships
     if game_log.home_score > game_log.away_score:
         winner_abbr = game_log.home_team_abbr
@@ -319,6 +321,8 @@ def _sync_game_team_relationships(
     except Exception as e:
         result.errors.append(f"LOST: {e}")
 
+    notify_written([game_id, winner_abbr, loser_abbr])
+
     return result
 
 
@@ -4,6 +4,10 @@ Event handlers for graph sync.
 Provides handlers that can be registered with the EventBus to automatically
 sync game events to the graph.
 
+Handlers never write to Neo4j themselves: they enqueue upserts on a
+GraphWriteQueue (see writer.py) whose background thread does the writes,
+so a slow or unavailable graph doesn't slow down the simulation.
+
 Usage:
     from huddle.graph.sync.handlers import register_game_handlers
 
@@ -16,38 +20,51 @@ Usage:
         # Events automatically sync to graph
 """
 
+import atexit
 import logging
 from typing import Any, Callable, Optional
 
-from huddle.graph.config import is_graph_enabled
+from huddle.graph.config import get_config, is_graph_enabled
 from huddle.graph.connection import get_graph, GraphConnection
+from huddle.graph.schema import NodeLabels
 from huddle.graph.sync.base import SyncResult
+from huddle.graph.sync.writer import GraphWriteQueue
 
 logger = logging.getLogger(__name__)
 
 # Track registered handlers for cleanup
 _registered_handlers: list[tuple[Any, Any, Callable]] = []
 
+# Write-behind queue per event bus (keyed by id(event_bus))
+_write_queues: dict[int, tuple[Any, GraphWriteQueue]] = {}
+
 
 def register_game_handlers(
     event_bus: Any,
     graph: Optional[GraphConnection] = None,
-) -> None:
+    queue: Optional[GraphWriteQueue] = None,
+) -> Optional[GraphWriteQueue]:
     """
     Register graph sync handlers with an EventBus.
 
-    Subscribes to relevant game events and syncs changes to the graph.
+    Subscribes to relevant game events and queues changes for the graph.
     Does nothing if graph is disabled.
 
     Args:
         event_bus: EventBus instance to register with
         graph: Optional graph connection
+        queue: Optional write queue (one is created and started if omitted)
+
+    Returns:
+        The write queue the handlers feed, or None if graph is disabled
     """
     if not is_graph_enabled():
         logger.debug("Graph disabled, not registering handlers")
-        return
+        return None
 
     graph = graph or get_graph()
+    queue = queue or GraphWriteQueue(graph)
+    queue.start()
 
     # Import event types here to avoid circular imports
     from huddle.events.types import (
@@ -59,16 +76,16 @@ def register_game_handlers(
 
     # Create handlers
     def on_game_end(event: GameEndEvent) -> None:
-        _handle_game_end(event, graph)
+        _handle_game_end(event, queue)
 
     def on_scoring(event: ScoringEvent) -> None:
-        _handle_scoring(event, graph)
+        _handle_scoring(event, queue)
 
     def on_turnover(event: TurnoverEvent) -> None:
-        _handle_turnover(event, graph)
+        _handle_turnover(event, queue)
 
     def on_quarter_end(event: QuarterEndEvent) -> None:
-        _handle_quarter_end(event, graph)
+        _handle_quarter_end(event, queue)
 
     # Register handlers
     event_bus.subscribe(GameEndEvent, on_game_end)
@@ -83,13 +100,23 @@ def register_game_handlers(
         (event_bus, TurnoverEvent, on_turnover),
         (event_bus, QuarterEndEvent, on_quarter_end),
     ])
+    _write_queues[id(event_bus)] = (event_bus, queue)
 
     logger.info("Registered graph sync handlers with event bus")
+    return queue
+
+
+def get_write_queue(event_bus: Any) -> Optional[GraphWriteQueue]:
+    """Get the write queue feeding the graph for an EventBus, if registered."""
+    entry = _write_queues.get(id(event_bus))
+    return entry[1] if entry is not None else None
 
 
 def unregister_game_handlers(event_bus: Any) -> None:
     """
     Unregister all graph sync handlers from an EventBus.
+
+    Stops the bus's write queue after flushing anything still pending.
     """
     global _registered_handlers
 
@@ -105,9 +132,26 @@ def unregister_game_handlers(event_bus: Any) -> None:
         if bus is not event_bus
     ]
 
+    entry = _write_queues.pop(id(event_bus), None)
+    if entry is not None:
+        queue = entry[1]
+        queue.stop()
+        stats = queue.stats()
+        logger.info(
+            f"Graph write queue stopped: {stats.written} written, "
+            f"{stats.coalesced} coalesced, {stats.dropped} dropped, {stats.failed} failed"
+        )
+
     logger.info("Unregistered graph sync handlers")
 
 
+@atexit.register
+def _flush_write_queues() -> None:
+    """Flush queues whose handlers were never unregistered."""
+    for _, queue in list(_write_queues.values()):
+        queue.stop(timeout=get_config().sync_timeout_seconds)
+
+
 class GraphSyncContext:
     """
     Context manager for enabling graph sync during game simulation.
@@ -126,9 +170,10 @@ class GraphSyncContext:
     ):
         self.event_bus = event_bus
         self.graph = graph
+        self.queue: Optional[GraphWriteQueue] = None
 
     def __enter__(self) -> "GraphSyncContext":
-        register_game_handlers(self.event_bus, self.graph)
+        self.queue = register_game_handlers(self.event_bus, self.graph)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -140,29 +185,25 @@ class GraphSyncContext:
 graph_sync_enabled = GraphSyncContext
 
 
-def _handle_game_end(event: Any, graph: GraphConnection) -> None:
+def _handle_game_end(event: Any, queue: GraphWriteQueue) -> None:
     """
-    Handle GameEndEvent - sync completed game to graph.
+    Handle GameEndEvent - queue the completed game for the graph.
 
     This is the main sync point for games. When a game ends,
-    we sync the full game with all stats.
+    we record the final state on the game node.
     """
     try:
-        logger.info(f"Syncing game end: {event.game_id}")
-
-        # Update game node with final state
-        from huddle.graph.sync.games import sync_game_from_event
+        logger.info(f"Queueing game end: {event.game_id}")
 
         # Note: We'd need access to the teams and game_log here
         # In practice, this would be passed through context or fetched
-        # For now, just update the game node properties
-
-        from huddle.graph.sync.base import sync_entity
-        from huddle.graph.schema import NodeLabels
+        # (see sync_after_game). For now, just update the game node properties
 
         game_id = str(event.game_id) if event.game_id else "unknown"
 
         properties = {
+            "home_score": event.final_home_score,
+            "away_score": event.final_away_score,
             "final_home_score": event.final_home_score,
             "final_away_score": event.final_away_score,
             "is_overtime": event.is_overtime,
@@ -172,30 +213,29 @@ def _handle_game_end(event: Any, graph: GraphConnection) -> None:
         if event.winner_id:
             properties["winner_id"] = str(event.winner_id)
 
-        result = sync_entity(NodeLabels.GAME, game_id, properties, graph)
-
-        if result.success:
-            logger.debug(f"Game end synced: {game_id}")
-        else:
-            logger.warning(f"Game end sync had errors: {result.errors}")
+        if not queue.upsert_node(NodeLabels.GAME, game_id, properties):
+            logger.warning(f"Game end for {game_id} dropped, graph write queue is full")
 
     except Exception as e:
         logger.error(f"Failed to handle game end event: {e}")
 
 
-def _handle_scoring(event: Any, graph: GraphConnection) -> None:
+def _handle_scoring(event: Any, queue: GraphWriteQueue) -> None:
     """
-    Handle ScoringEvent - update game and player stats.
+    Handle ScoringEvent - keep the live score on the game node.
 
-    Scoring events are important for narratives (touchdowns, field goals).
+    Scores coalesce in the write queue, so a game writes its running
+    score once per flush no matter how many times points are scored.
     """
     try:
-        # For now, just log - scoring is captured in final game stats
         logger.debug(
             f"Scoring event: {event.scoring_type} by team {event.team_id}, "
             f"scorer: {event.scorer_id}"
         )
 
+        if event.game_id:
+            queue.upsert_node(NodeLabels.GAME, str(event.game_id), _live_score(event))
+
         # Could update running narrative here
         # e.g., track hat tricks, scoring streaks, etc.
 
@@ -203,7 +243,7 @@ def _handle_scoring(event: Any, graph: GraphConnection) -> None:
         logger.error(f"Failed to handle scoring event: {e}")
 
 
-def _handle_turnover(event: Any, graph: GraphConnection) -> None:
+def _handle_turnover(event: Any, queue: GraphWriteQueue) -> None:
     """
     Handle TurnoverEvent - track for narratives.
 
@@ -221,7 +261,7 @@ def _handle_turnover(event: Any, graph: GraphConnection) -> None:
         logger.error(f"Failed to handle turnover event: {e}")
 
 
-def _handle_quarter_end(event: Any, graph: GraphConnection) -> None:
+def _handle_quarter_end(event: Any, queue: GraphWriteQueue) -> None:
     """
     Handle QuarterEndEvent - potential sync point.
 
@@ -230,6 +270,9 @@ def _handle_quarter_end(event: Any, graph: GraphConnection) -> None:
     try:
         logger.debug(f"Quarter {event.quarter_ended} ended")
 
+        if event.game_id:
+            queue.upsert_node(NodeLabels.GAME, str(event.game_id), _live_score(event))
+
         # Could sync running stats at quarter breaks
         # Useful for live commentary context updates
 
@@ -237,6 +280,15 @@ def _handle_quarter_end(event: Any, graph: GraphConnection) -> None:
         logger.error(f"Failed to handle quarter end event: {e}")
 
 
+def _live_score(event: Any) -> dict[str, Any]:
+    """In-progress game state carried by every game event."""
+    return {
+        "home_score": event.home_score,
+        "away_score": event.away_score,
+        "quarter": event.quarter,
+    }
+
+
 def sync_after_game(
     game_log: Any,
     home_team: Any,
@@ -15,7 +15,7 @@ Usage:
     # After each season in simulator:
     sync.sync_season_end(season, teams, transaction_log)
 
-    # Or process entire simulation result at once:
+    # Or process entire simulation result at once (batched UNWIND writes):
     sync.sync_simulation_result(result)
 """
 
@@ -24,9 +24,10 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 from datetime import datetime
 
-from huddle.graph.connection import get_graph, GraphConnection, is_graph_enabled
+from huddle.graph.connection import get_graph, GraphConnection
 from huddle.graph.schema import init_schema, NodeLabels, RelTypes
-from huddle.graph.sync.base import SyncResult, sync_entity, sync_entity_by_key
+from huddle.graph.sync.base import SyncResult, notify_written
+from huddle.graph.sync.batch import BatchWriter
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +49,13 @@ class HistoricalGraphSync:
     old relationships when players change teams.
     """
 
-    def __init__(self, graph: Optional[GraphConnection] = None):
+    def __init__(
+        self,
+        graph: Optional[GraphConnection] = None,
+        chunk_size: Optional[int] = None,
+    ):
         self.graph = graph or get_graph()
+        self.chunk_size = chunk_size
         # Track current player->team mappings
         # player_id -> (team_id, from_season)
         self._current_teams: dict[str, tuple[str, int]] = {}
@@ -63,6 +69,8 @@ class HistoricalGraphSync:
         Sync an entire SimulationResult to the graph.
 
         Processes the transaction log to build complete player history.
+        Upserts are queued on a BatchWriter and written as chunked UNWIND
+        statements once everything has been collected.
 
         Args:
             result: SimulationResult from HistoricalSimulator
@@ -71,7 +79,7 @@ class HistoricalGraphSync:
         Returns:
             SyncResult with operation stats
         """
-        if not is_graph_enabled():
+        if not self.graph.is_enabled:
             return SyncResult(success=True)
 
         start = datetime.now()
@@ -80,21 +88,20 @@ class HistoricalGraphSync:
         if clear_first:
             logger.info("Clearing existing graph data...")
             self.graph.clear_all(confirm=True)
+            notify_written(None)
             # Initialize schema after clear
             init_schema(self.graph)
 
-        total_result = SyncResult(success=True)
+        batch = BatchWriter(self.graph, self.chunk_size)
 
         # 1. Sync organizational structure
         logger.info("Syncing NFL structure...")
-        r = self._sync_nfl_structure()
-        total_result = total_result + r
+        self._sync_nfl_structure(batch)
 
         # 2. Sync teams
         logger.info(f"Syncing {len(result.teams)} teams...")
         for team_id, team_state in result.teams.items():
-            r = self._sync_team_state(team_state)
-            total_result = total_result + r
+            self._sync_team_state(team_state, batch)
 
         # 3. Process transaction log to build player histories
         logger.info(f"Processing {len(result.transaction_log.transactions)} transactions...")
@@ -109,14 +116,14 @@ class HistoricalGraphSync:
         logger.info(f"Syncing {len(all_players)} players...")
         for player_id, player in all_players.items():
             history = player_histories.get(player_id, [])
-            r = self._sync_player_with_history(player, history)
-            total_result = total_result + r
+            self._sync_player_with_history(player, history, batch)
 
         # 5. Sync season standings
         logger.info(f"Syncing {len(result.season_standings)} season standings...")
         for season, standings in result.season_standings.items():
-            r = self._sync_season_standings(season, standings)
-            total_result = total_result + r
+            self._sync_season_standings(season, standings, batch)
+
+        total_result = batch.flush()
 
         duration = (datetime.now() - start).total_seconds() * 1000
         total_result.duration_ms = duration
@@ -124,7 +131,7 @@ class HistoricalGraphSync:
         logger.info(
             f"Historical sync complete: {total_result.nodes_created} nodes, "
             f"{total_result.relationships_created} relationships, "
-            f"{len(total_result.errors)} errors, {duration:.0f}ms"
+            f"{len(total_result.errors)} errors, {batch.statements} statements, {duration:.0f}ms"
         )
 
         return total_result
@@ -148,7 +155,7 @@ class HistoricalGraphSync:
         Returns:
             SyncResult
         """
-        if not is_graph_enabled():
+        if not self.graph.is_enabled:
             return SyncResult(success=True)
 
         result = SyncResult(success=True)
@@ -198,18 +205,11 @@ class HistoricalGraphSync:
 
         return result
 
-    def _sync_nfl_structure(self) -> SyncResult:
-        """Sync NFL organizational structure."""
-        result = SyncResult(success=True)
-
+    def _sync_nfl_structure(self, batch: BatchWriter) -> None:
+        """Queue NFL organizational structure."""
         # Conferences
         for conf in ["AFC", "NFC"]:
-            r = sync_entity_by_key(
-                NodeLabels.CONFERENCE, "name", conf,
-                {"name": conf},
-                self.graph
-            )
-            result = result + r
+            batch.merge_node(NodeLabels.CONFERENCE, conf, {"name": conf}, key="name")
 
         # Divisions
         divisions = {
@@ -218,25 +218,18 @@ class HistoricalGraphSync:
         }
 
         for div_name, conf_name in divisions.items():
-            r = sync_entity_by_key(
-                NodeLabels.DIVISION, "name", div_name,
-                {"name": div_name},
-                self.graph
-            )
-            result = result + r
+            batch.merge_node(NodeLabels.DIVISION, div_name, {"name": div_name}, key="name")
 
             # Division -> Conference relationship
-            r = self._sync_relationship_by_names(
+            batch.merge_relationship(
                 NodeLabels.DIVISION, div_name,
                 RelTypes.IN_CONFERENCE,
                 NodeLabels.CONFERENCE, conf_name,
+                from_key="name", to_key="name",
             )
-            result = result + r
-
-        return result
 
-    def _sync_team_state(self, team_state: Any) -> SyncResult:
-        """Sync a TeamState to the graph."""
+    def _sync_team_state(self, team_state: Any, batch: BatchWriter) -> None:
+        """Queue a TeamState."""
         from huddle.core.league.nfl_data import NFL_TEAMS
 
         abbr = team_state.team_id
@@ -257,24 +250,17 @@ class HistoricalGraphSync:
         if team_state.status:
             properties["status"] = team_state.status.current_status.name
 
-        result = sync_entity_by_key(
-            NodeLabels.TEAM, "abbr", abbr,
-            properties,
-            self.graph
-        )
+        batch.merge_node(NodeLabels.TEAM, abbr, properties, key="abbr")
 
         # Team -> Division relationship
         if nfl_data and nfl_data.division:
             div_name = nfl_data.division.value
-            r = self._sync_relationship_by_names(
+            batch.merge_relationship(
                 NodeLabels.TEAM, abbr,
                 RelTypes.IN_DIVISION,
                 NodeLabels.DIVISION, div_name,
-                from_key="abbr",
+                from_key="abbr", to_key="name",
             )
-            result = result + r
-
-        return result
 
     def _build_player_histories(
         self,
@@ -364,8 +350,9 @@ class HistoricalGraphSync:
         self,
         player: Any,
         history: list[PlayerTeamHistory],
-    ) -> SyncResult:
-        """Sync a player and all their team history."""
+        batch: BatchWriter,
+    ) -> None:
+        """Queue a player and all their team history."""
         properties = {
             "name": player.full_name,
             "position": player.position.value if hasattr(player.position, "value") else str(player.position),
@@ -379,9 +366,10 @@ class HistoricalGraphSync:
             if hasattr(player.personality, "archetype") and player.personality.archetype:
                 properties["personality_archetype"] = player.personality.archetype.value
 
-        result = sync_entity(NodeLabels.PLAYER, player.id, properties, self.graph)
+        batch.merge_node(NodeLabels.PLAYER, player.id, properties)
 
         # Create PLAYS_FOR relationships for each team stint
+        # (MERGE on from_season to allow multiple stints)
         for stint in history:
             rel_props = {
                 "from_season": stint.from_season,
@@ -391,14 +379,14 @@ class HistoricalGraphSync:
             else:
                 rel_props["is_current"] = True
 
-            r = self._sync_plays_for(
-                str(player.id),
-                stint.team_id,
+            batch.merge_relationship(
+                NodeLabels.PLAYER, str(player.id),
+                RelTypes.PLAYS_FOR,
+                NodeLabels.TEAM, stint.team_id,
                 rel_props,
+                to_key="abbr",
+                merge_on=("from_season",),
             )
-            result = result + r
-
-        return result
 
     def _sync_plays_for(
         self,
@@ -425,6 +413,7 @@ class HistoricalGraphSync:
             }
 
             self.graph.run_write(query, params)
+            notify_written([player_id, team_abbr])
             return SyncResult(success=True, relationships_created=1)
 
         except Exception as e:
@@ -435,50 +424,29 @@ class HistoricalGraphSync:
         self,
         season: int,
         standings: list,
-    ) -> SyncResult:
-        """Sync season standings (SeasonSnapshot objects)."""
-        result = SyncResult(success=True)
-
+        batch: BatchWriter,
+    ) -> None:
+        """Queue season standings (SeasonSnapshot objects)."""
         # Create Season node
-        r = sync_entity_by_key(
-            NodeLabels.SEASON, "year", str(season),
-            {"year": season},
-            self.graph
-        )
-        result = result + r
+        batch.merge_node(NodeLabels.SEASON, season, {"year": season}, key="year")
 
         # Create standings relationships for each team
         for i, snapshot in enumerate(standings):
-            try:
-                query = """
-                MATCH (t:Team {abbr: $team_id})
-                MATCH (s:Season {year: $season})
-                MERGE (t)-[r:SEASON_RECORD {season: $season}]->(s)
-                SET r.wins = $wins,
-                    r.losses = $losses,
-                    r.standing = $standing,
-                    r.made_playoffs = $made_playoffs,
-                    r.won_championship = $won_championship
-                RETURN r
-                """
-
-                params = {
-                    "team_id": snapshot.team_id,
+            batch.merge_relationship(
+                NodeLabels.TEAM, snapshot.team_id,
+                RelTypes.SEASON_RECORD,
+                NodeLabels.SEASON, season,
+                {
                     "season": season,
                     "wins": snapshot.wins,
                     "losses": snapshot.losses,
                     "standing": i + 1,
                     "made_playoffs": snapshot.made_playoffs,
                     "won_championship": snapshot.won_championship,
-                }
-
-                self.graph.run_write(query, params)
-                result.relationships_created += 1
-
-            except Exception as e:
-                result.errors.append(str(e))
-
-        return result
+                },
+                from_key="abbr", to_key="year",
+                merge_on=("season",),
+            )
 
     def _handle_player_joins_team(
         self,
@@ -536,6 +504,7 @@ class HistoricalGraphSync:
                 "team_abbr": team_abbr,
                 "to_season": to_season,
             })
+            notify_written([player_id, team_abbr])
 
             return SyncResult(success=True)
 
@@ -543,40 +512,11 @@ class HistoricalGraphSync:
             logger.error(f"Failed to close PLAYS_FOR: {e}")
             return SyncResult(success=False, errors=[str(e)])
 
-    def _sync_relationship_by_names(
-        self,
-        from_label: str,
-        from_value: str,
-        rel_type: str,
-        to_label: str,
-        to_value: str,
-        from_key: str = "name",
-        to_key: str = "name",
-    ) -> SyncResult:
-        """Sync a relationship using name-based lookups."""
-        try:
-            query = f"""
-            MATCH (a:{from_label} {{{from_key}: $from_value}})
-            MATCH (b:{to_label} {{{to_key}: $to_value}})
-            MERGE (a)-[r:{rel_type}]->(b)
-            RETURN r
-            """
-
-            self.graph.run_write(query, {
-                "from_value": from_value,
-                "to_value": to_value,
-            })
-
-            return SyncResult(success=True, relationships_created=1)
-
-        except Exception as e:
-            logger.error(f"Failed to sync relationship: {e}")
-            return SyncResult(success=False, errors=[str(e)])
-
 
 def sync_historical_simulation(
     result: Any,  # SimulationResult
     clear_first: bool = True,
+    chunk_size: Optional[int] = None,
 ) -> SyncResult:
     """
     Convenience function to sync a SimulationResult to the graph.
@@ -584,9 +524,10 @@ def sync_historical_simulation(
     Args:
         result: SimulationResult from HistoricalSimulator
         clear_first: If True, clears graph before syncing
+        chunk_size: Rows per UNWIND statement (defaults to config.sync_batch_size)
 
     Returns:
         SyncResult
     """
-    sync = HistoricalGraphSync()
+    sync = HistoricalGraphSync(chunk_size=chunk_size)
     return sync.sync_simulation_result(result, clear_first=clear_first)
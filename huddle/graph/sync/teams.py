@@ -10,7 +10,7 @@ from uuid import UUID
 
 from huddle.graph.connection import GraphConnection, get_graph, is_graph_enabled
 from huddle.graph.schema import NodeLabels, RelTypes
-from huddle.graph.sync.base import SyncResult, sync_entity, sync_relationship
+from huddle.graph.sync.base import SyncResult, notify_written, sync_entity, sync_relationship
 
 logger = logging.getLogger(__name__)
 
@@ -216,6 +216,7 @@ def _sync_rivalry_by_abbr(
 
     try:
         graph.run_write(query, {"abbr_a": abbr_a, "abbr_b": abbr_b, "intensity": intensity})
+        notify_written([abbr_a, abbr_b])
         return SyncResult(success=True, relationships_created=1)
     except Exception as e:
         logger.warning(f"Failed to create rivalry {abbr_a} vs {abbr_b}: {e}")
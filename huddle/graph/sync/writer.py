@@ -0,0 +1,277 @@
+"""
+Write-behind queue for live graph sync.
+
+Event handlers run on the simulation thread. Writing to Neo4j from them
+would tie game throughput to graph latency, so they enqueue upserts on a
+GraphWriteQueue instead and a background thread writes them out.
+
+- Bounded: at most ``max_pending`` distinct upserts are held. When the
+  queue is full, producers wait up to ``put_timeout`` seconds for room
+  and then drop the upsert (counted in stats).
+- Coalescing: repeated upserts of the same node or relationship are
+  merged while pending, so a game node updated on every score is
+  written once per flush.
+- Batched: each flush goes through BatchWriter (UNWIND statements).
+- Flush on shutdown: ``stop()`` drains everything still pending.
+
+Usage:
+    queue = GraphWriteQueue(graph)
+    queue.start()
+    queue.upsert_node(NodeLabels.GAME, game_id, {"home_score": 14})
+    ...
+    queue.stop()            # flushes before returning
+    queue.stats().dropped   # back-pressure metrics
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Optional
+from uuid import UUID
+
+from huddle.graph.config import get_config
+from huddle.graph.connection import GraphConnection, get_graph
+from huddle.graph.sync.batch import BatchWriter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteQueueStats:
+    """Back-pressure and throughput counters for a GraphWriteQueue."""
+
+    enqueued: int = 0  # Upserts accepted (including coalesced ones)
+    coalesced: int = 0  # Upserts merged into one already pending
+    dropped: int = 0  # Upserts rejected because the queue stayed full
+    written: int = 0  # Upserts written successfully
+    failed: int = 0  # Upserts in batches that failed to write
+    batches: int = 0  # Flushes performed by the writer
+    pending: int = 0  # Upserts waiting to be written
+    high_water: int = 0  # Largest pending count seen
+    blocked_ms: float = 0.0  # Total time producers waited for room
+    last_flush_ms: float = 0.0
+
+
+class GraphWriteQueue:
+    """
+    Bounded, coalescing queue drained by a background writer thread.
+
+    Pending upserts are keyed by the node (label, key, value) or the
+    relationship (endpoints, type, merge values) they touch; later
+    properties overwrite earlier ones, as MERGE ... SET += would.
+    """
+
+    def __init__(
+        self,
+        graph: Optional[GraphConnection] = None,
+        max_pending: Optional[int] = None,
+        flush_interval: float = 0.5,
+        put_timeout: float = 0.0,
+        chunk_size: Optional[int] = None,
+    ):
+        self.graph = graph or get_graph()
+        self.max_pending = max(1, max_pending or get_config().async_queue_size)
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.chunk_size = chunk_size
+
+        # ident -> (kind, args, properties, options)
+        self._pending: dict[tuple, tuple[str, tuple, dict[str, Any], dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)  # Writer waits for work
+        self._room = threading.Condition(self._lock)  # Producers wait for space
+        self._idle = threading.Condition(self._lock)  # flush() waits for drain
+        self._writing = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = WriteQueueStats()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "GraphWriteQueue":
+        """Start the writer thread (no-op if already running)."""
+        with self._lock:
+            if self.is_running:
+                return self
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="graph-write-queue", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Write everything still pending, then stop the writer thread."""
+        with self._lock:
+            self._stopping = True
+            self._wake.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(f"Graph write queue still draining after {timeout}s")
+        with self._lock:
+            self._thread = None
+            has_pending = bool(self._pending)
+        if has_pending and (thread is None or not thread.is_alive()):
+            # Never started (or died): drain on the caller's thread
+            self._drain()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything enqueued so far has been written.
+
+        Returns False if the timeout expired first.
+        """
+        if not self.is_running:
+            self._drain()
+            return True
+        with self._lock:
+            self._wake.notify_all()
+            return self._idle.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+
+    # =========================================================================
+    # Producers
+    # =========================================================================
+
+    def upsert_node(
+        self,
+        label: str,
+        key_value: str | UUID | int,
+        properties: dict[str, Any],
+        key: str = "id",
+    ) -> bool:
+        """Queue a node upsert. Returns False if it was dropped."""
+        ident = ("node", label, key, str(key_value))
+        return self._put(ident, "node", (label, key_value), properties, {"key": key})
+
+    def upsert_relationship(
+        self,
+        from_label: str,
+        from_value: str | UUID | int,
+        rel_type: str,
+        to_label: str,
+        to_value: str | UUID | int,
+        properties: Optional[dict[str, Any]] = None,
+        from_key: str = "id",
+        to_key: str = "id",
+        merge_on: tuple[str, ...] = (),
+    ) -> bool:
+        """Queue a relationship upsert. Returns False if it was dropped."""
+        properties = properties or {}
+        ident = (
+            "rel", from_label, from_key, str(from_value), rel_type,
+            to_label, to_key, str(to_value),
+            tuple(properties.get(name) for name in merge_on),
+        )
+        options = {"from_key": from_key, "to_key": to_key, "merge_on": tuple(merge_on)}
+        return self._put(
+            ident, "rel", (from_label, from_value, rel_type, to_label, to_value),
+            properties, options,
+        )
+
+    def stats(self) -> WriteQueueStats:
+        """Snapshot of the queue's counters."""
+        with self._lock:
+            return replace(self._stats, pending=len(self._pending))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _put(
+        self,
+        ident: tuple,
+        kind: str,
+        args: tuple,
+        properties: dict[str, Any],
+        options: dict[str, Any],
+    ) -> bool:
+        with self._lock:
+            entry = self._pending.get(ident)
+            if entry is not None:
+                entry[2].update(properties)
+                self._stats.enqueued += 1
+                self._stats.coalesced += 1
+                return True
+
+            if len(self._pending) >= self.max_pending:
+                started = time.perf_counter()
+                self._wake.notify_all()
+                has_room = self.put_timeout > 0 and self._room.wait_for(
+                    lambda: len(self._pending) < self.max_pending, self.put_timeout
+                )
+                self._stats.blocked_ms += (time.perf_counter() - started) * 1000
+                if not has_room:
+                    self._stats.dropped += 1
+                    if self._stats.dropped == 1 or self._stats.dropped % 100 == 0:
+                        logger.warning(
+                            f"Graph write queue full ({self.max_pending}), "
+                            f"{self._stats.dropped} upserts dropped"
+                        )
+                    return False
+
+            self._pending[ident] = (kind, args, dict(properties), options)
+            self._stats.enqueued += 1
+            self._stats.high_water = max(self._stats.high_water, len(self._pending))
+            if len(self._pending) >= self.max_pending // 2:
+                self._wake.notify()
+            return True
+
+    # =========================================================================
+    # Writer
+    # =========================================================================
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending and not self._stopping:
+                    self._wake.wait(self.flush_interval)
+                if self._stopping and not self._pending:
+                    return
+            self._drain()
+
+    def _drain(self) -> None:
+        """Write out everything currently pending."""
+        with self._lock:
+            if not self._pending:
+                return
+            batch_items = self._pending
+            self._pending = {}
+            self._writing = True
+            self._room.notify_all()
+
+        started = time.perf_counter()
+        try:
+            batch = BatchWriter(self.graph, self.chunk_size)
+            for kind, args, properties, options in batch_items.values():
+                if kind == "node":
+                    batch.merge_node(*args, properties, **options)
+                else:
+                    batch.merge_relationship(*args, properties, **options)
+            result = batch.flush()
+            ok = result.success
+            if not ok:
+                logger.warning(f"Graph write-behind flush had errors: {result.errors}")
+        except Exception as e:
+            logger.error(f"Graph write-behind flush failed: {e}")
+            ok = False
+
+        with self._lock:
+            self._stats.batches += 1
+            self._stats.last_flush_ms = (time.perf_counter() - started) * 1000
+            if ok:
+                self._stats.written += len(batch_items)
+            else:
+                self._stats.failed += len(batch_items)
+            self._writing = False
+            self._idle.notify_all()
@@ -118,7 +118,7 @@ class EventTrigger:
     arc_stage: int = 0  # What stage in the arc this spawns
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagementEvent:
     """
     Base class for all management events.
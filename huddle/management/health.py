@@ -4,35 +4,23 @@ Calibrated from NFL injury data and snap count analysis.
 Research source: research/exports/active/injury_model.json, fatigue_model.json
 """
 
-import json
 import random
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
 from typing import Optional
 from uuid import UUID, uuid4
 
+from huddle.core.research import ResearchModel
+
 
 # =============================================================================
 # Load Calibration Data
 # =============================================================================
 
-_RESEARCH_DIR = Path(__file__).parent.parent.parent / "research" / "exports" / "active"
-
-
-def _load_model(filename: str) -> dict:
-    """Load a model JSON file from research exports."""
-    path = _RESEARCH_DIR / filename
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return {}
-
-
-# Load models at module import
-INJURY_MODEL = _load_model("injury_model.json")
-FATIGUE_MODEL = _load_model("fatigue_model.json")
+# Parsed on first access
+INJURY_MODEL = ResearchModel("injury_model.json")
+FATIGUE_MODEL = ResearchModel("fatigue_model.json")
 
 
 # =============================================================================
@@ -70,7 +58,7 @@ class InjuryType(Enum):
 
 
 # Position injury rates (per game probability)
-POSITION_INJURY_RATES = INJURY_MODEL.get("position_injury_rates", {
+POSITION_INJURY_RATES = ResearchModel("injury_model.json", "position_injury_rates", default={
     "QB": {"per_game_rate": 0.033, "modifier": 0.6},
     "RB": {"per_game_rate": 0.047, "modifier": 0.85},
     "WR": {"per_game_rate": 0.078, "modifier": 1.42},
@@ -83,7 +71,7 @@ POSITION_INJURY_RATES = INJURY_MODEL.get("position_injury_rates", {
 })
 
 # Injury type probabilities
-INJURY_TYPE_PROBS = INJURY_MODEL.get("injury_type_probabilities", {
+INJURY_TYPE_PROBS = ResearchModel("injury_model.json", "injury_type_probabilities", default={
     "Leg Muscle": 0.111,
     "Knee (Other)": 0.079,
     "Ankle": 0.070,
@@ -100,7 +88,7 @@ INJURY_TYPE_PROBS = INJURY_MODEL.get("injury_type_probabilities", {
 })
 
 # Injury duration distributions
-INJURY_DURATIONS = INJURY_MODEL.get("duration_distributions", {
+INJURY_DURATIONS = ResearchModel("injury_model.json", "duration_distributions", default={
     "Leg Muscle": {"min_weeks": 1, "typical_weeks": 2, "season_ending_rate": 0.05},
     "Knee (Other)": {"min_weeks": 1, "typical_weeks": 3, "season_ending_rate": 0.12},
     "Knee Ligament": {"min_weeks": 6, "typical_weeks": 12, "season_ending_rate": 0.65},
@@ -323,7 +311,7 @@ def check_practice_injury(position: str, intensity: str = "normal") -> Optional[
 # =============================================================================
 
 # Snap percentage targets by position
-SNAP_TARGETS = FATIGUE_MODEL.get("snap_targets", {
+SNAP_TARGETS = ResearchModel("fatigue_model.json", "snap_targets", default={
     "QB": {"starter_target_pct": 1.0, "rotation_target_pct": 1.0},
     "RB": {"starter_target_pct": 0.69, "rotation_target_pct": 0.27},
     "WR": {"starter_target_pct": 0.92, "rotation_target_pct": 0.53},
@@ -337,7 +325,7 @@ SNAP_TARGETS = FATIGUE_MODEL.get("snap_targets", {
 })
 
 # Fatigue curve - performance penalty by snap percentage
-FATIGUE_CURVE = FATIGUE_MODEL.get("fatigue_curve", {
+FATIGUE_CURVE = ResearchModel("fatigue_model.json", "fatigue_curve", default={
     "0.0": 1.0,
     "0.5": 1.0,
     "0.7": 0.99,
@@ -360,7 +348,7 @@ FATIGUE_CURVE = FATIGUE_MODEL.get("fatigue_curve", {
 })
 
 # Rotation recommendations
-ROTATION_RECS = FATIGUE_MODEL.get("rotation_recommendations", {
+ROTATION_RECS = ResearchModel("fatigue_model.json", "rotation_recommendations", default={
     "RB": {"typical_rotation_size": 2, "optimal_lead_pct": 0.70},
     "DL": {"typical_rotation_size": 6, "optimal_lead_pct": 0.30},
     "WR": {"typical_rotation_size": 4, "optimal_lead_pct": 0.50},
@@ -370,7 +358,7 @@ ROTATION_RECS = FATIGUE_MODEL.get("rotation_recommendations", {
 })
 
 # Cumulative game effects
-CUMULATIVE_EFFECTS = FATIGUE_MODEL.get("cumulative_effects", {
+CUMULATIVE_EFFECTS = ResearchModel("fatigue_model.json", "cumulative_effects", default={
     "games_1": 1.0,
     "games_2": 0.98,
     "games_3": 0.95,
@@ -98,7 +98,7 @@ class TickerCategory(Enum):
         return colors.get(self, "white")
 
 
-@dataclass
+@dataclass(slots=True)
 class TickerItem:
     """
     A single item in the news ticker.
@@ -29,7 +29,10 @@ from huddle.events.types import (
     TurnoverEvent,
 )
 from huddle.simulation.resolvers.base import DriveResolver, PlayResolver
+from huddle.simulation.resolvers.drive import StatisticalDriveResolver
 from huddle.simulation.resolvers.statistical import StatisticalPlayResolver
+from huddle.simulation.resolvers.team_ratings import TeamRatingCache
+from huddle.simulation.stats_accumulator import GameStatsAccumulator
 
 
 class SimulationMode(Enum):
@@ -60,6 +63,8 @@ class SimulationEngine:
         self,
         mode: SimulationMode = SimulationMode.PLAY_BY_PLAY,
         event_bus: Optional[EventBus] = None,
+        keep_play_history: Optional[bool] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
         """
         Initialize simulation engine.
@@ -67,13 +72,32 @@ class SimulationEngine:
         Args:
             mode: Simulation detail level
             event_bus: Event bus for notifications (creates new if None)
+            keep_play_history: Store each PlayResult on the GameState.
+                Defaults to off in FAST mode, where box scores come from
+                the streaming stats accumulator instead.
+            rng: Random generator for play calls and outcomes (defaults
+                to the module-level generator)
         """
         self.mode = mode
         self.event_bus = event_bus or EventBus()
+        if keep_play_history is None:
+            keep_play_history = mode != SimulationMode.FAST
+        self.keep_play_history = keep_play_history
+        self.rng = rng or random
+
+        # Box score for the current game, fed as plays are recorded
+        self.stats: Optional[GameStatsAccumulator] = None
 
         # Initialize resolvers
-        self._play_resolver: PlayResolver = StatisticalPlayResolver()
+        resolver = StatisticalPlayResolver(rng=self.rng)
+        self._rating_cache = TeamRatingCache(resolver.build_team_ratings)
+        resolver.rating_cache = self._rating_cache
+        self._play_resolver: PlayResolver = resolver
         self._drive_resolver: Optional[DriveResolver] = None
+        if mode == SimulationMode.FAST:
+            self._drive_resolver = StatisticalDriveResolver(
+                rating_cache=self._rating_cache, rng=self.rng
+            )
 
         # Special teams state
         self._special_teams_phase = SpecialTeamsPhase.NONE
@@ -83,22 +107,39 @@ class SimulationEngine:
         self._ot_first_possession: bool = False
         self._ot_first_team: Optional[UUID] = None
 
-    def create_game(self, home_team: Team, away_team: Team) -> GameState:
+    def create_game(
+        self,
+        home_team: Team,
+        away_team: Team,
+        rng: Optional[random.Random] = None,
+    ) -> GameState:
         """
         Create a new game between two teams.
 
         Args:
             home_team: Home team
             away_team: Away team
+            rng: Random generator for this game (keeps the current one if None)
 
         Returns:
             Initialized GameState ready for simulation
         """
+        if rng is not None:
+            self.rng = rng
+            self._play_resolver.rng = rng
+            if self._drive_resolver is not None:
+                self._drive_resolver.rng = rng
+
         game = GameState()
         game.set_teams(home_team, away_team)
+        self.stats = GameStatsAccumulator(home_team, away_team)
+
+        # Rosters are fixed for the game until an injury or substitution
+        self.refresh_team_ratings(home_team)
+        self.refresh_team_ratings(away_team)
 
         # Coin toss - random team receives first
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             receiving_team = away_team.id
             kicking_team = home_team.id
             game.possession.receiving_second_half = home_team.id
@@ -123,6 +164,15 @@ class SimulationEngine:
 
         return game
 
+    def refresh_team_ratings(self, team: Team) -> None:
+        """
+        Recompute cached ratings for a team.
+
+        Call after an injury or depth chart substitution so the play
+        resolver sees the new lineup.
+        """
+        self._rating_cache.refresh(team)
+
     def simulate_play(
         self,
         game_state: GameState,
@@ -238,7 +288,7 @@ class SimulationEngine:
 
         if go_for_two:
             # Randomly pick run or pass for 2pt
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 call = PlayCall.two_point(pass_type=PassType.SHORT)
             else:
                 call = PlayCall.two_point(run_type=RunType.INSIDE)
@@ -307,7 +357,7 @@ class SimulationEngine:
                 return True
 
         # Random chance based on aggression
-        if aggression > 0.7 and random.random() < 0.15:
+        if aggression > 0.7 and self.rng.random() < 0.15:
             return True
 
         return False
@@ -366,6 +416,145 @@ class SimulationEngine:
             line_of_scrimmage=new_los,
         )
 
+    def resolve_drive(self, game_state: GameState) -> DriveResult:
+        """
+        Resolve a whole drive at once with the drive resolver (FAST mode).
+
+        Takes any pending kickoff first, then applies the drive's clock,
+        score and change of possession the way simulate_drive would.
+
+        Args:
+            game_state: Current game state
+
+        Returns:
+            DriveResult for the drive
+        """
+        resolver = self._drive_resolver
+        if resolver is None:
+            raise ValueError("No drive resolver in this simulation mode")
+
+        if self._special_teams_phase == SpecialTeamsPhase.KICKOFF:
+            start = resolver.resolve_kickoff(
+                game_state, game_state.get_offensive_team(), game_state.get_defensive_team()
+            )
+            game_state.flip_possession()
+            game_state.down_state = DownState(
+                down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(start)
+            )
+            self._special_teams_phase = SpecialTeamsPhase.NONE
+
+        offense = game_state.get_offensive_team()
+        defense = game_state.get_defensive_team()
+        if not offense or not defense:
+            raise ValueError("Game state must have both teams set")
+
+        offense_is_home = game_state.is_home_on_offense()
+        drive = resolver.resolve_drive(game_state, offense, defense)
+        self._run_clock(game_state, drive.time_elapsed_seconds)
+        self._apply_drive_result(game_state, drive, offense, defense)
+
+        if self.stats is not None:
+            self.stats.record_drive(drive, offense_is_home)
+        self.event_bus.emit(
+            DriveCompletedEvent(
+                game_id=game_state.id,
+                quarter=game_state.current_quarter,
+                time_remaining=game_state.clock.display,
+                home_score=game_state.score.home_score,
+                away_score=game_state.score.away_score,
+                result=drive,
+                offensive_team_id=offense.id,
+            )
+        )
+        return drive
+
+    def _run_clock(self, game_state: GameState, seconds: int) -> None:
+        """Run the clock, carrying over into the 2nd or 4th quarter."""
+        clock = game_state.clock
+        while seconds > clock.time_remaining_seconds and clock.quarter in (1, 3):
+            seconds -= clock.time_remaining_seconds
+            clock.tick(clock.time_remaining_seconds)
+            self._check_quarter_end(game_state)
+        clock.tick(seconds)
+
+    def _apply_drive_result(
+        self, game_state: GameState, drive: DriveResult, offense: Team, defense: Team
+    ) -> None:
+        """Apply a drive's score and change of possession."""
+        in_overtime = game_state.phase == GamePhase.OVERTIME
+
+        if drive.result == "TD":
+            self._scoring_team_id = offense.id
+            game_state.add_score(6)
+            self._emit_scoring_event(game_state, 6, "TD", offense.id)
+            # Any overtime TD ends it: first possession, or answering a FG
+            if in_overtime:
+                game_state.phase = GamePhase.FINAL
+                return
+
+            go_for_two = self._should_go_for_two(game_state)
+            points = self._drive_resolver.resolve_conversion(game_state, offense, go_for_two)
+            if points:
+                drive.points += points
+                game_state.add_score(points)
+                self._emit_scoring_event(
+                    game_state, points, "2PT" if go_for_two else "XP", offense.id
+                )
+            self._setup_free_kick(game_state, 35)
+            return
+
+        if drive.result == "FG":
+            self._scoring_team_id = offense.id
+            game_state.add_score(3)
+            self._emit_scoring_event(game_state, 3, "FG", offense.id)
+            if in_overtime and not self._ot_first_possession:
+                game_state.phase = GamePhase.FINAL
+                return
+            self._ot_first_possession = False
+            self._setup_free_kick(game_state, 35)
+            return
+
+        if drive.result == "SAFETY":
+            self._scoring_team_id = defense.id
+            game_state.add_score(2, for_offense=False)
+            self._emit_scoring_event(game_state, 2, "SAFETY", defense.id)
+            if in_overtime:
+                game_state.phase = GamePhase.FINAL
+                return
+            self._setup_free_kick(game_state, 20)
+            return
+
+        if in_overtime:
+            self._ot_first_possession = False
+
+        if drive.takeover_yard_line is None:  # End of half
+            return
+
+        game_state.flip_possession()
+        game_state.down_state = DownState(
+            down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(drive.takeover_yard_line)
+        )
+        if drive.result in ("TURNOVER", "DOWNS"):
+            self.event_bus.emit(
+                TurnoverEvent(
+                    game_id=game_state.id,
+                    quarter=game_state.current_quarter,
+                    time_remaining=game_state.clock.display,
+                    home_score=game_state.score.home_score,
+                    away_score=game_state.score.away_score,
+                    losing_team_id=offense.id,
+                    gaining_team_id=defense.id,
+                    turnover_type=drive.turnover_type or "DOWNS",
+                )
+            )
+
+    def _setup_free_kick(self, game_state: GameState, yard_line: int) -> None:
+        """The team with the ball kicks off next (after a score or safety)."""
+        game_state.down_state = DownState(
+            down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(yard_line)
+        )
+        self._special_teams_phase = SpecialTeamsPhase.KICKOFF
+
     def simulate_game(self, game_state: GameState) -> GameState:
         """
         Simulate an entire game to completion.
@@ -378,7 +567,10 @@ class SimulationEngine:
         """
         while not game_state.is_game_over:
             # Simulate a drive
-            self.simulate_drive(game_state)
+            if self._drive_resolver is not None:
+                self.resolve_drive(game_state)
+            else:
+                self.simulate_drive(game_state)
 
             # Handle end of quarters
             self._check_quarter_end(game_state)
@@ -410,7 +602,7 @@ class SimulationEngine:
         # Handle penalty outcomes
         if result.outcome in (PlayOutcome.PENALTY_OFFENSE, PlayOutcome.PENALTY_DEFENSE):
             self._apply_penalty_result(game_state, result)
-            game_state.add_play(result)
+            self._record_play(game_state, result)
             return
 
         # Handle special outcomes first
@@ -426,7 +618,7 @@ class SimulationEngine:
                 down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(20)
             )
             self._special_teams_phase = SpecialTeamsPhase.KICKOFF
-            game_state.add_play(result)
+            self._record_play(game_state, result)
             return
 
         if result.is_touchdown:
@@ -437,7 +629,7 @@ class SimulationEngine:
             # Check for OT sudden death - TD on first possession ends game
             if game_state.phase == GamePhase.OVERTIME and self._ot_first_possession:
                 game_state.phase = GamePhase.FINAL
-                game_state.add_play(result)
+                self._record_play(game_state, result)
                 return
 
             # Setup for PAT
@@ -461,7 +653,7 @@ class SimulationEngine:
                     down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(15)
                 )
                 self._special_teams_phase = SpecialTeamsPhase.EXTRA_POINT
-                game_state.add_play(result)
+                self._record_play(game_state, result)
                 return
 
             # Normal turnover - flip possession, use return yards for field position
@@ -483,7 +675,7 @@ class SimulationEngine:
                 down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(new_los)
             )
             self._emit_turnover_event(game_state, result)
-            game_state.add_play(result)
+            self._record_play(game_state, result)
             return
 
         if result.outcome == PlayOutcome.PUNT_RESULT:
@@ -510,7 +702,7 @@ class SimulationEngine:
                     if not self._ot_first_possession:
                         # Second possession or later - FG wins if now ahead
                         game_state.phase = GamePhase.FINAL
-                        game_state.add_play(result)
+                        self._record_play(game_state, result)
                         return
                     # First possession FG - opponent gets a chance
                     self._ot_first_possession = False
@@ -528,7 +720,14 @@ class SimulationEngine:
         game_state.down_state = new_down_state
 
         # Add to history
-        game_state.add_play(result)
+        self._record_play(game_state, result)
+
+    def _record_play(self, game_state: GameState, result: PlayResult) -> None:
+        """Feed a finished play to the box score and (optionally) the history."""
+        if self.stats is not None:
+            self.stats.record_play(result)
+        if self.keep_play_history:
+            game_state.add_play(result)
 
     def _apply_penalty_result(self, game_state: GameState, result: PlayResult) -> None:
         """Apply penalty result to game state."""
@@ -657,7 +856,7 @@ class SimulationEngine:
 
         # Coin toss for OT - winner can choose to receive or defer
         # Simplified: random team receives
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             receiving_team = game_state.home_team_id
         else:
             receiving_team = game_state.away_team_id
@@ -760,20 +959,20 @@ class SimulationEngine:
             game_state, yards_to_go, field_pos, run_tendency
         )
 
-        if random.random() < run_tendency:
+        if self.rng.random() < run_tendency:
             # Run play
             run_types = [RunType.INSIDE, RunType.OUTSIDE, RunType.DRAW]
             weights = [0.5, 0.35, 0.15]
-            run_type = random.choices(run_types, weights=weights)[0]
+            run_type = self.rng.choices(run_types, weights=weights)[0]
             return PlayCall.run(run_type, formation, personnel)
         else:
             # Pass play
             if yards_to_go <= 5:
-                pass_type = random.choice([PassType.SHORT, PassType.SCREEN])
+                pass_type = self.rng.choice([PassType.SHORT, PassType.SCREEN])
             elif yards_to_go <= 12:
-                pass_type = random.choice([PassType.SHORT, PassType.MEDIUM])
+                pass_type = self.rng.choice([PassType.SHORT, PassType.MEDIUM])
             else:
-                pass_type = random.choice([PassType.MEDIUM, PassType.DEEP])
+                pass_type = self.rng.choice([PassType.MEDIUM, PassType.DEEP])
             return PlayCall.pass_play(pass_type, formation, personnel)
 
     def _get_fourth_down_call(
@@ -797,11 +996,11 @@ class SimulationEngine:
 
         # Short yardage in opponent's territory
         if yards_to_go <= 1 and field_pos.yard_line >= 50:
-            go_for_it = random.random() < (0.4 + aggression * 0.3)
+            go_for_it = self.rng.random() < (0.4 + aggression * 0.3)
 
         # 4th and short at opponent's 35-40 (no man's land)
         if yards_to_go <= 3 and 60 <= field_pos.yard_line < 65:
-            go_for_it = random.random() < (0.3 + aggression * 0.3)
+            go_for_it = self.rng.random() < (0.3 + aggression * 0.3)
 
         # Desperate situations
         if quarter == 4:
@@ -843,7 +1042,7 @@ class SimulationEngine:
         if yards_to_go <= 2:
             formations = [Formation.I_FORM, Formation.GOAL_LINE, Formation.UNDER_CENTER]
             personnel = [PersonnelPackage.TWENTY_TWO, PersonnelPackage.TWENTY_ONE, PersonnelPackage.THIRTEEN]
-            idx = random.randint(0, 2)
+            idx = self.rng.randint(0, 2)
             return formations[idx], personnel[idx]
 
         # Long yardage (8+ yards) - passing formations
@@ -851,7 +1050,7 @@ class SimulationEngine:
             formations = [Formation.SHOTGUN, Formation.SPREAD, Formation.EMPTY]
             weights = [0.5, 0.35, 0.15]
             personnel_opts = [PersonnelPackage.ELEVEN, PersonnelPackage.TEN, PersonnelPackage.EMPTY]
-            idx = random.choices(range(3), weights=weights)[0]
+            idx = self.rng.choices(range(3), weights=weights)[0]
             return formations[idx], personnel_opts[idx]
 
         # Run-heavy tendency - balanced/power formations
@@ -859,7 +1058,7 @@ class SimulationEngine:
             formations = [Formation.SINGLEBACK, Formation.I_FORM, Formation.UNDER_CENTER, Formation.PISTOL]
             weights = [0.35, 0.30, 0.20, 0.15]
             personnel_opts = [PersonnelPackage.TWELVE, PersonnelPackage.TWENTY_ONE, PersonnelPackage.TWELVE, PersonnelPackage.TWELVE]
-            idx = random.choices(range(4), weights=weights)[0]
+            idx = self.rng.choices(range(4), weights=weights)[0]
             return formations[idx], personnel_opts[idx]
 
         # Pass-heavy tendency - spread formations
@@ -867,14 +1066,14 @@ class SimulationEngine:
             formations = [Formation.SHOTGUN, Formation.SPREAD, Formation.PISTOL]
             weights = [0.50, 0.30, 0.20]
             personnel_opts = [PersonnelPackage.ELEVEN, PersonnelPackage.TEN, PersonnelPackage.ELEVEN]
-            idx = random.choices(range(3), weights=weights)[0]
+            idx = self.rng.choices(range(3), weights=weights)[0]
             return formations[idx], personnel_opts[idx]
 
         # Balanced - mix of formations
         formations = [Formation.SHOTGUN, Formation.SINGLEBACK, Formation.PISTOL, Formation.I_FORM]
         weights = [0.35, 0.30, 0.20, 0.15]
         personnel_opts = [PersonnelPackage.ELEVEN, PersonnelPackage.TWELVE, PersonnelPackage.ELEVEN, PersonnelPackage.TWENTY_ONE]
-        idx = random.choices(range(4), weights=weights)[0]
+        idx = self.rng.choices(range(4), weights=weights)[0]
         return formations[idx], personnel_opts[idx]
 
     def _get_ai_defensive_call(self, game_state: GameState) -> DefensiveCall:
@@ -898,16 +1097,16 @@ class SimulationEngine:
         if field_pos.yard_line >= 97:
             return DefensiveCall.man(press=True)
 
-        if random.random() < blitz_tendency:
-            rushers = random.choice([5, 6])
+        if self.rng.random() < blitz_tendency:
+            rushers = self.rng.choice([5, 6])
             return DefensiveCall.blitz(rushers)
 
         # Zone vs man
         if yards_to_go <= 5:
-            return DefensiveCall.man(press=random.random() < 0.4)
+            return DefensiveCall.man(press=self.rng.random() < 0.4)
         else:
             schemes = [DefensiveScheme.COVER_2, DefensiveScheme.COVER_3]
-            return DefensiveCall(scheme=random.choice(schemes))
+            return DefensiveCall(scheme=self.rng.choice(schemes))
 
     def _emit_play_event(
         self, game_state: GameState, result: PlayResult, offense_is_home: bool
@@ -1,10 +1,15 @@
 """Play resolvers for simulation."""
 
 from huddle.simulation.resolvers.base import DriveResolver, PlayResolver
+from huddle.simulation.resolvers.drive import StatisticalDriveResolver
 from huddle.simulation.resolvers.statistical import StatisticalPlayResolver
+from huddle.simulation.resolvers.team_ratings import TeamRatingCache, TeamRatings
 
 __all__ = [
     "DriveResolver",
     "PlayResolver",
+    "StatisticalDriveResolver",
     "StatisticalPlayResolver",
+    "TeamRatingCache",
+    "TeamRatings",
 ]
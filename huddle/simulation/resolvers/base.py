@@ -75,3 +75,33 @@ class DriveResolver(ABC):
             DriveResult containing plays, yards, outcome, points
         """
         ...
+
+    @abstractmethod
+    def resolve_kickoff(
+        self,
+        game_state: "GameState",
+        kicking_team: "Team",
+        receiving_team: "Team",
+    ) -> int:
+        """
+        Resolve a kickoff (or free kick) from the current line of scrimmage.
+
+        Returns:
+            Receiving team's starting yard line (0-100 from their own goal)
+        """
+        ...
+
+    @abstractmethod
+    def resolve_conversion(
+        self,
+        game_state: "GameState",
+        offensive_team: "Team",
+        go_for_two: bool,
+    ) -> int:
+        """
+        Resolve the try after a touchdown.
+
+        Returns:
+            Points scored (0, 1 or 2)
+        """
+        ...
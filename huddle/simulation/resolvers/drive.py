@@ -0,0 +1,562 @@
+"""Drive-level resolver for FAST simulation.
+
+Background-league games don't need play-level fidelity, so a whole
+possession is resolved in about a dozen random draws instead of a
+PlayResult per snap:
+
+1. The drive's outcome, from where it starts, tilted by how the
+   offense's units match up with the defense's
+2. Its yards and plays, shaped by that outcome
+3. The run/pass mix, sacks and completions, which set the clock
+4. Who gets credit for it in the box score
+
+Rates come from the research game-layer models (NFL 2019-2024):
+research/exports/reference/game_layer/drive_outcome_model.json and
+game_flow_model.json, plus the distributions in core/stats/generator.py.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from huddle.core.enums import PassType
+from huddle.core.models.game import GameState
+from huddle.core.models.play import DriveResult
+from huddle.core.models.player import Player
+from huddle.core.models.team import Team
+from huddle.core.stats.generator import NFL_COMPLETION_RATE, NFL_PASS_RATE, RUSH_SHARES
+from huddle.simulation.resolvers.base import DriveResolver
+from huddle.simulation.resolvers.team_ratings import TeamRatingCache, TeamRatings, WeightedChoice
+
+
+# Drive outcome rates by yards to the end zone at the start of the drive
+# (drive_outcome_model.json by_starting_position). End of half isn't
+# sampled here - it happens when a drive runs out of clock.
+DRIVE_OUTCOMES_BY_START = (
+    (10, {"TD": 0.7196, "FG": 0.2009, "TURNOVER": 0.0280, "DOWNS": 0.0421}),
+    (20, {"TD": 0.5143, "FG": 0.3688, "TURNOVER": 0.0442, "DOWNS": 0.0338}),
+    (35, {"TD": 0.4387, "FG": 0.3490, "PUNT": 0.0229, "TURNOVER": 0.0568, "DOWNS": 0.0429}),
+    (50, {"TD": 0.3088, "FG": 0.2572, "PUNT": 0.1699, "TURNOVER": 0.0809, "DOWNS": 0.0698}),
+    (64, {"TD": 0.2763, "FG": 0.1859, "PUNT": 0.3019, "TURNOVER": 0.0962, "DOWNS": 0.0598}),
+    (79, {"TD": 0.2173, "FG": 0.1434, "PUNT": 0.3951, "TURNOVER": 0.1144, "DOWNS": 0.0572}),
+    (100, {"TD": 0.1681, "FG": 0.1027, "PUNT": 0.4758, "TURNOVER": 0.1124, "DOWNS": 0.0475,
+           "SAFETY": 0.0130}),  # 96 safeties, nearly all on drives starting inside the 20
+)
+
+# Log-odds shift per 10 points of unit rating edge for the offense
+OUTCOME_TILT = {
+    "TD": 0.45, "FG": 0.10, "PUNT": -0.25, "TURNOVER": -0.30, "DOWNS": -0.10, "SAFETY": -0.30,
+}
+
+# Drive shape by outcome (drive_outcome_model.json drive_efficiency,
+# game_flow_model.json plays_per_drive): (mean, std)
+TD_DRIVE = (64.5, 7.8, 2.5)          # Average yards, plays (mean, std)
+FG_DRIVE = (46.3, 8.0, 2.5)
+FG_ATTEMPT_TO_GOAL = (22.0, 8.0)     # Yards to the end zone when the kick is tried
+PUNT_DRIVE_YARDS = (11.4, 9.0)
+PUNT_DRIVE_PLAYS = (4.2, 1.4)        # 21% of drives are three-and-outs
+TURNOVER_DRIVE_YARDS = (22.8, 15.0)
+TURNOVER_DRIVE_PLAYS = (4.7, 2.5)
+DOWNS_DRIVE_YARDS = (30.0, 15.0)
+DOWNS_DRIVE_PLAYS = (7.5, 2.5)
+
+# Seconds off the clock per play type (game_flow_model.json time_per_play)
+RUN_SECONDS = 36.2
+COMPLETION_SECONDS = 32.8
+INCOMPLETION_SECONDS = 5.6
+SACK_SECONDS = 30.0
+KICK_SECONDS = 6.0
+
+# Box score rates
+SACK_RATE = 0.065                  # Per dropback
+SACK_YARDS = 7
+INTERCEPTION_SHARE = 1.95 / 3.45   # Of turnovers (game_flow_model.json turnovers)
+PASS_TD_SHARE = 0.60
+YARDS_PER_CARRY = 4.3
+YARDS_PER_COMPLETION = 11.0
+
+# Special teams (special_teams_model.json, two_point_model.json)
+KICKOFF_TOUCHBACK_RATE = 0.625
+KICKOFF_TOUCHBACK_YARD_LINE = 25
+KICKOFF_RETURN_START = (24.0, 8.0)
+PUNT_NET_YARDS = (42.5, 10.8)
+PUNT_TOUCHBACK_YARD_LINE = 20
+EXTRA_POINT_RATE = 0.944
+TWO_POINT_RATE = 0.477
+
+# Field goal make rate by kick distance, up to each distance
+FG_MAKE_RATES = ((29, 0.97), (39, 0.92), (49, 0.80), (54, 0.72), (59, 0.60), (64, 0.39))
+FG_LONG_MAKE_RATE = 0.10
+FG_RANGE = 35  # Yards to the end zone where a stalled drive kicks
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+
+def _mean_overall(players: list[Optional[Player]], default: float = 50.0) -> float:
+    ratings = [p.overall for p in players if p is not None]
+    return sum(ratings) / len(ratings) if ratings else default
+
+
+@dataclass
+class DriveRatings:
+    """A team's unit strengths and box-score picks for drive resolution."""
+
+    pass_offense: float
+    run_offense: float
+    pass_defense: float
+    run_defense: float
+    pass_rush: float
+    oline: float
+    pass_rate: float
+
+    qb: Optional[Player] = None
+    kicker: Optional[Player] = None
+    punter: Optional[Player] = None
+    rushers: Optional[WeightedChoice] = None
+    targets: Optional[WeightedChoice] = None
+    tacklers: Optional[WeightedChoice] = None
+    sackers: Optional[WeightedChoice] = None
+    interceptors: Optional[WeightedChoice] = None
+
+    @classmethod
+    def build(cls, team: Team, ratings: TeamRatings) -> "DriveRatings":
+        qb = team.get_starter("QB1")
+        rb1 = team.get_starter("RB1")
+        rb2 = team.get_starter("RB2")
+        linebackers = [team.get_starter(slot) for slot in ("MLB1", "OLB1", "OLB2")]
+        receivers = ratings.get_receivers(None)
+        pass_rush = _mean_overall(ratings.pass_rushers, ratings.dline_rating)
+
+        rushers = [(rb1, RUSH_SHARES["RB1"]), (rb2, RUSH_SHARES["RB2"]), (qb, RUSH_SHARES["QB"])]
+        rushers = [(player, share) for player, share in rushers if player is not None]
+
+        return cls(
+            pass_offense=(
+                0.45 * _mean_overall([qb]) + 0.30 * _mean_overall(receivers)
+                + 0.25 * ratings.oline_rating
+            ),
+            run_offense=0.45 * _mean_overall([rb1]) + 0.55 * ratings.oline_rating,
+            pass_defense=0.5 * _mean_overall(ratings.coverage_players) + 0.5 * pass_rush,
+            run_defense=0.55 * ratings.dline_rating + 0.45 * _mean_overall(linebackers),
+            pass_rush=pass_rush,
+            oline=ratings.oline_rating,
+            pass_rate=_clamp(NFL_PASS_RATE + (0.5 - team.run_tendency) * 0.4, 0.40, 0.75),
+            qb=qb,
+            kicker=team.get_starter("K1"),
+            punter=team.get_starter("P1"),
+            rushers=WeightedChoice([p for p, _ in rushers], [s for _, s in rushers]),
+            targets=ratings.get_targets(None, PassType.SHORT),
+            tacklers=ratings.tacklers.get("none"),
+            sackers=ratings.sackers,
+            interceptors=ratings.interceptors,
+        )
+
+
+@dataclass
+class _PlayMix:
+    """How a drive's plays split between runs and passes."""
+
+    rushes: int = 0
+    attempts: int = 0  # Pass attempts, not counting sacks
+    completions: int = 0
+    sacks: int = 0
+    rush_yards: int = 0
+    pass_yards: int = 0
+    interception: bool = False
+    fumble: bool = False
+
+    @property
+    def plays(self) -> int:
+        return self.rushes + self.attempts + self.sacks
+
+    @property
+    def yards(self) -> int:
+        """Net yards: what the runs and catches gained, less sack losses."""
+        return self.rush_yards + self.pass_yards - SACK_YARDS * self.sacks
+
+    @property
+    def seconds(self) -> float:
+        return (
+            self.rushes * RUN_SECONDS
+            + self.completions * COMPLETION_SECONDS
+            + (self.attempts - self.completions) * INCOMPLETION_SECONDS
+            + self.sacks * SACK_SECONDS
+        )
+
+    def scaled(self, fraction: float) -> "_PlayMix":
+        """The part of the drive that fit on the clock (no turnover)."""
+        attempts = int(self.attempts * fraction)
+        rushes = int(self.rushes * fraction)
+        completions = min(attempts, int(self.completions * fraction))
+        return _PlayMix(
+            rushes=rushes,
+            attempts=attempts,
+            completions=completions,
+            sacks=int(self.sacks * fraction),
+            rush_yards=int(self.rush_yards * fraction) if rushes else 0,
+            pass_yards=int(self.pass_yards * fraction) if completions else 0,
+        )
+
+
+class StatisticalDriveResolver(DriveResolver):
+    """
+    Resolves whole drives from team unit ratings and research distributions.
+
+    Shares the engine's TeamRatingCache, so the receiver, tackler,
+    sacker and interceptor distributions are the ones the play resolver
+    uses and are only rebuilt when the engine refreshes a team.
+    """
+
+    def __init__(
+        self,
+        rating_cache: Optional[TeamRatingCache] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize resolver.
+
+        Args:
+            rating_cache: Per-game team ratings (builds its own if None)
+            rng: Random generator for drive outcomes (defaults to the
+                module-level generator)
+        """
+        if rating_cache is None:
+            from huddle.simulation.resolvers.statistical import StatisticalPlayResolver
+
+            rating_cache = TeamRatingCache(StatisticalPlayResolver().build_team_ratings)
+        self.rating_cache = rating_cache
+        self.rng = rng or random
+        self._drive_ratings: dict[UUID, tuple[TeamRatings, DriveRatings]] = {}
+        self._outcome_tables: dict[tuple[int, float], WeightedChoice] = {}
+
+    def drive_ratings(self, team: Team) -> DriveRatings:
+        """Unit ratings for a team, rebuilt whenever its TeamRatings are."""
+        ratings = self.rating_cache.get(team)
+        entry = self._drive_ratings.get(team.id)
+        if entry is None or entry[0] is not ratings:
+            entry = (ratings, DriveRatings.build(team, ratings))
+            self._drive_ratings[team.id] = entry
+        return entry[1]
+
+    # =========================================================================
+    # Drives
+    # =========================================================================
+
+    def resolve_drive(
+        self,
+        game_state: GameState,
+        offensive_team: Team,
+        defensive_team: Team,
+    ) -> DriveResult:
+        """Resolve a drive from the current line of scrimmage."""
+        rng = self.rng
+        offense = self.drive_ratings(offensive_team)
+        defense = self.drive_ratings(defensive_team)
+        start = game_state.down_state.line_of_scrimmage.yard_line
+        to_goal = 100 - start
+
+        pass_rate = offense.pass_rate
+        edge = (
+            pass_rate * (offense.pass_offense - defense.pass_defense)
+            + (1 - pass_rate) * (offense.run_offense - defense.run_defense)
+        ) / 10
+        result = self._outcome_table(to_goal, edge).sample(rng.random)
+
+        yards, plays = self._drive_shape(result, start)
+        turnover_type = ""
+        if result == "TURNOVER":
+            turnover_type = "INT" if rng.random() < INTERCEPTION_SHARE else "FUMBLE"
+        mix = self._play_mix(plays, yards, turnover_type, offense, defense)
+        yards = mix.yards
+
+        seconds = mix.seconds * _clamp(rng.gauss(1.0, 0.12), 0.6, 1.4)
+        if result in ("FG", "PUNT"):
+            seconds += KICK_SECONDS
+        seconds = max(1, int(seconds))
+
+        # Drives that would outlast the half end when the clock runs out,
+        # with a field goal try if they got close enough
+        time_left = self._seconds_left_in_half(game_state)
+        if seconds >= time_left:
+            fraction = time_left / seconds
+            mix = mix.scaled(fraction)
+            # Short of the end zone: the scoring play didn't happen
+            excess = mix.yards - (to_goal - 1)
+            if excess > 0:
+                if mix.rushes:
+                    mix.rush_yards -= excess
+                else:
+                    mix.pass_yards -= excess
+            yards = mix.yards
+            seconds = time_left
+            turnover_type = ""
+            result = "FG" if to_goal - yards <= FG_RANGE else "END_HALF"
+
+        drive = DriveResult(
+            starting_yard_line=start,
+            ending_yard_line=start + yards,
+            plays=mix.plays,
+            total_yards=yards,
+            time_elapsed_seconds=seconds,
+            result=result,
+            turnover_type=turnover_type,
+        )
+        self._finish_drive(drive, offense)
+        self._credit(drive, mix, offense, defense)
+        return drive
+
+    def _outcome_table(self, to_goal: int, edge: float) -> WeightedChoice:
+        """Outcome distribution for a starting spot, tilted by the matchup."""
+        bucket = next(
+            i for i, (limit, _) in enumerate(DRIVE_OUTCOMES_BY_START) if to_goal <= limit
+        )
+        edge = round(edge, 1)
+        table = self._outcome_tables.get((bucket, edge))
+        if table is None:
+            rates = DRIVE_OUTCOMES_BY_START[bucket][1]
+            table = WeightedChoice(
+                list(rates),
+                [rate * math.exp(OUTCOME_TILT[outcome] * edge) for outcome, rate in rates.items()],
+            )
+            self._outcome_tables[(bucket, edge)] = table
+        return table
+
+    def _drive_shape(self, result: str, start: int) -> tuple[int, int]:
+        """Yards gained and scrimmage plays for a drive with this outcome."""
+        gauss = self.rng.gauss
+        to_goal = 100 - start
+
+        if result in ("TD", "FG"):
+            # Scoring drives take plays in proportion to the field they cover
+            if result == "TD":
+                yards = to_goal
+                average_yards, plays_mean, plays_std = TD_DRIVE
+            else:
+                kick_from = int(_clamp(round(gauss(*FG_ATTEMPT_TO_GOAL)), 1, FG_RANGE))
+                yards = max(0, to_goal - kick_from)
+                average_yards, plays_mean, plays_std = FG_DRIVE
+            plays = round(yards / average_yards * max(2.0, gauss(plays_mean, plays_std)))
+        elif result == "SAFETY":
+            yards = -start
+            plays = 1 + int(self.rng.random() * 3)
+        else:
+            yards_dist, plays_dist, min_plays = {
+                "PUNT": (PUNT_DRIVE_YARDS, PUNT_DRIVE_PLAYS, 3),
+                "TURNOVER": (TURNOVER_DRIVE_YARDS, TURNOVER_DRIVE_PLAYS, 1),
+                "DOWNS": (DOWNS_DRIVE_YARDS, DOWNS_DRIVE_PLAYS, 4),
+            }[result]
+            yards = int(_clamp(round(gauss(*yards_dist)), 1 - start, to_goal - 1))
+            if result == "PUNT":
+                yards = min(yards, max(0, to_goal - FG_RANGE - 5))
+            plays = max(min_plays, round(gauss(*plays_dist)))
+        return yards, max(1, plays)
+
+    def _play_mix(
+        self,
+        plays: int,
+        yards: int,
+        turnover_type: str,
+        offense: DriveRatings,
+        defense: DriveRatings,
+    ) -> _PlayMix:
+        """Split a drive's plays and yards between the run and pass games."""
+        rng = self.rng
+        pass_rate = offense.pass_rate
+
+        spread = math.sqrt(plays * pass_rate * (1 - pass_rate))
+        dropbacks = int(_clamp(round(plays * pass_rate + rng.gauss(0, spread)), 0, plays))
+        if turnover_type == "INT":
+            dropbacks = max(dropbacks, 1)
+        elif turnover_type == "FUMBLE":
+            dropbacks = min(dropbacks, plays - 1)
+        mix = _PlayMix(rushes=plays - dropbacks)
+        mix.interception = turnover_type == "INT"
+        mix.fumble = turnover_type == "FUMBLE"
+
+        # Stochastic rounding keeps the expected counts exact with one draw each
+        sack_rate = _clamp(SACK_RATE + (defense.pass_rush - offense.oline) * 0.002, 0.03, 0.12)
+        mix.sacks = min(dropbacks - mix.interception, int(dropbacks * sack_rate + rng.random()))
+        mix.attempts = dropbacks - mix.sacks
+        catchable = mix.attempts - mix.interception
+        completion_rate = _clamp(
+            NFL_COMPLETION_RATE + (offense.pass_offense - defense.pass_defense) * 0.01, 0.50, 0.78
+        )
+        mix.completions = min(catchable, int(catchable * completion_rate + rng.random()))
+
+        # Sack losses come back out of the yards the plays gained
+        gain = yards + SACK_YARDS * mix.sacks
+        if gain and not (mix.rushes or mix.completions):
+            # Someone has to carry the drive's yards (and score its touchdown)
+            if not catchable and mix.sacks:
+                mix.sacks -= 1
+                mix.attempts += 1
+                catchable += 1
+                gain -= SACK_YARDS
+            if catchable:
+                mix.completions = 1
+            else:
+                # Only the interception: the other team takes over at the line
+                gain = 0
+        if mix.completions and mix.rushes and gain > 0:
+            rush_weight = mix.rushes * YARDS_PER_CARRY
+            pass_weight = mix.completions * YARDS_PER_COMPLETION
+            mix.rush_yards = round(gain * rush_weight / (rush_weight + pass_weight))
+        elif mix.rushes:
+            mix.rush_yards = gain
+        mix.pass_yards = gain - mix.rush_yards if mix.completions else 0
+        return mix
+
+    def _finish_drive(self, drive: DriveResult, offense: DriveRatings) -> None:
+        """Score the drive and set where the other team takes over."""
+        end = drive.ending_yard_line
+        result = drive.result
+
+        if result == "TD":
+            drive.points = 6
+        elif result == "FG":
+            distance = 100 - end + 17  # Snap and hold
+            if self.rng.random() < self._field_goal_rate(distance, offense.kicker):
+                drive.points = 3
+            else:
+                drive.result = "FG_MISS"
+                drive.takeover_yard_line = max(20, 100 - (end - 7))  # Spot of the kick
+        elif result == "PUNT":
+            power = offense.punter.get_attribute("kick_power") if offense.punter else 70
+            net = round(self.rng.gauss(PUNT_NET_YARDS[0] + (power - 80) * 0.2, PUNT_NET_YARDS[1]))
+            landing = end + max(10, net)
+            if landing >= 100:
+                drive.takeover_yard_line = PUNT_TOUCHBACK_YARD_LINE
+            else:
+                drive.takeover_yard_line = max(1, 100 - landing)
+        elif result in ("TURNOVER", "DOWNS"):
+            drive.takeover_yard_line = int(_clamp(100 - end, 1, 99))
+
+    def _credit(
+        self,
+        drive: DriveResult,
+        mix: _PlayMix,
+        offense: DriveRatings,
+        defense: DriveRatings,
+    ) -> None:
+        """Allocate the drive's box score to players."""
+        rand = self.rng.random
+        totals: dict[tuple[UUID, str], float] = {}
+
+        def credit(player: Optional[Player], stat: str, amount: float = 1) -> None:
+            if player is not None and amount:
+                key = (player.id, stat)
+                totals[key] = totals.get(key, 0) + amount
+
+        is_td = drive.result == "TD"
+        passing_td = is_td and mix.completions > 0 and (mix.rushes == 0 or rand() < PASS_TD_SHARE)
+
+        qb = offense.qb
+        credit(qb, "pass_attempts", mix.attempts)
+        credit(qb, "pass_completions", mix.completions)
+        credit(qb, "pass_yards", mix.pass_yards)
+        credit(qb, "pass_sacks", mix.sacks)
+        credit(qb, "pass_interceptions", int(mix.interception))
+        credit(qb, "pass_touchdowns", int(passing_td))
+
+        # Every attempt has a target; the first ones sampled are the catches
+        receiver = None
+        catches = self._split(mix.pass_yards, mix.completions)
+        for i in range(mix.attempts):
+            target = offense.targets.sample(rand) if offense.targets else None
+            credit(target, "targets")
+            if i < len(catches):
+                receiver = target
+                credit(receiver, "receptions")
+                credit(receiver, "receiving_yards", catches[i])
+        if passing_td:
+            credit(receiver, "receiving_touchdowns")
+
+        rusher = None
+        for yards in self._split(mix.rush_yards, mix.rushes):
+            rusher = offense.rushers.sample(rand) if offense.rushers else None
+            credit(rusher, "rush_attempts")
+            credit(rusher, "rush_yards", yards)
+        if is_td and not passing_td:
+            credit(rusher, "rush_touchdowns")
+        if mix.fumble:
+            credit(rusher, "fumbles_lost")
+
+        # Every run and catch ends in a tackle unless it scores
+        tackles = mix.rushes + mix.completions - is_td
+        if defense.tacklers:
+            for _ in range(tackles):
+                credit(defense.tacklers.sample(rand), "tackles")
+        if defense.sackers:
+            for _ in range(mix.sacks):
+                sacker = defense.sackers.sample(rand)
+                credit(sacker, "tackles")
+                credit(sacker, "sacks", 1.0)
+        if mix.interception and defense.interceptors:
+            credit(defense.interceptors.sample(rand), "interceptions")
+
+        drive.credits = [(player_id, stat, amount) for (player_id, stat), amount in totals.items()]
+
+    @staticmethod
+    def _split(total: int, count: int) -> list[int]:
+        """Split yards evenly across plays, remainder on the first."""
+        if count <= 0:
+            return []
+        share, remainder = divmod(total, count)
+        return [share + remainder] + [share] * (count - 1)
+
+    @staticmethod
+    def _seconds_left_in_half(game_state: GameState) -> int:
+        seconds = game_state.clock.time_remaining_seconds
+        if game_state.current_quarter in (1, 3):
+            seconds += 900
+        return seconds
+
+    @staticmethod
+    def _field_goal_rate(distance: int, kicker: Optional[Player]) -> float:
+        rate = next((r for limit, r in FG_MAKE_RATES if distance <= limit), FG_LONG_MAKE_RATE)
+        if kicker is not None:
+            skill = (kicker.get_attribute("kick_accuracy") + kicker.get_attribute("kick_power")) / 2
+            rate += (skill - 80) / 200
+        return _clamp(rate, 0.05, 0.99)
+
+    # =========================================================================
+    # Kicks
+    # =========================================================================
+
+    def resolve_kickoff(
+        self,
+        game_state: GameState,
+        kicking_team: Team,
+        receiving_team: Team,
+    ) -> int:
+        """Receiving team's start after a kickoff (or free kick) from the LOS."""
+        kicker = self.drive_ratings(kicking_team).kicker
+        power = kicker.get_attribute("kick_power") if kicker else 70
+        kick_from = game_state.down_state.line_of_scrimmage.yard_line
+        short_by = max(0, 35 - kick_from)  # Free kicks after a safety
+
+        touchback_rate = _clamp(KICKOFF_TOUCHBACK_RATE + (power - 80) * 0.01, 0.3, 0.9)
+        if not short_by and self.rng.random() < touchback_rate:
+            return KICKOFF_TOUCHBACK_YARD_LINE
+        start = round(self.rng.gauss(*KICKOFF_RETURN_START)) + short_by
+        return int(_clamp(start, 1, 60))
+
+    def resolve_conversion(
+        self,
+        game_state: GameState,
+        offensive_team: Team,
+        go_for_two: bool,
+    ) -> int:
+        """Points from the try after a touchdown."""
+        ratings = self.drive_ratings(offensive_team)
+        if go_for_two:
+            rate = TWO_POINT_RATE + ((ratings.qb.overall if ratings.qb else 75) - 75) / 200
+            return 2 if self.rng.random() < rate else 0
+        kicker = ratings.kicker
+        accuracy = kicker.get_attribute("kick_accuracy") if kicker else 75
+        rate = _clamp(EXTRA_POINT_RATE + (accuracy - 75) / 200, 0.80, 0.99)
+        return 1 if self.rng.random() < rate else 0
@@ -19,6 +19,13 @@ from huddle.core.models.play import DefensiveCall, PlayCall, PlayResult
 from huddle.core.models.player import Player
 from huddle.core.models.team import Team
 from huddle.simulation.resolvers.base import PlayResolver
+from huddle.simulation.resolvers.team_ratings import (
+    TeamRatingCache,
+    TeamRatings,
+    WeightedChoice,
+    pass_type_bucket,
+    run_type_bucket,
+)
 
 
 class StatisticalPlayResolver(PlayResolver):
@@ -101,6 +108,24 @@ class StatisticalPlayResolver(PlayResolver):
         RunType.QB_SCRAMBLE: (4.0, 4.0),
     }
 
+    def __init__(
+        self,
+        rating_cache: Optional[TeamRatingCache] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize resolver.
+
+        Args:
+            rating_cache: Per-game team ratings. When set, line ratings,
+                player groups and selection weights are read from the cache
+                instead of being recomputed from the roster every play.
+            rng: Random generator for play outcomes (defaults to the
+                module-level generator)
+        """
+        self.rating_cache = rating_cache
+        self.rng = rng or random
+
     def resolve_play(
         self,
         game_state: GameState,
@@ -159,9 +184,16 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Get key players based on personnel package
         qb = offense.get_starter("QB1")
-        receivers = self._get_receivers(offense, call.personnel)
-        pass_rushers = self._get_pass_rushers(defense)
-        coverage_players = self._get_coverage_players(defense)
+        off_ratings = self._team_ratings(offense)
+        def_ratings = self._team_ratings(defense)
+        if off_ratings and def_ratings:
+            receivers = off_ratings.get_receivers(call.personnel)
+            pass_rushers = def_ratings.pass_rushers
+            coverage_players = def_ratings.coverage_players
+        else:
+            receivers = self._get_receivers(offense, call.personnel)
+            pass_rushers = self._get_pass_rushers(defense)
+            coverage_players = self._get_coverage_players(defense)
 
         if not qb or not receivers:
             return self._incomplete_pass(call, def_call, None)
@@ -170,11 +202,14 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Check for sack first
         sack_chance = self._calculate_sack_probability(offense, defense, def_call)
-        if random.random() < sack_chance:
+        if self.rng.random() < sack_chance:
             return self._create_sack_result(game_state, call, def_call, qb, defense)
 
         # Select target
-        target = self._select_target(receivers, pass_type, coverage_players)
+        if off_ratings:
+            target = off_ratings.get_targets(call.personnel, pass_type).sample(self.rng.random)
+        else:
+            target = self._select_target(receivers, pass_type, coverage_players)
         if not target:
             return self._incomplete_pass(call, def_call, qb)
 
@@ -184,7 +219,7 @@ class StatisticalPlayResolver(PlayResolver):
         )
 
         # Roll for completion
-        roll = random.random()
+        roll = self.rng.random()
         was_complete = roll < completion_prob
 
         # Check for penalty during play (may override result)
@@ -210,7 +245,7 @@ class StatisticalPlayResolver(PlayResolver):
         int_chance = self._calculate_interception_probability(
             qb, pass_type, def_call, coverage_players
         )
-        if random.random() < int_chance:
+        if self.rng.random() < int_chance:
             return self._create_interception_result(
                 game_state, call, def_call, qb, defense
             )
@@ -243,13 +278,12 @@ class StatisticalPlayResolver(PlayResolver):
         run_type = call.run_type or RunType.INSIDE
 
         # Calculate yards based on matchups
-        ol_rating = self._calculate_oline_rating(offense)
-        dl_rating = self._calculate_dline_rating(defense)
+        ol_rating, dl_rating = self._line_ratings(offense, defense)
         line_advantage = (ol_rating - dl_rating) / 100  # -1 to +1
 
         # Base yards from distribution
         mean, std = self.RUN_YARDS_DISTRIBUTION.get(run_type, (4.0, 3.0))
-        base_yards = random.gauss(mean, std)
+        base_yards = self.rng.gauss(mean, std)
 
         # Modify by matchups
         yards = base_yards + (line_advantage * 2)
@@ -265,8 +299,8 @@ class StatisticalPlayResolver(PlayResolver):
         # Check for big play (breakaway) - rare event ~1-2% of runs
         speed = rb.get_attribute("speed")
         breakaway_chance = 0.012 * (speed / 99)
-        if random.random() < breakaway_chance:
-            yards += random.randint(8, 20)
+        if self.rng.random() < breakaway_chance:
+            yards += self.rng.randint(8, 20)
 
         yards = int(max(-5, yards))
 
@@ -292,7 +326,7 @@ class StatisticalPlayResolver(PlayResolver):
         # Check for fumble
         carrying = rb.get_attribute("carrying")
         fumble_chance = 0.015 * (100 - carrying) / 100
-        is_fumble = random.random() < fumble_chance
+        is_fumble = self.rng.random() < fumble_chance
 
         # Check for touchdown
         current_los = game_state.down_state.line_of_scrimmage.yard_line
@@ -315,7 +349,7 @@ class StatisticalPlayResolver(PlayResolver):
             out_of_bounds_chance = 0.15
         else:
             out_of_bounds_chance = 0.05
-        went_out_of_bounds = random.random() < out_of_bounds_chance
+        went_out_of_bounds = self.rng.random() < out_of_bounds_chance
 
         # Generate description
         description = self._generate_run_description(rb, yards, is_td, False, tackler)
@@ -332,9 +366,9 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Time elapsed is less if clock stops
         if clock_stopped:
-            time_elapsed = random.randint(5, 12)
+            time_elapsed = self.rng.randint(5, 12)
         else:
-            time_elapsed = random.randint(25, 40)
+            time_elapsed = self.rng.randint(25, 40)
 
         return PlayResult(
             play_call=call,
@@ -386,7 +420,7 @@ class StatisticalPlayResolver(PlayResolver):
                 defensive_call=def_call,
                 outcome=PlayOutcome.FUMBLE_LOST,
                 yards_gained=yards_before_fumble + return_yards,
-                time_elapsed_seconds=random.randint(10, 18),
+                time_elapsed_seconds=self.rng.randint(10, 18),
                 rusher_id=rusher.id,
                 fumble_recovered_by_id=recoverer.id if recoverer else None,
                 is_turnover=True,
@@ -408,7 +442,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.FUMBLE_LOST,
             yards_gained=yards_before_fumble + return_yards,
-            time_elapsed_seconds=random.randint(8, 15),
+            time_elapsed_seconds=self.rng.randint(8, 15),
             rusher_id=rusher.id,
             fumble_recovered_by_id=recoverer.id if recoverer else None,
             is_turnover=True,
@@ -430,11 +464,11 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Calculate punt distance
         base_distance = 35 + (kick_power - 50) * 0.3
-        distance = int(base_distance + random.gauss(0, 5))
+        distance = int(base_distance + self.rng.gauss(0, 5))
         distance = max(20, min(65, distance))
 
         # Net yards (considering return)
-        return_yards = random.randint(0, 15)
+        return_yards = self.rng.randint(0, 15)
         net_yards = distance - return_yards
 
         return PlayResult(
@@ -442,7 +476,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.PUNT_RESULT,
             yards_gained=-net_yards,  # Negative because possession changes
-            time_elapsed_seconds=random.randint(8, 15),
+            time_elapsed_seconds=self.rng.randint(8, 15),
             description=f"Punt for {distance} yards, {return_yards} yard return",
         )
 
@@ -480,18 +514,98 @@ class StatisticalPlayResolver(PlayResolver):
         make_prob = base_prob + (attr_mod * 0.15)
         make_prob = max(0.05, min(0.99, make_prob))
 
-        is_good = random.random() < make_prob
+        is_good = self.rng.random() < make_prob
 
         return PlayResult(
             play_call=call,
             defensive_call=def_call,
             outcome=PlayOutcome.FIELD_GOAL_GOOD if is_good else PlayOutcome.FIELD_GOAL_MISSED,
             yards_gained=0,
-            time_elapsed_seconds=random.randint(8, 15),
+            time_elapsed_seconds=self.rng.randint(8, 15),
             points_scored=3 if is_good else 0,
             description=f"{distance} yard field goal {'GOOD' if is_good else 'NO GOOD'}",
         )
 
+    # Team rating cache
+
+    def _team_ratings(self, team: Team) -> Optional[TeamRatings]:
+        """Cached ratings for a team, or None when running without a cache."""
+        if self.rating_cache is None:
+            return None
+        return self.rating_cache.get(team)
+
+    def _line_ratings(self, offense: Team, defense: Team) -> tuple[int, int]:
+        """O-line and D-line ratings, from the cache when available."""
+        off_ratings = self._team_ratings(offense)
+        def_ratings = self._team_ratings(defense)
+        if off_ratings and def_ratings:
+            return off_ratings.oline_rating, def_ratings.dline_rating
+        return self._calculate_oline_rating(offense), self._calculate_dline_rating(defense)
+
+    def build_team_ratings(self, team: Team) -> TeamRatings:
+        """
+        Compute everything the resolver derives from a team's roster.
+
+        Used as the TeamRatingCache builder. Selection weights are the
+        expected weights of the per-play selection methods, with backup
+        rotation folded in as a weight split between starter and backup.
+        """
+        ratings = TeamRatings(
+            team_id=team.id,
+            oline_rating=self._calculate_oline_rating(team),
+            dline_rating=self._calculate_dline_rating(team),
+            pass_rushers=self._get_pass_rushers(team),
+            coverage_players=self._get_coverage_players(team),
+        )
+
+        for personnel in [None, *PersonnelPackage]:
+            receivers = self._get_receivers(team, personnel)
+            ratings.receivers[personnel] = receivers
+            for pass_type in (PassType.DEEP, PassType.SCREEN, PassType.SHORT):
+                ratings.targets[(personnel, pass_type_bucket(pass_type))] = WeightedChoice(
+                    receivers, [self._target_weight(rec, pass_type) for rec in receivers]
+                )
+
+        for run_type in (None, RunType.INSIDE, RunType.OUTSIDE):
+            ratings.tacklers[run_type_bucket(run_type)] = self._expected_weighted_players(
+                team, self.TACKLE_WEIGHTS, attribute_name="tackle", run_type=run_type
+            )
+        ratings.sackers = self._expected_weighted_players(
+            team, self.SACK_WEIGHTS, attribute_name="finesse_moves"
+        )
+        ratings.interceptors = self._expected_weighted_players(
+            team, self.INT_WEIGHTS, attribute_name="zone_coverage"
+        )
+        return ratings
+
+    def _expected_weighted_players(
+        self,
+        team: Team,
+        weights: dict[str, float],
+        attribute_name: Optional[str] = None,
+        run_type: Optional[RunType] = None,
+    ) -> WeightedChoice:
+        """Distribution equivalent to _select_weighted_player, for the cache."""
+        player_weights: dict = {}
+        players: dict = {}
+
+        for slot, base_weight in self._run_adjusted_weights(weights, run_type).items():
+            starter = team.get_starter(slot)
+            position = slot.rstrip("0123456789")
+            depth = int(slot[-1]) if slot[-1].isdigit() else 1
+            rotated = team.get_starter(f"{position}{depth + 1}") or starter
+
+            for player, share in ((starter, 1 - self.ROTATION_CHANCE), (rotated, self.ROTATION_CHANCE)):
+                if not player:
+                    continue
+                weight = base_weight * share
+                if attribute_name:
+                    weight *= 0.8 + (player.get_attribute(attribute_name) / 250)
+                players[player.id] = player
+                player_weights[player.id] = player_weights.get(player.id, 0.0) + weight
+
+        return WeightedChoice(list(players.values()), list(player_weights.values()))
+
     # Helper methods
 
     def _get_receivers(
@@ -545,8 +659,7 @@ class StatisticalPlayResolver(PlayResolver):
             base_rate += 0.05 * (def_call.blitz_count - 4)
 
         # Modify by O-line vs D-line
-        ol_rating = self._calculate_oline_rating(offense)
-        dl_rating = self._calculate_dline_rating(defense)
+        ol_rating, dl_rating = self._line_ratings(offense, defense)
         line_diff = (dl_rating - ol_rating) / 100
 
         return max(0.03, min(0.25, base_rate + line_diff * 0.12))
@@ -632,12 +745,12 @@ class StatisticalPlayResolver(PlayResolver):
     ) -> int:
         """Calculate yards gained on completion."""
         mean, std = self.PASS_YARDS_DISTRIBUTION.get(pass_type, (10, 5))
-        base_yards = random.gauss(mean, std)
+        base_yards = self.rng.gauss(mean, std)
 
         # YAC based on receiver speed/elusiveness (NFL avg YAC ~4-5 yards)
         speed = receiver.get_attribute("speed")
         elusiveness = receiver.get_attribute("elusiveness")
-        yac = max(0, random.gauss(2, 1.5) * ((speed + elusiveness) / 150))
+        yac = max(0, self.rng.gauss(2, 1.5) * ((speed + elusiveness) / 150))
 
         yards = int(base_yards + yac)
 
@@ -688,23 +801,11 @@ class StatisticalPlayResolver(PlayResolver):
             return None
 
         # Weight by route running and speed for the given pass type
-        weights = []
-        for rec in receivers:
-            route = rec.get_attribute("route_running")
-            if pass_type == PassType.DEEP:
-                speed = rec.get_attribute("speed")
-                weight = route * 0.5 + speed * 0.5
-            elif pass_type == PassType.SCREEN:
-                speed = rec.get_attribute("speed")
-                weight = route * 0.3 + speed * 0.7
-            else:
-                catching = rec.get_attribute("catching")
-                weight = route * 0.6 + catching * 0.4
-            weights.append(max(1, weight))
+        weights = [self._target_weight(rec, pass_type) for rec in receivers]
 
         # Weighted random selection
         total = sum(weights)
-        r = random.random() * total
+        r = self.rng.random() * total
         cumulative = 0
         for rec, weight in zip(receivers, weights):
             cumulative += weight
@@ -712,6 +813,38 @@ class StatisticalPlayResolver(PlayResolver):
                 return rec
         return receivers[0]
 
+    def _target_weight(self, receiver: Player, pass_type: PassType) -> float:
+        """Targeting weight for a receiver on a given pass type."""
+        route = receiver.get_attribute("route_running")
+        if pass_type == PassType.DEEP:
+            speed = receiver.get_attribute("speed")
+            weight = route * 0.5 + speed * 0.5
+        elif pass_type == PassType.SCREEN:
+            speed = receiver.get_attribute("speed")
+            weight = route * 0.3 + speed * 0.7
+        else:
+            catching = receiver.get_attribute("catching")
+            weight = route * 0.6 + catching * 0.4
+        return max(1, weight)
+
+    def _run_adjusted_weights(
+        self, weights: dict[str, float], run_type: Optional[RunType]
+    ) -> dict[str, float]:
+        """Boost slot weights toward the point of attack for run plays."""
+        effective_weights = weights.copy()
+        if run_type:
+            if run_type in (RunType.INSIDE, RunType.DRAW):
+                # Interior runs - boost DL and MLB
+                for slot in ["DT1", "DT2", "MLB1", "MLB2", "ILB1", "ILB2"]:
+                    if slot in effective_weights:
+                        effective_weights[slot] *= 1.5
+            else:
+                # Outside runs - boost OLB, CB, safeties
+                for slot in ["OLB1", "OLB2", "CB1", "CB2", "SS1", "FS1"]:
+                    if slot in effective_weights:
+                        effective_weights[slot] *= 1.5
+        return effective_weights
+
     def _select_weighted_player(
         self,
         team: Team,
@@ -735,22 +868,11 @@ class StatisticalPlayResolver(PlayResolver):
         adjusted_weights = []
 
         # Apply run type modifiers if applicable
-        effective_weights = weights.copy()
-        if run_type:
-            if run_type in (RunType.INSIDE, RunType.DRAW):
-                # Interior runs - boost DL and MLB
-                for slot in ["DT1", "DT2", "MLB1", "MLB2", "ILB1", "ILB2"]:
-                    if slot in effective_weights:
-                        effective_weights[slot] *= 1.5
-            else:
-                # Outside runs - boost OLB, CB, safeties
-                for slot in ["OLB1", "OLB2", "CB1", "CB2", "SS1", "FS1"]:
-                    if slot in effective_weights:
-                        effective_weights[slot] *= 1.5
+        effective_weights = self._run_adjusted_weights(weights, run_type)
 
         for slot, base_weight in effective_weights.items():
             # Check for rotation to backup
-            if random.random() < self.ROTATION_CHANCE:
+            if self.rng.random() < self.ROTATION_CHANCE:
                 # Try backup slot (e.g., "DE1" -> "DE2")
                 position = slot.rstrip("0123456789")
                 depth = int(slot[-1]) if slot[-1].isdigit() else 1
@@ -774,9 +896,9 @@ class StatisticalPlayResolver(PlayResolver):
         # Weighted random selection
         total = sum(adjusted_weights)
         if total == 0:
-            return random.choice(candidates)
+            return self.rng.choice(candidates)
 
-        r = random.random() * total
+        r = self.rng.random() * total
         cumulative = 0
         for player, weight in zip(candidates, adjusted_weights):
             cumulative += weight
@@ -787,6 +909,8 @@ class StatisticalPlayResolver(PlayResolver):
 
     def _select_tackler(self, defense: Team, run_type: RunType) -> Optional[Player]:
         """Select the player who makes the tackle using position weights."""
+        if ratings := self._team_ratings(defense):
+            return ratings.tacklers[run_type_bucket(run_type)].sample(self.rng.random)
         return self._select_weighted_player(
             defense,
             self.TACKLE_WEIGHTS,
@@ -796,6 +920,8 @@ class StatisticalPlayResolver(PlayResolver):
 
     def _select_sacker(self, defense: Team) -> Optional[Player]:
         """Select player who gets the sack using position weights."""
+        if ratings := self._team_ratings(defense):
+            return ratings.sackers.sample(self.rng.random)
         return self._select_weighted_player(
             defense,
             self.SACK_WEIGHTS,
@@ -804,6 +930,8 @@ class StatisticalPlayResolver(PlayResolver):
 
     def _select_interceptor(self, defense: Team) -> Optional[Player]:
         """Select player who gets the interception using position weights."""
+        if ratings := self._team_ratings(defense):
+            return ratings.interceptors.sample(self.rng.random)
         return self._select_weighted_player(
             defense,
             self.INT_WEIGHTS,
@@ -819,7 +947,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.INCOMPLETE,
             yards_gained=0,
-            time_elapsed_seconds=random.randint(5, 10),  # Clock stops on incomplete
+            time_elapsed_seconds=self.rng.randint(5, 10),  # Clock stops on incomplete
             passer_id=qb.id if qb else None,
             clock_stopped=True,
             clock_stop_reason="incomplete",
@@ -835,7 +963,7 @@ class StatisticalPlayResolver(PlayResolver):
         defense: Team,
     ) -> PlayResult:
         """Create a sack result."""
-        yards_lost = random.randint(3, 10)
+        yards_lost = self.rng.randint(3, 10)
         sacker = self._select_sacker(defense)
 
         # Check for safety (sacked in own end zone)
@@ -850,7 +978,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.SACK,
             yards_gained=-yards_lost,
-            time_elapsed_seconds=random.randint(20, 35),
+            time_elapsed_seconds=self.rng.randint(20, 35),
             passer_id=qb.id,
             tackler_id=sacker.id if sacker else None,
             is_sack=True,
@@ -875,7 +1003,7 @@ class StatisticalPlayResolver(PlayResolver):
         tackler = coverage[0] if coverage else None
 
         # Check if receiver went out of bounds (~20% chance on sideline catches)
-        went_out_of_bounds = random.random() < 0.20
+        went_out_of_bounds = self.rng.random() < 0.20
 
         description = self._generate_pass_description(qb, receiver, yards, is_td)
         if went_out_of_bounds and not is_td:
@@ -891,9 +1019,9 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Time elapsed is less if clock stops
         if clock_stopped:
-            time_elapsed = random.randint(5, 12)
+            time_elapsed = self.rng.randint(5, 12)
         else:
-            time_elapsed = random.randint(25, 40)
+            time_elapsed = self.rng.randint(25, 40)
 
         return PlayResult(
             play_call=call,
@@ -944,7 +1072,7 @@ class StatisticalPlayResolver(PlayResolver):
                 defensive_call=def_call,
                 outcome=PlayOutcome.INTERCEPTION,
                 yards_gained=int_spot + return_yards,  # Total field position change
-                time_elapsed_seconds=random.randint(10, 18),
+                time_elapsed_seconds=self.rng.randint(10, 18),
                 passer_id=qb.id,
                 interceptor_id=interceptor.id if interceptor else None,
                 is_turnover=True,
@@ -966,7 +1094,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.INTERCEPTION,
             yards_gained=int_spot + return_yards,  # Used for field position calculation
-            time_elapsed_seconds=random.randint(25, 35),
+            time_elapsed_seconds=self.rng.randint(25, 35),
             passer_id=qb.id,
             interceptor_id=interceptor.id if interceptor else None,
             is_turnover=True,
@@ -983,7 +1111,7 @@ class StatisticalPlayResolver(PlayResolver):
             PassType.HAIL_MARY: (35, 50),
         }
         min_depth, max_depth = depth_ranges.get(pass_type, (5, 15))
-        return random.randint(min_depth, max_depth)
+        return self.rng.randint(min_depth, max_depth)
 
     def _calculate_turnover_return(
         self,
@@ -1014,7 +1142,7 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Base return is 0-20 yards, modified by speed
         speed = returner.get_attribute("speed")
-        base_return = random.gauss(10, 8)
+        base_return = self.rng.gauss(10, 8)
         return_yards = int(max(0, base_return * (speed / 85)))
 
         # Check for house call (about 1-2% of interceptions become pick-sixes)
@@ -1023,7 +1151,7 @@ class StatisticalPlayResolver(PlayResolver):
             return return_yards, True
 
         # Small chance of breaking a long return for TD
-        if return_yards > 25 and random.random() < 0.12:
+        if return_yards > 25 and self.rng.random() < 0.12:
             return yards_to_td, True
 
         # Cap return at available distance
@@ -1051,7 +1179,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.SAFETY,
             yards_gained=yards,
-            time_elapsed_seconds=random.randint(5, 10),
+            time_elapsed_seconds=self.rng.randint(5, 10),
             rusher_id=ball_carrier.id if not is_sack else None,
             passer_id=ball_carrier.id if is_sack else None,
             tackler_id=tackler.id if tackler else None,
@@ -1072,7 +1200,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=PlayOutcome.RUSH,
             yards_gained=yards,
-            time_elapsed_seconds=random.randint(8, 15),
+            time_elapsed_seconds=self.rng.randint(8, 15),
             description=f"Rush for {yards} yards",
         )
 
@@ -1119,13 +1247,13 @@ class StatisticalPlayResolver(PlayResolver):
 
         # Calculate kick distance (from own 35)
         base_distance = 60 + (kick_power - 50) * 0.3
-        distance = int(base_distance + random.gauss(0, 5))
+        distance = int(base_distance + self.rng.gauss(0, 5))
         distance = max(50, min(75, distance))
 
         # Determine if touchback (kick into end zone, ball at 25)
         # Kick from 35, end zone starts at 100, so kick of 65+ yards = touchback
         if distance >= 65:
-            is_touchback = random.random() < 0.7  # 70% of deep kicks are touchbacks
+            is_touchback = self.rng.random() < 0.7  # 70% of deep kicks are touchbacks
         else:
             is_touchback = False
 
@@ -1143,11 +1271,11 @@ class StatisticalPlayResolver(PlayResolver):
             # Return yards
             returner = receiving_team.get_starter("WR3")  # Often WR3 or specialized returner
             speed = returner.get_attribute("speed") if returner else 75
-            return_yards = int(random.gauss(22, 10) * (speed / 85))
+            return_yards = int(self.rng.gauss(22, 10) * (speed / 85))
             return_yards = max(0, min(50, return_yards))
 
             # Check for return TD (rare, ~0.5%)
-            if return_yards > 45 and random.random() < 0.02:
+            if return_yards > 45 and self.rng.random() < 0.02:
                 return_yards = 100 - catch_yard
                 is_return_td = True
             else:
@@ -1168,7 +1296,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=outcome,
             yards_gained=starting_position,  # Used for field position setup
-            time_elapsed_seconds=random.randint(5, 12),
+            time_elapsed_seconds=self.rng.randint(5, 12),
             is_touchdown=(outcome == PlayOutcome.TOUCHDOWN),
             points_scored=6 if outcome == PlayOutcome.TOUCHDOWN else 0,
             description=description,
@@ -1191,14 +1319,14 @@ class StatisticalPlayResolver(PlayResolver):
         attr_mod = (accuracy - 75) / 200
         make_prob = max(0.80, min(0.99, base_prob + attr_mod))
 
-        is_good = random.random() < make_prob
+        is_good = self.rng.random() < make_prob
 
         return PlayResult(
             play_call=call,
             defensive_call=def_call,
             outcome=PlayOutcome.EXTRA_POINT_GOOD if is_good else PlayOutcome.EXTRA_POINT_MISSED,
             yards_gained=0,
-            time_elapsed_seconds=random.randint(5, 8),
+            time_elapsed_seconds=self.rng.randint(5, 8),
             points_scored=1 if is_good else 0,
             description=f"Extra point {'GOOD' if is_good else 'NO GOOD'}",
         )
@@ -1234,7 +1362,7 @@ class StatisticalPlayResolver(PlayResolver):
                 success_prob = 0.45
             is_pass = True
 
-        success = random.random() < success_prob
+        success = self.rng.random() < success_prob
 
         if success:
             if is_pass:
@@ -1254,7 +1382,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=outcome,
             yards_gained=2 if success else 0,
-            time_elapsed_seconds=random.randint(5, 10),
+            time_elapsed_seconds=self.rng.randint(5, 10),
             points_scored=2 if success else 0,
             description=description,
         )
@@ -1271,20 +1399,20 @@ class StatisticalPlayResolver(PlayResolver):
             Tuple of (PenaltyType, is_on_offense) or None if no penalty
         """
         # Overall pre-snap penalty rate: ~3% of plays
-        if random.random() > 0.03:
+        if self.rng.random() > 0.03:
             return None
 
         # 60% offensive, 40% defensive
-        if random.random() < 0.60:
+        if self.rng.random() < 0.60:
             # Offensive pre-snap penalty
-            penalty_type = random.choices(
+            penalty_type = self.rng.choices(
                 [PenaltyType.FALSE_START, PenaltyType.DELAY_OF_GAME, PenaltyType.ILLEGAL_FORMATION],
                 weights=[0.65, 0.25, 0.10]
             )[0]
             return (penalty_type, True)
         else:
             # Defensive pre-snap penalty
-            penalty_type = random.choices(
+            penalty_type = self.rng.choices(
                 [PenaltyType.OFFSIDES, PenaltyType.ENCROACHMENT, PenaltyType.NEUTRAL_ZONE_INFRACTION],
                 weights=[0.60, 0.25, 0.15]
             )[0]
@@ -1305,15 +1433,15 @@ class StatisticalPlayResolver(PlayResolver):
             Tuple of (PenaltyType, is_on_offense, yards_to_target) or None
         """
         # Base penalty rate ~5% of pass plays (after pre-snap check)
-        if random.random() > 0.05:
+        if self.rng.random() > 0.05:
             return None
 
         # Pass plays can have holding, PI, roughing passer, etc.
         # Distribution based on approximate NFL rates
 
-        if random.random() < 0.40:
+        if self.rng.random() < 0.40:
             # Offensive penalty
-            penalty_type = random.choices(
+            penalty_type = self.rng.choices(
                 [PenaltyType.HOLDING_OFFENSE, PenaltyType.OFFENSIVE_PASS_INTERFERENCE,
                  PenaltyType.ILLEGAL_USE_OF_HANDS],
                 weights=[0.70, 0.15, 0.15]
@@ -1333,7 +1461,7 @@ class StatisticalPlayResolver(PlayResolver):
             if def_call.scheme in (DefensiveScheme.MAN_PRESS, DefensiveScheme.MAN_OFF):
                 holding_chance = 0.40
 
-            penalty_type = random.choices(
+            penalty_type = self.rng.choices(
                 [PenaltyType.DEFENSIVE_PASS_INTERFERENCE, PenaltyType.HOLDING_DEFENSE,
                  PenaltyType.ROUGHING_THE_PASSER, PenaltyType.FACEMASK],
                 weights=[dpi_chance, holding_chance, 0.15, 0.10]
@@ -1343,15 +1471,15 @@ class StatisticalPlayResolver(PlayResolver):
             yards_to_target = 0
             if penalty_type == PenaltyType.DEFENSIVE_PASS_INTERFERENCE:
                 if pass_type == PassType.SCREEN:
-                    yards_to_target = random.randint(1, 5)
+                    yards_to_target = self.rng.randint(1, 5)
                 elif pass_type == PassType.SHORT:
-                    yards_to_target = random.randint(5, 12)
+                    yards_to_target = self.rng.randint(5, 12)
                 elif pass_type == PassType.MEDIUM:
-                    yards_to_target = random.randint(12, 22)
+                    yards_to_target = self.rng.randint(12, 22)
                 elif pass_type == PassType.DEEP:
-                    yards_to_target = random.randint(20, 40)
+                    yards_to_target = self.rng.randint(20, 40)
                 else:
-                    yards_to_target = random.randint(30, 50)
+                    yards_to_target = self.rng.randint(30, 50)
 
             return (penalty_type, False, yards_to_target)
 
@@ -1365,12 +1493,12 @@ class StatisticalPlayResolver(PlayResolver):
             Tuple of (PenaltyType, is_on_offense) or None
         """
         # Base penalty rate ~4% of run plays (after pre-snap check)
-        if random.random() > 0.04:
+        if self.rng.random() > 0.04:
             return None
 
-        if random.random() < 0.55:
+        if self.rng.random() < 0.55:
             # Offensive penalty - mostly holding
-            penalty_type = random.choices(
+            penalty_type = self.rng.choices(
                 [PenaltyType.HOLDING_OFFENSE, PenaltyType.ILLEGAL_BLOCK_IN_BACK,
                  PenaltyType.ILLEGAL_USE_OF_HANDS],
                 weights=[0.75, 0.15, 0.10]
@@ -1378,7 +1506,7 @@ class StatisticalPlayResolver(PlayResolver):
             return (penalty_type, True)
         else:
             # Defensive penalty
-            penalty_type = random.choices(
+            penalty_type = self.rng.choices(
                 [PenaltyType.HOLDING_DEFENSE, PenaltyType.FACEMASK,
                  PenaltyType.UNNECESSARY_ROUGHNESS],
                 weights=[0.50, 0.30, 0.20]
@@ -1428,7 +1556,7 @@ class StatisticalPlayResolver(PlayResolver):
             defensive_call=def_call,
             outcome=outcome,
             yards_gained=0,  # Actual yards gained is 0, penalty yards handled separately
-            time_elapsed_seconds=random.randint(5, 15),  # Penalty stoppage
+            time_elapsed_seconds=self.rng.randint(5, 15),  # Penalty stoppage
             clock_stopped=True,
             clock_stop_reason="penalty",
             penalty_on_offense=is_on_offense,
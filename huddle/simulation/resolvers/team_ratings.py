@@ -0,0 +1,143 @@
+"""Per-game team rating cache for the statistical resolver.
+
+StatisticalPlayResolver needs the same roster-derived numbers on every
+play: line ratings, the receiver/rusher/coverage groups and the weighted
+distributions used to pick targets, tacklers, sackers and interceptors.
+Rosters don't change during a game except through injuries and
+substitutions, so these are computed once per team when the game is
+created and reused until the engine refreshes them.
+
+Weighted distributions are stored as cumulative arrays so each pick is
+a single random draw plus a binary search.
+"""
+
+import random
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import TYPE_CHECKING, Callable, Generic, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from huddle.core.enums import PassType, PersonnelPackage, RunType
+
+if TYPE_CHECKING:
+    from huddle.core.models.player import Player
+    from huddle.core.models.team import Team
+
+
+T = TypeVar("T")
+
+
+class WeightedChoice(Generic[T]):
+    """Immutable weighted distribution sampled in O(log n)."""
+
+    __slots__ = ("items", "cumulative", "total")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        self.items = list(items)
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rand: Callable[[], float] = random.random) -> Optional[T]:
+        """Draw one item, or None if the distribution is empty."""
+        if not self.items:
+            return None
+        if self.total <= 0:
+            return self.items[int(rand() * len(self.items))]
+        idx = bisect_left(self.cumulative, rand() * self.total)
+        return self.items[min(idx, len(self.items) - 1)]
+
+
+def run_type_bucket(run_type: Optional[RunType]) -> str:
+    """Group run types the way tackler weights are adjusted."""
+    if run_type is None:
+        return "none"
+    if run_type in (RunType.INSIDE, RunType.DRAW):
+        return "interior"
+    return "outside"
+
+
+def pass_type_bucket(pass_type: PassType) -> str:
+    """Group pass types the way target weights are computed."""
+    if pass_type == PassType.DEEP:
+        return "deep"
+    if pass_type == PassType.SCREEN:
+        return "screen"
+    return "standard"
+
+
+@dataclass
+class TeamRatings:
+    """Roster-derived numbers for one team, valid until the roster changes."""
+
+    team_id: UUID
+    oline_rating: int
+    dline_rating: int
+    pass_rushers: list["Player"]
+    coverage_players: list["Player"]
+
+    # Personnel package (None = default slots) -> receivers
+    receivers: dict[Optional[PersonnelPackage], list["Player"]] = field(default_factory=dict)
+    # (personnel, pass type bucket) -> target distribution
+    targets: dict[tuple, WeightedChoice] = field(default_factory=dict)
+    # Run type bucket -> tackler distribution
+    tacklers: dict[str, WeightedChoice] = field(default_factory=dict)
+    sackers: Optional[WeightedChoice] = None
+    interceptors: Optional[WeightedChoice] = None
+
+    def get_receivers(self, personnel: Optional[PersonnelPackage]) -> list["Player"]:
+        return self.receivers.get(personnel, self.receivers.get(None, []))
+
+    def get_targets(
+        self, personnel: Optional[PersonnelPackage], pass_type: PassType
+    ) -> Optional[WeightedChoice]:
+        bucket = pass_type_bucket(pass_type)
+        return self.targets.get((personnel, bucket), self.targets.get((None, bucket)))
+
+
+class TeamRatingCache:
+    """
+    TeamRatings keyed by team ID.
+
+    Entries are built on first use and stay valid until refresh() or
+    invalidate() is called for the team.
+
+    Usage:
+        cache = TeamRatingCache(resolver.build_team_ratings)
+        cache.refresh(home_team)          # at game creation
+        ratings = cache.get(home_team)    # every play
+        cache.refresh(home_team)          # after an injury/substitution
+    """
+
+    def __init__(self, builder: Callable[["Team"], TeamRatings]):
+        self._builder = builder
+        self._entries: dict[UUID, TeamRatings] = {}
+        self.builds = 0
+
+    def get(self, team: "Team") -> TeamRatings:
+        ratings = self._entries.get(team.id)
+        if ratings is None:
+            ratings = self.refresh(team)
+        return ratings
+
+    def refresh(self, team: "Team") -> TeamRatings:
+        """Rebuild a team's ratings from its current roster."""
+        ratings = self._builder(team)
+        self._entries[team.id] = ratings
+        self.builds += 1
+        return ratings
+
+    def invalidate(self, team_id: UUID) -> None:
+        self._entries.pop(team_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, team_id: UUID) -> bool:
+        return team_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
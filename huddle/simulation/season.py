@@ -14,8 +14,8 @@ from typing import Optional, Callable
 from uuid import UUID
 
 from huddle.core.league.league import League, ScheduledGame
-from huddle.core.models.stats import GameLog
 from huddle.core.models.team import Team
+from huddle.core.rng import SeedSequence
 from huddle.simulation.engine import SimulationEngine, SimulationMode
 from huddle.simulation.stats_collector import StatsCollector
 
@@ -97,6 +97,7 @@ class SeasonSimulator:
         self,
         league: League,
         mode: SimulationMode = SimulationMode.FAST,
+        seed_sequence: Optional[SeedSequence] = None,
     ) -> None:
         """
         Initialize season simulator.
@@ -104,8 +105,11 @@ class SeasonSimulator:
         Args:
             league: The League to simulate
             mode: Simulation detail level (FAST or PLAY_BY_PLAY)
+            seed_sequence: When set, each game gets its own stream keyed
+                by week and teams, so results don't depend on game order
         """
         self.league = league
+        self.seed_sequence = seed_sequence
         self.engine = SimulationEngine(mode=mode)
 
         # Callbacks for UI integration
@@ -139,8 +143,15 @@ class SeasonSimulator:
                 f"Teams not found: {scheduled_game.home_team_abbr} vs {scheduled_game.away_team_abbr}"
             )
 
+        rng = None
+        if self.seed_sequence is not None:
+            rng = self.seed_sequence.child(
+                "game", scheduled_game.week,
+                scheduled_game.home_team_abbr, scheduled_game.away_team_abbr,
+            ).rng()
+
         # Create and run game using engine's simulate_game method
-        game_state = self.engine.create_game(home_team, away_team)
+        game_state = self.engine.create_game(home_team, away_team, rng=rng)
         final_state = self.engine.simulate_game(game_state)
 
         # Check for overtime
@@ -160,13 +171,14 @@ class SeasonSimulator:
         scheduled_game.home_score = result.home_score
         scheduled_game.away_score = result.away_score
 
-        # Extract stats from play history and create game log
-        game_log = self._extract_game_log(
-            scheduled_game=scheduled_game,
-            final_state=final_state,
-            home_team=home_team,
-            away_team=away_team,
+        # Box score was accumulated by the engine as the plays happened
+        game_log = self.engine.stats.build_game_log(
+            game_id=scheduled_game.id,
+            week=scheduled_game.week,
+            home_score=final_state.score.home_score,
+            away_score=final_state.score.away_score,
             is_overtime=is_overtime,
+            is_playoff=scheduled_game.is_playoff,
         )
         self.league.add_game_log(game_log)
 
@@ -179,172 +191,6 @@ class SeasonSimulator:
 
         return result
 
-    def _extract_game_log(
-        self,
-        scheduled_game: ScheduledGame,
-        final_state,
-        home_team,
-        away_team,
-        is_overtime: bool,
-    ) -> GameLog:
-        """Extract game log from completed game state."""
-        from huddle.core.models.stats import (
-            GameLog, TeamGameStats, PlayerGameStats,
-            PassingStats, RushingStats, ReceivingStats, DefensiveStats
-        )
-        from huddle.core.enums import PlayOutcome
-
-        # Track player stats
-        player_stats: dict[str, PlayerGameStats] = {}
-
-        def get_player_stats(player_id, team) -> PlayerGameStats:
-            """Get or create player stats entry."""
-            key = str(player_id)
-            if key not in player_stats:
-                player = team.roster.get_player(player_id)
-                if player:
-                    player_stats[key] = PlayerGameStats(
-                        player_id=player_id,
-                        player_name=player.full_name,
-                        team_abbr=team.abbreviation,
-                        position=player.position.value,
-                    )
-            return player_stats.get(key)
-
-        # Calculate team stats from play history
-        home_passing = 0
-        home_rushing = 0
-        away_passing = 0
-        away_rushing = 0
-        home_turnovers = 0
-        away_turnovers = 0
-
-        for play in final_state.play_history:
-            yards = play.yards_gained
-
-            # Track passing plays
-            if play.passer_id:
-                passer_team = home_team if home_team.roster.get_player(play.passer_id) else away_team
-                pstats = get_player_stats(play.passer_id, passer_team)
-                if pstats:
-                    pstats.passing.attempts += 1
-                    if play.outcome == PlayOutcome.COMPLETE:
-                        pstats.passing.completions += 1
-                        pstats.passing.yards += max(0, yards)
-                        if passer_team == home_team:
-                            home_passing += max(0, yards)
-                        else:
-                            away_passing += max(0, yards)
-                        if play.is_touchdown:
-                            pstats.passing.touchdowns += 1
-                    elif play.outcome == PlayOutcome.INTERCEPTION:
-                        pstats.passing.interceptions += 1
-                        if passer_team == home_team:
-                            home_turnovers += 1
-                        else:
-                            away_turnovers += 1
-                    elif play.is_sack:
-                        pstats.passing.sacks += 1
-
-            # Track receiving
-            if play.receiver_id and play.outcome == PlayOutcome.COMPLETE:
-                rec_team = home_team if home_team.roster.get_player(play.receiver_id) else away_team
-                rstats = get_player_stats(play.receiver_id, rec_team)
-                if rstats:
-                    rstats.receiving.receptions += 1
-                    rstats.receiving.yards += max(0, yards)
-                    rstats.receiving.targets += 1
-                    if play.is_touchdown:
-                        rstats.receiving.touchdowns += 1
-
-            # Track rushing plays
-            if play.rusher_id:
-                rusher_team = home_team if home_team.roster.get_player(play.rusher_id) else away_team
-                rush_stats = get_player_stats(play.rusher_id, rusher_team)
-                if rush_stats:
-                    rush_stats.rushing.attempts += 1
-                    rush_stats.rushing.yards += yards
-                    if rusher_team == home_team:
-                        home_rushing += yards
-                    else:
-                        away_rushing += yards
-                    if play.is_touchdown:
-                        rush_stats.rushing.touchdowns += 1
-                    if play.outcome == PlayOutcome.FUMBLE_LOST:
-                        rush_stats.rushing.fumbles_lost += 1
-                        if rusher_team == home_team:
-                            home_turnovers += 1
-                        else:
-                            away_turnovers += 1
-
-            # Track tackles
-            if play.tackler_id:
-                tackler_team = home_team if home_team.roster.get_player(play.tackler_id) else away_team
-                tstats = get_player_stats(play.tackler_id, tackler_team)
-                if tstats:
-                    tstats.defense.tackles += 1
-                    if play.is_sack:
-                        tstats.defense.sacks += 1.0
-
-            # Track interceptions
-            if play.interceptor_id:
-                int_team = home_team if home_team.roster.get_player(play.interceptor_id) else away_team
-                istats = get_player_stats(play.interceptor_id, int_team)
-                if istats:
-                    istats.defense.interceptions += 1
-
-        home_stats = TeamGameStats(
-            team_abbr=home_team.abbreviation,
-            total_yards=home_passing + home_rushing,
-            passing_yards=home_passing,
-            rushing_yards=home_rushing,
-            turnovers=home_turnovers,
-            points=final_state.score.home_score,
-        )
-
-        away_stats = TeamGameStats(
-            team_abbr=away_team.abbreviation,
-            total_yards=away_passing + away_rushing,
-            passing_yards=away_passing,
-            rushing_yards=away_rushing,
-            turnovers=away_turnovers,
-            points=final_state.score.away_score,
-        )
-
-        # Build play log
-        plays = []
-        scoring_plays = []
-        for i, play in enumerate(final_state.play_history):
-            play_dict = {
-                "play_number": i + 1,
-                "description": play.description,
-                "yards": play.yards_gained,
-                "is_scoring": play.points_scored > 0,
-            }
-            plays.append(play_dict)
-
-            if play.points_scored > 0:
-                scoring_plays.append({
-                    **play_dict,
-                    "points": play.points_scored,
-                })
-
-        return GameLog(
-            game_id=scheduled_game.id,
-            week=scheduled_game.week,
-            home_team_abbr=home_team.abbreviation,
-            away_team_abbr=away_team.abbreviation,
-            home_score=final_state.score.home_score,
-            away_score=final_state.score.away_score,
-            is_overtime=is_overtime,
-            is_playoff=scheduled_game.is_playoff,
-            home_stats=home_stats,
-            away_stats=away_stats,
-            player_stats=player_stats,
-            plays=plays,
-            scoring_plays=scoring_plays,
-        )
-
     def simulate_week(self, week: Optional[int] = None) -> WeekResult:
         """
         Simulate all games for a week.
@@ -0,0 +1,283 @@
+"""
+Streaming stats accumulation.
+
+The engine feeds every recorded play to a GameStatsAccumulator as it
+happens, so box scores are ready at the final whistle without keeping
+the game's play history around or walking it a second time. This is
+what lets FAST mode drop play history entirely.
+
+Per-player counters live in flat columns (one array per stat, indexed
+by a slot assigned the first time a player records a stat); the
+PlayerGameStats objects are only built once, in build_game_log().
+
+Usage:
+    stats = GameStatsAccumulator(home_team, away_team)
+    stats.record_play(result)       # called by the engine per play
+    stats.record_drive(drive, True) # or per drive, in FAST mode
+    game_log = stats.build_game_log(game_id, week, 24, 17)
+"""
+
+from array import array
+from typing import Optional
+from uuid import UUID
+
+from huddle.core.enums import PlayOutcome
+from huddle.core.models.play import DriveResult, PlayResult
+from huddle.core.models.stats import (
+    DefensiveStats,
+    GameLog,
+    PassingStats,
+    PlayerGameStats,
+    ReceivingStats,
+    RushingStats,
+    TeamGameStats,
+)
+from huddle.core.models.team import Team
+
+
+HOME = 0
+AWAY = 1
+
+# Integer stat columns
+_COLUMNS = (
+    "pass_attempts", "pass_completions", "pass_yards", "pass_touchdowns",
+    "pass_interceptions", "pass_sacks",
+    "receptions", "receiving_yards", "targets", "receiving_touchdowns",
+    "rush_attempts", "rush_yards", "rush_touchdowns", "fumbles_lost",
+    "tackles", "interceptions",
+)
+
+
+class GameStatsAccumulator:
+    """
+    Builds one game's box score incrementally from play results.
+
+    Only players on either roster are credited, matching how game logs
+    have always been built.
+    """
+
+    def __init__(self, home_team: Team, away_team: Team) -> None:
+        self.home_team = home_team
+        self.away_team = away_team
+
+        # player_id -> (side, player), built once instead of probing rosters per play
+        self._rosters = {
+            player_id: (AWAY, player) for player_id, player in away_team.roster.players.items()
+        }
+        self._rosters.update(
+            (player_id, (HOME, player)) for player_id, player in home_team.roster.players.items()
+        )
+
+        # Flat per-player columns
+        self._slots: dict[UUID, int] = {}
+        self._sides: list[int] = []
+        self._columns = {name: array("q") for name in _COLUMNS}
+        self._def_sacks = array("d")
+
+        # Per-side team totals
+        self.passing_yards = [0, 0]
+        self.rushing_yards = [0, 0]
+        self.turnovers = [0, 0]
+        self.possession_seconds = [0, 0]
+
+        self.plays: list[dict] = []
+        self.scoring_plays: list[dict] = []
+
+    @property
+    def play_count(self) -> int:
+        return len(self.plays)
+
+    def record_play(self, play: PlayResult) -> None:
+        """Fold one play into the box score."""
+        yards = play.yards_gained
+        columns = self._columns
+
+        if play.passer_id:
+            slot = self._slot(play.passer_id)
+            if slot is not None:
+                side = self._sides[slot]
+                columns["pass_attempts"][slot] += 1
+                if play.outcome == PlayOutcome.COMPLETE:
+                    columns["pass_completions"][slot] += 1
+                    columns["pass_yards"][slot] += max(0, yards)
+                    self.passing_yards[side] += max(0, yards)
+                    if play.is_touchdown:
+                        columns["pass_touchdowns"][slot] += 1
+                elif play.outcome == PlayOutcome.INTERCEPTION:
+                    columns["pass_interceptions"][slot] += 1
+                    self.turnovers[side] += 1
+                elif play.is_sack:
+                    columns["pass_sacks"][slot] += 1
+
+        if play.receiver_id and play.outcome == PlayOutcome.COMPLETE:
+            slot = self._slot(play.receiver_id)
+            if slot is not None:
+                columns["receptions"][slot] += 1
+                columns["receiving_yards"][slot] += max(0, yards)
+                columns["targets"][slot] += 1
+                if play.is_touchdown:
+                    columns["receiving_touchdowns"][slot] += 1
+
+        if play.rusher_id:
+            slot = self._slot(play.rusher_id)
+            if slot is not None:
+                side = self._sides[slot]
+                columns["rush_attempts"][slot] += 1
+                columns["rush_yards"][slot] += yards
+                self.rushing_yards[side] += yards
+                if play.is_touchdown:
+                    columns["rush_touchdowns"][slot] += 1
+                if play.outcome == PlayOutcome.FUMBLE_LOST:
+                    columns["fumbles_lost"][slot] += 1
+                    self.turnovers[side] += 1
+
+        if play.tackler_id:
+            slot = self._slot(play.tackler_id)
+            if slot is not None:
+                columns["tackles"][slot] += 1
+                if play.is_sack:
+                    self._def_sacks[slot] += 1.0
+
+        if play.interceptor_id:
+            slot = self._slot(play.interceptor_id)
+            if slot is not None:
+                columns["interceptions"][slot] += 1
+
+        play_dict = {
+            "play_number": len(self.plays) + 1,
+            "description": play.description,
+            "yards": yards,
+            "is_scoring": play.points_scored > 0,
+        }
+        self.plays.append(play_dict)
+        if play.points_scored > 0:
+            self.scoring_plays.append({**play_dict, "points": play.points_scored})
+
+    def record_drive(self, drive: DriveResult, offense_is_home: bool) -> None:
+        """Fold one drive-level result (and its player credits) into the box score."""
+        columns = self._columns
+        for player_id, stat, amount in drive.credits:
+            slot = self._slot(player_id)
+            if slot is None:
+                continue
+            if stat == "sacks":
+                self._def_sacks[slot] += amount
+                continue
+            columns[stat][slot] += int(amount)
+            side = self._sides[slot]
+            if stat == "pass_yards":
+                self.passing_yards[side] += int(amount)
+            elif stat == "rush_yards":
+                self.rushing_yards[side] += int(amount)
+            elif stat in ("pass_interceptions", "fumbles_lost"):
+                self.turnovers[side] += int(amount)
+
+        self.possession_seconds[HOME if offense_is_home else AWAY] += drive.time_elapsed_seconds
+
+        drive_dict = {
+            "play_number": len(self.plays) + 1,
+            "description": drive.display,
+            "yards": drive.total_yards,
+            "is_scoring": drive.points > 0,
+        }
+        self.plays.append(drive_dict)
+        if drive.points > 0:
+            self.scoring_plays.append({**drive_dict, "points": drive.points})
+
+    def _slot(self, player_id: UUID) -> Optional[int]:
+        slot = self._slots.get(player_id)
+        if slot is not None:
+            return slot
+        entry = self._rosters.get(player_id)
+        if entry is None:
+            return None
+
+        slot = len(self._sides)
+        self._slots[player_id] = slot
+        self._sides.append(entry[0])
+        for column in self._columns.values():
+            column.append(0)
+        self._def_sacks.append(0.0)
+        return slot
+
+    # =========================================================================
+    # Output
+    # =========================================================================
+
+    def player_stats(self) -> dict[str, PlayerGameStats]:
+        """Materialize PlayerGameStats for every player credited with a stat."""
+        c = self._columns
+        teams = (self.home_team, self.away_team)
+        result = {}
+        for player_id, i in self._slots.items():
+            side, player = self._rosters[player_id]
+            result[str(player_id)] = PlayerGameStats(
+                player_id=player_id,
+                player_name=player.full_name,
+                team_abbr=teams[side].abbreviation,
+                position=player.position.value,
+                passing=PassingStats(
+                    attempts=c["pass_attempts"][i],
+                    completions=c["pass_completions"][i],
+                    yards=c["pass_yards"][i],
+                    touchdowns=c["pass_touchdowns"][i],
+                    interceptions=c["pass_interceptions"][i],
+                    sacks=c["pass_sacks"][i],
+                ),
+                rushing=RushingStats(
+                    attempts=c["rush_attempts"][i],
+                    yards=c["rush_yards"][i],
+                    touchdowns=c["rush_touchdowns"][i],
+                    fumbles_lost=c["fumbles_lost"][i],
+                ),
+                receiving=ReceivingStats(
+                    targets=c["targets"][i],
+                    receptions=c["receptions"][i],
+                    yards=c["receiving_yards"][i],
+                    touchdowns=c["receiving_touchdowns"][i],
+                ),
+                defense=DefensiveStats(
+                    tackles=c["tackles"][i],
+                    sacks=self._def_sacks[i],
+                    interceptions=c["interceptions"][i],
+                ),
+            )
+        return result
+
+    def team_stats(self, side: int, points: int) -> TeamGameStats:
+        team = self.home_team if side == HOME else self.away_team
+        return TeamGameStats(
+            team_abbr=team.abbreviation,
+            total_yards=self.passing_yards[side] + self.rushing_yards[side],
+            passing_yards=self.passing_yards[side],
+            rushing_yards=self.rushing_yards[side],
+            turnovers=self.turnovers[side],
+            time_of_possession_seconds=self.possession_seconds[side],
+            points=points,
+        )
+
+    def build_game_log(
+        self,
+        game_id: UUID,
+        week: int,
+        home_score: int,
+        away_score: int,
+        is_overtime: bool = False,
+        is_playoff: bool = False,
+    ) -> GameLog:
+        """Build the finished game's GameLog."""
+        return GameLog(
+            game_id=game_id,
+            week=week,
+            home_team_abbr=self.home_team.abbreviation,
+            away_team_abbr=self.away_team.abbreviation,
+            home_score=home_score,
+            away_score=away_score,
+            is_overtime=is_overtime,
+            is_playoff=is_playoff,
+            home_stats=self.team_stats(HOME, home_score),
+            away_stats=self.team_stats(AWAY, away_score),
+            player_stats=self.player_stats(),
+            plays=self.plays,
+            scoring_plays=self.scoring_plays,
+        )
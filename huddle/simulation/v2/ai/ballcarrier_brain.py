@@ -24,9 +24,10 @@ from typing import List, Optional, Tuple
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import BallcarrierContextBase
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import get_trace_system, TraceCategory, TraceMessage
 from .shared.perception import calculate_effective_vision, angle_between as shared_angle_between
 
 
@@ -34,10 +35,12 @@ from .shared.perception import calculate_effective_vision, angle_between as shar
 # Trace Helper
 # =============================================================================
 
-def _trace(world: WorldState, msg: str, category: TraceCategory = TraceCategory.DECISION):
+def _trace(world: WorldState, msg: TraceMessage, *args,
+           category: TraceCategory = TraceCategory.DECISION):
     """Add a trace for this ballcarrier."""
     trace = get_trace_system()
-    trace.trace(world.me.id, world.me.name, category, msg)
+    if trace.enabled:
+        trace.trace(world.me.id, world.me.name, category, msg, *args)
 
 
 # =============================================================================
@@ -68,7 +71,7 @@ class MoveType(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BallcarrierState:
     """Tracked state for ballcarrier decision-making."""
     yards_gained: float = 0.0
@@ -89,18 +92,16 @@ class BallcarrierState:
             self.moves_used = []
 
 
-# Module-level state
-_bc_states: dict[str, BallcarrierState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "ballcarrier"
 
 
-def _get_state(player_id: str) -> BallcarrierState:
-    if player_id not in _bc_states:
-        _bc_states[player_id] = BallcarrierState()
-    return _bc_states[player_id]
+def _get_state(store: BrainStateStore, player_id: str) -> BallcarrierState:
+    return store.get(_STATE_KEY, player_id, BallcarrierState)
 
 
-def _reset_state(player_id: str) -> None:
-    _bc_states[player_id] = BallcarrierState()
+def _reset_state(store: BrainStateStore, player_id: str) -> BallcarrierState:
+    return store.reset_player(_STATE_KEY, player_id, BallcarrierState)
 
 
 # =============================================================================
@@ -777,10 +778,11 @@ def ballcarrier_brain(world: BallcarrierContextBase) -> BrainDecision:
         BrainDecision with action and reasoning
     """
     # Reset state at start of new play (matches pattern in other brains)
+    store = store_for(world)
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
+        _reset_state(store, world.me.id)
 
-    state = _get_state(world.me.id)
+    state = _get_state(store, world.me.id)
 
     # Verify we have the ball
     if not world.me.has_ball:
@@ -22,9 +22,10 @@ from typing import Optional, Tuple
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import DBContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import get_trace_system, TraceCategory, TraceMessage
 from ..core.variance import recognition_delay as apply_recognition_variance
 from ..core.reads import (
     BrainType,
@@ -38,10 +39,12 @@ from ..core.read_registry import get_read_registry
 # Trace Helper
 # =============================================================================
 
-def _trace(world: WorldState, msg: str, category: TraceCategory = TraceCategory.DECISION):
+def _trace(world: WorldState, msg: TraceMessage, *args,
+           category: TraceCategory = TraceCategory.DECISION):
     """Add a trace for this DB."""
     trace = get_trace_system()
-    trace.trace(world.me.id, world.me.name, category, msg)
+    if trace.enabled:
+        trace.trace(world.me.id, world.me.name, category, msg, *args)
 
 
 # =============================================================================
@@ -90,7 +93,7 @@ class ZoneType(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DBState:
     """Tracked state for DB decision-making."""
     phase: DBPhase = DBPhase.PRE_SNAP
@@ -118,17 +121,16 @@ class DBState:
     has_reacted_to_zone_threat: bool = False
 
 
-_db_states: dict[str, DBState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "db"
 
 
-def _get_state(player_id: str) -> DBState:
-    if player_id not in _db_states:
-        _db_states[player_id] = DBState()
-    return _db_states[player_id]
+def _get_state(store: BrainStateStore, player_id: str) -> DBState:
+    return store.get(_STATE_KEY, player_id, DBState)
 
 
-def _reset_state(player_id: str) -> None:
-    _db_states[player_id] = DBState()
+def _reset_state(store: BrainStateStore, player_id: str) -> DBState:
+    return store.reset_player(_STATE_KEY, player_id, DBState)
 
 
 # =============================================================================
@@ -509,19 +511,19 @@ def _apply_route_anticipation_read(
             if release_dir == "inside" and trigger_val == "inside_release":
                 primary = read.get_primary_outcome()
                 if primary:
-                    _trace(world, f"[READ] {read.name}: {primary.reasoning}")
+                    _trace(world, "[READ] %s: %s", read.name, primary.reasoning)
                     return (primary.adjustment or "wall_inside", primary.reasoning)
 
             elif release_dir == "outside" and trigger_val == "outside_release":
                 primary = read.get_primary_outcome()
                 if primary:
-                    _trace(world, f"[READ] {read.name}: {primary.reasoning}")
+                    _trace(world, "[READ] %s: %s", read.name, primary.reasoning)
                     return (primary.adjustment or "leverage_outside", primary.reasoning)
 
             elif release_dir == "vertical" and trigger_val == "vertical_stem":
                 primary = read.get_primary_outcome()
                 if primary:
-                    _trace(world, f"[READ] {read.name}: {primary.reasoning}")
+                    _trace(world, "[READ] %s: %s", read.name, primary.reasoning)
                     return (primary.adjustment or "trail_deep", primary.reasoning)
 
     return None
@@ -687,12 +689,12 @@ def db_brain(world: DBContext) -> BrainDecision:
     Returns:
         BrainDecision with action and reasoning
     """
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
 
         # Set initial coverage based on position
         if world.me.position == Position.CB:
@@ -707,7 +709,9 @@ def db_brain(world: DBContext) -> BrainDecision:
         state.receiver_id = receiver.id
         state.separation = _calculate_coverage_separation(world.me.pos, receiver)
         state.in_phase = _am_in_phase(world, receiver)
-        _trace(world, f"Coverage: {state.coverage_type.value}, sep={state.separation:.1f}yd, {'in-phase' if state.in_phase else 'trailing'}", TraceCategory.PERCEPTION)
+        _trace(world, "Coverage: %s, sep=%.1fyd, %s",
+               state.coverage_type.value, state.separation,
+               'in-phase' if state.in_phase else 'trailing', category=TraceCategory.PERCEPTION)
 
     # =========================================================================
     # Ball In Air - React (with cognitive delay)
@@ -742,12 +746,12 @@ def db_brain(world: DBContext) -> BrainDecision:
         # DB has reacted - now track the ball
         state.phase = DBPhase.BALL_TRACKING
         my_dist = world.me.pos.distance_to(target)
-        _trace(world, f"Ball tracking: {my_dist:.1f}yd to target", TraceCategory.PERCEPTION)
+        _trace(world, "Ball tracking: %.1fyd to target", my_dist, category=TraceCategory.PERCEPTION)
 
         # Is this coming to my receiver?
         if receiver and world.ball.intended_receiver_id == receiver.id:
             reaction, reasoning = _decide_ball_reaction(world, receiver, target)
-            _trace(world, f"Ball reaction: {reaction.value} - {reasoning}")
+            _trace(world, "Ball reaction: %s - %s", reaction.value, reasoning)
 
             if reaction == BallReaction.PLAY_BALL:
                 return BrainDecision(
@@ -787,7 +791,7 @@ def db_brain(world: DBContext) -> BrainDecision:
     # =========================================================================
     if _detect_run(world):
         state.phase = DBPhase.RUN_SUPPORT
-        _trace(world, "Run detected - preventing yards", TraceCategory.PERCEPTION)
+        _trace(world, "Run detected - preventing yards", category=TraceCategory.PERCEPTION)
 
         ballcarrier = _find_ballcarrier(world)
         if ballcarrier:
@@ -961,7 +965,7 @@ def db_brain(world: DBContext) -> BrainDecision:
 
             if state.recognition_timer >= state.break_recognition_delay:
                 state.has_recognized_break = True
-                _trace(world, f"Break recognized after {state.recognition_timer:.2f}s delay")
+                _trace(world, "Break recognized after %.2fs delay", state.recognition_timer)
 
         # Position to PREVENT the completion
         # Check for sideline leverage advantage
@@ -22,9 +22,10 @@ from typing import Optional, List
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import DLContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import get_trace_system, TraceCategory, TraceMessage
 from ..core.variance import pursuit_angle_accuracy
 
 
@@ -32,10 +33,12 @@ from ..core.variance import pursuit_angle_accuracy
 # Trace Helper
 # =============================================================================
 
-def _trace(world: WorldState, msg: str, category: TraceCategory = TraceCategory.DECISION):
+def _trace(world: WorldState, msg: TraceMessage, *args,
+           category: TraceCategory = TraceCategory.DECISION):
     """Add a trace for this DL."""
     trace = get_trace_system()
-    trace.trace(world.me.id, world.me.name, category, msg)
+    if trace.enabled:
+        trace.trace(world.me.id, world.me.name, category, msg, *args)
 
 
 # =============================================================================
@@ -80,7 +83,7 @@ class StuntRole(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DLState:
     """Tracked state for DL decision-making."""
     phase: DLPhase = DLPhase.PRE_SNAP
@@ -97,17 +100,16 @@ class DLState:
     stunt_role: Optional[StuntRole] = None
 
 
-_dl_states: dict[str, DLState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "dl"
 
 
-def _get_state(player_id: str) -> DLState:
-    if player_id not in _dl_states:
-        _dl_states[player_id] = DLState()
-    return _dl_states[player_id]
+def _get_state(store: BrainStateStore, player_id: str) -> DLState:
+    return store.get(_STATE_KEY, player_id, DLState)
 
 
-def _reset_state(player_id: str) -> None:
-    _dl_states[player_id] = DLState()
+def _reset_state(store: BrainStateStore, player_id: str) -> DLState:
+    return store.reset_player(_STATE_KEY, player_id, DLState)
 
 
 # =============================================================================
@@ -433,12 +435,12 @@ def dl_brain(world: DLContext) -> BrainDecision:
     Returns:
         BrainDecision with action and reasoning
     """
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
 
         # Set gap technique and assignment based on position
         if world.me.position == Position.NT:
@@ -24,9 +24,10 @@ from typing import List, Optional, Tuple
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import LBContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import get_trace_system, TraceCategory, TraceMessage
 from ..core.variance import pursuit_angle_accuracy
 from ..core.reads import (
     BrainType,
@@ -40,10 +41,12 @@ from ..core.read_registry import get_read_registry
 # Trace Helper
 # =============================================================================
 
-def _trace(world: WorldState, msg: str, category: TraceCategory = TraceCategory.DECISION):
+def _trace(world: WorldState, msg: TraceMessage, *args,
+           category: TraceCategory = TraceCategory.DECISION):
     """Add a trace for this LB."""
     trace = get_trace_system()
-    trace.trace(world.me.id, world.me.name, category, msg)
+    if trace.enabled:
+        trace.trace(world.me.id, world.me.name, category, msg, *args)
 
 
 # =============================================================================
@@ -94,7 +97,7 @@ class CoverageType(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LBState:
     """Tracked state for LB decision-making."""
     phase: LBPhase = LBPhase.PRE_SNAP
@@ -117,17 +120,16 @@ class LBState:
     throw_reaction_delay: float = 0.0
 
 
-_lb_states: dict[str, LBState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "lb"
 
 
-def _get_state(player_id: str) -> LBState:
-    if player_id not in _lb_states:
-        _lb_states[player_id] = LBState()
-    return _lb_states[player_id]
+def _get_state(store: BrainStateStore, player_id: str) -> LBState:
+    return store.get(_STATE_KEY, player_id, LBState)
 
 
-def _reset_state(player_id: str) -> None:
-    _lb_states[player_id] = LBState()
+def _reset_state(store: BrainStateStore, player_id: str) -> LBState:
+    return store.reset_player(_STATE_KEY, player_id, LBState)
 
 
 # =============================================================================
@@ -695,21 +697,21 @@ def _apply_run_fit_read(
             if scheme == "zone" and trigger_val == "zone_block":
                 primary = read.get_primary_outcome()
                 if primary:
-                    _trace(world, f"[READ] {read.name}: {primary.reasoning}")
+                    _trace(world, "[READ] %s: %s", read.name, primary.reasoning)
                     return (primary.adjustment or "fast_flow", primary.reasoning)
 
             # Match gap/power blocking reads
             elif scheme == "gap" and trigger_val == "gap_block":
                 primary = read.get_primary_outcome()
                 if primary:
-                    _trace(world, f"[READ] {read.name}: {primary.reasoning}")
+                    _trace(world, "[READ] %s: %s", read.name, primary.reasoning)
                     return (primary.adjustment or "attack_downhill", primary.reasoning)
 
             # Match pull reads (power/counter)
             elif scheme == "pull" and trigger_val == "guard_pull":
                 primary = read.get_primary_outcome()
                 if primary:
-                    _trace(world, f"[READ] {read.name}: {primary.reasoning}")
+                    _trace(world, "[READ] %s: %s", read.name, primary.reasoning)
                     return (primary.adjustment or "attack_downhill", primary.reasoning)
 
     return None
@@ -752,12 +754,12 @@ def lb_brain(world: LBContext) -> BrainDecision:
     Returns:
         BrainDecision optimizing for tackles, INTs, PBUs, TFLs
     """
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
         state.gap_assignment = _find_my_gap(world)
         state.coverage_assignment = CoverageType.HOOK  # Default
 
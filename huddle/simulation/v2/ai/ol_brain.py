@@ -22,19 +22,22 @@ from typing import Optional
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import OLContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import get_trace_system, TraceCategory, TraceMessage
 
 
 # =============================================================================
 # Trace Helper
 # =============================================================================
 
-def _trace(world: WorldState, msg: str, category: TraceCategory = TraceCategory.DECISION):
+def _trace(world: WorldState, msg: TraceMessage, *args,
+           category: TraceCategory = TraceCategory.DECISION):
     """Add a trace for this OL."""
     trace = get_trace_system()
-    trace.trace(world.me.id, world.me.name, category, msg)
+    if trace.enabled:
+        trace.trace(world.me.id, world.me.name, category, msg, *args)
 
 
 # =============================================================================
@@ -78,7 +81,7 @@ class BlockCounter(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OLState:
     """Tracked state for OL decision-making."""
     phase: OLPhase = OLPhase.PRE_SNAP
@@ -108,30 +111,27 @@ class ProtectionCall:
     slide_direction: str = "none"      # "left", "right", or "none"
 
 
-# Module-level state
-_ol_states: dict[str, OLState] = {}
-_protection_call: Optional[ProtectionCall] = None  # Shared by all OL
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "ol"
+_PROTECTION_CALL_KEY = "ol.protection_call"  # Shared by all OL
 
 
-def _get_state(player_id: str) -> OLState:
-    if player_id not in _ol_states:
-        _ol_states[player_id] = OLState()
-    return _ol_states[player_id]
+def _get_state(store: BrainStateStore, player_id: str) -> OLState:
+    return store.get(_STATE_KEY, player_id, OLState)
 
 
-def _reset_state(player_id: str) -> None:
-    _ol_states[player_id] = OLState()
+def _reset_state(store: BrainStateStore, player_id: str) -> OLState:
+    return store.reset_player(_STATE_KEY, player_id, OLState)
 
 
-def _reset_protection_call() -> None:
+def _reset_protection_call(store: BrainStateStore) -> None:
     """Reset protection call at start of play."""
-    global _protection_call
-    _protection_call = None
+    store.set_shared(_PROTECTION_CALL_KEY, None)
 
 
-def _get_protection_call() -> Optional[ProtectionCall]:
+def _get_protection_call(store: BrainStateStore) -> Optional[ProtectionCall]:
     """Get current protection call."""
-    return _protection_call
+    return store.get_shared(_PROTECTION_CALL_KEY)
 
 
 # =============================================================================
@@ -832,28 +832,28 @@ def ol_brain(world: OLContext) -> BrainDecision:
     Returns:
         BrainDecision with action and reasoning
     """
-    global _protection_call
-
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        _reset_protection_call()
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
+        _reset_protection_call(store)
+    protection_call = _get_protection_call(store)
 
     # =========================================================================
     # MIKE Identification (Center makes call for all OL)
     # =========================================================================
     just_made_call = False
-    if _should_center_make_call(world) and _protection_call is None:
-        _protection_call = _identify_mike(world)
+    if _should_center_make_call(world) and protection_call is None:
+        protection_call = _identify_mike(world)
+        store.set_shared(_PROTECTION_CALL_KEY, protection_call)
         just_made_call = True
 
     # Build protection call string to return to orchestrator
     protection_call_str = None
-    if just_made_call and _protection_call and _protection_call.slide_direction != "none":
-        protection_call_str = f"slide_{_protection_call.slide_direction}"
+    if just_made_call and protection_call and protection_call.slide_direction != "none":
+        protection_call_str = f"slide_{protection_call.slide_direction}"
 
     # Find our assignment (use protection call if available)
     rusher = _find_rusher(world)
@@ -880,8 +880,8 @@ def ol_brain(world: OLContext) -> BrainDecision:
 
             # Include MIKE call in reasoning if we're Center
             mike_info = ""
-            if _protection_call and _should_center_make_call(world):
-                mike_info = f" [MIKE: {_protection_call.front_type}, blitz: {_protection_call.blitz_threat}]"
+            if protection_call and _should_center_make_call(world):
+                mike_info = f" [MIKE: {protection_call.front_type}, blitz: {protection_call.blitz_threat}]"
 
             return BrainDecision(
                 move_target=set_pos,
@@ -965,10 +965,10 @@ def ol_brain(world: OLContext) -> BrainDecision:
             )
 
         # No direct threat - look for blitzing LB (use MIKE call)
-        if _protection_call and _protection_call.mike_id:
+        if protection_call and protection_call.mike_id:
             mike = None
             for opp in world.opponents:
-                if opp.id == _protection_call.mike_id:
+                if opp.id == protection_call.mike_id:
                     mike = opp
                     break
 
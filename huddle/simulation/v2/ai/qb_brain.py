@@ -22,15 +22,18 @@ Lifecycle: PRE_SNAP → SNAP → DROPBACK → POCKET → THROW/SCRAMBLE/SACK
 from __future__ import annotations
 
 import random
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Tuple
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import QBContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import TraceCategory, TraceMessage, get_trace_system
+from ..systems.separation import SeparationTable
 from .shared.perception import calculate_effective_vision, angle_between, VisionParams
 from ..core.variance import (
     decision_hesitation,
@@ -129,7 +132,7 @@ class ReceiverEval:
     settle_point: Optional[Vec2] = None  # Where settling routes stop
 
 
-@dataclass
+@dataclass(slots=True)
 class QBState:
     """Tracked state for QB decision-making."""
     dropback_complete: bool = False
@@ -146,31 +149,27 @@ class QBState:
     time_per_read: float = 0.0  # 0 = not yet calculated
 
 
-# Module-level state tracking (per player)
-_qb_states: dict[str, QBState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "qb"
 
 
-def _get_state(player_id: str) -> QBState:
+def _get_state(store: BrainStateStore, player_id: str) -> QBState:
     """Get or create state for a QB."""
-    if player_id not in _qb_states:
-        _qb_states[player_id] = QBState()
-    return _qb_states[player_id]
+    return store.get(_STATE_KEY, player_id, QBState)
 
 
-def _reset_state(player_id: str) -> None:
+def _reset_state(store: BrainStateStore, player_id: str) -> QBState:
     """Reset state for a new play."""
-    _qb_states[player_id] = QBState()
+    return store.reset_player(_STATE_KEY, player_id, QBState)
 
 
 # =============================================================================
 # Debug Trace System (uses centralized TraceSystem)
 # =============================================================================
 
-# Module-level reference for backward compatibility
-_trace_enabled: bool = False
-_trace_buffer: list[str] = []
-_current_qb_id: str = ""
-_current_qb_name: str = ""
+# QB currently being traced. Thread-local so plays running in parallel
+# threads attribute trace messages to their own QB.
+_trace_context = threading.local()
 
 
 def enable_trace(enabled: bool = True):
@@ -182,46 +181,60 @@ def enable_trace(enabled: bool = True):
     Args:
         enabled: Whether to enable tracing (default True)
     """
-    global _trace_enabled, _trace_buffer
-    _trace_enabled = enabled
-    if enabled:
-        _trace_buffer = []  # Clear on enable
-    # Also enable centralized trace system
     get_trace_system().enable(enabled)
 
 
-def get_trace() -> list[str]:
-    """Get a copy of the current trace buffer.
+def get_trace(player_id: Optional[str] = None) -> list[str]:
+    """Get a QB's trace messages since tracing was enabled.
 
-    DEPRECATED: Use get_trace_system().get_entries() instead.
-    This function is kept for backward compatibility.
+    DEPRECATED: Use get_trace_system().get_entries_for_player() instead.
+    This function is kept for backward compatibility. Messages come from
+    the centralized TraceSystem, so they are bounded by its per-player
+    ring buffer.
+
+    Args:
+        player_id: QB to get messages for (defaults to the QB last traced
+            in this thread)
 
     Returns:
         List of trace messages in order
     """
-    return _trace_buffer.copy()
+    if player_id is None:
+        player_id = getattr(_trace_context, "qb_id", None)
+        if player_id is None:
+            return []
+    return [entry.message for entry in get_trace_system().get_entries_for_player(player_id)]
 
 
 def _set_trace_context(player_id: str, player_name: str):
     """Set the current QB context for tracing."""
-    global _current_qb_id, _current_qb_name
-    _current_qb_id = player_id
-    _current_qb_name = player_name
+    _trace_context.qb_id = player_id
+    _trace_context.qb_name = player_name
+
+
+def _tracing() -> bool:
+    """Whether trace messages are collected (guard for trace-only work)."""
+    return get_trace_system().enabled
 
 
-def _trace(msg: str, category: TraceCategory = TraceCategory.DECISION):
-    """Add a trace message to both local buffer and centralized system.
+def _trace(msg: TraceMessage, *args, category: TraceCategory = TraceCategory.DECISION):
+    """Add a trace message to the centralized trace system.
 
     Args:
-        msg: Message to add to trace
+        msg: Message to add to trace, %-formatted with args (or a callable
+            returning it). Only rendered when tracing is enabled.
         category: Type of trace (perception, decision, action)
     """
-    global _trace_buffer
-    if _trace_enabled:
-        _trace_buffer.append(msg)
-    # Always send to centralized system (it checks if enabled internally)
     trace = get_trace_system()
-    trace.trace(_current_qb_id, _current_qb_name, category, msg)
+    if not trace.enabled:
+        return
+    trace.trace(
+        getattr(_trace_context, "qb_id", ""),
+        getattr(_trace_context, "qb_name", ""),
+        category,
+        msg,
+        *args,
+    )
 
 
 # =============================================================================
@@ -503,20 +516,31 @@ def _evaluate_receivers(world: WorldState, pressure: PressureLevel = None) -> Li
     qb_facing = _get_qb_facing(world)
     qb_pos = world.me.pos
 
-    _trace(f"[VISION SETUP] t={world.time_since_snap:.2f}s, facing=({qb_facing.x:.2f}, {qb_facing.y:.2f})")
+    tracing = _tracing()
+    _trace("[VISION SETUP] t=%.2fs, facing=(%.2f, %.2f)",
+           world.time_since_snap, qb_facing.x, qb_facing.y)
+
+    throw_power = getattr(world.me.attributes, 'throw_power', 80)
 
     # Get position labels for tracing (e.g., "WR", "TE1")
     position_counts = {}
 
-    for teammate in world.teammates:
-        # Only evaluate receivers
-        if teammate.position not in (Position.WR, Position.TE, Position.RB):
-            continue
+    receiving_positions = (Position.WR, Position.TE, Position.RB)
+    receivers = [t for t in world.teammates if t.position in receiving_positions]
+
+    # Orchestrator builds one table per tick; build our own when called directly
+    table = getattr(world, 'separation_table', None)
+    if table is None or any(r.id not in table for r in receivers):
+        table = SeparationTable(receivers, world.opponents, tick=world.tick)
+
+    for teammate in receivers:
 
         # Generate position label for tracing
-        pos_name = teammate.position.name
-        position_counts[pos_name] = position_counts.get(pos_name, 0) + 1
-        label = f"{pos_name}{position_counts[pos_name]}" if position_counts[pos_name] > 1 else pos_name
+        if tracing:
+            pos_name = teammate.position.name
+            position_counts[pos_name] = position_counts.get(pos_name, 0) + 1
+            count = position_counts[pos_name]
+            label = f"{pos_name}{count}" if count > 1 else pos_name
 
         to_receiver = teammate.pos - qb_pos
         distance = to_receiver.length()
@@ -526,29 +550,15 @@ def _evaluate_receivers(world: WorldState, pressure: PressureLevel = None) -> Li
         # Decision is based on projected separation at ball arrival
         detection_quality = 1.0
 
-        # Find nearest defender
-        nearest_def = None
-        nearest_dist = float('inf')
-        closing_speed = 0.0
-
-        for opp in world.opponents:
-            dist = teammate.pos.distance_to(opp.pos)
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_def = opp
-
-                # Calculate closing speed
-                if opp.velocity.length() > 0:
-                    to_receiver = (teammate.pos - opp.pos).normalized()
-                    closing_speed = opp.velocity.dot(to_receiver)
+        # Nearest defender and closing speed from the shared separation table
+        entry = table.nearest(teammate.id)
+        closing_speed = entry.closing_speed if entry else 0.0
 
         # PROJECT SEPARATION TO BALL ARRIVAL TIME
         # This is the key insight: "open now" doesn't mean "open when ball arrives"
-        qb_pos = world.me.pos
         throw_distance = qb_pos.distance_to(teammate.pos)
 
         # Estimate ball flight time (based on throw power ~60-80 fps)
-        throw_power = getattr(world.me.attributes, 'throw_power', 80)
         ball_speed = 50 + (throw_power - 50) * 0.76  # 50-88 fps range
         # Shorter passes thrown softer
         if throw_distance < 10:
@@ -558,26 +568,14 @@ def _evaluate_receivers(world: WorldState, pressure: PressureLevel = None) -> Li
         flight_time = throw_distance / ball_speed
         flight_time = min(flight_time, 0.8)  # Cap at 0.8s
 
-        # Project receiver position at ball arrival
-        receiver_at_arrival = Vec2(
-            teammate.pos.x + teammate.velocity.x * flight_time,
-            teammate.pos.y + teammate.velocity.y * flight_time
-        )
-
-        # Project defender position at ball arrival
+        # Separation AT BALL ARRIVAL (not current separation)
         defender_trailing = False
-        if nearest_def:
-            defender_at_arrival = Vec2(
-                nearest_def.pos.x + nearest_def.velocity.x * flight_time,
-                nearest_def.pos.y + nearest_def.velocity.y * flight_time
-            )
-
-            # Separation AT BALL ARRIVAL (not current separation)
-            projected_sep = receiver_at_arrival.distance_to(defender_at_arrival)
+        if entry:
+            projected_sep = table.projected_separation(teammate.id, flight_time)
 
             # Check if defender is trailing (behind receiver relative to QB)
             receiver_to_qb = (qb_pos - teammate.pos).normalized()
-            def_to_receiver = (teammate.pos - nearest_def.pos).normalized()
+            def_to_receiver = (teammate.pos - entry.defender_pos).normalized()
             if receiver_to_qb.dot(def_to_receiver) > 0.5:
                 defender_trailing = True
                 projected_sep += 0.5  # Trailing defender = slightly easier catch
@@ -612,8 +610,10 @@ def _evaluate_receivers(world: WorldState, pressure: PressureLevel = None) -> Li
         is_hot = bool(world.hot_routes and teammate.id in world.hot_routes)
 
         # Trace receiver evaluation
-        hot_tag = " HOT" if is_hot else ""
-        _trace(f"[EVAL] R{read_order} {label}: {status.value} (proj_sep={effective_sep:.1f}yd{hot_tag})")
+        if tracing:
+            hot_tag = " HOT" if is_hot else ""
+            _trace("[EVAL] R%s %s: %s (proj_sep=%.1fyd%s)",
+                   read_order, label, status.value, effective_sep, hot_tag)
 
         evaluations.append(ReceiverEval(
             player_id=teammate.id,
@@ -621,8 +621,9 @@ def _evaluate_receivers(world: WorldState, pressure: PressureLevel = None) -> Li
             velocity=teammate.velocity,  # For throw lead calculation
             separation=effective_sep,
             status=status,
-            nearest_defender_id=nearest_def.id if nearest_def else "",
-            nearest_defender_pos=nearest_def.pos if nearest_def else None,  # For far-shoulder placement
+            nearest_defender_id=entry.defender_id if entry else "",
+            # For far-shoulder placement
+            nearest_defender_pos=entry.defender_pos if entry else None,
             defender_closing_speed=closing_speed,
             route_phase=route_phase,
             is_hot=is_hot,
@@ -750,10 +751,11 @@ def _find_best_receiver(
             break
 
     if current_eval:
-        _trace(f"[READ] Read {current_read} ({current_eval.player_id}): {current_eval.status.value}")
+        _trace("[READ] Read %s (%s): %s",
+               current_read, current_eval.player_id, current_eval.status.value)
         # Check if currently open
         if current_eval.status in (ReceiverStatus.OPEN, ReceiverStatus.WINDOW):
-            _trace(f"[READ] -> THROW to read {current_read}")
+            _trace("[READ] -> THROW to read %s", current_read)
             return current_eval, False, f"read {current_read} open"
 
         # Check for anticipation throw
@@ -761,19 +763,19 @@ def _find_best_receiver(
             accuracy, current_eval, pressure, time_in_pocket, anticipation
         )
         if can_anticipate:
-            _trace(f"[READ] -> ANTICIPATION to read {current_read}")
+            _trace("[READ] -> ANTICIPATION to read %s", current_read)
             return current_eval, True, f"anticipation: {anticipate_reason}"
-        _trace(f"[READ] Read {current_read}: covered, checking next")
+        _trace("[READ] Read %s: covered, checking next", current_read)
     else:
-        _trace(f"[READ] Read {current_read}: NOT VISIBLE - skip")
+        _trace("[READ] Read %s: NOT VISIBLE - skip", current_read)
 
     # If current read is covered, progress to next reads IN ORDER
     # Don't skip to any random open receiver - respect the progression
     for eval in evaluations:
         if eval.read_order > current_read:
-            _trace(f"[READ] Read {eval.read_order} ({eval.player_id}): {eval.status.value}")
+            _trace("[READ] Read %s (%s): %s", eval.read_order, eval.player_id, eval.status.value)
             if eval.status in (ReceiverStatus.OPEN, ReceiverStatus.WINDOW):
-                _trace(f"[READ] -> THROW to read {eval.read_order}")
+                _trace("[READ] -> THROW to read %s", eval.read_order)
                 return eval, False, f"progressed to read {eval.read_order}"
             # Check anticipation on next reads too
             can_anticipate, anticipate_reason = _can_throw_anticipation(
@@ -836,7 +838,7 @@ def _select_target_with_reads(
     )
 
     if not reads:
-        _trace(f"[READ] No reads for concept={play_concept}, coverage={detected_coverage}")
+        _trace("[READ] No reads for concept=%s, coverage=%s", play_concept, detected_coverage)
         return None, "no applicable reads"
 
     # Get the read evaluator
@@ -896,7 +898,7 @@ def _select_target_with_reads(
 
                 if matched:
                     reasoning = f"READ: {result.reasoning}"
-                    _trace(f"[READ] Target={evaluation.player_id}, {reasoning}")
+                    _trace("[READ] Target=%s, %s", evaluation.player_id, reasoning)
 
                     # Verify target is reasonably open
                     if evaluation.status in (ReceiverStatus.COVERED,):
@@ -905,13 +907,13 @@ def _select_target_with_reads(
                         if result.outcome.adjustment == "anticipation":
                             return evaluation, reasoning
                         # Otherwise, note the read but let fallback handle it
-                        _trace(f"[READ] Target covered, deferring to fallback")
+                        _trace("[READ] Target covered, deferring to fallback")
                         continue
 
                     return evaluation, reasoning
 
             # Couldn't find matching receiver
-            _trace(f"[READ] Outcome target '{target_pos}' not found in evaluations")
+            _trace("[READ] Outcome target '%s' not found in evaluations", target_pos)
 
     return None, "no read triggered"
 
@@ -1170,14 +1172,14 @@ def _calculate_throw_lead(
     receiver_speed = receiver.velocity.length()
 
     # Trace throw lead calculation for debugging
-    _trace(f"[THROW_LEAD] pre_break={receiver.pre_break}, route_phase={receiver.route_phase}, "
-           f"break_point={receiver.break_point}, route_dir={receiver.route_direction}")
+    _trace("[THROW_LEAD] pre_break=%s, route_phase=%s, break_point=%s, route_dir=%s",
+           receiver.pre_break, receiver.route_phase, receiver.break_point, receiver.route_direction)
 
     # Use pre_break as source of truth (waypoint-based, accurate)
     # Don't require route_phase match - it's time-based and can lag behind
     if not receiver.pre_break:
         # Receiver has already broken - trust their current movement
-        _trace(f"[THROW_LEAD] Post-break receiver - using actual velocity")
+        _trace("[THROW_LEAD] Post-break receiver - using actual velocity")
         if receiver_speed < 1.0:
             # Barely moving post-break = settling route (hitch, curl)
             # Throw right at them
@@ -1233,7 +1235,7 @@ def _calculate_throw_lead(
     # If receiver is post-break, the break_point is BEHIND them.
     if receiver.break_point and receiver.pre_break:
         # Route has a defined break point - use route structure for throw lead
-        _trace(f"[THROW_LEAD] Using route structure (pre-break with break_point)")
+        _trace("[THROW_LEAD] Using route structure (pre-break with break_point)")
         break_point = receiver.break_point
 
         # How far is receiver from break point?
@@ -1262,7 +1264,8 @@ def _calculate_throw_lead(
                 else:
                     # Receiver on left side: positive offset = inside, negative = outside
                     effective_route_dir = "inside" if lateral_offset > 0 else "outside"
-                _trace(f"[THROW_LEAD] Inferred route_dir={effective_route_dir} from break_point offset={lateral_offset:.1f}")
+                _trace("[THROW_LEAD] Inferred route_dir=%s from break_point offset=%.1f",
+                       effective_route_dir, lateral_offset)
 
         if effective_route_dir == "inside":
             # Slant, dig, post - continue inside after break
@@ -1336,7 +1339,10 @@ def _calculate_throw_lead(
             if arrival_gap > 0.5:
                 # Receiver is way too far behind (>0.5s) - likely jammed or delayed
                 # Abort anticipation throw - target receiver's current projected position instead
-                _trace(f"[THROW_LEAD] Aborting anticipation - receiver {arrival_gap:.2f}s behind (jammed/delayed)")
+                _trace(
+                    "[THROW_LEAD] Aborting anticipation - receiver %.2fs behind (jammed/delayed)",
+                    arrival_gap,
+                )
 
                 # Project receiver position at ball arrival (on stem, not at break)
                 dist_to_receiver = qb_pos.distance_to(receiver.position)
@@ -1350,7 +1356,7 @@ def _calculate_throw_lead(
             else:
                 # Receiver is close enough - this is a valid anticipation throw
                 # Throw to break point with YAC lead, receiver will catch in stride
-                _trace(f"[THROW_LEAD] Anticipation throw - receiver {arrival_gap:.2f}s behind")
+                _trace("[THROW_LEAD] Anticipation throw - receiver %.2fs behind", arrival_gap)
                 yac_buffer = 1.0
                 target = break_point + post_break_dir * yac_buffer
 
@@ -1358,7 +1364,7 @@ def _calculate_throw_lead(
         # No break point - use ACTUAL VELOCITY for continuing routes (like GO)
         # This is common for vertical routes that just keep running
         # OR: Phase mismatch (pre_break=False but route_phase != "post_break")
-        _trace(f"[THROW_LEAD] Using fallback (no break_point or phase mismatch)")
+        _trace("[THROW_LEAD] Using fallback (no break_point or phase mismatch)")
 
         actual_speed = receiver.velocity.length()
 
@@ -1366,7 +1372,7 @@ def _calculate_throw_lead(
             # Receiver is moving - use their actual velocity direction
             lead_dir = receiver.velocity.normalized()
             receiver_speed = actual_speed
-            _trace(f"[THROW_LEAD] Using velocity for lead: {lead_dir}")
+            _trace("[THROW_LEAD] Using velocity for lead: %s", lead_dir)
         else:
             # Receiver barely moving - fall back to route_direction
             receiver_speed = 6.5  # Assume they'll get up to speed
@@ -1710,12 +1716,12 @@ def qb_brain(world: QBContext) -> BrainDecision:
                 reasoning=f"Retreated {depth_behind_los:.0f}yds, inside tackle box - protecting ball",
             )
 
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset state at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
 
     # If we don't have the ball, something is wrong
     if not world.me.has_ball:
@@ -1735,7 +1741,8 @@ def qb_brain(world: QBContext) -> BrainDecision:
     pressure = perceived_pressure
     state.pressure_level = pressure
 
-    _trace(f"[POISE] poise={poise}, actual={actual_pressure.value}, perceived={pressure.value}")
+    _trace("[POISE] poise=%s, actual=%s, perceived=%s",
+           poise, actual_pressure.value, pressure.value)
 
     # Calculate decision-making effects
     # Low DM: forces throws into coverage, doesn't check down
@@ -1823,7 +1830,10 @@ def qb_brain(world: QBContext) -> BrainDecision:
     MIN_ROUTE_DEVELOPMENT_TIME = 1.0  # seconds since snap
     routes_developing = world.time_since_snap < MIN_ROUTE_DEVELOPMENT_TIME
 
-    _trace(f"[POCKET] t={world.current_time:.2f}s, pocket={time_in_pocket:.2f}s, read={state.current_read}, pressure={pressure.value}, receivers={len(receivers)}, routes_developing={routes_developing}")
+    _trace("[POCKET] t=%.2fs, pocket=%.2fs, read=%s, pressure=%s, receivers=%s, "
+           "routes_developing=%s",
+           world.current_time, time_in_pocket, state.current_read, pressure.value, len(receivers),
+           routes_developing)
 
     # =========================================================================
     # Critical Pressure Response
@@ -1905,7 +1915,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
         # They can't process going to the next read - tunnel vision
         if poise_effects["read_lock_under_pressure"]:
             # Low poise: staring down first read, force throw or bail
-            _trace(f"[POISE] Low poise ({poise}) - locked onto R{state.current_read}")
+            _trace("[POISE] Low poise (%s) - locked onto R%s", poise, state.current_read)
             if current_eval:
                 # Force throw even into coverage (bad decision)
                 lead_pos = _calculate_throw_lead(world.me.pos, current_eval, throw_power)
@@ -1919,7 +1929,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
         # Current read covered - high poise can still progress
         if poise_effects["progression_under_pressure"]:
             # High poise: can advance reads even under heavy pressure
-            _trace(f"[POISE] High poise ({poise}) - continuing progression under pressure")
+            _trace("[POISE] High poise (%s) - continuing progression under pressure", poise)
             state.current_read = min(state.current_read + 1, 4)
             # Don't immediately bail - let read progression continue
         else:
@@ -1958,7 +1968,8 @@ def qb_brain(world: QBContext) -> BrainDecision:
     # Only critical/heavy pressure bypasses this (survival mode).
     if routes_developing and pressure not in (PressureLevel.CRITICAL, PressureLevel.HEAVY):
         # Still waiting for routes to develop - scan but don't throw
-        _trace(f"[POCKET] Routes still developing ({world.time_since_snap:.2f}s < {MIN_ROUTE_DEVELOPMENT_TIME}s)")
+        _trace("[POCKET] Routes still developing (%.2fs < %ss)",
+               world.time_since_snap, MIN_ROUTE_DEVELOPMENT_TIME)
         return BrainDecision(
             intent="scanning",
             facing_direction=_get_read_target_facing(world, state.current_read),
@@ -1985,7 +1996,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
 
         if read_target:
             lead_pos = _calculate_throw_lead(world.me.pos, read_target, throw_power)
-            _trace(f"[READ SYSTEM] {read_reasoning}")
+            _trace("[READ SYSTEM] %s", read_reasoning)
             return BrainDecision(
                 action="throw",
                 target_id=read_target.player_id,
@@ -2029,12 +2040,14 @@ def qb_brain(world: QBContext) -> BrainDecision:
     if current_eval:
         sep = current_eval.separation
         status = current_eval.status
-        _trace(f"[READ] R{state.current_read} ({current_eval.player_id}): {status.value} ({sep:.1f}yd) dwell={time_on_current_read:.2f}/{effective_dwell:.2f}s")
+        _trace("[READ] R%s (%s): %s (%.1fyd) dwell=%.2f/%.2fs",
+               state.current_read, current_eval.player_id, status.value, sep, time_on_current_read,
+               effective_dwell)
 
         # OPEN = throw immediately, no dwell needed
         if status == ReceiverStatus.OPEN:
             lead_pos = _calculate_throw_lead(world.me.pos, current_eval, throw_power)
-            _trace(f"[READ] -> THROW to R{state.current_read} (OPEN)")
+            _trace("[READ] -> THROW to R%s (OPEN)", state.current_read)
             return BrainDecision(
                 action="throw",
                 target_id=current_eval.player_id,
@@ -2047,7 +2060,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
             # Need to dwell at least half the time to confirm it's a good window
             if time_on_current_read >= effective_dwell * 0.5 and accuracy >= 75:
                 lead_pos = _calculate_throw_lead(world.me.pos, current_eval, throw_power)
-                _trace(f"[READ] -> THROW to R{state.current_read} (window confirmed)")
+                _trace("[READ] -> THROW to R%s (window confirmed)", state.current_read)
                 return BrainDecision(
                     action="throw",
                     target_id=current_eval.player_id,
@@ -2055,7 +2068,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
                     reasoning=f"R{state.current_read} {current_eval.player_id} window ({sep:.1f}yd)",
                 )
             # Still evaluating this window
-            _trace(f"[READ] R{state.current_read}: evaluating window...")
+            _trace("[READ] R%s: evaluating window...", state.current_read)
             return BrainDecision(
                 intent="scanning",
                 facing_direction=_get_read_target_facing(world, state.current_read),
@@ -2069,7 +2082,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
             # high DM QBs see "covered, check down"
             if random.random() < dm_effects["force_throw_chance"]:
                 # Bad decision: force the throw anyway
-                _trace(f"[DM] Low decision-making ({decision_making}) - forcing into contested!")
+                _trace("[DM] Low decision-making (%s) - forcing into contested!", decision_making)
                 lead_pos = _calculate_throw_lead(world.me.pos, current_eval, throw_power)
                 return BrainDecision(
                     action="throw",
@@ -2082,7 +2095,8 @@ def qb_brain(world: QBContext) -> BrainDecision:
                 # Dwell complete, move to next read
                 if state.current_read < 4:
                     state.current_read += 1
-                    _trace(f"[READ] R{state.current_read - 1} contested, advancing to R{state.current_read}")
+                    _trace("[READ] R%s contested, advancing to R%s",
+                           state.current_read - 1, state.current_read)
                     return BrainDecision(
                         intent="scanning",
                         facing_direction=_get_read_target_facing(world, state.current_read),
@@ -2100,7 +2114,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
             # DECISION-MAKING EFFECT: Really bad QBs might even throw into COVERED receivers
             # This creates interceptions and the dramatic "what was he thinking?!" moments
             if decision_making < 45 and random.random() < dm_effects["force_throw_chance"] * 0.5:
-                _trace(f"[DM] Poor decision-making ({decision_making}) - throwing into coverage!")
+                _trace("[DM] Poor decision-making (%s) - throwing into coverage!", decision_making)
                 lead_pos = _calculate_throw_lead(world.me.pos, current_eval, throw_power)
                 return BrainDecision(
                     action="throw",
@@ -2111,7 +2125,8 @@ def qb_brain(world: QBContext) -> BrainDecision:
 
             if state.current_read < 4:
                 state.current_read += 1
-                _trace(f"[READ] R{state.current_read - 1} COVERED, quick advance to R{state.current_read}")
+                _trace("[READ] R%s COVERED, quick advance to R%s",
+                       state.current_read - 1, state.current_read)
                 return BrainDecision(
                     intent="scanning",
                     facing_direction=_get_read_target_facing(world, state.current_read),
@@ -2125,7 +2140,8 @@ def qb_brain(world: QBContext) -> BrainDecision:
 
         if best and best.status in (ReceiverStatus.OPEN, ReceiverStatus.WINDOW):
             lead_pos = _calculate_throw_lead(world.me.pos, best, throw_power)
-            _trace(f"[READ] All reads checked, throwing to best: {best.player_id} ({best.separation:.1f}yd)")
+            _trace("[READ] All reads checked, throwing to best: %s (%.1fyd)",
+                   best.player_id, best.separation)
             return BrainDecision(
                 action="throw",
                 target_id=best.player_id,
@@ -2137,7 +2153,7 @@ def qb_brain(world: QBContext) -> BrainDecision:
         escape = _find_escape_lane(world)
         if escape:
             state.scramble_committed = True
-            _trace(f"[READ] No completion, scrambling")
+            _trace("[READ] No completion, scrambling")
             return BrainDecision(
                 move_target=escape,
                 move_type="sprint",
@@ -22,19 +22,22 @@ from typing import Optional
 from typing import Union
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import WRContext, RBContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team, BallState
-from ..core.trace import get_trace_system, TraceCategory
+from ..core.trace import get_trace_system, TraceCategory, TraceMessage
 
 
 # =============================================================================
 # Trace Helper
 # =============================================================================
 
-def _trace(world: WorldState, msg: str, category: TraceCategory = TraceCategory.DECISION):
+def _trace(world: WorldState, msg: TraceMessage, *args,
+           category: TraceCategory = TraceCategory.DECISION):
     """Add a trace for this receiver."""
     trace = get_trace_system()
-    trace.trace(world.me.id, world.me.name, category, msg)
+    if trace.enabled:
+        trace.trace(world.me.id, world.me.name, category, msg, *args)
 
 
 # =============================================================================
@@ -86,7 +89,7 @@ class HotRouteType(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ReceiverState:
     """Tracked state for receiver decision-making."""
     route_phase: RoutePhase = RoutePhase.PRE_SNAP
@@ -106,20 +109,18 @@ class ReceiverState:
     original_route: str = ""
 
 
-# Module-level state tracking
-_receiver_states: dict[str, ReceiverState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "receiver"
 
 
-def _get_state(player_id: str) -> ReceiverState:
+def _get_state(store: BrainStateStore, player_id: str) -> ReceiverState:
     """Get or create state for a receiver."""
-    if player_id not in _receiver_states:
-        _receiver_states[player_id] = ReceiverState()
-    return _receiver_states[player_id]
+    return store.get(_STATE_KEY, player_id, ReceiverState)
 
 
-def _reset_state(player_id: str) -> None:
+def _reset_state(store: BrainStateStore, player_id: str) -> ReceiverState:
     """Reset state for a new play."""
-    _receiver_states[player_id] = ReceiverState()
+    return store.reset_player(_STATE_KEY, player_id, ReceiverState)
 
 
 # =============================================================================
@@ -632,12 +633,12 @@ def receiver_brain(world: Union[WRContext, RBContext]) -> BrainDecision:
     Returns:
         BrainDecision with action and reasoning
     """
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset state at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
         state.route_phase = RoutePhase.RELEASE
 
     # =========================================================================
@@ -699,7 +700,8 @@ def receiver_brain(world: Union[WRContext, RBContext]) -> BrainDecision:
 
             # === GOOD THROW: Run through the ball ===
             if can_run_through:
-                _trace(world, f"Ball on path - catching in stride", TraceCategory.PERCEPTION)
+                _trace(world, "Ball on path - catching in stride",
+                       category=TraceCategory.PERCEPTION)
 
                 if dist_to_catch < 0.5:
                     # At catch point - keep running!
@@ -730,7 +732,8 @@ def receiver_brain(world: Union[WRContext, RBContext]) -> BrainDecision:
 
             # === BAD THROW: Must adjust to ball ===
             else:
-                _trace(world, f"Ball off path - adjusting ({dist_to_catch:.1f}yd)", TraceCategory.PERCEPTION)
+                _trace(world, "Ball off path - adjusting (%.1fyd)",
+                       dist_to_catch, category=TraceCategory.PERCEPTION)
 
                 if dist_to_catch < 0.5:
                     # At catch point - try to continue but may be slow
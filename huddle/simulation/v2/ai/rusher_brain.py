@@ -20,6 +20,7 @@ from typing import Optional, List
 
 from ..orchestrator import WorldState, BrainDecision, PlayerView, PlayPhase
 from ..core.contexts import RBContext
+from ..core.brain_state import BrainStateStore, store_for
 from ..core.vec2 import Vec2
 from ..core.entities import Position, Team
 
@@ -57,7 +58,7 @@ class ProtectionPhase(str, Enum):
 # Internal State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RusherState:
     """Tracked state for rusher decision-making."""
     assignment: RusherAssignment = RusherAssignment.RUN_PATH
@@ -69,17 +70,16 @@ class RusherState:
     is_lead_blocker: bool = False
 
 
-_rusher_states: dict[str, RusherState] = {}
+# Per-player state lives in the orchestrator's BrainStateStore
+_STATE_KEY = "rusher"
 
 
-def _get_state(player_id: str) -> RusherState:
-    if player_id not in _rusher_states:
-        _rusher_states[player_id] = RusherState()
-    return _rusher_states[player_id]
+def _get_state(store: BrainStateStore, player_id: str) -> RusherState:
+    return store.get(_STATE_KEY, player_id, RusherState)
 
 
-def _reset_state(player_id: str) -> None:
-    _rusher_states[player_id] = RusherState()
+def _reset_state(store: BrainStateStore, player_id: str) -> RusherState:
+    return store.reset_player(_STATE_KEY, player_id, RusherState)
 
 
 # =============================================================================
@@ -242,12 +242,12 @@ def rusher_brain(world: RBContext) -> BrainDecision:
     Returns:
         BrainDecision with action and reasoning
     """
-    state = _get_state(world.me.id)
+    store = store_for(world)
+    state = _get_state(store, world.me.id)
 
     # Reset at start of play
     if world.tick == 0 or world.time_since_snap < 0.1:
-        _reset_state(world.me.id)
-        state = _get_state(world.me.id)
+        state = _reset_state(store, world.me.id)
 
         # Determine assignment based on play call
         if "protect" in world.assignment.lower():
@@ -1,6 +1,8 @@
 """Core simulation utilities."""
 
 from .trace import TraceSystem, TraceCategory, TraceEntry, get_trace_system
+from .instrumentation import TickProfiler, SpanStats
+from .brain_state import BrainStateStore, store_for
 from .reads import (
     ReadDefinition,
     ReadOutcome,
@@ -31,6 +33,12 @@ __all__ = [
     "TraceCategory",
     "TraceEntry",
     "get_trace_system",
+    # Per-tick instrumentation
+    "TickProfiler",
+    "SpanStats",
+    # Brain state
+    "BrainStateStore",
+    "store_for",
     # Read System - Data Structures
     "ReadDefinition",
     "ReadOutcome",
@@ -0,0 +1,86 @@
+"""Per-orchestrator storage for AI brain state.
+
+Brains are plain functions, but most of them need memory across ticks
+(current read, pursuit angle, move cooldowns...). That state lives in a
+BrainStateStore owned by the Orchestrator rather than in module globals,
+so it is released between plays and two orchestrators running in
+different threads never see each other's players.
+
+The orchestrator hands its store to every brain through the
+``brain_state`` field of the world-state context:
+
+    store = store_for(world)
+    state = store.get("qb", world.me.id, QBState)
+
+State dataclasses are allocated lazily on a player's first tick and
+dropped in bulk when ``reset()`` is called from ``setup_play``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class BrainStateStore:
+    """Slots of per-player brain state, grouped by brain type.
+
+    Usage:
+        store = BrainStateStore()
+        state = store.get("qb", "QB1", QBState)   # allocates on first use
+        state = store.reset_player("qb", "QB1", QBState)
+        store.set_shared("ol.protection_call", call)
+        store.reset()                             # between plays
+    """
+
+    def __init__(self):
+        self._slots: Dict[str, Dict[str, Any]] = {}
+        self._shared: Dict[str, Any] = {}
+
+    def get(self, brain: str, player_id: str, factory: Callable[[], T]) -> T:
+        """Get a player's state for a brain, allocating it if needed."""
+        slots = self._slots.get(brain)
+        if slots is None:
+            slots = self._slots[brain] = {}
+        state = slots.get(player_id)
+        if state is None:
+            state = slots[player_id] = factory()
+        return state
+
+    def peek(self, brain: str, player_id: str) -> Optional[Any]:
+        """Get a player's state without allocating it."""
+        return self._slots.get(brain, {}).get(player_id)
+
+    def reset_player(self, brain: str, player_id: str, factory: Callable[[], T]) -> T:
+        """Replace a player's state with a fresh instance."""
+        state = factory()
+        self._slots.setdefault(brain, {})[player_id] = state
+        return state
+
+    def get_shared(self, key: str, default: Any = None) -> Any:
+        """Get state shared by every player using a brain (e.g. OL protection call)."""
+        return self._shared.get(key, default)
+
+    def set_shared(self, key: str, value: Any) -> None:
+        self._shared[key] = value
+
+    def reset(self) -> None:
+        """Drop all state. Called by the orchestrator at the start of each play."""
+        self._slots.clear()
+        self._shared.clear()
+
+    def __len__(self) -> int:
+        return sum(len(slots) for slots in self._slots.values())
+
+
+# Store used when a brain is called with a context that was not built by an
+# Orchestrator (unit tests, scripts). Orchestrated plays never touch it.
+_detached_store = BrainStateStore()
+
+
+def store_for(world: Any) -> BrainStateStore:
+    """Get the brain-state store for a world-state context."""
+    store = getattr(world, "brain_state", None)
+    return store if store is not None else _detached_store
@@ -87,6 +87,9 @@ class WorldStateBase:
     play_history: Any = None  # PlayHistory
     game_situation: Any = None  # GameSituation
 
+    # Per-play brain memory owned by the orchestrator
+    brain_state: Any = None  # BrainStateStore
+
     # Run play flag (needed by multiple brains)
     is_run_play: bool = False
 
@@ -171,6 +174,9 @@ class QBContext(BallcarrierContextBase):
     # Pressure tracking (from PressureSystem)
     pressure_state: Any = None  # PressureState - current pocket pressure
 
+    # Receiver x defender separation, built once per tick by the orchestrator
+    separation_table: Any = None  # SeparationTable
+
     # Read System context
     play_concept: str = ""  # Current play concept (e.g., "smash", "flood")
     detected_coverage: str = ""  # Detected defensive coverage (e.g., "cover_2", "cover_3")
@@ -0,0 +1,302 @@
+"""Per-tick timing of the orchestrator's systems and brains.
+
+Opt-in: a TickProfiler attached to an Orchestrator wraps the tick loop's
+systems (blocking, pressure, tackles, world-state building, ...) and
+every brain call on that orchestrator instance only. Nothing is wrapped
+on orchestrators it isn't attached to, so the disabled cost is zero.
+
+Each attached orchestrator is one play. Per system or brain the profiler
+keeps its time and calls for every tick it ran in and its total for
+every play, so it can report p50/p99 tick cost, histograms, and export
+JSON or a Chrome trace (chrome://tracing, Perfetto).
+
+Usage:
+    profiler = TickProfiler(record_spans=True)
+    for ...:
+        orch = build_play()
+        orch.instrument(profiler)
+        orch.run()
+    profiler.finish()
+    print(profiler.format_report())
+    profiler.write_chrome_trace("ticks.json")
+
+Timings are inclusive: "tick" covers everything, and a brain's time
+does not include building its WorldState ("world_state").
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+# Orchestrator methods timed as systems: attribute -> span name
+SYSTEM_METHODS = {
+    "_update_qb_dropback_state": "qb_dropback",
+    "_build_separation_table": "separation_table",
+    "_resolve_blocks": "resolve_blocks",
+    "_check_sack": "check_sack",
+    "_build_world_state": "world_state",
+    "_apply_brain_decision": "apply_decision",
+    "_update_offense_player": "offense_systems",
+    "_update_defense_player": "defense_systems",
+    "_resolve_pass": "ball_flight",
+    "_enforce_lineman_collisions": "lineman_collisions",
+    "_check_tackles": "check_tackles",
+    "_check_out_of_bounds": "out_of_bounds",
+}
+
+# Histogram bucket upper bounds, in microseconds
+HISTOGRAM_BOUNDS_US = (10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000)
+
+
+def _percentile(values: array, q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+@dataclass
+class SpanStats:
+    """Aggregate timings for one system or brain."""
+    name: str
+    calls: int = 0
+    tick_seconds: array = field(default_factory=lambda: array("d"))  # Per tick it ran in
+    play_seconds: array = field(default_factory=lambda: array("d"))  # Per play it ran in
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.play_seconds)
+
+    def percentile(self, q: float, per: str = "tick") -> float:
+        """Seconds at percentile ``q`` of the per-tick (or per-play) cost."""
+        return _percentile(self.tick_seconds if per == "tick" else self.play_seconds, q)
+
+    def histogram(self) -> List[Tuple[str, int]]:
+        """Counts of per-tick cost in HISTOGRAM_BOUNDS_US buckets."""
+        counts = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+        for seconds in self.tick_seconds:
+            micros = seconds * 1e6
+            index = next(
+                (i for i, bound in enumerate(HISTOGRAM_BOUNDS_US) if micros <= bound),
+                len(HISTOGRAM_BOUNDS_US),
+            )
+            counts[index] += 1
+        labels = [f"<={b}us" for b in HISTOGRAM_BOUNDS_US] + [f">{HISTOGRAM_BOUNDS_US[-1]}us"]
+        return list(zip(labels, counts))
+
+    def to_dict(self) -> dict:
+        ticks = len(self.tick_seconds)
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "ticks": ticks,
+            "plays": len(self.play_seconds),
+            "total_seconds": self.total_seconds,
+            "calls_per_tick": self.calls / ticks if ticks else 0.0,
+            "tick_p50_seconds": self.percentile(50),
+            "tick_p99_seconds": self.percentile(99),
+            "tick_max_seconds": max(self.tick_seconds, default=0.0),
+            "play_p50_seconds": self.percentile(50, per="play"),
+            "play_p99_seconds": self.percentile(99, per="play"),
+            "tick_histogram": dict(self.histogram()),
+        }
+
+
+class TickProfiler:
+    """
+    Collects per-tick system and brain timings across plays.
+
+    Args:
+        record_spans: Keep every individual call for the Chrome trace
+        max_spans: Stop recording spans past this many (aggregates continue)
+    """
+
+    def __init__(self, record_spans: bool = False, max_spans: int = 1_000_000) -> None:
+        self.record_spans = record_spans
+        self.max_spans = max_spans
+        self.stats: Dict[str, SpanStats] = {}
+        self.plays = 0
+        self.ticks = 0
+        # (name, play, tick, start, end) in perf_counter seconds
+        self.spans: List[Tuple[str, int, int, float, float]] = []
+
+        self._orchestrator: Any = None
+        self._tick: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+        self._play: Dict[str, float] = {}
+        self._tick_number = 0
+        self._brain_wrappers: Dict[Callable, Callable] = {}
+        self._epoch = time.perf_counter()
+
+    # =========================================================================
+    # Attaching
+    # =========================================================================
+
+    def attach(self, orchestrator: Any) -> None:
+        """Start a play on ``orchestrator``, finishing the previous one."""
+        self.finish()
+        self._orchestrator = orchestrator
+        self._play = {}
+        self._brain_wrappers = {}
+
+        for attribute, name in SYSTEM_METHODS.items():
+            method = getattr(orchestrator, attribute, None)
+            if method is not None:
+                setattr(orchestrator, attribute, self._timed(name, method))
+
+        pressure = orchestrator.pressure_system
+        pressure.update = self._timed("pressure", pressure.update)
+
+        get_brain = orchestrator._get_brain_for_player
+
+        def timed_get_brain(player):
+            brain = get_brain(player)
+            if brain is None:
+                return None
+            wrapper = self._brain_wrappers.get(brain)
+            if wrapper is None:
+                name = getattr(brain, "__name__", type(brain).__name__)
+                wrapper = self._timed(f"brain:{name.removesuffix('_brain')}", brain)
+                self._brain_wrappers[brain] = wrapper
+            return wrapper
+
+        orchestrator._get_brain_for_player = timed_get_brain
+
+        update_tick = orchestrator._update_tick
+
+        def timed_update_tick(dt, verbose=False):
+            self._flush_outside_tick()
+            self._tick_number = orchestrator.clock.tick_count
+            start = time.perf_counter()
+            try:
+                return update_tick(dt, verbose)
+            finally:
+                self._record("tick", start, time.perf_counter())
+                self._end_tick()
+
+        orchestrator._update_tick = timed_update_tick
+
+    def finish(self) -> None:
+        """End the current play and unwrap its orchestrator."""
+        orchestrator = self._orchestrator
+        if orchestrator is None:
+            return
+        self._flush_outside_tick()
+        for attribute in (*SYSTEM_METHODS, "_get_brain_for_player", "_update_tick"):
+            orchestrator.__dict__.pop(attribute, None)
+        orchestrator.pressure_system.__dict__.pop("update", None)
+        self._orchestrator = None
+
+        if self._play:
+            for name, seconds in self._play.items():
+                self._stats(name).play_seconds.append(seconds)
+            self.plays += 1
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def _timed(self, name: str, func: Callable) -> Callable:
+        perf_counter = time.perf_counter
+        record = self._record
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, start, perf_counter())
+
+        return timed
+
+    def _record(self, name: str, start: float, end: float) -> None:
+        entry = self._tick.get(name)
+        if entry is None:
+            self._tick[name] = [end - start, 1]
+        else:
+            entry[0] += end - start
+            entry[1] += 1
+        if self.record_spans and len(self.spans) < self.max_spans:
+            self.spans.append((name, self.plays, self._tick_number, start, end))
+
+    def _end_tick(self) -> None:
+        for name, (seconds, calls) in self._tick.items():
+            stats = self._stats(name)
+            stats.calls += calls
+            stats.tick_seconds.append(seconds)
+            self._play[name] = self._play.get(name, 0.0) + seconds
+        self._tick = {}
+        self.ticks += 1
+
+    def _flush_outside_tick(self) -> None:
+        # Work between ticks (pre-snap reads, the snap) counts for the play only
+        for name, (seconds, calls) in self._tick.items():
+            self._stats(name).calls += calls
+            self._play[name] = self._play.get(name, 0.0) + seconds
+        self._tick = {}
+
+    def _stats(self, name: str) -> SpanStats:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = SpanStats(name)
+        return stats
+
+    # =========================================================================
+    # Reporting
+    # =========================================================================
+
+    def format_report(self) -> str:
+        """Systems and brains by total time, with per-tick p50/p99."""
+        tick_total = self.stats["tick"].total_seconds if "tick" in self.stats else 0.0
+        lines = [
+            f"{self.plays} plays, {self.ticks} ticks",
+            f"{'System':<22} {'total':>9} {'share':>6} {'calls/tick':>10} "
+            f"{'p50 us':>9} {'p99 us':>9}",
+            "-" * 70,
+        ]
+        for stats in sorted(self.stats.values(), key=lambda s: -s.total_seconds):
+            data = stats.to_dict()
+            share = stats.total_seconds / tick_total if tick_total else 0.0
+            lines.append(
+                f"{stats.name:<22} {stats.total_seconds:>8.3f}s {share:>6.1%} "
+                f"{data['calls_per_tick']:>10.1f} {data['tick_p50_seconds'] * 1e6:>9.0f} "
+                f"{data['tick_p99_seconds'] * 1e6:>9.0f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "plays": self.plays,
+            "ticks": self.ticks,
+            "systems": {name: stats.to_dict() for name, stats in self.stats.items()},
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Recorded spans in Chrome trace event format (one thread row per play)."""
+        events = []
+        for name, play, tick, start, end in self.spans:
+            events.append({
+                "name": name,
+                "cat": "brain" if name.startswith("brain:") else "system",
+                "ph": "X",
+                "ts": (start - self._epoch) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 1,
+                "tid": play,
+                "args": {"tick": tick},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
@@ -343,7 +343,7 @@ class ReadEvaluator:
         if awareness < read.min_awareness:
             reason = f"awareness ({awareness}) below minimum ({read.min_awareness})"
             trace.trace(player_id, player_name, TraceCategory.DECISION,
-                       f"[READ] {read.id}: DISABLED - {reason}")
+                       "[READ] %s: DISABLED - %s", read.id, reason)
             return ReadEvaluationResult(
                 success=False,
                 reasoning=reason,
@@ -362,7 +362,7 @@ class ReadEvaluator:
         if current_idx > max_idx:
             reason = f"pressure ({pressure_level}) exceeds poise threshold ({max_pressure})"
             trace.trace(player_id, player_name, TraceCategory.DECISION,
-                       f"[READ] {read.id}: DISABLED - {reason}")
+                       "[READ] %s: DISABLED - %s", read.id, reason)
             return ReadEvaluationResult(
                 success=False,
                 reasoning=reason,
@@ -373,7 +373,7 @@ class ReadEvaluator:
         if current_idx >= read_max_idx:
             reason = f"pressure ({pressure_level}) disables read (threshold: {read.pressure_disabled_level})"
             trace.trace(player_id, player_name, TraceCategory.DECISION,
-                       f"[READ] {read.id}: DISABLED - {reason}")
+                       "[READ] %s: DISABLED - %s", read.id, reason)
             return ReadEvaluationResult(
                 success=False,
                 reasoning=reason,
@@ -392,7 +392,7 @@ class ReadEvaluator:
         if not is_deterministic() and random.random() > accuracy:
             reason = f"failed to identify key actor (awareness {awareness}, {accuracy:.0%} chance)"
             trace.trace(player_id, player_name, TraceCategory.DECISION,
-                       f"[READ] {read.id}: FAILED - {reason}")
+                       "[READ] %s: FAILED - %s", read.id, reason)
             return ReadEvaluationResult(
                 success=False,
                 reasoning=reason,
@@ -410,7 +410,7 @@ class ReadEvaluator:
         if key_actor is None:
             reason = f"key actor ({read.key_actor_role.value}) not found"
             trace.trace(player_id, player_name, TraceCategory.DECISION,
-                       f"[READ] {read.id}: NO ACTOR - {reason}")
+                       "[READ] %s: NO ACTOR - %s", read.id, reason)
             return ReadEvaluationResult(
                 success=False,
                 reasoning=reason,
@@ -448,7 +448,7 @@ class ReadEvaluator:
         if trigger_matched is None:
             reason = "no trigger condition met"
             trace.trace(player_id, player_name, TraceCategory.DECISION,
-                       f"[READ] {read.id}: NO TRIGGER - key actor {key_actor_id}")
+                       "[READ] %s: NO TRIGGER - key actor %s", read.id, key_actor_id)
             return ReadEvaluationResult(
                 success=False,
                 key_actor_id=key_actor_id,
@@ -510,7 +510,8 @@ class ReadEvaluator:
         # Success!
         full_reason = f"{outcome.reasoning} ({reason})"
         trace.trace(player_id, player_name, TraceCategory.DECISION,
-                   f"[READ] {read.id}: {outcome.target_position} ({outcome.target_route}) - {full_reason}")
+                   "[READ] %s: %s (%s) - %s",
+                   read.id, outcome.target_position, outcome.target_route, full_reason)
 
         return ReadEvaluationResult(
             success=True,
@@ -2,13 +2,25 @@
 
 Captures AI decision traces for all players, organized by tick.
 Enables SimAnalyzer to show timeline of player decisions and rewind to any tick.
+
+Tracing is off during normal simulation, so it has to cost next to nothing
+then: messages can be passed as a %-format string plus args (or a callable)
+and are only formatted when tracing is enabled, and ``trace.enabled`` lets
+callers skip whole blocks of trace-only work. When enabled, entries are kept
+in a bounded ring buffer per player.
 """
 
+import heapq
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Union
 from enum import Enum
 
 
+# Entries kept per player before the oldest are dropped
+DEFAULT_PLAYER_CAPACITY = 4096
+
+
 class TraceCategory(Enum):
     """Categories of trace messages."""
     PERCEPTION = "perception"  # What the player sees/detects
@@ -25,6 +37,23 @@ class TraceEntry:
     player_name: str
     category: TraceCategory
     message: str
+    seq: int = field(default=0, repr=False, compare=False)  # Global insertion order
+
+
+TraceMessage = Union[str, Callable[..., str]]
+
+
+def format_trace_message(message: TraceMessage, args: tuple = ()) -> str:
+    """Render a lazy trace message.
+
+    ``message`` is either a string, %-formatted with ``args`` when there are
+    any (like logging), or a callable returning the string.
+    """
+    if callable(message):
+        return message(*args)
+    if args:
+        return message % args
+    return message
 
 
 class TraceSystem:
@@ -37,26 +66,41 @@ class TraceSystem:
         # At start of each tick in orchestrator:
         trace.set_tick(tick_num, sim_time)
 
-        # In each brain:
+        # In each brain (formatted only when enabled):
         trace.trace(player.id, player.name, TraceCategory.DECISION, "Breaking on ball")
+        trace.trace(player.id, player.name, TraceCategory.PERCEPTION, "sep=%.1fyd", sep)
+
+        # Skip trace-only work entirely when disabled:
+        if trace.enabled:
+            ...
 
         # To get entries for WebSocket:
         entries = trace.get_entries(since_tick=last_sent_tick)
+
+    Ticks are expected to only move forward between clear() calls (each play
+    starts with enable() or clear()), which lets retrieval walk back from the
+    newest entries instead of scanning everything.
     """
 
-    def __init__(self):
+    def __init__(self, capacity_per_player: int = DEFAULT_PLAYER_CAPACITY):
         self._enabled = False
-        self._entries: List[TraceEntry] = []
+        self.capacity_per_player = capacity_per_player
+        self._buffers: Dict[str, Deque[TraceEntry]] = {}
+        self._seq = 0
         self._current_tick = 0
         self._current_time = 0.0
         self._last_retrieved_tick = -1
 
+    @property
+    def enabled(self) -> bool:
+        """Whether trace collection is on (cheap guard for trace-only work)."""
+        return self._enabled
+
     def enable(self, enabled: bool = True) -> None:
         """Enable or disable trace collection."""
         self._enabled = enabled
         if enabled:
-            self._entries.clear()
-            self._last_retrieved_tick = -1
+            self.clear()
 
     def is_enabled(self) -> bool:
         """Check if tracing is enabled."""
@@ -67,25 +111,40 @@ class TraceSystem:
         self._current_tick = tick
         self._current_time = time
 
-    def trace(self, player_id: str, player_name: str, category: TraceCategory, message: str) -> None:
+    def trace(
+        self,
+        player_id: str,
+        player_name: str,
+        category: TraceCategory,
+        message: TraceMessage,
+        *args,
+    ) -> None:
         """Add a trace entry for a player.
 
         Args:
             player_id: Unique player identifier
             player_name: Human-readable player name
             category: Type of trace (perception, decision, action)
-            message: Concise description of what happened
+            message: Concise description of what happened - a string,
+                %-formatted with ``args``, or a callable returning one.
+                Only rendered when tracing is enabled.
         """
         if not self._enabled:
             return
-        self._entries.append(TraceEntry(
+        self._seq += 1
+        entry = TraceEntry(
             tick=self._current_tick,
             time=self._current_time,
             player_id=player_id,
             player_name=player_name,
             category=category,
-            message=message
-        ))
+            message=format_trace_message(message, args),
+            seq=self._seq,
+        )
+        buffer = self._buffers.get(player_id)
+        if buffer is None:
+            buffer = self._buffers[player_id] = deque(maxlen=self.capacity_per_player)
+        buffer.append(entry)
 
     def get_entries(self, since_tick: Optional[int] = None) -> List[TraceEntry]:
         """Get trace entries, optionally filtered by tick.
@@ -94,40 +153,45 @@ class TraceSystem:
             since_tick: If provided, only return entries from this tick onwards
 
         Returns:
-            List of trace entries
+            List of trace entries, in the order they were traced
         """
-        if since_tick is None:
-            return list(self._entries)
-        return [e for e in self._entries if e.tick >= since_tick]
+        return self._merge(
+            self._window(buffer, since_tick) for buffer in self._buffers.values()
+        )
 
     def get_entries_for_tick(self, tick: int) -> List[TraceEntry]:
         """Get all trace entries for a specific tick."""
-        return [e for e in self._entries if e.tick == tick]
+        return self._merge(
+            self._window(buffer, tick, tick) for buffer in self._buffers.values()
+        )
 
     def get_entries_for_player(self, player_id: str, since_tick: Optional[int] = None) -> List[TraceEntry]:
         """Get trace entries for a specific player."""
-        entries = self._entries if since_tick is None else [e for e in self._entries if e.tick >= since_tick]
-        return [e for e in entries if e.player_id == player_id]
+        buffer = self._buffers.get(player_id)
+        if buffer is None:
+            return []
+        return self._window(buffer, since_tick)
 
     def get_new_entries(self) -> List[TraceEntry]:
         """Get entries since last retrieval and update marker.
 
         Useful for incremental WebSocket sends.
         """
-        new_entries = [e for e in self._entries if e.tick > self._last_retrieved_tick]
-        if self._entries:
+        new_entries = self.get_entries(since_tick=self._last_retrieved_tick + 1)
+        if self._buffers:
             self._last_retrieved_tick = self._current_tick
         return new_entries
 
     def clear(self) -> None:
         """Clear all trace entries."""
-        self._entries.clear()
+        self._buffers.clear()
+        self._seq = 0
         self._last_retrieved_tick = -1
 
     def to_dict_list(self, entries: Optional[List[TraceEntry]] = None) -> List[Dict]:
         """Convert entries to list of dicts for JSON serialization."""
         if entries is None:
-            entries = self._entries
+            entries = self.get_entries()
         return [
             {
                 "tick": e.tick,
@@ -140,6 +204,34 @@ class TraceSystem:
             for e in entries
         ]
 
+    @staticmethod
+    def _window(
+        buffer: Deque[TraceEntry],
+        first_tick: Optional[int] = None,
+        last_tick: Optional[int] = None,
+    ) -> List[TraceEntry]:
+        """Entries of one player's buffer with first_tick <= tick <= last_tick."""
+        if first_tick is None and last_tick is None:
+            return list(buffer)
+        # Buffers are in tick order, so walk back from the newest entry
+        window = []
+        for entry in reversed(buffer):
+            if last_tick is not None and entry.tick > last_tick:
+                continue
+            if first_tick is not None and entry.tick < first_tick:
+                break
+            window.append(entry)
+        window.reverse()
+        return window
+
+    @staticmethod
+    def _merge(runs: Iterable[List[TraceEntry]]) -> List[TraceEntry]:
+        """Merge per-player runs back into global trace order."""
+        runs = [run for run in runs if run]
+        if len(runs) == 1:
+            return runs[0]
+        return list(heapq.merge(*runs, key=lambda e: e.seq))
+
 
 # Global singleton instance
 _trace_system = TraceSystem()
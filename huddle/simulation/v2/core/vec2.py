@@ -79,7 +79,10 @@ class Vec2:
 
     def distance_to(self, other: Vec2) -> float:
         """Euclidean distance to another point."""
-        return (other - self).length()
+        # Inline rather than (other - self).length(): called per player pair per tick
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return math.sqrt(dx * dx + dy * dy)
 
     def angle(self) -> float:
         """Angle in radians from positive X axis (-π to π)."""
@@ -47,7 +47,9 @@ from .plays.run_concepts import get_run_concept, RunConcept
 from .game_state import PlayHistory, GameSituation
 from .core.variance import VarianceConfig, SimulationMode, set_config as set_variance_config
 from .core.trace import get_trace_system, TraceCategory
+from .core.instrumentation import TickProfiler
 from .core.phases import PlayPhase, PhaseStateMachine
+from .core.brain_state import BrainStateStore
 from .core.huddle_positions import (
     HuddleConfig, DEFAULT_HUDDLE_CONFIG,
     get_player_huddle_target, calculate_huddle_center,
@@ -57,6 +59,7 @@ from .core.contexts import (
     LBContext, DBContext, RBContext, BallcarrierContext,
 )
 from .systems.pressure import PressureSystem, PressureState, PressureLevel
+from .systems.separation import SeparationTable
 
 
 class DropbackType(str, Enum):
@@ -374,6 +377,7 @@ class Orchestrator:
         self.block_resolver = BlockResolver(self.event_bus)
         self.movement_solver = MovementSolver()
         self.pressure_system = PressureSystem()
+        self.separation_table: Optional[SeparationTable] = None  # Rebuilt when the QB reads
 
         # Game-level state (persists across plays)
         self.play_history = PlayHistory()
@@ -385,6 +389,9 @@ class Orchestrator:
         # AI brains (player_id -> brain function)
         self._brains: Dict[str, BrainFunc] = {}
 
+        # Per-play brain memory, passed to brains via their context
+        self.brain_state = BrainStateStore()
+
         # State - use PhaseStateMachine for validated transitions
         self._phase_machine = PhaseStateMachine()
         self.snap_time: Optional[float] = None  # None = no snap yet, 0.0 = snapped at t=0
@@ -651,6 +658,7 @@ class Orchestrator:
         self._phase_machine.reset()  # Reset to SETUP
         self._transition_to(PlayPhase.PRE_SNAP, "play setup complete")
         self.pressure_system.reset()  # Reset pressure tracking
+        self.brain_state.reset()  # Drop brain memory from the previous play
         self.snap_time = None
         self._throw_time = None
         self._throw_position = None
@@ -708,6 +716,19 @@ class Orchestrator:
         """Remove all registered brains."""
         self._brains.clear()
 
+    def instrument(self, profiler: Optional[TickProfiler] = None) -> TickProfiler:
+        """Time this play's systems and brains per tick.
+
+        Args:
+            profiler: Profiler collecting across plays (a new one if None)
+
+        Returns:
+            The profiler, now recording this orchestrator as its current play
+        """
+        profiler = profiler or TickProfiler()
+        profiler.attach(self)
+        return profiler
+
     def register_default_brains(self) -> None:
         """Register the default AI brains for all positions.
 
@@ -825,6 +846,7 @@ class Orchestrator:
             is_run_play=is_run_play,
             play_history=self.play_history,
             game_situation=self.game_situation,
+            brain_state=self.brain_state,
             # Explicit play state machine
             play_state=player.play_state,
             time_in_state=player.time_in_state(self.clock.current_time),
@@ -835,6 +857,11 @@ class Orchestrator:
 
         # QB Context
         if pos == Position.QB:
+            # One receiver x defender scan shared by the QB brain and its throw,
+            # taken from the same positions as this world state
+            if self._qb_reads_separation(player):
+                self.separation_table = self._build_separation_table()
+
             # Ballcarrier fields for scramble scenarios
             run_play_side = self._run_concept.play_side if self._run_concept else ""
             has_immunity = player.tackle_immunity_until > self.clock.current_time
@@ -847,6 +874,7 @@ class Orchestrator:
                 qb_set_time=self._qb_set_time,
                 hot_routes=self._hot_routes,
                 pressure_state=self.pressure_system.state,
+                separation_table=self.separation_table,
                 # Ballcarrier fields (inherited from BallcarrierContextBase)
                 run_play_side=run_play_side,
                 run_aiming_point=None,  # QBs don't have designed gaps
@@ -1273,6 +1301,7 @@ class Orchestrator:
             return
 
         # Update QB dropback state first (so WorldState has fresh data)
+        self.separation_table = None
         if self.phase == PlayPhase.DEVELOPMENT:
             self._update_qb_dropback_state(dt)
 
@@ -1349,6 +1378,22 @@ class Orchestrator:
         if verbose:
             self._print_tick_state()
 
+    def _qb_reads_separation(self, qb: Player) -> bool:
+        """Whether the QB is holding the ball in pass development."""
+        return (
+            self.phase == PlayPhase.DEVELOPMENT
+            and self.ball.carrier_id == qb.id
+            and not (self.config and self.config.is_run_play)
+        )
+
+    def _build_separation_table(self) -> SeparationTable:
+        """Separation of every receiver from every defender, as the QB sees them now."""
+        receivers = [
+            p for p in self.offense
+            if p.position in (Position.WR, Position.TE, Position.RB)
+        ]
+        return SeparationTable(receivers, self.defense, tick=self.clock.tick_count)
+
     def _update_player_brain_only(self, player: Player, dt: float) -> None:
         """Run brain for action selection only - don't apply movement.
 
@@ -1704,6 +1749,7 @@ class Orchestrator:
             clock=self.clock,
             anticipated_target_pos=target_pos,
             defenders=defenders,
+            separation_table=self.separation_table,
         )
 
         # Update QB state
@@ -2482,10 +2528,9 @@ class Orchestrator:
         success = player.transition_to(new_state, self.clock.current_time, validate)
         if not success:
             trace = get_trace_system()
-            trace.add(
-                TraceCategory.BRAIN,
-                player.id,
-                f"Invalid state transition {player.play_state.value} -> {new_state.value}",
+            trace.trace(
+                player.id, player.name, TraceCategory.DECISION,
+                "Invalid state transition %s -> %s", player.play_state.value, new_state.value,
             )
         return success
 
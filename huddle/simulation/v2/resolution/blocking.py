@@ -19,6 +19,7 @@ from ..core.events import EventBus, EventType
 from ..core.entities import Position
 from ..core.variance import sigmoid_matchup_probability
 from ..core.ratings import get_matchup_modifier, get_composite_rating
+from ..core.trace import TraceCategory, get_trace_system
 
 if TYPE_CHECKING:
     from ..core.entities import Player
@@ -208,6 +209,33 @@ def reset_play_blocking_quality() -> None:
     _current_play_quality = "average"
 
 
+def blocking_quality_yards(quality: str, rng: Optional[random.Random] = None) -> int:
+    """Play-level yardage adjustment for a run, given its blocking quality.
+
+    Creates the realistic run distribution (stuffs, explosives, etc.).
+    NFL targets: 17% for 0 or loss, 11.6% for 10+, 2.5% for 20+, mean 4.5, median 3.0
+
+    Args:
+        quality: "great", "average", or "poor" (see roll_play_blocking_quality)
+        rng: Random generator (defaults to the module-level one)
+    """
+    rng = rng or random
+    if quality == "great":
+        # OL dominates -> explosive potential; 20% of these break into the secondary
+        if rng.random() < 0.20:
+            return rng.randint(18, 35)
+        # Normal great block: solid 3-11 yard gain (fills 7-9 good bucket)
+        return rng.randint(3, 11)
+    if quality == "poor":
+        # DL wins -> subtract 2-5 yards (creates losses and no-gains)
+        return -rng.randint(2, 5)
+    # Average blocking: 10% of the time the defense fills gaps quickly -> 0 or loss,
+    # otherwise spread across short, medium and occasional good gains
+    if rng.random() < 0.10:
+        return rng.randint(-3, 0)
+    return rng.randint(-2, 3)
+
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -790,7 +818,7 @@ class BlockResolver:
 
         # Check if DL is moving fast enough to even attempt evasion
         dl_velocity = dl.velocity if hasattr(dl, "velocity") else None
-        if dl_velocity and dl_velocity.magnitude() < 3.0:
+        if dl_velocity and dl_velocity.length() < 3.0:
             # Too slow to evade - need to be at speed
             evasion_chance *= 0.3
 
@@ -799,16 +827,20 @@ class BlockResolver:
 
         success = random.random() < evasion_chance
 
-        if success:
-            _trace(
-                f"[EVASION] {dl.id} evaded {ol.id} with {dl_action} "
-                f"(chance={evasion_chance:.1%}, DL agi={dl_agility} spd={dl_speed})"
-            )
-        else:
-            _trace(
-                f"[EVASION] {dl.id} failed to evade {ol.id} with {dl_action} "
-                f"(chance={evasion_chance:.1%})"
-            )
+        trace = get_trace_system()
+        if trace.enabled:
+            if success:
+                trace.trace(
+                    dl.id, dl.name, TraceCategory.ACTION,
+                    f"[EVASION] {dl.id} evaded {ol.id} with {dl_action} "
+                    f"(chance={evasion_chance:.1%}, DL agi={dl_agility} spd={dl_speed})"
+                )
+            else:
+                trace.trace(
+                    dl.id, dl.name, TraceCategory.ACTION,
+                    f"[EVASION] {dl.id} failed to evade {ol.id} with {dl_action} "
+                    f"(chance={evasion_chance:.1%})"
+                )
 
         return success
 
@@ -20,6 +20,7 @@ from ..core.entities import Player, Ball, BallState, Team, ThrowType
 from ..core.clock import Clock
 from ..core.events import EventBus, EventType
 from ..core.ratings import get_matchup_modifier
+from .separation import SeparationTable, defender_in_lane
 from ..physics.ball_flight import (
     calculate_spin_rate,
     calculate_drag_factor,
@@ -241,35 +242,7 @@ class PassingSystem:
         Returns:
             True if a defender is in the passing lane
         """
-        throw_vec = target_pos - thrower_pos
-        throw_length = throw_vec.length()
-
-        if throw_length < 0.1:
-            return False
-
-        throw_dir = throw_vec.normalized()
-
-        for defender in defenders:
-            # Vector from thrower to defender
-            to_defender = defender.pos - thrower_pos
-
-            # Project defender position onto throw vector
-            proj_length = to_defender.dot(throw_dir)
-
-            # Only consider defenders BETWEEN thrower and target (not behind or past)
-            if proj_length < 1.0 or proj_length > throw_length - 1.0:
-                continue
-
-            # Calculate perpendicular distance from throw line
-            proj_point = thrower_pos + throw_dir * proj_length
-            perp_distance = defender.pos.distance_to(proj_point)
-
-            # Check if defender is within the lane
-            if perp_distance < lane_width:
-                # Defender is in the passing lane!
-                return True
-
-        return False
+        return defender_in_lane(thrower_pos, target_pos, defenders, lane_width)
 
     def _calculate_intercept_point(
         self,
@@ -362,6 +335,7 @@ class PassingSystem:
         expected_receiver_velocity: Optional[Vec2] = None,
         throw_type_override: Optional[ThrowType] = None,
         defenders: Optional[List[Player]] = None,
+        separation_table: Optional[SeparationTable] = None,
     ) -> ThrowResult:
         """Execute a throw to a receiver.
 
@@ -381,6 +355,8 @@ class PassingSystem:
                 Use when receiver's route is complete but they should continue running.
             throw_type_override: Force a specific throw type
             defenders: List of defensive players (for passing lane detection)
+            separation_table: This tick's separation table; used for the
+                passing lane check instead of scanning defenders when provided
 
         Returns:
             ThrowResult with throw details
@@ -400,7 +376,9 @@ class PassingSystem:
 
         # Check for defenders in the passing lane ("Linebacker Magnet" prevention)
         has_defender_underneath = False
-        if defenders and not throw_type_override:
+        if separation_table is not None and not throw_type_override:
+            has_defender_underneath = separation_table.defender_in_lane(thrower.pos, initial_target)
+        elif defenders and not throw_type_override:
             has_defender_underneath = self._has_defender_in_lane(
                 thrower.pos, initial_target, defenders
             )
@@ -883,6 +861,7 @@ class PassingSystem:
         receivers: List[Player],
         defenders: List[Player],
         route_assignments: Optional[Dict[str, Any]] = None,
+        separation_table: Optional[SeparationTable] = None,
     ) -> List[ReceiverWindow]:
         """Evaluate all receivers and return their throw windows.
 
@@ -891,23 +870,21 @@ class PassingSystem:
             defenders: List of defender players
             route_assignments: Optional dict mapping player_id to RouteAssignment
                               (for route phase info)
+            separation_table: This tick's separation table, if already built
 
         Returns list sorted by read_order (progression order).
         """
         windows = []
 
-        for receiver in receivers:
-            # Find nearest defender to this receiver
-            nearest_defender = None
-            min_dist = float("inf")
-
-            for defender in defenders:
-                dist = receiver.pos.distance_to(defender.pos)
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest_defender = defender
+        table = separation_table
+        if table is None or any(r.id not in table for r in receivers):
+            table = SeparationTable(receivers, defenders)
 
-            separation = min_dist
+        for receiver in receivers:
+            # Nearest defender to this receiver
+            entry = table.nearest(receiver.id)
+            nearest_defender = entry.defender if entry else None
+            separation = entry.distance if entry else float("inf")
 
             # Score is based on separation (used for final decision)
             score = separation
@@ -944,6 +921,7 @@ class PassingSystem:
         defenders: List[Player],
         clock: Clock,
         route_assignments: Optional[Dict[str, Any]] = None,
+        separation_table: Optional[SeparationTable] = None,
     ) -> Optional[Player]:
         """Decide if QB should throw and to whom using read progression.
 
@@ -958,6 +936,7 @@ class PassingSystem:
             defenders: List of defender players
             clock: Game clock
             route_assignments: Optional dict mapping player_id to RouteAssignment
+            separation_table: This tick's separation table, if already built
 
         Returns the target receiver if should throw, None otherwise.
         """
@@ -969,7 +948,7 @@ class PassingSystem:
         if self.state != PassState.PRE_THROW:
             return None
 
-        windows = self.evaluate_receivers(receivers, defenders, route_assignments)
+        windows = self.evaluate_receivers(receivers, defenders, route_assignments, separation_table)
         if not windows:
             return None
 
@@ -0,0 +1,181 @@
+"""Receiver-defender separation table.
+
+Built once per tick during pass development (the orchestrator builds
+it alongside the QB's world state, so it matches what the QB sees) and
+shared by everything that needs to know how open receivers are:
+- QB brain: nearest defender, closing speed and projected separation at
+  ball arrival for each receiver in the progression
+- PassingSystem: passing-lane checks and receiver windows
+- CoverageSystem: separation from a defender's assignment
+
+Without the table each consumer repeats its own receiver x defender scan.
+
+Entries accept anything with ``id``, ``pos`` and ``velocity`` (Player or
+PlayerView). Positions and velocities are captured when the table is
+built, so later movement in the same tick doesn't skew the numbers.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..core.vec2 import Vec2
+
+
+# =============================================================================
+# Passing Lane Geometry
+# =============================================================================
+
+def defender_in_lane(
+    thrower_pos: Vec2,
+    target_pos: Vec2,
+    defenders: Iterable[Any],
+    lane_width: float = 2.0,
+) -> bool:
+    """Check if any defender is in the passing lane.
+
+    Uses perpendicular distance from defender to the throw vector. Only
+    defenders between thrower and target (not behind or past) count.
+
+    Args:
+        thrower_pos: QB position
+        target_pos: Target position for the throw
+        defenders: Defensive players (anything with .pos)
+        lane_width: Width of the lane to check (yards from center line)
+    """
+    return _positions_in_lane(thrower_pos, target_pos, (d.pos for d in defenders), lane_width)
+
+
+def _positions_in_lane(
+    thrower_pos: Vec2,
+    target_pos: Vec2,
+    positions: Iterable[Vec2],
+    lane_width: float,
+) -> bool:
+    throw_vec = target_pos - thrower_pos
+    throw_length = throw_vec.length()
+
+    if throw_length < 0.1:
+        return False
+
+    throw_dir = throw_vec.normalized()
+
+    for pos in positions:
+        proj_length = (pos - thrower_pos).dot(throw_dir)
+
+        if proj_length < 1.0 or proj_length > throw_length - 1.0:
+            continue
+
+        proj_point = thrower_pos + throw_dir * proj_length
+        if pos.distance_to(proj_point) < lane_width:
+            return True
+
+    return False
+
+
+# =============================================================================
+# Separation Table
+# =============================================================================
+
+@dataclass(slots=True)
+class SeparationEntry:
+    """Nearest-defender info for one receiver."""
+    receiver_id: str
+    receiver_pos: Vec2
+    receiver_velocity: Vec2
+    defender: Any  # Player or PlayerView
+    defender_pos: Vec2
+    defender_velocity: Vec2
+    distance: float
+    closing_speed: float  # Defender speed toward the receiver (yd/s)
+
+    @property
+    def defender_id(self) -> str:
+        return self.defender.id
+
+
+class SeparationTable:
+    """Receiver x defender distances for a single tick.
+
+    Usage:
+        table = SeparationTable(receivers, defenders, tick=clock.tick_count)
+        entry = table.nearest("WR1")
+        sep = table.projected_separation("WR1", flight_time=0.6)
+    """
+
+    def __init__(self, receivers: Iterable[Any], defenders: Iterable[Any], tick: int = 0):
+        self.tick = tick
+        self.defenders: List[Any] = list(defenders)
+        self._def_pos: List[Vec2] = [d.pos for d in self.defenders]
+        self._def_index: Dict[str, int] = {d.id: i for i, d in enumerate(self.defenders)}
+        self._receivers: Dict[str, Any] = {}
+        self._distances: Dict[str, List[float]] = {}
+        self._nearest: Dict[str, Optional[SeparationEntry]] = {}
+
+        # Vec2 is immutable, so holding the references snapshots this tick
+        def_pos = self._def_pos
+        def_vel = [d.velocity for d in self.defenders]
+
+        for receiver in receivers:
+            r_pos, r_vel = receiver.pos, receiver.velocity
+            row = [math.hypot(r_pos.x - p.x, r_pos.y - p.y) for p in def_pos]
+            self._receivers[receiver.id] = receiver
+            self._distances[receiver.id] = row
+
+            entry = None
+            if row:
+                idx = min(range(len(row)), key=row.__getitem__)
+                d_pos, d_vel = def_pos[idx], def_vel[idx]
+                closing_speed = 0.0
+                if d_vel.length() > 0:
+                    closing_speed = d_vel.dot((r_pos - d_pos).normalized())
+                entry = SeparationEntry(
+                    receiver_id=receiver.id,
+                    receiver_pos=r_pos,
+                    receiver_velocity=r_vel,
+                    defender=self.defenders[idx],
+                    defender_pos=d_pos,
+                    defender_velocity=d_vel,
+                    distance=row[idx],
+                    closing_speed=closing_speed,
+                )
+            self._nearest[receiver.id] = entry
+
+    def __contains__(self, receiver_id: str) -> bool:
+        return receiver_id in self._receivers
+
+    def nearest(self, receiver_id: str) -> Optional[SeparationEntry]:
+        """Nearest defender to a receiver, or None if there are no defenders."""
+        return self._nearest.get(receiver_id)
+
+    def distance(self, receiver_id: str, defender_id: str) -> float:
+        """Distance between a receiver and a defender (inf if either is unknown)."""
+        row = self._distances.get(receiver_id)
+        idx = self._def_index.get(defender_id)
+        if row is None or idx is None:
+            return float("inf")
+        return row[idx]
+
+    def projected_separation(self, receiver_id: str, flight_time: float) -> Optional[float]:
+        """Separation from the nearest defender when a ball thrown now arrives.
+
+        Both players are projected along their current velocity.
+        Returns None if the receiver has no nearby defender.
+        """
+        entry = self._nearest.get(receiver_id)
+        if entry is None:
+            return None
+        r_at_arrival = entry.receiver_pos + entry.receiver_velocity * flight_time
+        d_at_arrival = entry.defender_pos + entry.defender_velocity * flight_time
+        return r_at_arrival.distance_to(d_at_arrival)
+
+    def defender_in_lane(
+        self,
+        thrower_pos: Vec2,
+        target_pos: Vec2,
+        lane_width: float = 2.0,
+    ) -> bool:
+        """Check the passing lane against this tick's defender positions."""
+        return _positions_in_lane(thrower_pos, target_pos, self._def_pos, lane_width)
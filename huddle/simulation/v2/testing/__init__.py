@@ -1,9 +1,10 @@
 """Testing infrastructure for v2 simulation.
 
-Two types of testing:
+Three types of testing:
 
 1. Unit tests (pytest) - verify logic correctness
 2. Scenario runners - produce logs/stats for behavioral assessment
+3. Calibration runner (calibration.py) - seeded full plays vs NFL targets
 
 The scenario runners output detailed logs that can be analyzed by
 humans or AI to assess whether behavior "looks right" from a football
@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""Headless calibration runner for the v2 pass and run game.
+
+Builds plays directly through the Orchestrator (no API sessions), runs
+thousands of seeded plays across a process pool, and compares the
+aggregate against NFL targets with 95% confidence intervals.
+
+Every play gets its own seed derived from the run seed and the play's
+index, so a run is reproducible regardless of worker count or
+scheduling.
+
+Usage:
+    python -m huddle.simulation.v2.testing.calibration [--plays 2000] [--workers 8]
+
+    # Only the pass game, fixed seed
+    python -m huddle.simulation.v2.testing.calibration --kind pass --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from huddle.core.rng import SeedSequence
+
+from ..core.vec2 import Vec2
+from ..core.entities import Player, PlayerAttributes, Position, Team
+from ..orchestrator import DropbackType, Orchestrator, PlayConfig
+from ..plays.matchup import create_matchup
+from ..plays.run_concepts import get_run_concept
+from ..resolution.blocking import blocking_quality_yards
+from ..systems.pressure import ACCUMULATED_THRESHOLDS, PressureLevel
+
+
+# =============================================================================
+# NFL Targets
+# =============================================================================
+
+# Research targets (121,640 pass plays, 44,545 run plays): (target, tolerance)
+PASS_TARGETS: Dict[str, Tuple[float, float]] = {
+    "completion_rate": (60.5, 8.0),
+    "clean_completion_rate": (67.2, 8.0),
+    "pressure_completion_rate": (41.1, 10.0),
+    "interception_rate": (2.3, 2.0),
+    "sack_rate": (6.5, 3.0),
+    "pressure_rate": (35.0, 10.0),
+    "time_to_throw": (2.79, 0.4),
+    "yards_per_completion": (11.0, 3.0),
+    "depth_behind_los": (76.9, 10.0),
+    "depth_0_5": (74.0, 10.0),
+    "depth_6_10": (63.2, 10.0),
+    "depth_11_15": (56.8, 10.0),
+    "depth_16_20": (51.8, 12.0),
+    "depth_21_30": (38.2, 15.0),
+    "depth_30_plus": (29.8, 15.0),
+}
+
+RUN_TARGETS: Dict[str, Tuple[float, float]] = {
+    "mean_yards": (4.5, 1.0),
+    "stuff_rate": (8.7, 5.0),
+    "explosive_rate": (11.6, 5.0),
+    "big_play_rate": (2.5, 2.0),
+}
+
+# Air-yard buckets for completion by depth: (name, low, high)
+DEPTH_BUCKETS = [
+    ("behind_los", float("-inf"), 0),
+    ("0_5", 0, 6),
+    ("6_10", 6, 11),
+    ("11_15", 11, 16),
+    ("16_20", 16, 21),
+    ("21_30", 21, 31),
+    ("30_plus", 31, float("inf")),
+]
+
+DEFAULT_CONCEPTS = ["four_verts", "mesh", "smash", "flood", "stick", "slant_flat", "curl_flat"]
+DEFAULT_COVERAGES = ["cover_1", "cover_2", "cover_3", "cover_4", "cover_2_man"]
+DEFAULT_RUN_CONCEPTS = [
+    "inside_zone_right", "outside_zone_left", "power_right", "counter_right", "draw",
+]
+
+Z_95 = 1.96
+
+
+# =============================================================================
+# Play Construction
+# =============================================================================
+
+# The API's PlayerConfig baseline, so calibration matches what sessions play
+_BASE_ATTRIBUTES = dict(
+    speed=85, acceleration=85, agility=85, throw_power=85, throw_accuracy=85,
+    route_running=85, catching=85,
+)
+
+# (name, position, x, y, attribute overrides)
+_PASS_LINE = [
+    ("QB", "QB", 0, -5, dict(throw_power=88, throw_accuracy=85)),
+    ("LT", "LT", -3.0, -0.5, dict(block_power=80, strength=82)),
+    ("LG", "LG", -1.5, -0.5, dict(block_power=78, strength=80)),
+    ("C", "C", 0, -0.5, dict(block_power=76, strength=78)),
+    ("RG", "RG", 1.5, -0.5, dict(block_power=78, strength=80)),
+    ("RT", "RT", 3.0, -0.5, dict(block_power=78, strength=80)),
+]
+
+_PASS_RUSH = [
+    ("LDE", "DE", -3.5, 0.5, dict(pass_rush=82, strength=78)),
+    ("LDT", "DT", -1.0, 0.5, dict(pass_rush=78, strength=82)),
+    ("RDT", "DT", 1.0, 0.5, dict(pass_rush=78, strength=82)),
+    ("RDE", "DE", 3.5, 0.5, dict(pass_rush=84, strength=78)),
+]
+
+_RUN_OFFENSE = [
+    ("QB", "QB", 0, -3.5, {}),
+    ("RB", "RB", -0.5, -4.5, dict(speed=88, elusiveness=82)),
+    ("LT", "LT", -3.0, -0.5, dict(block_power=80, strength=82)),
+    ("LG", "LG", -1.5, -0.5, dict(block_power=78, strength=80)),
+    ("C", "C", 0, -0.5, dict(block_power=76, strength=78)),
+    ("RG", "RG", 1.5, -0.5, dict(block_power=78, strength=80)),
+    ("RT", "RT", 3.0, -0.5, dict(block_power=78, strength=80)),
+    ("WR1", "WR", -15, 0, {}),
+    ("WR2", "WR", 15, 0, {}),
+    ("TE", "TE", 4.5, -0.5, dict(block_power=72)),
+]
+
+_RUN_DEFENSE = [
+    ("LDE", "DE", -3.5, 0.5, dict(pass_rush=78, strength=78)),
+    ("LDT", "DT", -1.0, 0.5, dict(pass_rush=76, strength=82)),
+    ("RDT", "DT", 1.0, 0.5, dict(pass_rush=76, strength=82)),
+    ("RDE", "DE", 3.5, 0.5, dict(pass_rush=80, strength=78)),
+    ("WLB", "OLB", -5, 3.5, dict(tackling=78, speed=82)),
+    ("MLB", "MLB", 0, 4.0, dict(tackling=82, play_recognition=80)),
+    ("SLB", "OLB", 5, 3.5, dict(tackling=78, speed=82)),
+    ("LCB", "CB", -15, 5, dict(man_coverage=78, speed=88)),
+    ("RCB", "CB", 15, 5, dict(man_coverage=78, speed=88)),
+    ("FS", "FS", 0, 15, dict(zone_coverage=80, speed=86)),
+    ("SS", "SS", 5, 10, dict(tackling=80, speed=84)),
+]
+
+_RECEIVER_POSITIONS = {
+    "x": "WR", "y": "WR", "z": "WR", "slot_l": "WR", "slot_r": "WR",
+    "h": "TE", "t": "TE", "f": "RB", "b": "RB", "rb": "RB",
+}
+
+_DEFENDER_POSITIONS = {
+    "cb1": "CB", "cb2": "CB", "cb3": "CB", "slot_cb": "CB", "ncb": "CB",
+    "fs": "FS", "ss": "SS", "s": "SS",
+    "mlb": "MLB", "wlb": "OLB", "slb": "OLB", "olb": "OLB", "ilb": "ILB",
+    "de": "DE", "dt": "DT", "nt": "NT",
+}
+
+
+def _make_player(
+    name: str, position: str, x: float, y: float, team: Team, overrides: dict, **kwargs,
+) -> Player:
+    return Player(
+        id=name.lower().replace(" ", "_"),
+        name=name,
+        team=team,
+        position=Position(position),
+        pos=Vec2(x, y),
+        attributes=PlayerAttributes(**{**_BASE_ATTRIBUTES, **overrides}),
+        **kwargs,
+    )
+
+
+def build_pass_play(concept: str, coverage: str) -> Orchestrator:
+    """Orchestrator set up for a pass concept against a coverage scheme."""
+    matchup = create_matchup(concept, coverage)
+    if matchup is None:
+        raise ValueError(f"Unknown matchup: {concept} vs {coverage}")
+
+    offense = [_make_player(*spec[:4], Team.OFFENSE, spec[4]) for spec in _PASS_LINE]
+    routes: Dict[str, str] = {}
+    receiver_ids: Dict[str, str] = {}
+    for r in matchup.receivers:
+        player = _make_player(
+            r["name"], _RECEIVER_POSITIONS.get(r["position"].lower(), "WR"),
+            r["x"], r.get("y", 0), Team.OFFENSE, dict(route_running=85, speed=88),
+            read_order=r.get("read_order", 1), is_hot_route=r.get("hot_route", False),
+        )
+        offense.append(player)
+        routes[player.id] = r["route_type"]
+        receiver_ids[r["id"]] = player.id
+
+    defense = [_make_player(*spec[:4], Team.DEFENSE, spec[4]) for spec in _PASS_RUSH]
+    man_assignments: Dict[str, str] = {}
+    zone_assignments: Dict[str, str] = {}
+    for d in matchup.defenders:
+        player = _make_player(
+            d["name"], _DEFENDER_POSITIONS.get(d["position"].lower(), "CB"),
+            d["x"], d["y"], Team.DEFENSE, dict(speed=85),
+        )
+        defense.append(player)
+        target = receiver_ids.get(d.get("man_target_id"))
+        if d["coverage_type"] == "man" and target:
+            man_assignments[player.id] = target
+        elif d["coverage_type"] == "zone" and d.get("zone_type"):
+            zone_assignments[player.id] = d["zone_type"]
+
+    orchestrator = Orchestrator()
+    orchestrator.setup_play(offense, defense, PlayConfig(
+        routes=routes,
+        man_assignments=man_assignments,
+        zone_assignments=zone_assignments,
+        max_duration=10.0,
+    ))
+    orchestrator.register_default_brains()
+    return orchestrator
+
+
+def build_run_play(concept: str) -> Orchestrator:
+    """Orchestrator set up for a run concept against a base 4-3."""
+    run_concept = get_run_concept(concept)
+    if run_concept is None:
+        raise ValueError(f"Unknown run concept: {concept}")
+
+    offense = [_make_player(*spec[:4], Team.OFFENSE, spec[4]) for spec in _RUN_OFFENSE]
+    defense = [_make_player(*spec[:4], Team.DEFENSE, spec[4]) for spec in _RUN_DEFENSE]
+
+    orchestrator = Orchestrator()
+    orchestrator.setup_play(offense, defense, PlayConfig(
+        max_duration=10.0,
+        dropback_type=DropbackType.SHOTGUN,  # Minimal dropback for the handoff
+        is_run_play=True,
+        run_concept=concept,
+        handoff_timing=run_concept.handoff_timing,
+        ball_carrier_id="rb",
+    ))
+    orchestrator.register_default_brains()
+    return orchestrator
+
+
+# =============================================================================
+# Running Plays
+# =============================================================================
+
+@dataclass(frozen=True)
+class PlaySpec:
+    """One play to simulate."""
+    kind: str  # "pass" or "run"
+    concept: str
+    coverage: str = ""
+    seed: int = 0
+
+
+@dataclass
+class PlaySample:
+    """What calibration needs from one simulated play."""
+    kind: str
+    outcome: str
+    yards: float
+    depth: Optional[float] = None  # Air yards of the target (pass attempts)
+    time_to_throw: Optional[float] = None
+    pressured: bool = False
+
+    @property
+    def is_attempt(self) -> bool:
+        return self.outcome in ("complete", "incomplete", "interception")
+
+
+def simulate_play(spec: PlaySpec) -> PlaySample:
+    """
+    Run one seeded play headlessly.
+
+    The v2 brains and resolvers draw from the module-level generator, so
+    it is reseeded per play; specs are therefore safe to run in any order
+    or process.
+    """
+    random.seed(spec.seed)
+    if spec.kind == "run":
+        orchestrator = build_run_play(spec.concept)
+        result = orchestrator.run()
+        yards = int(result.yards_gained)
+        yards += blocking_quality_yards(getattr(orchestrator, "_play_blocking_quality", "average"))
+        return PlaySample(kind="run", outcome=result.outcome, yards=yards)
+
+    orchestrator = build_pass_play(spec.concept, spec.coverage)
+    result = orchestrator.run()
+    target = orchestrator.ball.flight_target
+    depth = target.y - orchestrator.los_y if result.throw_time is not None and target else None
+    # Pressured once the pocket broke down (accumulated pressure reached MODERATE)
+    peak = orchestrator.pressure_system.state.peak_accumulated
+    return PlaySample(
+        kind="pass",
+        outcome=result.outcome,
+        yards=result.yards_gained,
+        depth=depth,
+        time_to_throw=result.throw_time,
+        pressured=result.outcome == "sack" or peak >= ACCUMULATED_THRESHOLDS[PressureLevel.LIGHT],
+    )
+
+
+def _simulate_chunk(specs: Sequence[PlaySpec]) -> List[PlaySample]:
+    return [simulate_play(spec) for spec in specs]
+
+
+def plan_plays(
+    plays: int,
+    kind: str = "pass",
+    concepts: Optional[Sequence[str]] = None,
+    coverages: Optional[Sequence[str]] = None,
+    seed: int = 0,
+) -> List[PlaySpec]:
+    """Round-robin concept/coverage specs, each with its own derived seed."""
+    root = SeedSequence(seed).child(kind)
+    if kind == "run":
+        concepts = list(concepts or DEFAULT_RUN_CONCEPTS)
+        return [
+            PlaySpec("run", concepts[i % len(concepts)], seed=root.child(i).generate_seed())
+            for i in range(plays)
+        ]
+
+    concepts = list(concepts or DEFAULT_CONCEPTS)
+    coverages = list(coverages or DEFAULT_COVERAGES)
+    return [
+        PlaySpec(
+            "pass",
+            concepts[i % len(concepts)],
+            coverages[(i // len(concepts)) % len(coverages)],
+            seed=root.child(i).generate_seed(),
+        )
+        for i in range(plays)
+    ]
+
+
+def run_plays(specs: Sequence[PlaySpec], workers: Optional[int] = None) -> List[PlaySample]:
+    """
+    Simulate ``specs`` across a process pool, preserving their order.
+
+    Args:
+        specs: Plays to run
+        workers: Process count (defaults to the CPU count; 1 runs inline)
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(specs) < 2:
+        return _simulate_chunk(specs)
+
+    size = max(1, math.ceil(len(specs) / (workers * 4)))
+    chunks = [specs[i:i + size] for i in range(0, len(specs), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [sample for chunk in pool.map(_simulate_chunk, chunks) for sample in chunk]
+
+
+# =============================================================================
+# Statistics
+# =============================================================================
+
+@dataclass
+class Metric:
+    """A measured value with its 95% confidence interval and NFL target."""
+    name: str
+    value: float
+    low: float
+    high: float
+    n: int
+    target: Optional[float] = None
+    tolerance: Optional[float] = None
+
+    @property
+    def passes(self) -> Optional[bool]:
+        """Within tolerance of the target (None when there is no target or data)."""
+        if self.target is None or self.n == 0:
+            return None
+        return abs(self.value - self.target) <= self.tolerance
+
+
+def rate_metric(name: str, hits: int, n: int, targets: Dict[str, Tuple[float, float]]) -> Metric:
+    """Percentage with a Wilson score interval."""
+    target, tolerance = targets.get(name, (None, None))
+    if n == 0:
+        return Metric(name, 0.0, 0.0, 0.0, 0, target, tolerance)
+    p = hits / n
+    denom = 1 + Z_95 ** 2 / n
+    centre = (p + Z_95 ** 2 / (2 * n)) / denom
+    half = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 ** 2 / (4 * n * n)) / denom
+    return Metric(name, 100 * p, 100 * (centre - half), 100 * (centre + half), n, target, tolerance)
+
+
+def mean_metric(
+    name: str, values: Sequence[float], targets: Dict[str, Tuple[float, float]],
+) -> Metric:
+    """Mean with a normal-approximation interval."""
+    target, tolerance = targets.get(name, (None, None))
+    n = len(values)
+    if n == 0:
+        return Metric(name, 0.0, 0.0, 0.0, 0, target, tolerance)
+    mean = statistics.fmean(values)
+    half = Z_95 * statistics.stdev(values) / math.sqrt(n) if n > 1 else 0.0
+    return Metric(name, mean, mean - half, mean + half, n, target, tolerance)
+
+
+@dataclass
+class CalibrationReport:
+    """Calibration metrics for one batch of plays."""
+    kind: str
+    samples: List[PlaySample]
+    metrics: Dict[str, Metric] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.metrics:
+            self.metrics = (
+                _run_metrics(self.samples) if self.kind == "run" else _pass_metrics(self.samples)
+            )
+
+    @property
+    def failures(self) -> List[Metric]:
+        return [m for m in self.metrics.values() if m.passes is False]
+
+    def format_report(self) -> str:
+        """Human-readable table of metrics against targets."""
+        lines = [
+            "=" * 78,
+            f"{self.kind.upper()} GAME CALIBRATION ({len(self.samples)} plays)",
+            "=" * 78,
+            f"{'Metric':<26} {'Actual':>8} {'95% CI':>17} {'n':>6} {'Target':>8} {'Status':>8}",
+            "-" * 78,
+        ]
+        for m in self.metrics.values():
+            ci = f"[{m.low:.1f}, {m.high:.1f}]"
+            target = f"{m.target:.1f}" if m.target is not None else "-"
+            status = {True: "PASS", False: "FAIL", None: ""}[m.passes]
+            lines.append(
+                f"{m.name:<26} {m.value:>8.2f} {ci:>17} {m.n:>6} {target:>8} {status:>8}"
+            )
+        judged = [m for m in self.metrics.values() if m.passes is not None]
+        lines.append("-" * 78)
+        lines.append(f"RESULT: {len(judged) - len(self.failures)}/{len(judged)} within tolerance")
+        return "\n".join(lines)
+
+
+def _pass_metrics(samples: Sequence[PlaySample]) -> Dict[str, Metric]:
+    t = PASS_TARGETS
+    dropbacks = [s for s in samples if s.kind == "pass"]
+    attempts = [s for s in dropbacks if s.is_attempt]
+    completions = [s for s in attempts if s.outcome == "complete"]
+    clean = [s for s in attempts if not s.pressured]
+    pressured = [s for s in attempts if s.pressured]
+
+    def completed(plays: Sequence[PlaySample]) -> int:
+        return sum(1 for s in plays if s.outcome == "complete")
+
+    metrics = [
+        rate_metric("completion_rate", len(completions), len(attempts), t),
+        rate_metric("clean_completion_rate", completed(clean), len(clean), t),
+        rate_metric("pressure_completion_rate", completed(pressured), len(pressured), t),
+        rate_metric("interception_rate",
+                    sum(1 for s in attempts if s.outcome == "interception"), len(attempts), t),
+        rate_metric("sack_rate",
+                    sum(1 for s in dropbacks if s.outcome == "sack"), len(dropbacks), t),
+        rate_metric("pressure_rate", sum(1 for s in dropbacks if s.pressured), len(dropbacks), t),
+        mean_metric("time_to_throw", [s.time_to_throw for s in attempts if s.time_to_throw], t),
+        mean_metric("yards_per_completion", [s.yards for s in completions], t),
+    ]
+    for bucket, low, high in DEPTH_BUCKETS:
+        in_bucket = [s for s in attempts if s.depth is not None and low <= s.depth < high]
+        metrics.append(rate_metric(f"depth_{bucket}", completed(in_bucket), len(in_bucket), t))
+    return {m.name: m for m in metrics}
+
+
+def _run_metrics(samples: Sequence[PlaySample]) -> Dict[str, Metric]:
+    t = RUN_TARGETS
+    yards = [s.yards for s in samples if s.kind == "run"]
+    metrics = [
+        mean_metric("mean_yards", yards, t),
+        rate_metric("stuff_rate", sum(1 for y in yards if y < 0), len(yards), t),
+        rate_metric("explosive_rate", sum(1 for y in yards if y >= 10), len(yards), t),
+        rate_metric("big_play_rate", sum(1 for y in yards if y >= 20), len(yards), t),
+    ]
+    return {m.name: m for m in metrics}
+
+
+def run_calibration(
+    plays: int = 2000,
+    kind: str = "pass",
+    concepts: Optional[Sequence[str]] = None,
+    coverages: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> CalibrationReport:
+    """
+    Simulate ``plays`` seeded plays and compare them to the NFL targets.
+
+    Args:
+        plays: Number of plays to simulate
+        kind: "pass" or "run"
+        concepts: Concepts to rotate through (library names)
+        coverages: Coverage schemes to rotate through (pass only)
+        seed: Run seed; the same seed reproduces the same report
+        workers: Process count (defaults to the CPU count)
+
+    Returns:
+        CalibrationReport with metrics and confidence intervals
+    """
+    specs = plan_plays(plays, kind, concepts, coverages, seed)
+    return CalibrationReport(kind, run_plays(specs, workers))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plays", type=int, default=2000, help="plays per kind")
+    parser.add_argument("--kind", choices=["pass", "run", "both"], default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPUs)")
+    parser.add_argument("--strict", action="store_true", help="exit 1 if any metric fails")
+    args = parser.parse_args()
+
+    kinds = ["pass", "run"] if args.kind == "both" else [args.kind]
+    reports = [
+        run_calibration(args.plays, kind, seed=args.seed, workers=args.workers) for kind in kinds
+    ]
+    for report in reports:
+        print(report.format_report())
+        print()
+
+    if args.strict and any(report.failures for report in reports):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
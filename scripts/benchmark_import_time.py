@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Cold-start import benchmark for the API server.
+
+Each run imports the module in a fresh interpreter, which is what an
+autoscaled API container pays before it can serve its first request.
+Routers mount lazily (see huddle.api.lazy_routers), so the simulators and
+research models should not appear here. Exits non-zero when the median
+import time exceeds the budget.
+
+Usage:
+    python scripts/benchmark_import_time.py [--module huddle.api.main] [--budget 1.0]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMER = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+
+
+def import_seconds(module: str) -> float:
+    """Wall-clock import time of ``module`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", TIMER.format(module=module)],
+        capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str, count: int) -> list[tuple[int, str]]:
+    """(cumulative microseconds, name) of the slowest imports, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="huddle.api.main", help="module to import")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time")
+    parser.add_argument("--budget", type=float, default=1.0, help="median seconds allowed")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    args = parser.parse_args()
+
+    times = [import_seconds(args.module) for _ in range(args.runs)]
+    median = statistics.median(times)
+
+    print(f"{'Import':<60} {'cumulative':>10}")
+    print("-" * 71)
+    for micros, name in slowest_imports(args.module, args.top):
+        print(f"{name:<60} {micros / 1e6:>9.3f}s")
+    print()
+    print(f"{args.module}: median {median:.3f}s over {args.runs} runs (budget {args.budget:.3f}s)")
+
+    if median > args.budget:
+        sys.exit(f"Import time regressed past the {args.budget:.3f}s budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the high-volume slotted models.
+
+Season simulation, transaction history and the management feeds create
+these objects by the tens of thousands. Each model is a
+``@dataclass(slots=True)``; this script measures it against an
+otherwise identical dict-backed dataclass so the savings stay visible
+when fields are added.
+
+Usage:
+    python scripts/benchmark_model_memory.py [--count 50000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import os
+import sys
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from huddle.core.models.stats import (
+    DefensiveStats,
+    KickingStats,
+    PassingStats,
+    PlayerGameStats,
+    ReceivingStats,
+    RushingStats,
+)
+from huddle.core.transactions.transaction_log import Transaction
+from huddle.game.drive import PlayLog
+from huddle.management.events import ManagementEvent
+from huddle.management.ticker import TickerItem
+
+MODELS = [
+    PassingStats,
+    RushingStats,
+    ReceivingStats,
+    DefensiveStats,
+    KickingStats,
+    PlayerGameStats,
+    Transaction,
+    TickerItem,
+    ManagementEvent,
+    PlayLog,
+]
+
+# Required constructor arguments for models without full defaults
+REQUIRED_ARGS = {
+    PlayerGameStats: dict(player_id=None, player_name="", team_abbr="", position=""),
+    PlayLog: dict(
+        play_number=1, down=1, distance=10, los=25.0, play_type="run",
+        play_call="", yards_gained=0.0, result="run", first_down=False,
+        touchdown=False, turnover=False, time_elapsed=0.0,
+    ),
+}
+
+
+def dict_backed(cls: type) -> type:
+    """The same dataclass as ``cls`` without __slots__."""
+    spec = []
+    for f in dataclasses.fields(cls):
+        kwargs = {}
+        if f.default is not dataclasses.MISSING:
+            kwargs["default"] = f.default
+        if f.default_factory is not dataclasses.MISSING:
+            kwargs["default_factory"] = f.default_factory
+        spec.append((f.name, f.type, dataclasses.field(**kwargs)))
+    return dataclasses.make_dataclass(f"{cls.__name__}Dict", spec)
+
+
+def bytes_per_instance(cls: type, count: int, kwargs: dict) -> float:
+    """Average traced allocation per instance built from ``kwargs``."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(**kwargs) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000, help="instances per model")
+    args = parser.parse_args()
+
+    print(f"{'Model':<18} {'dict B/obj':>11} {'slots B/obj':>12} {'saved':>7}")
+    print("-" * 51)
+    for cls in MODELS:
+        kwargs = REQUIRED_ARGS.get(cls, {})
+        slotted = bytes_per_instance(cls, args.count, kwargs)
+        plain = bytes_per_instance(dict_backed(cls), args.count, kwargs)
+        saved = 1 - slotted / plain
+        print(f"{cls.__name__:<18} {plain:>11.0f} {slotted:>12.0f} {saved:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
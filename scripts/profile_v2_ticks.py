@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Per-tick system and brain timings for the v2 play simulation.
+
+Runs seeded calibration plays with a TickProfiler attached and prints
+where tick time goes (world-state building, each brain, blocking,
+tackles, ...) with p50/p99 per tick. Optionally writes the aggregates
+as JSON and every call as a Chrome trace (open in chrome://tracing or
+ui.perfetto.dev).
+
+Usage:
+    python scripts/profile_v2_ticks.py [--plays 40] [--kind pass|run|both]
+        [--json ticks.json] [--chrome-trace trace.json]
+"""
+
+import argparse
+import os
+import random
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from huddle.simulation.v2.core.instrumentation import TickProfiler
+from huddle.simulation.v2.testing.calibration import build_pass_play, build_run_play, plan_plays
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plays", type=int, default=40, help="plays per kind")
+    parser.add_argument("--kind", choices=["pass", "run", "both"], default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write aggregate timings here")
+    parser.add_argument("--chrome-trace", help="write every call as a Chrome trace here")
+    args = parser.parse_args()
+
+    kinds = ["pass", "run"] if args.kind == "both" else [args.kind]
+    profiler = TickProfiler(record_spans=bool(args.chrome_trace))
+
+    for kind in kinds:
+        for spec in plan_plays(args.plays, kind, seed=args.seed):
+            random.seed(spec.seed)
+            if kind == "run":
+                orchestrator = build_run_play(spec.concept)
+            else:
+                orchestrator = build_pass_play(spec.concept, spec.coverage)
+            orchestrator.instrument(profiler)
+            orchestrator.run()
+    profiler.finish()
+
+    print(profiler.format_report())
+    if args.json:
+        profiler.write_json(args.json)
+        print(f"\nAggregates written to {args.json}")
+    if args.chrome_trace:
+        profiler.write_chrome_trace(args.chrome_trace)
+        print(f"Chrome trace written to {args.chrome_trace}")
+
+
+if __name__ == "__main__":
+    main()
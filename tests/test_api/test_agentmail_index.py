@@ -0,0 +1,150 @@
+"""Tests for the in-memory AgentMail index."""
+
+import asyncio
+import os
+
+import pytest
+
+from huddle.api.routers import agentmail
+from huddle.api.services.agentmail_index import AgentMailIndex
+
+
+def write_message(path, subject, to_agent, from_agent="coordinator", **fields):
+    """Write a message file in the format the router produces."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = f"# {subject}\n\n**From:** {from_agent}\n**To:** {to_agent}\n"
+    for key, value in fields.items():
+        header += f"**{key}:** {value}\n"
+    path.write_text(header + "\n---\n\nBody text.\n")
+
+
+@pytest.fixture
+def mail_root(tmp_path):
+    """A small agentmail tree with two agents."""
+    root = tmp_path / "agentmail"
+    write_message(root / "qa_agent" / "to" / "001_bug_one.md", "Bug one", "qa_agent",
+                  Status="open", Thread="t1")
+    write_message(root / "qa_agent" / "to" / "002_task_two.md", "Task two", "qa_agent",
+                  Status="resolved", CC="live_sim_agent")
+    write_message(root / "live_sim_agent" / "to" / "001_reply.md", "Reply", "live_sim_agent",
+                  from_agent="qa_agent", Status="open", Thread="t1",
+                  **{"In-Reply-To": "qa_agent_to_001"})
+    (root / "live_sim_agent" / "notes").mkdir(parents=True)
+    (root / "live_sim_agent" / "notes" / "001_idea.md").write_text("# Idea\n\n**Tags:** a, b\n")
+    (root / "status").mkdir()
+    (root / "status" / "qa_agent_status.md").write_text("# QA - Status\n\n**Agent Role:** Testing\n")
+    (root / "tuning_notes").mkdir()
+    (root / "tuning_notes" / "001_speed.md").write_text("# Speed\n\n**Added by:** qa_agent\n")
+    return root
+
+
+@pytest.fixture
+def index(mail_root):
+    return AgentMailIndex(
+        mail_root,
+        parse_message=agentmail.parse_message_file,
+        parse_status=agentmail.parse_status_file,
+        parse_tuning_note=agentmail.parse_tuning_note,
+        parse_agent_note=agentmail.parse_agent_note,
+        max_staleness=3600,
+    )
+
+
+class TestIndexQueries:
+    """Lookups against a freshly synced index."""
+
+    def test_folder_messages_newest_first(self, index):
+        ids = [m.id for m in index.folder_messages("qa_agent", "to")]
+        assert ids == ["qa_agent_to_002", "qa_agent_to_001"]
+
+    def test_lookup_by_number(self, index):
+        msg = index.get_message("qa_agent", "to", "002")
+        assert msg.subject == "Task two"
+        assert index.get_message("qa_agent", "to", "999") is None
+
+    def test_secondary_indexes(self, index):
+        assert [m.id for m in index.cc_messages("live_sim_agent")] == ["qa_agent_to_002"]
+        assert len(index.thread_messages("t1")) == 2
+        assert [m.id for m in index.replies_to("qa_agent_to_001")] == ["live_sim_agent_to_001"]
+        assert {m.id for m in index.messages_with_status("open")} == {
+            "qa_agent_to_001", "live_sim_agent_to_001"
+        }
+
+    def test_notes_status_and_tuning(self, index):
+        assert [n.title for n in index.agent_notes("live_sim_agent")] == ["Idea"]
+        assert index.status("qa_agent").role == "Testing"
+        assert [n.topic for n in index.tuning_notes()] == ["Speed"]
+        assert index.next_number("qa_agent", "to") == "003"
+
+    def test_returned_records_are_copies(self, index):
+        msg = index.folder_messages("qa_agent", "to")[0]
+        msg.content = None
+        assert index.folder_messages("qa_agent", "to")[0].content is not None
+
+
+class TestIncrementalUpdates:
+    """Changes are picked up without a full reparse."""
+
+    def test_update_path_reindexes_one_file(self, index, mail_root):
+        index.sync()
+        path = mail_root / "qa_agent" / "to" / "001_bug_one.md"
+        path.write_text(path.read_text().replace("**Status:** open", "**Status:** closed"))
+        index.update_path(path)
+
+        assert index.get_message("qa_agent", "to", "001").status == "closed"
+        assert "qa_agent_to_001" not in {m.id for m in index.messages_with_status("open")}
+
+    def test_sync_reparses_only_changed_files(self, mail_root):
+        parsed = []
+
+        def counting_parser(filepath, agent_name, direction):
+            parsed.append(filepath.name)
+            return agentmail.parse_message_file(filepath, agent_name, direction)
+
+        index = AgentMailIndex(
+            mail_root,
+            parse_message=counting_parser,
+            parse_status=agentmail.parse_status_file,
+            parse_tuning_note=agentmail.parse_tuning_note,
+            parse_agent_note=agentmail.parse_agent_note,
+        )
+        index.sync()
+        assert len(parsed) == 3
+
+        parsed.clear()
+        new_file = mail_root / "qa_agent" / "to" / "003_new.md"
+        write_message(new_file, "New", "qa_agent")
+        changed = index.sync()
+
+        assert parsed == ["003_new.md"]
+        assert changed == {str(new_file)}
+
+    def test_deleted_files_are_dropped(self, index, mail_root):
+        index.sync()
+        os.remove(mail_root / "qa_agent" / "to" / "002_task_two.md")
+        index.sync()
+
+        assert index.cc_messages("live_sim_agent") == []
+        assert index.get_message("qa_agent", "to", "002") is None
+
+
+class TestRouterUsesIndex:
+    """Endpoints answer from the index and keep it current on writes."""
+
+    @pytest.fixture
+    def router_index(self, monkeypatch, mail_root, index):
+        monkeypatch.setattr(agentmail, "AGENTMAIL_PATH", mail_root)
+        monkeypatch.setattr(agentmail, "agentmail_index", index)
+        return index
+
+    def test_inbox_includes_cc(self, router_index):
+        inbox = asyncio.run(agentmail.get_agent_inbox("live_sim_agent"))
+        assert {m.id for m in inbox.messages} == {"live_sim_agent_to_001", "qa_agent_to_002"}
+
+    def test_status_update_is_visible_immediately(self, router_index):
+        request = agentmail.UpdateMessageStatusRequest(message_id="qa_agent_to_001", status="in_progress")
+        asyncio.run(agentmail.update_message_status(request))
+
+        # max_staleness is an hour, so this only passes if the write updated the index
+        msg = asyncio.run(agentmail.get_message("qa_agent_to_001"))
+        assert msg["status"] == "in_progress"
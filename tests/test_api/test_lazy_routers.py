@@ -0,0 +1,80 @@
+"""Tests for lazy router mounting and API cold-start cost."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from huddle.api.lazy_routers import LazyRouter, LazyRouterMiddleware, mount_lazy_routers
+from huddle.api.main import LAZY_ROUTERS, create_app
+from huddle.core.research import ResearchModel
+
+# Generous for slow CI machines; importing every router eagerly took ~1.7s
+IMPORT_BUDGET_SECONDS = 1.5
+
+
+@pytest.fixture
+def lazy_app():
+    app = FastAPI()
+    app.state.lazy_routers = [
+        LazyRouter("/api/v1/teams", "huddle.api.routers.teams", "/api/v1"),
+        LazyRouter("/api/v1/team-routes", "huddle.api.routers.team_routes", "/api/v1"),
+    ]
+    app.add_middleware(LazyRouterMiddleware, target=app)
+    return app
+
+
+class TestLazyRouters:
+
+    def test_mounts_on_first_request_to_prefix(self, lazy_app):
+        client = TestClient(lazy_app)
+
+        assert client.get("/api/v1/unrelated").status_code == 404
+        assert len(lazy_app.state.lazy_routers) == 2
+
+        assert client.get("/api/v1/teams/").status_code == 200
+        assert [r.module for r in lazy_app.state.lazy_routers] == ["huddle.api.routers.team_routes"]
+
+    def test_openapi_mounts_everything(self, lazy_app):
+        paths = TestClient(lazy_app).get("/openapi.json").json()["paths"]
+
+        assert lazy_app.state.lazy_routers == []
+        assert any(p.startswith("/api/v1/teams") for p in paths)
+        assert any(p.startswith("/api/v1/team-routes") for p in paths)
+
+    def test_table_covers_router_prefixes(self):
+        app = create_app()
+        mount_lazy_routers(app)
+        paths = list(app.openapi()["paths"])
+        paths += [
+            route.path for lazy in LAZY_ROUTERS if not lazy.prefix
+            for route in importlib.import_module(lazy.module).router.routes
+        ]
+
+        unclaimed = [p for p in paths if not any(lazy.matches(p) for lazy in LAZY_ROUTERS)]
+        assert len(paths) > 200 and unclaimed == []
+
+
+class TestColdStart:
+
+    def test_api_import_stays_light(self):
+        code = (
+            "import sys, time; t = time.perf_counter(); import huddle.api.main; "
+            "print(time.perf_counter() - t); "
+            "print(sorted(m for m in sys.modules if m.startswith('huddle.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        seconds, modules = result.stdout.strip().splitlines()[-2:]
+
+        assert modules == "['huddle.api', 'huddle.api.lazy_routers', 'huddle.api.main']"
+        assert float(seconds) < IMPORT_BUDGET_SECONDS
+
+    def test_research_model_loads_on_first_access(self):
+        model = ResearchModel("injury_model.json", "no_such_section", default={"QB": 1})
+        assert model._data is None
+        assert model.get("QB") == 1 and dict(model) == {"QB": 1}
@@ -0,0 +1,68 @@
+"""Tests for the benchmark harness."""
+
+import pytest
+
+from benchmarks.harness import (
+    BENCHMARKS,
+    BenchContext,
+    Benchmark,
+    BenchmarkResult,
+    compare_results,
+    format_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+from benchmarks import game, league, v2_plays, websocket  # noqa: F401  (register benchmarks)
+
+
+def _fixed(seconds_per_run):
+    """Benchmark whose runs take the given (recorded, not slept) times."""
+    runs = iter(seconds_per_run)
+
+    def func(ctx: BenchContext) -> None:
+        ctx.record("work", next(runs))
+        ctx.ops += 10
+    return Benchmark("fixed", "items", func, repeats=len(seconds_per_run))
+
+
+class TestHarness:
+
+    def test_keeps_median_run(self):
+        result = run_benchmark(_fixed([3.0, 1.0, 2.0]))
+
+        assert result.seconds == 2.0
+        assert result.rate == 5.0
+        assert result.runs == [3.0, 1.0, 2.0]
+
+    def test_rejects_benchmark_that_timed_nothing(self):
+        with pytest.raises(RuntimeError):
+            run_benchmark(Benchmark("empty", "items", lambda ctx: None, repeats=1))
+
+    def test_results_round_trip_and_flag_regressions(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        save_results(path, [BenchmarkResult("fixed", "items", 100, 1.0)])
+        baseline = load_results(path)
+
+        slower = [BenchmarkResult("fixed", "items", 100, 1.25), BenchmarkResult("new", "x", 1, 1.0)]
+        [comparison] = compare_results(slower, baseline)
+
+        assert baseline["fixed"].rate == 100.0
+        assert comparison.change == pytest.approx(-0.2)
+        assert comparison.is_regression(0.15) and not comparison.is_regression(0.25)
+        assert "-20.0% !" in format_results(slower, [comparison], 0.15)
+
+
+class TestBenchmarks:
+
+    @pytest.mark.parametrize("name", sorted(BENCHMARKS))
+    def test_every_benchmark_runs_quick(self, name):
+        result = run_benchmark(BENCHMARKS[name], quick=True, repeats=1)
+
+        assert result.ops > 0 and result.seconds > 0
+
+    def test_ws_frames_quick(self):
+        result = run_benchmark(BENCHMARKS["ws_frames"], quick=True, repeats=1)
+
+        assert result.ops > 10
+        assert set(result.phases) == {"state_sync", "tick"}
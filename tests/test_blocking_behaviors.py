@@ -792,9 +792,7 @@ class TestTier6ProtectionCall:
 
     def test_6_1_center_makes_call(self):
         """Test 6.1: Center identifies MIKE and makes protection call."""
-        from huddle.simulation.v2.ai.ol_brain import ol_brain, _protection_call, _reset_protection_call
-
-        _reset_protection_call()
+        from huddle.simulation.v2.ai.ol_brain import ol_brain
 
         offense = [
             make_player('C', Position.C, Team.OFFENSE, 0, -0.5),
@@ -814,7 +812,7 @@ class TestTier6ProtectionCall:
 
         # Check that protection call was made
         from huddle.simulation.v2.ai.ol_brain import _get_protection_call
-        call = _get_protection_call()
+        call = _get_protection_call(orch.brain_state)
 
         assert call is not None, "Center should have made protection call"
         assert call.mike_id is not None, "MIKE should be identified"
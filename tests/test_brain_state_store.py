@@ -0,0 +1,137 @@
+"""Tests for the per-orchestrator brain state store."""
+
+from typing import List
+
+import pytest
+
+from huddle.simulation.v2.orchestrator import Orchestrator, PlayConfig, DropbackType
+from huddle.simulation.v2.core.brain_state import BrainStateStore, store_for
+from huddle.simulation.v2.core.entities import Player, Team, Position, PlayerAttributes
+from huddle.simulation.v2.core.vec2 import Vec2
+from huddle.simulation.v2.ai.qb_brain import qb_brain, QBState
+from huddle.simulation.v2.ai.ol_brain import ol_brain, _get_protection_call
+from huddle.simulation.v2.ai.lb_brain import lb_brain
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def make_player(name: str, pos: Position, team: Team, x: float, y: float) -> Player:
+    return Player(
+        id=name.lower(), name=name, team=team, position=pos, pos=Vec2(x, y),
+        attributes=PlayerAttributes(speed=75, acceleration=75, strength=75, awareness=75),
+    )
+
+
+def make_players() -> tuple[List[Player], List[Player]]:
+    offense = [
+        make_player("QB", Position.QB, Team.OFFENSE, 0, -5),
+        make_player("C", Position.C, Team.OFFENSE, 0, -0.5),
+    ]
+    defense = [
+        make_player("MLB", Position.MLB, Team.DEFENSE, 0, 4),
+    ]
+    return offense, defense
+
+
+def setup_orchestrator() -> Orchestrator:
+    offense, defense = make_players()
+    orch = Orchestrator()
+    orch.register_brain("qb", qb_brain)
+    orch.register_brain("c", ol_brain)
+    orch.register_brain("mlb", lb_brain)
+
+    config = PlayConfig(
+        routes={},
+        man_assignments={},
+        zone_assignments={},
+        max_duration=3.0,
+        dropback_type=DropbackType.SHOTGUN,
+    )
+    orch.setup_play(offense, defense, config)
+    orch._do_pre_snap_reads()
+    orch._do_snap()
+    return orch
+
+
+def run_ticks(orch: Orchestrator, num_ticks: int) -> None:
+    for _ in range(num_ticks):
+        orch._update_tick(orch.clock.tick())
+
+
+# =============================================================================
+# Store Tests
+# =============================================================================
+
+class TestBrainStateStore:
+    """Tests for the store itself."""
+
+    def test_get_allocates_once(self):
+        store = BrainStateStore()
+        state = store.get("qb", "QB1", QBState)
+        state.current_read = 3
+
+        assert store.get("qb", "QB1", QBState) is state
+        assert len(store) == 1
+
+    def test_reset_player_replaces_state(self):
+        store = BrainStateStore()
+        store.get("qb", "QB1", QBState).current_read = 3
+
+        fresh = store.reset_player("qb", "QB1", QBState)
+        assert store.peek("qb", "QB1") is fresh
+        assert fresh.current_read != 3
+
+    def test_reset_drops_everything(self):
+        store = BrainStateStore()
+        store.get("qb", "QB1", QBState)
+        store.set_shared("ol.protection_call", object())
+
+        store.reset()
+        assert len(store) == 0
+        assert store.get_shared("ol.protection_call") is None
+
+    def test_state_dataclasses_use_slots(self):
+        with pytest.raises(AttributeError):
+            QBState().not_a_field = 1
+
+
+# =============================================================================
+# Orchestrator Integration
+# =============================================================================
+
+class TestOrchestratorBrainState:
+    """Brains keep their memory in the orchestrator's store."""
+
+    def test_brains_receive_orchestrator_store(self):
+        orch = setup_orchestrator()
+        world = orch._build_world_state(orch.offense[0], 0.05)
+
+        assert world.brain_state is orch.brain_state
+        assert store_for(world) is orch.brain_state
+
+    def test_brain_state_lives_on_orchestrator(self):
+        orch = setup_orchestrator()
+        run_ticks(orch, 5)
+
+        assert orch.brain_state.peek("qb", "qb") is not None
+        assert orch.brain_state.peek("ol", "c") is not None
+        assert orch.brain_state.peek("lb", "mlb") is not None
+        assert _get_protection_call(orch.brain_state) is not None
+
+    def test_orchestrators_do_not_share_state(self):
+        first = setup_orchestrator()
+        second = setup_orchestrator()
+        run_ticks(first, 5)
+
+        assert len(first.brain_state) > 0
+        assert len(second.brain_state) == 0
+
+    def test_setup_play_releases_previous_play(self):
+        orch = setup_orchestrator()
+        run_ticks(orch, 5)
+
+        offense, defense = make_players()
+        orch.setup_play(offense, defense, orch.config)
+        assert len(orch.brain_state) == 0
@@ -0,0 +1,181 @@
+"""Tests for commentary caching, coalescing and batching."""
+
+import asyncio
+import copy
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from huddle.ai.commentary import (
+    CachedCommentaryGenerator,
+    CommentaryCache,
+    GeminiClient,
+    GeminiCommentaryGenerator,
+    build_batch_play_by_play_prompt,
+    commentary_cache_key,
+    parse_batch_play_by_play,
+)
+from huddle.ai.commentary.stub_server import StubGeminiServer
+from huddle.ai.commentary.test_prompts import (
+    create_routine_completion,
+    create_sack,
+    create_touchdown,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def stub_server():
+    with StubGeminiServer() as server:
+        yield server
+
+
+def make_generator(server: StubGeminiServer, **kwargs) -> CachedCommentaryGenerator:
+    client = GeminiClient(api_key="stub", base_url=server.base_url, max_retries=1)
+    return CachedCommentaryGenerator(GeminiCommentaryGenerator(client=client), **kwargs)
+
+
+# =============================================================================
+# Cache Key Tests
+# =============================================================================
+
+class TestCacheKey:
+    """Tests for context normalization."""
+
+    def test_same_bucket_shares_key(self):
+        """Plays differing only within a situation bucket share a key."""
+        a = create_routine_completion()
+        b = copy.deepcopy(a)
+        b.play.situation.distance = 9  # still "long"
+        b.play.situation.yards_to_goal = 33  # still opponent territory
+
+        assert commentary_cache_key(a, "play_by_play") == commentary_cache_key(b, "play_by_play")
+
+    def test_yards_are_exact(self):
+        """Stated facts like yardage are never bucketed."""
+        a = create_routine_completion()
+        b = copy.deepcopy(a)
+        b.play.yards_gained = a.play.yards_gained + 1
+
+        assert commentary_cache_key(a, "play_by_play") != commentary_cache_key(b, "play_by_play")
+
+    def test_color_key_includes_hooks(self):
+        """Color commentary keys change with the narrative hooks."""
+        a = create_routine_completion()
+        b = copy.deepcopy(a)
+        b.hooks_to_use = ["Something new"]
+
+        assert commentary_cache_key(a, "play_by_play") == commentary_cache_key(b, "play_by_play")
+        assert commentary_cache_key(a, "color") != commentary_cache_key(b, "color")
+
+
+class TestCommentaryCache:
+    """Tests for the LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = CommentaryCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+
+    def test_ttl_expiry(self):
+        now = [0.0]
+        cache = CommentaryCache(ttl_seconds=10, clock=lambda: now[0])
+        cache.put("a", "A")
+
+        now[0] = 5.0
+        assert cache.get("a") == "A"
+        now[0] = 20.0
+        assert cache.get("a") is None
+
+
+# =============================================================================
+# Batch Prompt Tests
+# =============================================================================
+
+class TestBatchPrompt:
+    """Tests for batched prompt building and parsing."""
+
+    def test_prompt_numbers_each_play(self):
+        contexts = [create_routine_completion(), create_sack()]
+        _, user = build_batch_play_by_play_prompt(contexts)
+
+        assert "=== Play [1] ===" in user
+        assert "=== Play [2] ===" in user
+
+    def test_parse_skips_missing_and_out_of_range(self):
+        text = "[1] First call.\nnoise\n[3] Out of range.\n"
+        assert parse_batch_play_by_play(text, 2) == {0: "First call."}
+
+
+# =============================================================================
+# Generator Tests (against the local stub server)
+# =============================================================================
+
+class TestCachedGenerator:
+    """End-to-end tests against the stub Gemini server."""
+
+    def test_repeat_play_served_from_cache(self, stub_server):
+        async def run():
+            async with make_generator(stub_server) as generator:
+                first = await generator.generate_play_by_play(create_routine_completion())
+                second = await generator.generate_play_by_play(create_routine_completion())
+                return first, second, generator.get_stats()
+
+        first, second, stats = asyncio.run(run())
+
+        assert first == second == "Stub commentary."
+        assert stub_server.request_count == 1
+        assert stats["hits"] == 1
+
+    def test_concurrent_identical_requests_coalesce(self):
+        with StubGeminiServer(latency=0.05) as server:
+            async def run():
+                async with make_generator(server) as generator:
+                    return await asyncio.gather(*[
+                        generator.generate_play_by_play(create_routine_completion())
+                        for _ in range(5)
+                    ])
+
+            results = asyncio.run(run())
+
+        assert len(set(results)) == 1
+        assert server.request_count == 1
+
+    def test_queued_plays_are_batched(self):
+        with StubGeminiServer(latency=0.05) as server:
+            async def run():
+                async with make_generator(server) as generator:
+                    return await asyncio.gather(
+                        generator.generate_play_by_play(create_routine_completion()),
+                        generator.generate_play_by_play(create_sack()),
+                        generator.generate_play_by_play(create_touchdown()),
+                    )
+
+            results = asyncio.run(run())
+
+        assert results == [
+            "Stub call for play 1.",
+            "Stub call for play 2.",
+            "Stub call for play 3.",
+        ]
+        assert server.request_count == 1
+
+    def test_api_failure_falls_back(self):
+        with StubGeminiServer(status_code=400) as server:
+            async def run():
+                async with make_generator(server) as generator:
+                    return await generator.generate_play_by_play(create_sack())
+
+            text = asyncio.run(run())
+
+        assert text.startswith("Sack!")
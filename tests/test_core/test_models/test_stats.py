@@ -0,0 +1,50 @@
+"""Tests for the slotted stat and log models."""
+
+from uuid import uuid4
+
+import pytest
+
+from huddle.core.models.stats import (
+    DefensiveStats,
+    KickingStats,
+    PassingStats,
+    PlayerGameStats,
+    ReceivingStats,
+    RushingStats,
+)
+from huddle.core.transactions.transaction_log import Transaction, TransactionType
+from huddle.management.events import EventCategory, ManagementEvent
+from huddle.management.ticker import TickerCategory, TickerItem
+
+
+class TestSlottedModels:
+    """High-volume models carry no per-instance __dict__."""
+
+    @pytest.mark.parametrize("model", [
+        PassingStats(), RushingStats(), ReceivingStats(), DefensiveStats(), KickingStats(),
+        PlayerGameStats(player_id=uuid4(), player_name="Test", team_abbr="PHI", position="QB"),
+        Transaction(), TickerItem(), ManagementEvent(),
+    ])
+    def test_no_instance_dict(self, model):
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.not_a_field = 1
+
+    def test_player_game_stats_round_trip(self):
+        stats = PlayerGameStats(
+            player_id=uuid4(), player_name="Jalen Hurts", team_abbr="PHI", position="QB",
+            passing=PassingStats(attempts=30, completions=21, yards=280, touchdowns=2),
+            rushing=RushingStats(attempts=8, yards=45, touchdowns=1),
+            defense=DefensiveStats(sacks=0.5),
+        )
+
+        assert PlayerGameStats.from_dict(stats.to_dict()) == stats
+
+    def test_feed_models_round_trip(self):
+        transaction = Transaction(transaction_type=TransactionType.TRADE, season=2024, team_id="PHI")
+        ticker = TickerItem(category=TickerCategory.TRADE, headline="Blockbuster", priority=8)
+        event = ManagementEvent(event_type="practice", category=EventCategory.PRACTICE, title="Practice")
+
+        assert Transaction.from_dict(transaction.to_dict()).to_dict() == transaction.to_dict()
+        assert TickerItem.from_dict(ticker.to_dict()).to_dict() == ticker.to_dict()
+        assert ManagementEvent.from_dict(event.to_dict()).to_dict() == event.to_dict()
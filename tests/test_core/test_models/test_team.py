@@ -3,6 +3,7 @@
 import pytest
 from uuid import uuid4
 
+from huddle.core.attributes import PlayerAttributes
 from huddle.core.enums import Position
 from huddle.core.models.player import Player
 from huddle.core.models.team import DepthChart, Roster, Team
@@ -191,6 +192,66 @@ class TestRoster:
         assert restored.get_starter("QB1") is not None
         assert restored.get_starter("QB1").position == Position.QB
 
+    def _rated_qb(self, name: str, rating: int) -> Player:
+        attrs = PlayerAttributes()
+        for attr in ("throw_power", "throw_accuracy_short", "awareness"):
+            attrs.set(attr, rating)
+        return Player(first_name=name, last_name="QB", position=Position.QB, attributes=attrs)
+
+    def test_new_player_joins_bottom_of_depth(self):
+        """add_player should slot newcomers behind existing depth."""
+        roster = Roster()
+        starter, backup = self._rated_qb("Starter", 60), self._rated_qb("Backup", 90)
+
+        roster.add_player(starter)
+        roster.add_player(backup)
+
+        assert roster.depth_chart.get_all_at_position("QB") == [starter.id, backup.id]
+
+    def test_remove_player_closes_depth_gap(self):
+        """Removing a starter should promote the players behind them."""
+        roster = Roster()
+        qbs = [self._rated_qb(name, 70) for name in ("A", "B", "C")]
+        for qb in qbs:
+            roster.add_player(qb)
+
+        roster.remove_player(qbs[0].id)
+
+        assert roster.depth_chart.get_all_at_position("QB") == [qbs[1].id, qbs[2].id]
+        assert roster.get_starter("QB1") is qbs[1]
+        assert roster.depth_chart.get("QB3") is None
+
+    def test_update_position_depth_reranks_by_overall(self):
+        """update_position_depth should re-sort only that position."""
+        roster = Roster()
+        low, high = self._rated_qb("Low", 60), self._rated_qb("High", 70)
+        wr = Player(first_name="Wide", last_name="Out", position=Position.WR)
+        for player in (low, high, wr):
+            roster.add_player(player)
+        roster.auto_fill_depth_chart()
+        assert roster.get_starter("QB1") is high
+
+        for attr in ("throw_power", "throw_accuracy_short", "awareness"):
+            low.attributes.set(attr, 95)
+        roster.update_position_depth(Position.QB)
+
+        assert roster.depth_chart.get_all_at_position("QB") == [low.id, high.id]
+        assert roster.get_starter("WR1") is wr
+
+    def test_position_index_survives_direct_edits(self):
+        """Editing `players` directly should not leave stale lookups."""
+        roster = Roster()
+        wr = Player(first_name="Wide", last_name="Out", position=Position.WR)
+        roster.add_player(wr)
+        assert roster.get_players_by_position(Position.WR) == [wr]
+
+        del roster.players[wr.id]
+        assert roster.get_players_by_position(Position.WR) == []
+
+        roster.clear()
+        assert roster.size == 0
+        assert roster.depth_chart.slots == {}
+
 
 class TestTeam:
     """Tests for Team."""
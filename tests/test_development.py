@@ -1,5 +1,9 @@
 """Tests for the player development system."""
 
+import hashlib
+import json
+import random
+
 import pytest
 from uuid import uuid4
 
@@ -22,6 +26,11 @@ from huddle.core.development import (
     develop_player,
     can_develop,
 )
+from huddle.core.ai.development_curves import (
+    apply_offseason_development,
+    apply_offseason_development_bulk,
+)
+from huddle.generators.player import generate_players
 
 
 # =============================================================================
@@ -406,3 +415,62 @@ class TestCanDevelop:
 
         if player.overall >= player.potential:
             assert can_develop(player) is False
+
+
+class TestOffseasonDevelopmentBulk:
+    """Tests for the league-wide offseason development pass."""
+
+    def _league_sample(self):
+        rng = random.Random(4)
+        players = []
+        for position in (Position.QB, Position.RB, Position.CB, Position.LT, Position.K):
+            ages = [22, 25, 28, 31, 34]
+            players += generate_players(position, len(ages), ages=ages, rng=rng)
+        players[0].attributes.set_potential("awareness", players[0].attributes.get("awareness") + 1)
+        return players
+
+    # Captured from the per-player implementation before the bulk pass
+    # (apply_offseason_development on each player, sharing Random(1))
+    GOLDEN_OVERALL_BEFORE = [
+        69, 77, 70, 74, 82, 76, 81, 75, 77, 79, 86, 78, 89,
+        85, 76, 91, 97, 79, 90, 86, 81, 93, 76, 73, 81,
+    ]
+    GOLDEN_OVERALL_AFTER = [
+        76, 86, 68, 74, 78, 86, 81, 64, 66, 68, 96, 76, 89,
+        76, 68, 97, 97, 79, 90, 81, 89, 99, 77, 71, 78,
+    ]
+    GOLDEN_PHASES = "ggppdgpdddgppddgpppdggppd"
+    GOLDEN_ATTRIBUTES_SHA256 = "5b850640bafa79771b49d925c90b31293f954823d14a72d87b97148180ecc148"
+
+    def _assert_golden(self, players, entries):
+        assert [e["overall_before"] for e in entries] == self.GOLDEN_OVERALL_BEFORE
+        assert [e["overall_after"] for e in entries] == self.GOLDEN_OVERALL_AFTER
+        assert [p.overall for p in players] == self.GOLDEN_OVERALL_AFTER
+        assert "".join(e["phase"][0] for e in entries) == self.GOLDEN_PHASES
+
+        attributes = [p.attributes.to_dict() for p in players]
+        assert [(a["awareness"], a["speed"]) for a in attributes[0:25:12]] == [
+            (83, 66), (83, 99), (64, 50),
+        ]
+        digest = hashlib.sha256(json.dumps(attributes, sort_keys=True).encode()).hexdigest()
+        assert digest == self.GOLDEN_ATTRIBUTES_SHA256
+
+    def test_bulk_matches_pre_bulk_golden_values(self):
+        players = self._league_sample()
+        entries = apply_offseason_development_bulk(players, 2025, rng=random.Random(1))
+        self._assert_golden(players, entries)
+
+    def test_per_player_matches_pre_bulk_golden_values(self):
+        players = self._league_sample()
+        rng = random.Random(1)
+        entries = [apply_offseason_development(p, 2025, rng=rng) for p in players]
+        self._assert_golden(players, entries)
+
+    def test_entry_overall_matches_player(self):
+        players = self._league_sample()
+        before = [p.overall for p in players]
+        entries = apply_offseason_development_bulk(players, 2025)
+
+        assert [e["overall_before"] for e in entries] == before
+        assert [e["overall_after"] for e in entries] == [p.overall for p in players]
+        assert all(e["age_after"] == e["age_before"] + 1 for e in entries)
@@ -0,0 +1,157 @@
+"""Tests for the columnar game-log archive."""
+
+from uuid import uuid4
+
+from huddle.core.league import GameLogArchive, League
+from huddle.core.models.stats import (
+    DefensiveStats,
+    GameLog,
+    PassingStats,
+    PlayerGameStats,
+    RushingStats,
+    TeamGameStats,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+QB = uuid4()
+RB = uuid4()
+LB = uuid4()
+
+
+def make_game(week, home, away, home_score, away_score, qb_yards=250, rb_yards=80, sacks=0.5):
+    game = GameLog(
+        game_id=uuid4(), week=week,
+        home_team_abbr=home, away_team_abbr=away,
+        home_score=home_score, away_score=away_score,
+        home_stats=TeamGameStats(team_abbr=home, total_yards=qb_yards + rb_yards, points=home_score),
+        away_stats=TeamGameStats(team_abbr=away, total_yards=300, points=away_score),
+    )
+    game.player_stats = {
+        str(QB): PlayerGameStats(
+            player_id=QB, player_name="Jalen Hurts", team_abbr="PHI", position="QB",
+            passing=PassingStats(attempts=30, completions=20, yards=qb_yards, touchdowns=2),
+        ),
+        str(RB): PlayerGameStats(
+            player_id=RB, player_name="Saquon Barkley", team_abbr="PHI", position="RB",
+            rushing=RushingStats(attempts=18, yards=rb_yards, touchdowns=1),
+        ),
+        str(LB): PlayerGameStats(
+            player_id=LB, player_name="Micah Parsons", team_abbr="DAL", position="OLB",
+            defense=DefensiveStats(tackles=6, sacks=sacks),
+        ),
+    }
+    return game
+
+
+def make_archive():
+    archive = GameLogArchive()
+    archive.add_game(make_game(1, "PHI", "DAL", 24, 17, qb_yards=300), season=2024)
+    archive.add_game(make_game(2, "DAL", "PHI", 20, 10, qb_yards=150), season=2024)
+    archive.add_game(make_game(1, "PHI", "DAL", 31, 3, qb_yards=400), season=2025)
+    return archive
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+class TestGameLogArchive:
+
+    def test_game_log_round_trip(self):
+        archive = GameLogArchive()
+        game = make_game(3, "PHI", "DAL", 24, 17)
+        archive.add_game(game, season=2024)
+
+        rebuilt = archive.game_log(game.game_id)
+        assert rebuilt.home_score == 24
+        assert rebuilt.home_stats.total_yards == game.home_stats.total_yards
+        assert rebuilt.player_stats[str(QB)].passing == game.player_stats[str(QB)].passing
+        assert rebuilt.player_stats[str(LB)].defense.sacks == 0.5
+
+    def test_leaders_per_season(self):
+        archive = make_archive()
+
+        leaders = archive.leaders(2024, "passing", "yards", limit=1)
+        stats, value = leaders[0]
+        assert value == 450
+        assert stats.player_name == "Jalen Hurts"
+        assert stats.games_played == 2
+        assert archive.leaders(2025, "passing", "yards")[0][1] == 400
+        assert archive.leaders(2024, "passing", "bogus") == []
+
+    def test_player_games_and_team_splits(self):
+        archive = make_archive()
+
+        games = archive.player_games(QB)
+        assert [(g.season, g.week, g.is_home) for g in games] == [
+            (2024, 1, True), (2024, 2, False), (2025, 1, True),
+        ]
+        assert games[1].opponent_abbr == "DAL"
+
+        splits = archive.team_splits("PHI", 2024)
+        assert (splits["home"].wins, splits["away"].losses) == (1, 1)
+        assert splits["total"].points_for == 34
+        assert splits["total"].win_pct == 0.5
+
+    def test_save_and_load_mapped(self, tmp_path):
+        archive = make_archive()
+        archive.save(tmp_path / "archive")
+
+        loaded = GameLogArchive.load(tmp_path / "archive")
+        table = loaded.seasons[2024]
+        assert table.is_mapped
+        assert loaded.leaders(2024, "passing", "yards")[0][1] == 450
+
+        # Appending copies the mapped season into memory first
+        loaded.add_game(make_game(3, "PHI", "NYG", 14, 7, qb_yards=50), season=2024)
+        assert not table.is_mapped
+        assert loaded.leaders(2024, "passing", "yards")[0][1] == 500
+
+
+# =============================================================================
+# League Integration
+# =============================================================================
+
+class TestLeagueArchive:
+
+    def test_default_league_keeps_no_game_logs(self):
+        league = League(current_season=2024)
+        game = make_game(1, "PHI", "DAL", 24, 17)
+        league.add_game_log(game)
+
+        assert league._game_logs == {}
+        assert league.to_dict()["game_logs"] == {}
+        # game_logs is rebuilt from the archive
+        assert list(league.game_logs) == [str(game.game_id)]
+        rebuilt = league.game_logs[str(game.game_id)]
+        assert rebuilt is not game and rebuilt.home_score == 24
+        assert league.game_logs.get("missing") is None
+
+    def test_retained_game_logs(self, tmp_path):
+        league = League(current_season=2024, retain_game_logs=True)
+        game = make_game(1, "PHI", "DAL", 24, 17)
+        league.add_game_log(game)
+        assert league.game_logs == {str(game.game_id): game}
+
+        league.save(tmp_path / "league.json")
+        loaded = League.load(tmp_path / "league.json")
+        assert loaded.retain_game_logs
+        assert loaded.game_logs[str(game.game_id)].home_score == 24
+        assert len(loaded.archive) == 1
+
+    def test_history_survives_new_season(self):
+        league = League(current_season=2024)
+        game = make_game(1, "PHI", "DAL", 24, 17)
+        league.add_game_log(game)
+
+        assert league.get_game_log(game.game_id).away_score == 17
+        assert len(league.get_team_game_logs("DAL")) == 1
+        assert league.season_stats[str(QB)].passing.yards == 250
+
+        league.start_new_season()
+        assert len(league.game_logs) == 0
+        assert league.archive.player_games(QB)[0].season == 2024
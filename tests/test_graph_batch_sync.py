@@ -0,0 +1,222 @@
+"""Tests for batched UNWIND graph writes."""
+
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+from huddle.graph.schema import NodeLabels, RelTypes
+from huddle.graph.sync.base import full_sync
+from huddle.graph.sync.batch import BatchWriter
+from huddle.graph.sync.historical import HistoricalGraphSync
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class RecordingGraph:
+    """Stand-in GraphConnection that records every write."""
+
+    is_enabled = True
+    is_connected = True
+
+    def __init__(self, fail_on: str = ""):
+        self.writes: list[tuple[str, dict]] = []
+        self.fail_on = fail_on
+
+    @contextmanager
+    def session(self, database=None):
+        yield SimpleNamespace(run=lambda *args, **kwargs: None)
+
+    def run_write(self, query, parameters=None):
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("write failed")
+        parameters = parameters or {}
+        self.writes.append((query, parameters))
+        rows = len(parameters.get("rows", []))
+        is_rel = "]->" in query
+        return {
+            "nodes_created": 0 if is_rel else rows,
+            "relationships_created": rows if is_rel else 0,
+            "properties_set": rows,
+        }
+
+    def clear_all(self, confirm=False):
+        return {}
+
+    def rows_for(self, fragment: str) -> list[dict]:
+        return [row for query, params in self.writes if fragment in query for row in params["rows"]]
+
+
+def make_player(position: str = "QB"):
+    return SimpleNamespace(
+        id=uuid4(),
+        full_name="Test Player",
+        position=SimpleNamespace(value=position),
+        age=25,
+        experience_years=3,
+        overall=70,
+        potential=80,
+        personality=None,
+        years_on_team=2,
+    )
+
+
+def make_simulation_result(seasons: int = 20, teams: int = 32, roster_size: int = 53):
+    team_states = {}
+    transactions = []
+    standings = {}
+    draft_type = SimpleNamespace(name="DRAFT_SELECTION")
+
+    for t in range(teams):
+        abbr = f"T{t:02d}"
+        roster = [make_player() for _ in range(roster_size)]
+        for i, player in enumerate(roster):
+            transactions.append(SimpleNamespace(
+                player_id=str(player.id),
+                team_id=abbr,
+                other_team_id=None,
+                season=2000 + i % seasons,
+                transaction_date=date(2000 + i % seasons, 4, 1),
+                transaction_type=draft_type,
+            ))
+        team_states[abbr] = SimpleNamespace(
+            team_id=abbr, team_name=f"Team {t}", wins=9, losses=8,
+            made_playoffs=False, won_championship=False, status=None, roster=roster,
+        )
+
+    for season in range(2000, 2000 + seasons):
+        standings[season] = [
+            SimpleNamespace(team_id=abbr, wins=9, losses=8, made_playoffs=False, won_championship=False)
+            for abbr in team_states
+        ]
+
+    return SimpleNamespace(
+        teams=team_states,
+        transaction_log=SimpleNamespace(transactions=transactions),
+        season_standings=standings,
+    )
+
+
+# =============================================================================
+# BatchWriter
+# =============================================================================
+
+class TestBatchWriter:
+
+    def test_nodes_grouped_and_chunked(self):
+        graph = RecordingGraph()
+        batch = BatchWriter(graph, chunk_size=2)
+        for i in range(5):
+            batch.merge_node(NodeLabels.PLAYER, f"p{i}", {"overall": i})
+        batch.merge_node(NodeLabels.TEAM, "NYG", {"name": "Giants"}, key="abbr")
+
+        result = batch.flush()
+
+        assert batch.statements == 4  # 3 player chunks + 1 team chunk
+        assert all("UNWIND $rows AS row" in query for query, _ in graph.writes)
+        assert "MERGE (n:Team {abbr: row.key})" in graph.writes[-1][0]
+        assert result.success
+        assert result.nodes_created == 6
+        assert len(batch) == 0
+
+    def test_repeated_upserts_coalesce(self):
+        graph = RecordingGraph()
+        batch = BatchWriter(graph)
+        batch.merge_node(NodeLabels.SEASON, "2024", {"year": 2024})
+        batch.merge_node(NodeLabels.SEASON, "2024", {"current": True})
+
+        batch.flush()
+
+        assert graph.rows_for("Season") == [{"key": "2024", "properties": {"year": 2024, "current": True}}]
+
+    def test_nodes_written_before_relationships(self):
+        graph = RecordingGraph()
+        batch = BatchWriter(graph)
+        batch.merge_relationship(NodeLabels.PLAYER, "p1", RelTypes.PLAYS_FOR, NodeLabels.TEAM, "t1")
+        batch.merge_node(NodeLabels.PLAYER, "p1", {})
+
+        batch.flush()
+
+        assert "MERGE (n:Player" in graph.writes[0][0]
+        assert "PLAYS_FOR" in graph.writes[1][0]
+
+    def test_merge_on_keeps_separate_relationships(self):
+        graph = RecordingGraph()
+        batch = BatchWriter(graph)
+        for season in (2020, 2023):
+            batch.merge_relationship(
+                NodeLabels.PLAYER, "p1", RelTypes.PLAYS_FOR, NodeLabels.TEAM, "NYG",
+                {"from_season": season}, to_key="abbr", merge_on=("from_season",),
+            )
+
+        result = batch.flush()
+
+        query, params = graph.writes[0]
+        assert "[r:PLAYS_FOR {from_season: row.merge.from_season}]" in query
+        assert len(params["rows"]) == 2
+        assert result.relationships_created == 2
+
+    def test_failed_chunk_recorded(self):
+        graph = RecordingGraph(fail_on="PLAYS_FOR")
+        batch = BatchWriter(graph)
+        batch.merge_node(NodeLabels.PLAYER, "p1", {})
+        batch.merge_relationship(NodeLabels.PLAYER, "p1", RelTypes.PLAYS_FOR, NodeLabels.TEAM, "t1")
+
+        result = batch.flush()
+
+        assert not result.success
+        assert result.errors == ["write failed"]
+        assert result.nodes_created == 1
+
+
+# =============================================================================
+# Bulk Syncs
+# =============================================================================
+
+class TestBulkSync:
+
+    def test_historical_sync_is_dozens_of_statements(self):
+        result = make_simulation_result(seasons=20)
+        graph = RecordingGraph()
+
+        sync_result = HistoricalGraphSync(graph, chunk_size=500).sync_simulation_result(result)
+
+        players = 32 * 53
+        standings = 32 * 20
+        assert sync_result.success
+        assert sync_result.nodes_created == 2 + 8 + 32 + players + 20
+        # Made-up team abbreviations have no division, so no IN_DIVISION rows
+        assert sync_result.relationships_created == 8 + players + standings
+        assert len(graph.writes) < 20
+        assert {row["key"] for row in graph.rows_for("MERGE (n:Season")} == set(range(2000, 2020))
+
+    def test_full_sync_batches_league(self):
+        team = SimpleNamespace(
+            id=uuid4(), abbreviation="NYG", name="Giants", city="New York",
+            tendencies=None, financials=None,
+        )
+        players = [make_player() for _ in range(53)]
+        team.roster = SimpleNamespace(players={p.id: p for p in players})
+        stats = SimpleNamespace(
+            games_played=17,
+            passing=SimpleNamespace(yards=4000, touchdowns=30),
+            rushing=SimpleNamespace(yards=100, touchdowns=1),
+            receiving=SimpleNamespace(yards=0, touchdowns=0),
+        )
+        league = SimpleNamespace(
+            teams={team.abbreviation: team},
+            game_logs={},
+            season_stats={str(p.id): stats for p in players},
+            season=2024,
+        )
+        graph = RecordingGraph()
+
+        result = full_sync(league, graph, chunk_size=100)
+
+        assert result.success
+        assert len(graph.rows_for("MERGE (n:Player")) == 53
+        assert len(graph.rows_for("MERGE (n:Season")) == 1
+        assert len(graph.rows_for("SEASON_STATS")) == 53
+        assert len(graph.writes) < 10
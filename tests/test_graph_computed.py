@@ -0,0 +1,153 @@
+"""Tests for incrementally maintained computed graph properties."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from huddle.core.models.stats import GameLog, PlayerGameStats, RushingStats
+from huddle.graph.schema import NodeLabels
+from huddle.graph.sync import computed
+from huddle.graph.sync.computed import ComputedPropertyTracker
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class RecordingGraph:
+    """Stand-in GraphConnection that records every write."""
+
+    is_enabled = True
+
+    def __init__(self):
+        self.writes: list[tuple[str, dict]] = []
+
+    def run_write(self, query, parameters=None):
+        self.writes.append((query, parameters or {}))
+        rows = len((parameters or {}).get("rows", []))
+        return {"nodes_created": rows, "relationships_created": 0, "properties_set": rows}
+
+    def keys_for(self, label: str) -> set:
+        return {
+            row["key"]
+            for query, params in self.writes if f"MERGE (n:{label} " in query
+            for row in params["rows"]
+        }
+
+
+def make_player():
+    return SimpleNamespace(
+        id=uuid4(), full_name="Test Back", position=SimpleNamespace(value="RB"),
+        age=25, experience_years=3,
+    )
+
+
+def make_league(rosters: dict[str, list]):
+    return SimpleNamespace(teams={
+        abbr: SimpleNamespace(roster=SimpleNamespace(players={p.id: p for p in players}))
+        for abbr, players in rosters.items()
+    })
+
+
+def make_game(home: str, away: str, home_score: int, away_score: int, rushers=()):
+    game = GameLog(
+        game_id=uuid4(), week=1,
+        home_team_abbr=home, away_team_abbr=away,
+        home_score=home_score, away_score=away_score,
+    )
+    for player, team, yards in rushers:
+        game.player_stats[str(player.id)] = PlayerGameStats(
+            player_id=player.id, player_name=player.full_name, team_abbr=team, position="RB",
+            rushing=RushingStats(attempts=20, yards=yards),
+        )
+    return game
+
+
+# =============================================================================
+# Rolling Windows and Tallies
+# =============================================================================
+
+class TestComputedPropertyTracker:
+
+    def test_head_to_head_tally(self):
+        tracker = ComputedPropertyTracker()
+        tracker.record_game(make_game("NYG", "DAL", 24, 17))
+        tracker.record_game(make_game("DAL", "NYG", 10, 20))
+        tracker.record_game(make_game("NYG", "DAL", 13, 13))
+        tracker.record_game(make_game("DAL", "NYG", 31, 7))
+
+        h2h = tracker.head_to_head("NYG", "DAL")
+        assert h2h.games_played == 4
+        assert (h2h.team_a_wins, h2h.team_b_wins, h2h.ties) == (2, 1, 1)
+        assert h2h.point_differential == 24 - 17 + 20 - 10 + 0 + 7 - 31
+        assert h2h.streak == "B1"
+        assert h2h.is_rivalry
+
+        flipped = tracker.head_to_head("DAL", "NYG")
+        assert flipped.team_a_abbr == "DAL"
+        assert flipped.team_a_wins == 1
+        assert flipped.point_differential == -h2h.point_differential
+        assert flipped.streak == "A1"
+
+    def test_games_recorded_once(self):
+        tracker = ComputedPropertyTracker()
+        game = make_game("NYG", "DAL", 24, 17)
+
+        assert tracker.record_game(game)
+        assert not tracker.record_game(game)
+        assert tracker.head_to_head("NYG", "DAL").games_played == 1
+
+    def test_rolling_window_trend(self):
+        back = make_player()
+        tracker = ComputedPropertyTracker(window=4)
+        # Two bad early games fall out of the window
+        for yards in (200, 200, 40, 50, 100, 120):
+            tracker.record_game(make_game("NYG", "DAL", 0, 0, [(back, "NYG", yards)]))
+
+        trend = tracker.performance_trend(back.id)
+        assert trend.window == 4
+        assert trend.direction == "improving"
+        assert trend.key_stats["rushing_yards"]["old"] == 45
+        assert trend.key_stats["rushing_yards"]["new"] == 110
+
+
+# =============================================================================
+# Dirty Tracking
+# =============================================================================
+
+class TestIncrementalSync:
+
+    def test_sync_only_touches_new_games(self):
+        nyg_back, dal_back, phi_back = make_player(), make_player(), make_player()
+        league = make_league({"NYG": [nyg_back], "DAL": [dal_back], "PHI": [phi_back]})
+        tracker = ComputedPropertyTracker()
+
+        tracker.record_game(make_game("NYG", "DAL", 21, 14, [(nyg_back, "NYG", 90), (dal_back, "DAL", 60)]))
+        graph = RecordingGraph()
+        result = tracker.sync(league, graph)
+
+        assert result.success
+        assert graph.keys_for(NodeLabels.PLAYER) == {str(nyg_back.id), str(dal_back.id)}
+        assert graph.keys_for(NodeLabels.HEAD_TO_HEAD) == {"DAL_NYG"}
+        assert not tracker.dirty_players and not tracker.dirty_matchups
+
+        tracker.record_game(make_game("PHI", "NYG", 28, 3, [(phi_back, "PHI", 120)]))
+        graph = RecordingGraph()
+        tracker.sync(league, graph)
+
+        assert graph.keys_for(NodeLabels.PLAYER) == {str(phi_back.id)}
+        assert graph.keys_for(NodeLabels.HEAD_TO_HEAD) == {"NYG_PHI"}
+
+    def test_full_rebuild_without_tracker(self, monkeypatch):
+        monkeypatch.setattr(computed, "is_graph_enabled", lambda: True)
+        bench = make_player()
+        starter = make_player()
+        game = make_game("NYG", "DAL", 21, 14, [(starter, "NYG", 90)])
+        league = make_league({"NYG": [starter, bench]})
+        league.game_logs = {str(game.game_id): game}
+        graph = RecordingGraph()
+
+        computed.sync_all_computed_properties(league, graph)
+
+        # Every rostered player gets career phase, even without games
+        assert graph.keys_for(NodeLabels.PLAYER) == {str(starter.id), str(bench.id)}
+        assert graph.keys_for(NodeLabels.HEAD_TO_HEAD) == {"DAL_NYG"}
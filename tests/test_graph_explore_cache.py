@@ -0,0 +1,170 @@
+"""Tests for the read-through graph exploration cache."""
+
+import pytest
+
+from huddle.graph.explore import cache as explore_cache
+from huddle.graph.explore import tools, traversal
+from huddle.graph.explore.cache import MISSING, ExploreCache
+from huddle.graph.explore.traversal import GraphTraversal
+from huddle.graph.sync.base import notify_written
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingGraph:
+    """Stand-in GraphConnection that serves nodes by id and counts reads."""
+
+    is_enabled = True
+
+    def __init__(self, nodes: dict[str, tuple[str, dict]]):
+        self.nodes = nodes  # id -> (label, properties)
+        self.queries = 0
+
+    def run_query(self, query, parameters=None):
+        self.queries += 1
+        parameters = parameters or {}
+        if "count(" in query:
+            return [{"count": 0}]
+        if "{id: $id}" in query and "RETURN n, labels(n)" in query:
+            node = self.nodes.get(parameters["id"])
+            return [{"n": node[1], "labels": [node[0]]}] if node else []
+        if "$abbrs" in query:
+            return [
+                {"id": node_id, "name": props.get("name")}
+                for node_id, (label, props) in self.nodes.items()
+                if label == "Player" and props.get("team") in parameters["abbrs"]
+            ]
+        return []
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    graph = CountingGraph({
+        "PHI": ("Team", {"id": "PHI", "abbr": "PHI", "name": "Philadelphia"}),
+        "DAL": ("Team", {"id": "DAL", "abbr": "DAL", "name": "Dallas"}),
+        "p1": ("Player", {"id": "p1", "name": "Jalen Hurts", "team": "PHI"}),
+        "p2": ("Player", {"id": "p2", "name": "Dak Prescott", "team": "DAL"}),
+    })
+    monkeypatch.setattr(traversal, "get_graph", lambda: graph)
+    monkeypatch.setattr(tools, "is_graph_enabled", lambda: True)
+    explore_cache.set_explore_cache(ExploreCache())
+    yield graph
+    explore_cache.set_explore_cache(None)
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+class TestExploreCache:
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = ExploreCache(ttl_seconds=10, clock=clock)
+        cache.put("k", "v")
+
+        clock.now = 9
+        assert cache.get("k") == "v"
+        clock.now = 11
+        assert cache.get("k") is MISSING
+        assert cache.stats.expirations == 1
+
+    def test_least_recently_used_evicted(self):
+        cache = ExploreCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.stats.evictions == 1
+
+    def test_write_invalidates_tagged_entries(self):
+        cache = ExploreCache()
+        explore_cache.set_explore_cache(cache)
+        try:
+            cache.put("phi", "x", tags={"PHI", "p1"})
+            cache.put("dal", "y", tags={"DAL"})
+
+            notify_written({"p1"})
+
+            assert cache.get("phi") is MISSING
+            assert cache.get("dal") == "y"
+            notify_written(None)
+            assert len(cache) == 0
+        finally:
+            explore_cache.set_explore_cache(None)
+
+    def test_pinned_entries_survive_ttl_and_eviction(self):
+        clock = FakeClock()
+        cache = ExploreCache(max_entries=1, ttl_seconds=1, clock=clock)
+        cache.pin("game", "ctx", tags={"PHI"})
+        cache.put("a", 1)
+        cache.put("b", 2)
+        clock.now = 100
+
+        assert cache.get("game") == "ctx"
+        cache.invalidate({"PHI"})
+        assert cache.get("game") is MISSING
+
+
+# =============================================================================
+# Tools and Traversal
+# =============================================================================
+
+class TestCachedExploration:
+
+    def test_repeated_tool_call_skips_graph(self, graph):
+        first = tools.get_team_context("PHI")
+        queries = graph.queries
+        second = tools.get_team_context("PHI", include_roster=True)
+
+        assert first.success
+        assert second is first
+        assert graph.queries == queries
+
+        notify_written({"PHI"})
+        tools.get_team_context("PHI")
+        assert graph.queries > queries
+
+    def test_failed_lookups_not_cached(self, graph):
+        assert not tools.get_team_context("NYG").success
+        queries = graph.queries
+        tools.get_team_context("NYG")
+        assert graph.queries > queries
+
+    def test_traversal_explore_cached_per_graph(self, graph):
+        first = GraphTraversal(graph).explore("player", "p1")
+        queries = graph.queries
+
+        assert GraphTraversal(graph).explore("player", "p1") is first
+        assert graph.queries == queries
+
+        other = CountingGraph(dict(graph.nodes))
+        GraphTraversal(other).explore("player", "p1")
+        assert other.queries == 1
+
+    def test_game_neighborhood_pinned(self, graph):
+        pinned = tools.prime_game_context("PHI", "DAL")
+
+        # Both teams, the matchup, and each player under id and name
+        assert pinned == 7
+        queries = graph.queries
+        tools.get_player_context("Jalen Hurts")
+        tools.get_player_context("p2")
+        tools.get_matchup_context("PHI", "DAL")
+        assert graph.queries == queries
+
+        tools.release_game_context()
+        assert explore_cache.get_explore_cache().pinned_count == 0
@@ -0,0 +1,140 @@
+"""Tests for the write-behind graph sync queue."""
+
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from huddle.events.bus import EventBus
+from huddle.events.types import GameEndEvent, ScoringEvent
+from huddle.graph.schema import NodeLabels
+from huddle.graph.sync import handlers
+from huddle.graph.sync.writer import GraphWriteQueue
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class SlowGraph:
+    """Stand-in GraphConnection whose writes take ``delay`` seconds."""
+
+    is_enabled = True
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.writes: list[tuple[str, dict]] = []
+        self.lock = threading.Lock()
+
+    def run_write(self, query, parameters=None):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("graph unavailable")
+        with self.lock:
+            self.writes.append((query, parameters or {}))
+        rows = len((parameters or {}).get("rows", []))
+        return {"nodes_created": rows, "relationships_created": 0, "properties_set": rows}
+
+    def rows(self) -> list[dict]:
+        with self.lock:
+            return [row for _, params in self.writes for row in params["rows"]]
+
+
+@pytest.fixture
+def graph_enabled(monkeypatch):
+    monkeypatch.setattr(handlers, "is_graph_enabled", lambda: True)
+
+
+# =============================================================================
+# Queue
+# =============================================================================
+
+class TestGraphWriteQueue:
+
+    def test_updates_to_same_node_coalesce(self):
+        graph = SlowGraph()
+        queue = GraphWriteQueue(graph, max_pending=10)
+        queue.upsert_node(NodeLabels.GAME, "g1", {"home_score": 7})
+        queue.upsert_node(NodeLabels.GAME, "g1", {"home_score": 14})
+        queue.upsert_node(NodeLabels.GAME, "g1", {"away_score": 3})
+
+        assert len(queue) == 1
+        queue.flush()
+
+        assert graph.rows() == [{"key": "g1", "properties": {"home_score": 14, "away_score": 3}}]
+        stats = queue.stats()
+        assert stats.enqueued == 3
+        assert stats.coalesced == 2
+        assert stats.written == 1
+
+    def test_full_queue_drops_new_upserts(self):
+        queue = GraphWriteQueue(SlowGraph(), max_pending=2)
+        assert queue.upsert_node(NodeLabels.GAME, "g1", {})
+        assert queue.upsert_node(NodeLabels.GAME, "g2", {})
+        assert not queue.upsert_node(NodeLabels.GAME, "g3", {})
+        # Updates to pending nodes still fit
+        assert queue.upsert_node(NodeLabels.GAME, "g1", {"quarter": 2})
+
+        stats = queue.stats()
+        assert stats.dropped == 1
+        assert stats.pending == 2
+        assert stats.high_water == 2
+
+    def test_stop_flushes_pending(self):
+        graph = SlowGraph()
+        queue = GraphWriteQueue(graph, flush_interval=60).start()
+        queue.upsert_node(NodeLabels.GAME, "g1", {"is_complete": True})
+
+        queue.stop()
+
+        assert not queue.is_running
+        assert graph.rows() == [{"key": "g1", "properties": {"is_complete": True}}]
+
+    def test_failed_writes_counted(self):
+        queue = GraphWriteQueue(SlowGraph(fail=True))
+        queue.upsert_node(NodeLabels.GAME, "g1", {})
+        queue.flush()
+
+        stats = queue.stats()
+        assert stats.failed == 1
+        assert stats.written == 0
+        assert stats.pending == 0
+
+
+# =============================================================================
+# Event Handlers
+# =============================================================================
+
+class TestWriteBehindHandlers:
+
+    def test_slow_graph_does_not_block_events(self, graph_enabled):
+        graph = SlowGraph(delay=0.2)
+        bus = EventBus()
+        queue = handlers.register_game_handlers(bus, graph)
+        game_id = uuid4()
+
+        started = time.perf_counter()
+        for i in range(50):
+            bus.emit(ScoringEvent(game_id=game_id, home_score=7 * (i + 1), points=7))
+        bus.emit(GameEndEvent(game_id=game_id, final_home_score=350, final_away_score=0))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.2
+        assert handlers.get_write_queue(bus) is queue
+
+        handlers.unregister_game_handlers(bus)
+
+        assert not queue.is_running
+        assert handlers.get_write_queue(bus) is None
+        rows = [row for row in graph.rows() if row["key"] == str(game_id)]
+        assert rows[-1]["properties"]["home_score"] == 350
+        assert rows[-1]["properties"]["is_complete"] is True
+        assert queue.stats().coalesced > 0
+
+    def test_context_manager_exposes_queue(self, graph_enabled):
+        bus = EventBus()
+        with handlers.graph_sync_enabled(bus, SlowGraph()) as ctx:
+            assert ctx.queue is handlers.get_write_queue(bus)
+        assert not ctx.queue.is_running
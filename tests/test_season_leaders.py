@@ -0,0 +1,85 @@
+"""Tests for incrementally maintained season leader boards."""
+
+import random
+from uuid import uuid4
+
+from huddle.core.league import League
+from huddle.core.models.stats import (
+    DefensiveStats,
+    GameLog,
+    PassingStats,
+    PlayerGameStats,
+    RushingStats,
+)
+
+
+PLAYERS = [uuid4() for _ in range(60)]
+
+
+def random_game(rng: random.Random) -> GameLog:
+    game = GameLog(
+        game_id=uuid4(), week=1, home_team_abbr="PHI", away_team_abbr="DAL",
+        home_score=0, away_score=0,
+    )
+    for player_id in rng.sample(PLAYERS, 30):
+        game.player_stats[str(player_id)] = PlayerGameStats(
+            player_id=player_id, player_name=str(player_id)[:8], team_abbr="PHI", position="RB",
+            passing=PassingStats(attempts=rng.randint(0, 3), yards=rng.randint(0, 40)),
+            # Negative games knock players back down the board
+            rushing=RushingStats(attempts=rng.randint(0, 5), yards=rng.randint(-15, 20)),
+            defense=DefensiveStats(sacks=rng.choice([0.0, 0.5, 1.0])),
+        )
+    return game
+
+
+def scan_leaders(league: League, category: str, stat: str, limit: int):
+    results = [
+        (s, getattr(getattr(s, category), stat)) for s in league.season_stats.values()
+    ]
+    results = [r for r in results if r[1] > 0]
+    results.sort(key=lambda r: r[1], reverse=True)
+    return [(s.player_id, value) for s, value in results[:limit]]
+
+
+def board_leaders(league: League, category: str, stat: str, limit: int):
+    return [(s.player_id, value) for s, value in league.get_season_leaders(category, stat, limit)]
+
+
+class TestSeasonLeaders:
+
+    def test_boards_match_full_scan(self):
+        rng = random.Random(7)
+        league = League()
+        for _ in range(40):
+            league.add_game_log(random_game(rng))
+            for category, stat in [
+                ("passing", "yards"), ("passing", "attempts"),
+                ("rushing", "yards"), ("defense", "sacks"),
+            ]:
+                assert board_leaders(league, category, stat, 10) == scan_leaders(
+                    league, category, stat, 10
+                )
+
+    def test_derived_and_long_lists_fall_back_to_scan(self):
+        rng = random.Random(3)
+        league = League()
+        for _ in range(5):
+            league.add_game_log(random_game(rng))
+
+        assert len(league.get_season_leaders("rushing", "yards_per_carry", 5)) == 5
+        assert board_leaders(league, "passing", "yards", 50) == scan_leaders(
+            league, "passing", "yards", 50
+        )
+        assert league.get_season_leaders("rushing", "bogus") == []
+
+    def test_rebuilt_after_load(self):
+        rng = random.Random(11)
+        league = League()
+        for _ in range(10):
+            league.add_game_log(random_game(rng))
+
+        loaded = League.from_dict(league.to_dict())
+
+        assert board_leaders(loaded, "rushing", "yards", 10) == scan_leaders(
+            league, "rushing", "yards", 10
+        )
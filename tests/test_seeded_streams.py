@@ -0,0 +1,116 @@
+"""Tests for seeded random streams and reproducible simulation."""
+
+import copy
+import os
+import random
+import subprocess
+import sys
+
+from huddle.core.enums import Position
+from huddle.core.league import League
+from huddle.core.league.league import ScheduledGame, TeamStanding
+from huddle.core.rng import SeedSequence, random_uuid
+from huddle.generators import generate_team
+from huddle.generators.player import generate_draft_class, generate_player, generate_players
+from huddle.simulation.season import SeasonSimulator
+
+
+def make_league() -> League:
+    league = League(current_season=2024)
+    for name, city, abbr in [
+        ("Eagles", "Philadelphia", "PHI"), ("Cowboys", "Dallas", "DAL"),
+        ("Giants", "New York", "NYG"), ("Commanders", "Washington", "WAS"),
+    ]:
+        team = generate_team(name=name, city=city, abbreviation=abbr)
+        league.teams[abbr] = team
+        league.standings[abbr] = TeamStanding(team_id=team.id, abbreviation=abbr)
+    return league
+
+
+class TestSeedSequence:
+
+    def test_children_are_keyed_not_ordered(self):
+        root = SeedSequence(42)
+        draft = root.child("season", 2024, "draft").generate_seed()
+
+        root.child("season", 2023).rng().random()
+        assert SeedSequence(42).child("season", 2024, "draft").generate_seed() == draft
+        assert root.child("season", 2024, "trades").generate_seed() != draft
+        assert SeedSequence(43).child("season", 2024, "draft").generate_seed() != draft
+
+    def test_spawn_continues_numbering(self):
+        root = SeedSequence(1)
+        first = [s.generate_seed() for s in root.spawn(2)]
+        second = [s.generate_seed() for s in root.spawn(2)]
+
+        assert len(set(first + second)) == 4
+        assert [s.generate_seed() for s in SeedSequence(1).spawn(4)] == first + second
+
+    def test_random_uuid(self):
+        assert random_uuid(random.Random(5)) == random_uuid(random.Random(5))
+        assert random_uuid().version == 4
+
+
+class TestReproducibleGeneration:
+
+    def test_player_and_draft_class(self):
+        a = generate_player(Position.QB, rng=random.Random(3))
+        b = generate_player(Position.QB, rng=random.Random(3))
+        assert a.id == b.id
+        assert a.to_dict() == b.to_dict()
+
+        first = generate_draft_class(2025, rng=random.Random(9))
+        second = generate_draft_class(2025, rng=random.Random(9))
+        assert [p.to_dict() for p in first] == [p.to_dict() for p in second]
+
+    def test_batch_matches_sequential_generation(self):
+        ages = [23, 27, 31, 25]
+        rng = random.Random(11)
+        sequential = [generate_player(Position.WR, age=age, rng=rng) for age in ages]
+        batch = generate_players(Position.WR, len(ages), ages=ages, rng=random.Random(11))
+
+        assert [p.to_dict() for p in batch] == [p.to_dict() for p in sequential]
+        assert all(p.player_archetype for p in batch)
+
+    def test_game_result_independent_of_order(self):
+        league = make_league()
+
+        def play(games):
+            simulator = SeasonSimulator(copy.deepcopy(league), seed_sequence=SeedSequence(7))
+            return [
+                simulator.simulate_game(ScheduledGame(week=1, home_team_abbr=h, away_team_abbr=a))
+                for h, a in games
+            ]
+
+        alone = play([("PHI", "DAL")])[0]
+        after = play([("NYG", "WAS"), ("PHI", "DAL")])[1]
+
+        assert (alone.home_score, alone.away_score) == (after.home_score, after.away_score)
+
+
+# Full seeded history, hashed without the profiler's wall-clock timings
+HISTORY_DIGEST = """
+import hashlib, json
+from huddle.core.simulation.historical_sim import HistoricalSimulator, SimulationConfig
+config = SimulationConfig(years_to_simulate=1, seed=123)
+result = HistoricalSimulator.create_with_nfl_teams(config).run().to_dict()
+result.pop("profile")
+print(hashlib.sha256(json.dumps(result, sort_keys=True, default=str).encode()).hexdigest())
+"""
+
+
+class TestReproducibleHistory:
+
+    def test_seeded_history_matches_across_processes(self):
+        runs = [
+            subprocess.Popen(
+                [sys.executable, "-c", HISTORY_DIGEST],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                env={**os.environ, "PYTHONHASHSEED": str(hash_seed)},
+            )
+            for hash_seed in (1, 2)
+        ]
+        digests = [run.communicate()[0].strip().splitlines()[-1] for run in runs]
+
+        assert all(run.returncode == 0 for run in runs)
+        assert digests[0] == digests[1]
@@ -0,0 +1,110 @@
+"""Tests for the per-tick receiver-defender separation table."""
+
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from huddle.simulation.v2.ai.qb_brain import qb_brain
+from huddle.simulation.v2.core.entities import Player, PlayerAttributes, Position
+from huddle.simulation.v2.core.vec2 import Vec2
+from huddle.simulation.v2.orchestrator import Orchestrator, PlayConfig
+from huddle.simulation.v2.systems.separation import SeparationTable, defender_in_lane
+
+
+@dataclass
+class Body:
+    id: str
+    pos: Vec2
+    velocity: Vec2 = Vec2(0, 0)
+
+
+@pytest.fixture
+def table():
+    receivers = [Body("wr1", Vec2(10, 10), Vec2(0, 5)), Body("wr2", Vec2(-10, 5))]
+    defenders = [
+        Body("cb1", Vec2(10, 12), Vec2(0, -2)),  # 2 yds in front of wr1, closing
+        Body("cb2", Vec2(-10, 9)),
+        Body("fs", Vec2(0, 20)),
+    ]
+    return SeparationTable(receivers, defenders, tick=3)
+
+
+class TestSeparationTable:
+
+    def test_nearest_defender(self, table):
+        entry = table.nearest("wr1")
+        assert entry.defender_id == "cb1"
+        assert entry.distance == pytest.approx(2.0)
+        assert entry.closing_speed == pytest.approx(2.0)
+        assert table.nearest("wr2").defender_id == "cb2"
+
+    def test_pairwise_distance(self, table):
+        assert table.distance("wr2", "cb2") == pytest.approx(4.0)
+        assert table.distance("wr2", "nobody") == float("inf")
+        assert table.distance("nobody", "cb2") == float("inf")
+
+    def test_projected_separation(self, table):
+        # wr1 runs at cb1: 2 yds now, they meet after ~0.29s and pass each other
+        assert table.projected_separation("wr1", 0.0) == pytest.approx(2.0)
+        assert table.projected_separation("wr1", 0.2) == pytest.approx(0.6)
+
+    def test_snapshot_ignores_later_movement(self):
+        receiver = Body("wr1", Vec2(0, 0))
+        defender = Body("cb1", Vec2(0, 3))
+        table = SeparationTable([receiver], [defender])
+
+        defender.pos = Vec2(0, 10)
+        assert table.nearest("wr1").distance == pytest.approx(3.0)
+        assert table.projected_separation("wr1", 0.0) == pytest.approx(3.0)
+
+    def test_no_defenders(self):
+        table = SeparationTable([Body("wr1", Vec2(0, 0))], [])
+        assert "wr1" in table
+        assert table.nearest("wr1") is None
+        assert table.projected_separation("wr1", 0.5) is None
+
+    def test_passing_lane(self, table):
+        # cb2 sits on the line from (-10, 0) to (-10, 15)
+        assert table.defender_in_lane(Vec2(-10, 0), Vec2(-10, 15))
+        assert not table.defender_in_lane(Vec2(20, 0), Vec2(20, 15))
+        assert defender_in_lane(Vec2(-10, 0), Vec2(-10, 15), table.defenders)
+
+
+class TestOrchestratorTable:
+
+    def test_table_matches_what_the_qb_sees(self):
+        # Built with the QB's world state: after block resolution and after
+        # any players the shuffled update order moved earlier in the tick
+        seen = []
+
+        def watching_qb(world):
+            table = world.separation_table
+            if table is None:  # pre-snap read
+                return qb_brain(world)
+            wr = next(t for t in world.teammates if t.id == "WR1")
+            cb = next(o for o in world.opponents if o.id == "CB1")
+            entry = table.nearest("WR1")
+            seen.append((entry.receiver_pos, wr.pos, entry.defender_pos, cb.pos))
+            return qb_brain(world)
+
+        qb = Player(id="QB1", position=Position.QB, pos=Vec2(0, -5), has_ball=True,
+                    attributes=PlayerAttributes(throw_power=85, throw_accuracy=85))
+        wr = Player(id="WR1", position=Position.WR, pos=Vec2(20, 0),
+                    attributes=PlayerAttributes(speed=88, route_running=85))
+        cb = Player(id="CB1", position=Position.CB, pos=Vec2(18, 7),
+                    attributes=PlayerAttributes(speed=88, man_coverage=80))
+        config = PlayConfig(routes={"WR1": "go"}, man_assignments={"CB1": "WR1"},
+                            max_duration=3.0)
+
+        random.seed(3)
+        orch = Orchestrator()
+        orch.register_brain("QB1", watching_qb)
+        orch.setup_play([qb, wr], [cb], config)
+        orch.run()
+
+        assert len(seen) > 5
+        assert all(
+            table_wr == world_wr and table_cb == world_cb
+            for table_wr, world_wr, table_cb, world_cb in seen
+        )
@@ -0,0 +1,156 @@
+"""Tests for StatisticalDriveResolver."""
+
+import random
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from huddle.core.models.field import DownState, FieldPosition
+from huddle.core.models.game import GameClock, GameState
+from huddle.events.types import DriveCompletedEvent
+from huddle.generators import generate_team
+from huddle.simulation.engine import SimulationEngine, SimulationMode
+from huddle.simulation.resolvers.drive import StatisticalDriveResolver
+
+
+@pytest.fixture
+def home_team():
+    return generate_team(name="Eagles", city="Philadelphia", abbreviation="PHI")
+
+
+@pytest.fixture
+def away_team():
+    return generate_team(name="Cowboys", city="Dallas", abbreviation="DAL")
+
+
+def game_at(home_team, away_team, yard_line: int, seconds: int = 900, quarter: int = 1):
+    game = GameState()
+    game.set_teams(home_team, away_team)
+    game.possession.team_with_ball = home_team.id
+    game.clock = GameClock(quarter=quarter, time_remaining_seconds=seconds)
+    game.down_state = DownState(down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(yard_line))
+    return game
+
+
+def resolve_many(home_team, away_team, yard_line: int, n: int = 300, **clock):
+    resolver = StatisticalDriveResolver(rng=random.Random(7))
+    game = game_at(home_team, away_team, yard_line, **clock)
+    return [resolver.resolve_drive(game, home_team, away_team) for _ in range(n)]
+
+
+class TestResolveDrive:
+
+    def test_outcomes_and_field_position(self, home_team, away_team):
+        drives = resolve_many(home_team, away_team, 25)
+        outcomes = Counter(d.result for d in drives)
+
+        assert outcomes["PUNT"] > outcomes["TD"] > outcomes["DOWNS"]
+        for drive in drives:
+            assert 0 <= drive.ending_yard_line <= 100
+            assert drive.total_yards == drive.ending_yard_line - drive.starting_yard_line
+            assert drive.plays >= 1 and drive.time_elapsed_seconds > 0
+            if drive.result == "TD":
+                assert drive.ending_yard_line == 100 and drive.points == 6
+            elif drive.result == "FG":
+                assert drive.points == 3
+            elif drive.result in ("PUNT", "TURNOVER", "DOWNS", "FG_MISS"):
+                assert 1 <= drive.takeover_yard_line <= 99
+                assert drive.points == 0
+
+    def test_short_fields_score_more(self, home_team, away_team):
+        near = resolve_many(home_team, away_team, 85)
+        far = resolve_many(home_team, away_team, 10)
+
+        assert sum(d.points for d in near) > 2 * sum(d.points for d in far)
+        assert not any(d.result == "PUNT" for d in near)
+
+    def test_credits_match_the_drive(self, home_team, away_team):
+        qb = home_team.get_starter("QB1")
+        for drive in resolve_many(home_team, away_team, 25, n=100):
+            totals = Counter()
+            for player_id, stat, amount in drive.credits:
+                totals[stat] += amount
+            assert totals["pass_yards"] == totals["receiving_yards"]
+            assert totals["pass_completions"] == totals["receptions"]
+            assert totals["receptions"] <= totals["targets"] == totals["pass_attempts"]
+            gained = totals["pass_yards"] + totals["rush_yards"] - 7 * totals["pass_sacks"]
+            assert gained == drive.total_yards
+            dropbacks = totals["pass_attempts"] + totals["pass_sacks"]
+            assert drive.plays == dropbacks + totals["rush_attempts"]
+            assert totals["pass_interceptions"] == totals["interceptions"]
+            assert all(pid == qb.id for pid, stat, _ in drive.credits if stat.startswith("pass_"))
+            if drive.result == "TD":
+                assert totals["pass_touchdowns"] + totals["rush_touchdowns"] == 1
+
+    def test_every_attempt_has_a_target(self, home_team, away_team):
+        totals = Counter()
+        for start in (5, 25, 50, 80):
+            for drive in resolve_many(home_team, away_team, start, n=200):
+                for _, stat, amount in drive.credits:
+                    totals[stat] += amount
+
+        # pass_attempts doesn't count sacks
+        assert totals["targets"] == totals["pass_attempts"]
+        assert totals["receptions"] < totals["targets"]
+        assert totals["interceptions"] > 0
+
+    def test_drives_stop_at_the_end_of_the_half(self, home_team, away_team):
+        drives = resolve_many(home_team, away_team, 25, n=50, seconds=40, quarter=2)
+
+        assert all(d.time_elapsed_seconds <= 40 for d in drives)
+        assert Counter(d.result for d in drives)["END_HALF"] > 0
+
+
+class TestKicks:
+
+    def test_kickoff_and_free_kick(self, home_team, away_team):
+        resolver = StatisticalDriveResolver(rng=random.Random(3))
+        kickoffs = [
+            resolver.resolve_kickoff(game_at(home_team, away_team, 35), home_team, away_team)
+            for _ in range(200)
+        ]
+        free_kicks = [
+            resolver.resolve_kickoff(game_at(home_team, away_team, 20), home_team, away_team)
+            for _ in range(200)
+        ]
+
+        assert 0.3 < kickoffs.count(25) / len(kickoffs) < 0.9
+        assert all(1 <= start <= 60 for start in kickoffs + free_kicks)
+        assert sum(free_kicks) / len(free_kicks) > sum(kickoffs) / len(kickoffs)
+
+    def test_conversions(self, home_team, away_team):
+        resolver = StatisticalDriveResolver(rng=random.Random(3))
+        game = game_at(home_team, away_team, 85)
+        extra_points = [resolver.resolve_conversion(game, home_team, False) for _ in range(200)]
+        two_points = [resolver.resolve_conversion(game, home_team, True) for _ in range(200)]
+
+        assert set(extra_points) <= {0, 1} and sum(extra_points) > 160
+        assert set(two_points) <= {0, 2} and 0 < sum(two_points) < 400
+
+
+class TestFastModeGame:
+
+    def test_game_is_resolved_by_drive(self, home_team, away_team):
+        engine = SimulationEngine(mode=SimulationMode.FAST)
+        drives = []
+        engine.event_bus.subscribe(DriveCompletedEvent, drives.append)
+
+        game = engine.simulate_game(engine.create_game(home_team, away_team, rng=random.Random(11)))
+        log = engine.stats.build_game_log(uuid4(), 1, game.score.home_score, game.score.away_score)
+
+        assert game.is_game_over
+        assert 12 <= len(drives) == engine.stats.play_count <= 35
+        assert game.score.home_score + game.score.away_score > 0
+        top = log.home_stats.time_of_possession_seconds + log.away_stats.time_of_possession_seconds
+        assert 3000 <= top <= 3600 + 600
+        assert log.home_stats.total_yards > 0 and log.away_stats.total_yards > 0
+
+    def test_seeded_games_repeat(self, home_team, away_team):
+        def play(seed):
+            engine = SimulationEngine(mode=SimulationMode.FAST)
+            game = engine.create_game(home_team, away_team, rng=random.Random(seed))
+            engine.simulate_game(game)
+            return game.score.home_score, game.score.away_score, engine.stats.plays
+
+        assert play(5) == play(5)
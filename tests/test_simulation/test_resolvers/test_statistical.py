@@ -3,11 +3,15 @@
 import pytest
 import random
 
-from huddle.core.enums import PassType, PlayOutcome, PlayType, RunType
+from huddle.core.enums import PassType, PlayOutcome, PlayType, Position, RunType
 from huddle.core.models.field import DownState, FieldPosition
 from huddle.core.models.game import GameState
 from huddle.core.models.play import DefensiveCall, PlayCall, PlayResult
+from huddle.core.models.player import Player
+from huddle.core.models.team import Team
+from huddle.simulation.engine import SimulationEngine
 from huddle.simulation.resolvers.statistical import StatisticalPlayResolver
+from huddle.simulation.resolvers.team_ratings import TeamRatingCache, WeightedChoice
 
 
 class TestStatisticalPlayResolverInit:
@@ -554,3 +558,103 @@ class TestDescriptionGeneration:
             if result.is_touchdown:
                 assert "touchdown" in result.description.lower()
                 break
+
+
+class TestTeamRatingCache:
+    """Tests for the per-game team rating cache."""
+
+    @staticmethod
+    def make_team(name: str, slots: list[tuple[str, Position]]) -> Team:
+        team = Team(name=name, abbreviation=name[:3].upper())
+        for slot, position in slots:
+            player = Player(first_name=name, last_name=slot, position=position)
+            team.roster.add_player(player)
+            team.roster.depth_chart.set(slot, player.id)
+        return team
+
+    @pytest.fixture
+    def offense_team(self):
+        return self.make_team("Eagles", [
+            ("QB1", Position.QB), ("RB1", Position.RB), ("WR1", Position.WR),
+            ("WR2", Position.WR), ("TE1", Position.TE), ("LT1", Position.LT),
+            ("C1", Position.C), ("RT1", Position.RT),
+        ])
+
+    @pytest.fixture
+    def defended_team(self):
+        """Team with a front seven and secondary on the depth chart."""
+        return self.make_team("Cowboys", [
+            ("DE1", Position.DE), ("DE2", Position.DE), ("DT1", Position.DT),
+            ("MLB1", Position.MLB), ("MLB2", Position.MLB), ("CB1", Position.CB),
+        ])
+
+    @pytest.fixture
+    def game_state(self, offense_team, defended_team):
+        state = GameState()
+        state.set_teams(offense_team, defended_team)
+        state.possession.team_with_ball = offense_team.id
+        state.down_state = DownState(down=1, yards_to_go=10, line_of_scrimmage=FieldPosition(25))
+        return state
+
+    def test_weighted_choice_uses_cumulative_weights(self):
+        choice = WeightedChoice(["a", "b", "c"], [1.0, 2.0, 1.0])
+        assert choice.sample(lambda: 0.1) == "a"
+        assert choice.sample(lambda: 0.5) == "b"
+        assert choice.sample(lambda: 0.9) == "c"
+        assert WeightedChoice([], []).sample() is None
+
+    def test_cached_ratings_match_roster(self, offense_team, defended_team):
+        resolver = StatisticalPlayResolver()
+        offense = resolver.build_team_ratings(offense_team)
+        defense = resolver.build_team_ratings(defended_team)
+
+        assert offense.oline_rating == resolver._calculate_oline_rating(offense_team)
+        assert defense.dline_rating == resolver._calculate_dline_rating(defended_team)
+        assert offense.get_receivers(None) == resolver._get_receivers(offense_team)
+        assert defense.coverage_players == resolver._get_coverage_players(defended_team)
+
+    def test_rotation_folded_into_tackler_weights(self, defended_team):
+        resolver = StatisticalPlayResolver()
+        tacklers = resolver.build_team_ratings(defended_team).tacklers["interior"]
+        weights = dict(zip(
+            [p.id for p in tacklers.items],
+            [b - a for a, b in zip([0.0] + tacklers.cumulative[:-1], tacklers.cumulative)],
+        ))
+
+        mlb1 = defended_team.get_starter("MLB1")
+        mlb2 = defended_team.get_starter("MLB2")
+        # MLB1 keeps 85% of its slot; MLB2 gets the 15% rotation plus its own slot
+        # (equal attributes, so the tackle modifier cancels out)
+        mlb1_slot, mlb2_slot = 0.22 * 1.5, 0.10 * 1.5
+        expected_ratio = (mlb1_slot * 0.85) / (mlb1_slot * 0.15 + mlb2_slot)
+        assert weights[mlb1.id] / weights[mlb2.id] == pytest.approx(expected_ratio)
+
+    def test_plays_reuse_cached_ratings(self, game_state, offense_team, defended_team):
+        resolver = StatisticalPlayResolver()
+        resolver.rating_cache = TeamRatingCache(resolver.build_team_ratings)
+        random.seed(7)
+
+        for _ in range(30):
+            resolver.resolve_play(
+                game_state, offense_team, defended_team,
+                PlayCall.pass_play(PassType.SHORT), DefensiveCall.cover_3()
+            )
+            resolver.resolve_play(
+                game_state, offense_team, defended_team,
+                PlayCall.run(RunType.OUTSIDE), DefensiveCall.cover_3()
+            )
+
+        assert resolver.rating_cache.builds == 2
+
+    def test_engine_refresh_sees_substitution(self, offense_team, defended_team):
+        engine = SimulationEngine()
+        engine.create_game(offense_team, defended_team)
+        cache = engine._rating_cache
+        assert offense_team.id in cache and defended_team.id in cache
+
+        new_cb = Player(first_name="New", last_name="Corner", position=Position.CB)
+        defended_team.roster.add_player(new_cb)
+        defended_team.roster.depth_chart.set("CB1", new_cb.id)
+        engine.refresh_team_ratings(defended_team)
+
+        assert new_cb in cache.get(defended_team).coverage_players
@@ -0,0 +1,104 @@
+"""Tests for streaming box score accumulation."""
+
+from uuid import uuid4
+
+import pytest
+
+from huddle.core.enums import PassType, PlayOutcome, RunType
+from huddle.core.models.play import DefensiveCall, PlayCall, PlayResult
+from huddle.generators import generate_team
+from huddle.simulation.engine import SimulationEngine, SimulationMode
+from huddle.simulation.stats_accumulator import GameStatsAccumulator
+
+
+@pytest.fixture
+def home_team():
+    return generate_team(name="Eagles", city="Philadelphia", abbreviation="PHI")
+
+
+@pytest.fixture
+def away_team():
+    return generate_team(name="Cowboys", city="Dallas", abbreviation="DAL")
+
+
+def pass_play(**kwargs) -> PlayResult:
+    return PlayResult(
+        play_call=PlayCall.pass_play(PassType.MEDIUM), defensive_call=DefensiveCall.cover_3(), **kwargs
+    )
+
+
+def run_play(**kwargs) -> PlayResult:
+    return PlayResult(
+        play_call=PlayCall.run(RunType.INSIDE), defensive_call=DefensiveCall.cover_3(), **kwargs
+    )
+
+
+def player_id(team, position: str):
+    return next(p.id for p in team.roster.players.values() if p.position.value == position)
+
+
+class TestGameStatsAccumulator:
+    """Tests for GameStatsAccumulator.record_play()."""
+
+    def test_completion_credits_passer_receiver_and_team(self, home_team, away_team):
+        stats = GameStatsAccumulator(home_team, away_team)
+        qb, wr = player_id(home_team, "QB"), player_id(home_team, "WR")
+
+        stats.record_play(pass_play(
+            outcome=PlayOutcome.COMPLETE, yards_gained=25,
+            passer_id=qb, receiver_id=wr, is_touchdown=True, points_scored=6,
+        ))
+        stats.record_play(pass_play(
+            outcome=PlayOutcome.INCOMPLETE, passer_id=qb,
+        ))
+
+        log = stats.build_game_log(uuid4(), 1, home_score=7, away_score=0)
+        passing = log.player_stats[str(qb)].passing
+        assert (passing.attempts, passing.completions, passing.yards, passing.touchdowns) == (2, 1, 25, 1)
+        assert log.player_stats[str(wr)].receiving.touchdowns == 1
+        assert log.home_stats.passing_yards == 25
+        assert log.away_stats.total_yards == 0
+        assert len(log.plays) == 2
+        assert log.scoring_plays[0]["points"] == 6
+
+    def test_turnovers_and_unrostered_players(self, home_team, away_team):
+        stats = GameStatsAccumulator(home_team, away_team)
+        qb, rb = player_id(away_team, "QB"), player_id(away_team, "RB")
+
+        stats.record_play(pass_play(
+            outcome=PlayOutcome.INTERCEPTION,
+            passer_id=qb, interceptor_id=uuid4(),
+        ))
+        stats.record_play(run_play(
+            outcome=PlayOutcome.FUMBLE_LOST,
+            yards_gained=-2, rusher_id=rb, tackler_id=uuid4(),
+        ))
+
+        log = stats.build_game_log(uuid4(), 1, 0, 0)
+        assert set(log.player_stats) == {str(qb), str(rb)}
+        assert log.away_stats.turnovers == 2
+        assert log.away_stats.rushing_yards == -2
+        assert log.player_stats[str(rb)].rushing.fumbles_lost == 1
+
+
+class TestEngineStreaming:
+    """Tests for the engine feeding the accumulator."""
+
+    def test_fast_mode_drops_play_history(self, home_team, away_team):
+        engine = SimulationEngine(mode=SimulationMode.FAST)
+        game = engine.simulate_game(engine.create_game(home_team, away_team))
+
+        assert game.play_history == []
+        assert engine.stats.play_count > 0
+
+        log = engine.stats.build_game_log(uuid4(), 1, game.score.home_score, game.score.away_score)
+        home_passing = sum(
+            s.passing.yards for s in log.player_stats.values() if s.team_abbr == home_team.abbreviation
+        )
+        assert log.home_stats.passing_yards == home_passing
+
+    def test_play_by_play_keeps_history(self, home_team, away_team):
+        engine = SimulationEngine()
+        game = engine.simulate_game(engine.create_game(home_team, away_team))
+
+        assert len(game.play_history) == engine.stats.play_count
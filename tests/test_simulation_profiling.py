@@ -0,0 +1,76 @@
+"""Tests for phase-level profiling of the historical simulation."""
+
+import pstats
+
+from huddle.core.simulation import (
+    HistoricalSimulator,
+    PhaseProfiler,
+    SimulationConfig,
+    SimulationProfile,
+)
+
+
+class TestPhaseProfiler:
+
+    def test_records_phases_in_order_with_counts(self):
+        timings = []
+        profiler = PhaseProfiler(on_phase=timings.append)
+
+        profiler.count("ignored")  # No phase running
+        profiler.start(2024, "draft")
+        profiler.count("players_generated", 3)
+        profiler.count("players_generated")
+        profiler.start(2024, "trades")  # Ends the draft
+        profiler.close()
+
+        assert [t.phase for t in timings] == ["draft", "trades"]
+        assert timings[0].counts == {"players_generated": 4}
+        assert timings[1].counts == {}
+        assert profiler.profile.phases == timings
+        assert not profiler.active
+
+    def test_allocations_and_cprofile_dumps(self, tmp_path):
+        profiler = PhaseProfiler(track_allocations=True, profile_dir=str(tmp_path))
+
+        profiler.start(2025, "development")
+        kept = [list(range(100)) for _ in range(1000)]
+        profiler.close()
+
+        timing = profiler.profile.phases[0]
+        assert timing.allocated_bytes > 100_000
+        assert timing.peak_bytes >= timing.allocated_bytes
+        assert timing.profile_path.endswith("2025_00_development.prof")
+        pstats.Stats(timing.profile_path)  # Loadable dump
+        del kept
+
+    def test_totals_across_seasons_round_trip(self):
+        profiler = PhaseProfiler()
+        for season in (2023, 2024):
+            profiler.start(season, "draft")
+            profiler.count("players_generated", 10)
+        profiler.close()
+
+        profile = SimulationProfile.from_dict(profiler.profile.to_dict())
+        [draft] = profile.by_phase().values()
+
+        assert draft.counts == {"players_generated": 20}
+        assert draft.wall_seconds == profile.total_seconds
+        assert len(profile.for_season(2023)) == 1
+        assert "draft" in profile.format_report()
+
+
+class TestHistoricalSimulatorPhases:
+
+    def test_phase_switch_reports_previous_phase(self):
+        timings = []
+        config = SimulationConfig(years_to_simulate=0, seed=1, phase_callback=timings.append)
+        simulator = HistoricalSimulator.create_with_nfl_teams(config)
+
+        simulator._enter_phase(2024, "initialize")
+        simulator._initialize_league(2024)
+        simulator._enter_phase(2024, "position_plans")
+
+        [initialize] = timings
+        assert initialize.phase == "initialize"
+        assert initialize.counts["players_generated"] > 32 * 40
+        assert initialize.wall_seconds > 0 and initialize.cpu_seconds > 0
@@ -29,6 +29,7 @@ from huddle.core.ai.trade_market import (
     generate_all_bids,
     resolve_auctions,
     build_trade_market,
+    update_trade_market,
     simulate_trade_market,
     attempt_blockbuster_trade,
 )
@@ -618,6 +619,63 @@ class TestCooldowns:
         assert not market.is_team_on_cooldown("NYG")
 
 
+class TestDemandIndex:
+    """Tests for indexed bidder discovery and incremental market updates."""
+
+    def _build_market(self):
+        statuses = [TeamStatus.REBUILDING, TeamStatus.CONTENDING, TeamStatus.EMERGING]
+        teams = {
+            f"TEAM_{i:02d}": create_mock_team(f"TEAM_{i:02d}", status=statuses[i % 3])
+            for i in range(12)
+        }
+        teams["TEAM_00"].needs["WR"] = 0.9  # Takes a 75+ WR
+        market = build_trade_market(teams, season=2024, round_number=1, config=TradeMarketConfig())
+        return teams, market
+
+    def test_lookup_matches_linear_scan(self):
+        teams, market = self._build_market()
+
+        for listing in market.get_all_listings():
+            expected = {}
+            for team_id, targets in market.demand.items():
+                for target in targets:
+                    if target.matches_listing(listing):
+                        expected[team_id] = target.priority
+                        break
+            assert market.find_interested_teams(listing) == expected
+
+    def test_set_team_demand_updates_index(self):
+        teams, market = self._build_market()
+        listing = next(
+            l for l in market.get_all_listings()
+            if l.player_position == "WR" and l.listing_team_id != "TEAM_00"
+        )
+        assert "TEAM_00" in market.find_interested_teams(listing)
+
+        market.set_team_demand("TEAM_00", [])
+        assert "TEAM_00" not in market.find_interested_teams(listing)
+
+    def test_update_refreshes_only_given_teams(self):
+        teams, market = self._build_market()
+
+        def listed(team_id):
+            return [l.player_id for l in market.supply[team_id] if l.asset_type == "player"]
+
+        def trade_away(team_id):
+            player_id = listed(team_id)[0]
+            teams[team_id].roster = [p for p in teams[team_id].roster if p.id != player_id]
+            return player_id
+
+        sold = trade_away("TEAM_01")
+        unrefreshed = trade_away("TEAM_02")
+
+        update_trade_market(market, teams, ["TEAM_01"])
+
+        assert sold not in listed("TEAM_01")
+        assert unrefreshed in listed("TEAM_02")
+        assert list(market.supply) == [t for t in teams if t in market.supply]
+
+
 # =============================================================================
 # Full Market Simulation Tests
 # =============================================================================
@@ -0,0 +1,55 @@
+"""Tests for the headless v2 calibration runner."""
+
+import pytest
+
+from huddle.simulation.v2.testing.calibration import (
+    CalibrationReport,
+    PlaySample,
+    build_pass_play,
+    plan_plays,
+    rate_metric,
+    run_calibration,
+    simulate_play,
+)
+
+
+class TestStatistics:
+
+    def test_wilson_interval_brackets_rate(self):
+        metric = rate_metric("completion_rate", 60, 100, {"completion_rate": (60.5, 8.0)})
+
+        assert metric.value == 60.0
+        assert 50 < metric.low < 60 < metric.high < 70
+        assert metric.passes
+
+    def test_report_flags_metrics_outside_tolerance(self):
+        samples = [PlaySample("pass", "incomplete", 0, depth=8.0, time_to_throw=2.5)] * 20
+        report = CalibrationReport("pass", samples)
+
+        assert report.metrics["completion_rate"].value == 0.0
+        assert report.metrics["completion_rate"] in report.failures
+        assert report.metrics["depth_behind_los"].passes is None  # No attempts there
+        assert "PASS GAME CALIBRATION" in report.format_report()
+
+
+class TestRunner:
+
+    def test_unknown_matchup_raises(self):
+        with pytest.raises(ValueError):
+            build_pass_play("mesh", "cover_99")
+
+    def test_plays_are_seeded_per_play(self):
+        specs = plan_plays(4, "pass", seed=5)
+
+        assert specs == plan_plays(4, "pass", seed=5)
+        assert len({s.seed for s in specs}) == 4
+        assert simulate_play(specs[2]) == simulate_play(specs[2])
+
+    def test_process_pool_matches_inline_run(self):
+        inline = run_calibration(4, "run", seed=3, workers=1)
+        pooled = run_calibration(4, "run", seed=3, workers=2)
+
+        assert pooled.samples == inline.samples
+        assert set(inline.metrics) == {
+            "mean_yards", "stuff_rate", "explosive_rate", "big_play_rate",
+        }
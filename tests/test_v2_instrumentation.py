@@ -0,0 +1,60 @@
+"""Tests for per-tick orchestrator instrumentation."""
+
+import random
+
+from huddle.simulation.v2.core.instrumentation import SpanStats, TickProfiler
+from huddle.simulation.v2.testing.calibration import build_pass_play, plan_plays
+
+
+def run_play(spec, profiler=None):
+    random.seed(spec.seed)
+    orchestrator = build_pass_play(spec.concept, spec.coverage)
+    if profiler is not None:
+        orchestrator.instrument(profiler)
+    return orchestrator, orchestrator.run()
+
+
+class TestTickProfiler:
+
+    def test_records_systems_and_brains_without_changing_the_play(self):
+        spec = plan_plays(1, "pass", seed=4)[0]
+        profiler = TickProfiler(record_spans=True)
+
+        orchestrator, result = run_play(spec, profiler)
+        profiler.finish()
+        _, plain = run_play(spec)
+
+        assert (result.outcome, result.yards_gained) == (plain.outcome, plain.yards_gained)
+        assert profiler.plays == 1
+        tick = profiler.stats["tick"]
+        assert tick.calls == profiler.ticks == len(tick.tick_seconds)
+        assert {"world_state", "resolve_blocks", "brain:qb", "brain:ol"} <= set(profiler.stats)
+        assert profiler.stats["world_state"].total_seconds < tick.total_seconds
+
+        # Unwrapped once finished
+        assert "_update_tick" not in vars(orchestrator)
+        assert "update" not in vars(orchestrator.pressure_system)
+
+    def test_plays_aggregate_and_export(self):
+        profiler = TickProfiler(record_spans=True)
+        for spec in plan_plays(2, "pass", seed=1):
+            run_play(spec, profiler)  # Attaching the next play finishes the last
+        profiler.finish()
+
+        data = profiler.to_dict()
+        trace = profiler.to_chrome_trace()["traceEvents"]
+
+        assert data["plays"] == 2 and data["systems"]["tick"]["plays"] == 2
+        assert {event["tid"] for event in trace} == {0, 1}
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace)
+        assert "brain:ol" in profiler.format_report()
+
+    def test_percentiles_and_histogram(self):
+        stats = SpanStats("x")
+        stats.tick_seconds.extend([i / 1e6 for i in range(1, 101)])  # 1..100us
+
+        assert stats.percentile(50) == 50e-6
+        assert stats.percentile(99) == 99e-6
+        histogram = dict(stats.histogram())
+        assert histogram["<=10us"] == 10 and histogram["<=100us"] == 50
+        assert sum(histogram.values()) == 100
@@ -0,0 +1,94 @@
+"""Tests for the v2 AI trace system."""
+
+from huddle.simulation.v2.core.trace import TraceCategory, TraceSystem
+
+
+def traced(system, tick, player_id, message, *args):
+    system.set_tick(tick, tick * 0.05)
+    system.trace(player_id, player_id.upper(), TraceCategory.DECISION, message, *args)
+
+
+class TestTraceSystem:
+
+    def test_messages_are_only_rendered_when_enabled(self):
+        system = TraceSystem()
+        calls = []
+
+        def message():
+            calls.append(1)
+            return "expensive"
+
+        traced(system, 0, "qb", message)
+        traced(system, 0, "qb", "sep=%.1fyd", object())  # Would fail if formatted
+        assert not system.enabled and calls == [] and system.get_entries() == []
+
+        system.enable()
+        traced(system, 1, "qb", message)
+        traced(system, 1, "qb", "sep=%.1fyd", 2.345)
+        traced(system, 1, "qb", "100% literal")
+
+        assert [e.message for e in system.get_entries()] == ["expensive", "sep=2.3yd", "100% literal"]
+
+    def test_tick_retrieval_keeps_global_order(self):
+        system = TraceSystem()
+        system.enable()
+        for tick in range(4):
+            traced(system, tick, "qb", "qb %d", tick)
+            traced(system, tick, "cb", "cb %d", tick)
+
+        assert [e.message for e in system.get_entries(since_tick=2)] == [
+            "qb 2", "cb 2", "qb 3", "cb 3",
+        ]
+        assert [e.message for e in system.get_entries_for_tick(1)] == ["qb 1", "cb 1"]
+        assert [e.message for e in system.get_entries_for_player("cb", since_tick=3)] == ["cb 3"]
+        assert system.to_dict_list()[0]["message"] == "qb 0"
+
+    def test_new_entries_are_incremental(self):
+        system = TraceSystem()
+        system.enable()
+        traced(system, 0, "qb", "a")
+        traced(system, 1, "qb", "b")
+
+        assert [e.message for e in system.get_new_entries()] == ["a", "b"]
+        assert system.get_new_entries() == []
+        traced(system, 2, "lb", "c")
+        assert [e.message for e in system.get_new_entries()] == ["c"]
+
+        system.enable()  # Re-enabling starts over
+        assert system.get_entries() == []
+
+    def test_per_player_ring_buffer(self):
+        system = TraceSystem(capacity_per_player=3)
+        system.enable()
+        for tick in range(5):
+            traced(system, tick, "qb", "qb %d", tick)
+        traced(system, 5, "cb", "cb")
+
+        assert [e.tick for e in system.get_entries_for_player("qb")] == [2, 3, 4]
+        assert [e.message for e in system.get_entries()] == ["qb 2", "qb 3", "qb 4", "cb"]
+
+
+class TestQBTrace:
+
+    def test_qb_trace_comes_from_the_trace_system(self):
+        from huddle.simulation.v2.ai.qb_brain import (
+            _set_trace_context,
+            _trace,
+            enable_trace,
+            get_trace,
+        )
+        from huddle.simulation.v2.core.trace import get_trace_system
+
+        system = get_trace_system()
+        try:
+            enable_trace(True)
+            for tick in range(5):
+                system.set_tick(tick, tick * 0.05)
+                _set_trace_context("qb-1", "QB")
+                _trace("read %d", tick)
+            system.trace("cb-1", "CB", TraceCategory.DECISION, "not the QB")
+
+            assert get_trace() == [f"read {i}" for i in range(5)]
+            assert get_trace("cb-1") == ["not the QB"]
+        finally:
+            enable_trace(False)